@@ -26,6 +26,7 @@ dePeriod= actionAngleIsochroneApprox.dePeriod
 #
 # Classes
 #
+interpDeltaStaeckel= actionAngleStaeckel.interpDeltaStaeckel
 actionAngle= actionAngle.actionAngle
 actionAngleInverse= actionAngleInverse.actionAngleInverse
 actionAngleAxi= actionAngleAxi.actionAngleAxi
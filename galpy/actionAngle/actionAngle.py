@@ -358,3 +358,24 @@ class UnboundError(Exception): #pragma: no cover
         self.value = value
     def __str__(self):
         return repr(self.value)
+
+def _fixed_quad_vec(func,a,b,order):
+    """
+    NAME:
+       _fixed_quad_vec
+    PURPOSE:
+       integrate a function over arrays of intervals simultaneously using fixed-order Gauss-Legendre quadrature
+    INPUT:
+       func - function func(x) that evaluates the integrand at x with shape [len(a),order], i.e., for each interval at each quadrature node
+       a, b - arrays of lower and upper integration limits
+       order - order of the Gauss-Legendre quadrature
+    OUTPUT:
+       integrals (array)
+    HISTORY:
+       2026-10-19 - Written - agent
+    """
+    glx, glw= numpy.polynomial.legendre.leggauss(order)
+    a= numpy.atleast_1d(a)[:,None]
+    b= numpy.atleast_1d(b)[:,None]
+    x= (b-a)/2.*glx[None,:]+(b+a)/2.
+    return numpy.sum(glw[None,:]*func(x),axis=1)*(b[:,0]-a[:,0])/2.
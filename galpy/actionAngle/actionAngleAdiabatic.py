@@ -8,16 +8,18 @@
 #
 #      methods:
 #             __call__: returns (jr,lz,jz)
+#             EccZmaxRperiRap: returns (e,zmax,rperi,rap)
 #
 ###############################################################################
-import copy
 import warnings
 import numpy
 from ..util import galpyWarning
 from ..potential import MWPotential
 from ..potential.Potential import flatten as flatten_potential
+from ..potential.Potential import _evaluatePotentials
 from ..potential import toPlanarPotential, toVerticalPotential
-from .actionAngleAxi import actionAngleAxi
+from .actionAngleAxi import actionAngleAxi, _calcRapRperiAxi_vec, _JRAxi_vec
+from .actionAngleVertical import _calczmax_vec, _Jz_vec
 from .actionAngle import actionAngle
 from . import actionAngleAdiabatic_c
 from .actionAngleAdiabatic_c import _ext_loaded as ext_loaded
@@ -40,6 +42,10 @@ class actionAngleAdiabatic(actionAngle):
 
            gamma= (default=1.) replace Lz by Lz+gamma Jz in effective potential
 
+           c= (False) if True, use C for calculations (if the potential has a C implementation)
+
+           order= (20) number of points to use in the Gauss-Legendre numerical integration of the action integrals when using the vectorized Python implementation for multiple phase-space points
+
            ro= distance from vantage point to GC (kpc; can be Quantity)
 
            vo= circular velocity at ro (km/s; can be Quantity)
@@ -52,6 +58,8 @@ class actionAngleAdiabatic(actionAngle):
 
             2012-07-26 - Written - Bovy (IAS@MPIA)
 
+            2026-10-19 - Added vectorized Python implementation - agent
+
         """
         actionAngle.__init__(self,
                              ro=kwargs.get('ro',None),vo=kwargs.get('vo',None))
@@ -68,6 +76,7 @@ class actionAngleAdiabatic(actionAngle):
         else:
             self._c= False
         self._gamma= kwargs.get('gamma',1.)
+        self._order= kwargs.get('order',20)
         # Check the units
         self._check_consistent_units()
         return None
@@ -85,13 +94,19 @@ class actionAngleAdiabatic(actionAngle):
                  2) numpy.ndarray: [N] phase-space values for N objects (each can be a Quantity)
               b) Orbit instance: initial condition used if that's it, orbit(t) if there is a time given as well as the second argument 
            c= (object-wide default, bool) True/False to override the object-wide setting for whether or not to use the C implementation
-           scipy.integrate.quadrature keywords
+           When not using C:
+              for multiple phase-space points:
+                 order= (object-wide default, int) number of points to use in the Gauss-Legendre numerical integration of the action integrals, which are evaluated for all points at once
+              for a single phase-space point:
+                 scipy.integrate.quadrature keywords
            _justjr, _justjz= if True, only calculate the radial or vertical action (internal use)
         OUTPUT:
            (jr,lz,jz)
         HISTORY:
            2012-07-26 - Written - Bovy (IAS@MPIA)
+           2026-10-19 - Vectorized Python implementation for multiple phase-space points - agent
         """
+        order= kwargs.pop('order',self._order)
         if len(args) == 5: #R,vR.vT, z, vz
             R,vR,vT, z, vz= args
         elif len(args) == 6: #R,vR.vT, z, vz, phi
@@ -124,16 +139,15 @@ class actionAngleAdiabatic(actionAngle):
                 warnings.warn("C module not used because potential does not have a C implementation",galpyWarning) #pragma: no cover
             kwargs.pop('c',None)
             if len(R) > 1:
-                ojr= numpy.zeros((len(R)))
-                olz= numpy.zeros((len(R)))
-                ojz= numpy.zeros((len(R)))
-                for ii in range(len(R)):
-                    targs= (R[ii],vR[ii],vT[ii],z[ii],vz[ii])
-                    tjr,tlz,tjz= self(*targs,**copy.copy(kwargs))
-                    ojr[ii]= tjr
-                    ojz[ii]= tjz
-                    olz[ii]= tlz
-                return (ojr,olz,ojz)
+                Lz= R*vT
+                Ez, zmax, jz= self._vertical_vec(R,z,vz,order)
+                if kwargs.get('_justjz',False):
+                    return (numpy.nan*Lz,numpy.nan*Lz,jz)
+                E, L, rperi, Rap= self._radial_vec(R,vR,vT,jz)
+                jr= _JRAxi_vec(rperi,Rap,E,L,self._planarpotfunc,order=order)
+                if kwargs.get('_justjr',False):
+                    return (jr,numpy.nan*Lz,numpy.nan*Lz)
+                return (jr,Lz,jz)
             else:
                 #Set up the actionAngleAxi object
                 thispot= toPlanarPotential(self._pot)
@@ -168,11 +182,14 @@ class actionAngleAdiabatic(actionAngle):
                  2) numpy.ndarray: [N] phase-space values for N objects (each can be a Quantity)
               b) Orbit instance: initial condition used if that's it, orbit(t) if there is a time given as well as the second argument 
            c= (object-wide default, bool) True/False to override the object-wide setting for whether or not to use the C implementation
+           order= (object-wide default, int) when not using C for multiple phase-space points, number of points to use in the Gauss-Legendre numerical integration of the vertical action integral (needed when gamma != 0)
         OUTPUT:
            (e,zmax,rperi,rap)
         HISTORY:
            2017-12-21 - Written - Bovy (UofT)
+           2026-10-19 - Vectorized Python implementation for multiple phase-space points - agent
         """
+        order= kwargs.pop('order',self._order)
         if len(args) == 5: #R,vR.vT, z, vz
             R,vR,vT, z, vz= args
         elif len(args) == 6: #R,vR.vT, z, vz, phi
@@ -206,19 +223,10 @@ class actionAngleAdiabatic(actionAngle):
                 warnings.warn("C module not used because potential does not have a C implementation",galpyWarning) #pragma: no cover
             kwargs.pop('c',None)
             if len(R) > 1:
-                oecc= numpy.zeros((len(R)))
-                orperi= numpy.zeros((len(R)))
-                orap= numpy.zeros((len(R)))
-                ozmax= numpy.zeros((len(R)))
-                for ii in range(len(R)):
-                    targs= (R[ii],vR[ii],vT[ii],z[ii],vz[ii])
-                    tecc, tzmax, trperi,trap= self._EccZmaxRperiRap(\
-                        *targs,**copy.copy(kwargs))
-                    oecc[ii]= tecc
-                    ozmax[ii]= tzmax
-                    orperi[ii]= trperi
-                    orap[ii]= trap
-                return (oecc,ozmax,orperi,orap)
+                Ez, zmax, jz= self._vertical_vec(R,z,vz,order)
+                E, L, rperi, Rap= self._radial_vec(R,vR,vT,jz)
+                rap= numpy.sqrt(Rap**2.+zmax**2.)
+                return ((rap-rperi)/(rap+rperi),zmax,rperi,rap)
             else:
                 #Set up the actionAngleAxi object
                 thispot= toPlanarPotential(self._pot)
@@ -234,6 +242,43 @@ class actionAngleAdiabatic(actionAngle):
                         numpy.atleast_1d(zmax),numpy.atleast_1d(rperi),
                         numpy.atleast_1d(rap))
 
+    def _planarpotfunc(self,R):
+        """Evaluate the potential in the mid-plane for R with any shape"""
+        R= numpy.asarray(R)
+        return numpy.reshape(_eval_pot_nodes(self._pot,R.flatten(),
+                                             numpy.zeros(R.size)),
+                             R.shape)
+
+    def _vertical_vec(self,R,z,vz,order):
+        """Compute the vertical energy, maximum height, and vertical action for arrays of phase-space points at once"""
+        Phi0= self._planarpotfunc(R)
+        def verticalpotfunc(tz,indx):
+            # Vertical potential at R[indx], tz has shape [len(indx)] or [len(indx),M]
+            tR= numpy.broadcast_to(numpy.reshape(R[indx],
+                                                 (len(indx),)\
+                                                     +(1,)*(tz.ndim-1)),
+                                   tz.shape)
+            return numpy.reshape(_eval_pot_nodes(self._pot,tR.flatten(),
+                                                 tz.flatten()),
+                                 tz.shape)\
+                -numpy.reshape(Phi0[indx],(len(indx),)+(1,)*(tz.ndim-1))
+        Ez= verticalpotfunc(z,numpy.arange(len(R)))+vz**2./2.
+        zmax= _calczmax_vec(z,vz,Ez,verticalpotfunc)
+        jz= _Jz_vec(zmax,Ez,verticalpotfunc,order=order)
+        return (Ez,zmax,jz)
+
+    def _radial_vec(self,R,vR,vT,jz):
+        """Compute the (effective) energy and angular momentum and the peri- and apocenter for arrays of phase-space points at once"""
+        E= self._planarpotfunc(R)+vR**2./2.+vT**2./2.
+        L= R*vT
+        if self._gamma != 0.:
+            #Adjust E
+            E-= vT**2./2.
+            L= numpy.fabs(L)+self._gamma*jz
+            E+= L**2./2./R**2.
+        rperi, Rap= _calcRapRperiAxi_vec(R,vR,E,L,self._planarpotfunc)
+        return (E,L,rperi,Rap)
+
     def calcRapRperi(self,*args,**kwargs):
         """
         NAME:
@@ -280,3 +325,13 @@ class actionAngleAdiabatic(actionAngle):
                                verticalPot=thisverticalpot,
                                gamma=self._gamma)
         return aAAxi.calczmax(**kwargs)
+
+def _eval_pot_nodes(pot,R,z):
+    """Evaluate the potential for arrays R and z, falling back onto
+    element-by-element evaluation for potentials that do not accept arrays"""
+    try:
+        out= numpy.asarray(_evaluatePotentials(pot,R,z),dtype='float')
+        return out*numpy.ones(R.shape)
+    except (TypeError,ValueError):
+        return numpy.array([_evaluatePotentials(pot,tR,tz)
+                            for tR,tz in zip(R,z)],dtype='float')
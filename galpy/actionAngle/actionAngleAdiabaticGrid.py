@@ -8,22 +8,28 @@
 #
 #      methods:
 #             __call__: returns (jr,lz,jz)
+#             save: save the grids to a file
+#             load: load an instance from a file written by save
 #
 ###############################################################################
 from __future__ import print_function
+import pickle
 import numpy
 from scipy import interpolate
 from .actionAngleAdiabatic import actionAngleAdiabatic
-from .actionAngle import actionAngle, UnboundError
+from .actionAngleAdiabatic_c import _ext_loaded as ext_loaded
+from .actionAngle import actionAngle
 from .. import potential
 from ..potential.Potential import _evaluatePotentials
 from ..potential.Potential import flatten as flatten_potential
-from ..util import multi
+from ..potential.Potential import _check_c
+from ..util import multi, save_pickles
+from ..util.cache import cached_setup
 _PRINTOUTSIDEGRID= False
 class actionAngleAdiabaticGrid(actionAngle):
     """Action-angle formalism for axisymmetric potentials using the adiabatic approximation, grid-based interpolation"""
     def __init__(self,pot=None,zmax=1.,gamma=1.,Rmax=5.,
-                 nR=16,nEz=16,nEr=31,nLz=31,numcores=1,
+                 nR=16,nEz=16,nEr=31,nLz=31,numcores=1,cache=None,
                  **kwargs):
         """
         NAME:
@@ -44,7 +50,9 @@ class actionAngleAdiabaticGrid(actionAngle):
 
            numcores= number of cpus to use to parallellize
 
-           c= if True, use C to calculate actions
+           cache= (None) if True, save the grids to the persistent cache (see galpy.util.cache) and load them from there when the same actionAngleAdiabaticGrid is set up again; can also be set to the directory to use for the cache
+
+           c= (False) if True, use C to calculate actions (both grids are then computed in a single OpenMP-parallel call)
 
            ro= distance from vantage point to GC (kpc; can be Quantity)
 
@@ -60,67 +68,53 @@ class actionAngleAdiabaticGrid(actionAngle):
 
             2012-07-27 - Written - Bovy (IAS@MPIA)
 
+            2026-10-19 - Added cache= - agent
+
+            2026-10-19 - Build the grids with a single call and added save/load - agent
+
         """
         actionAngle.__init__(self,
                              ro=kwargs.get('ro',None),vo=kwargs.get('vo',None))
         if pot is None: #pragma: no cover
             raise IOError("Must specify pot= for actionAngleAxi")
-        self._c= kwargs.pop('c',False)
         self._gamma= gamma
         self._pot= flatten_potential(pot)
+        if ext_loaded and kwargs.pop('c',False):
+            self._c= _check_c(self._pot)
+        else:
+            kwargs.pop('c',None)
+            self._c= False
         self._zmax= zmax
         self._Rmax= Rmax
         self._Rmin= 0.01
         #Set up the actionAngleAdiabatic object that we will use to interpolate
         self._aA= actionAngleAdiabatic(pot=self._pot,gamma=self._gamma,
                                        c=self._c)
+        #Build the grids or load them from the cache
+        cached_setup(self,lambda: self._setup_grids(nR,nEz,nEr,nLz,numcores,
+                                                    **kwargs),
+                     cache,nR,nEz,nEr,nLz,self._c,
+                     sorted((k,v) for k,v in kwargs.items()
+                            if not k in ['ro','vo']))
+        # Check the units
+        self._check_consistent_units()
+        return None
+
+    def _setup_grids(self,nR,nEz,nEr,nLz,numcores,**kwargs):
+        """Build the Jz and JR grids and their interpolations"""
         #Build grid for Ez, first calculate Ez(zmax;R) function
         self._Rs= numpy.linspace(self._Rmin,self._Rmax,nR)
         self._EzZmaxs= _evaluatePotentials(self._pot,self._Rs,
                                            self._zmax*numpy.ones(nR))\
                                            -_evaluatePotentials(self._pot,self._Rs,numpy.zeros(nR))
         self._EzZmaxsInterp= interpolate.InterpolatedUnivariateSpline(self._Rs,numpy.log(self._EzZmaxs),k=3)
-        y= numpy.linspace(0.,1.,nEz)
-        jz= numpy.zeros((nR,nEz))
-        jzEzzmax= numpy.zeros(nR)
+        yz= numpy.linspace(0.,1.,nEz)
         thisRs= (numpy.tile(self._Rs,(nEz,1)).T).flatten()
         thisEzZmaxs= (numpy.tile(self._EzZmaxs,(nEz,1)).T).flatten()
-        thisy= (numpy.tile(y,(nR,1))).flatten()
-        if self._c:
-            jz= self._aA(thisRs,
-                         numpy.zeros(len(thisRs)),
-                         numpy.ones(len(thisRs)),#these two r dummies
-                         numpy.zeros(len(thisRs)),
-                         numpy.sqrt(2.*thisy*thisEzZmaxs),
-                         **kwargs)[2]
-            jz= numpy.reshape(jz,(nR,nEz))
-            jzEzzmax[0:nR]= jz[:,nEz-1]
-        else:
-            if numcores > 1:
-                jz= multi.parallel_map((lambda x: self._aA(thisRs[x],0.,1.,#these two r dummies
-                                                              0.,numpy.sqrt(2.*thisy[x]*thisEzZmaxs[x]),
-                                                           _justjz=True,
-                                                           **kwargs)[2]),
-                                       range(nR*nEz),numcores=numcores)
-                jz= numpy.reshape(jz,(nR,nEz))
-                jzEzzmax[0:nR]= jz[:,nEz-1]
-            else:
-                for ii in range(nR):
-                    for jj in range(nEz):
-                        #Calculate Jz
-                        jz[ii,jj]= self._aA(self._Rs[ii],0.,1.,#these two r dummies
-                                            0.,numpy.sqrt(2.*y[jj]*self._EzZmaxs[ii]),
-                                            _justjz=True,**kwargs)[2]
-                        if jj == nEz-1: 
-                            jzEzzmax[ii]= jz[ii,jj]
-        for ii in range(nR): jz[ii,:]/= jzEzzmax[ii]
-        #First interpolate Ez=Ezmax
-        self._jzEzmaxInterp= interpolate.InterpolatedUnivariateSpline(self._Rs,numpy.log(jzEzzmax+10.**-5.),k=3)
-        self._jz= jz
-        self._jzInterp= interpolate.RectBivariateSpline(self._Rs,
-                                                        y,
-                                                        jz,
-                                                        kx=3,ky=3,s=0.)
+        thisy= (numpy.tile(yz,(nR,1))).flatten()
+        # Grid points for Jz: in the plane with vz set by Ez
+        zR= thisRs
+        zvz= numpy.sqrt(2.*thisy*thisEzZmaxs)
         #JR grid
         self._Lzmin= 0.01
         self._Lzs= numpy.linspace(self._Lzmin,
@@ -129,7 +123,7 @@ class actionAngleAdiabaticGrid(actionAngle):
                                   nLz)
         self._Lzmax= self._Lzs[-1]
         #Calculate ER(vr=0,R=RL)
-        self._RL= numpy.array([potential.rl(self._pot,l) for l in self._Lzs])
+        self._RL= potential.rl(self._pot,self._Lzs)
         self._RLInterp= interpolate.InterpolatedUnivariateSpline(self._Lzs,
                                                                  self._RL,k=3)
         self._ERRL= _evaluatePotentials(self._pot,self._RL,numpy.zeros(nLz)) +self._Lzs**2./2./self._RL**2.
@@ -141,62 +135,133 @@ class actionAngleAdiabaticGrid(actionAngle):
         self._ERRamax= numpy.amax(self._ERRa)+1.
         self._ERRaInterp= interpolate.InterpolatedUnivariateSpline(self._Lzs,
                                                                    numpy.log(-(self._ERRa-self._ERRamax)),k=3)
-        y= numpy.linspace(0.,1.,nEr)
-        jr= numpy.zeros((nLz,nEr))
-        jrERRa= numpy.zeros(nLz)
+        yr= numpy.linspace(0.,1.,nEr)
         thisRL= (numpy.tile(self._RL,(nEr-1,1)).T).flatten()
         thisLzs= (numpy.tile(self._Lzs,(nEr-1,1)).T).flatten()
         thisERRL= (numpy.tile(self._ERRL,(nEr-1,1)).T).flatten()
         thisERRa= (numpy.tile(self._ERRa,(nEr-1,1)).T).flatten()
-        thisy= (numpy.tile(y[0:-1],(nLz,1))).flatten()
-        if self._c:
-            mjr= self._aA(thisRL,
-                          numpy.sqrt(2.*(thisERRa+thisy*(thisERRL-thisERRa)-_evaluatePotentials(self._pot,thisRL,numpy.zeros((nEr-1)*nLz)))-thisLzs**2./thisRL**2.),
-                          thisLzs/thisRL,
-                          numpy.zeros(len(thisRL)),
-                          numpy.zeros(len(thisRL)),
-                          **kwargs)[0]
-            jr[:,0:-1]= numpy.reshape(mjr,(nLz,nEr-1))
-            jrERRa[0:nLz]= jr[:,0]
-        else:
-            if numcores > 1:
-                mjr= multi.parallel_map((lambda x: self._aA(thisRL[x],
-                                                          numpy.sqrt(2.*(thisERRa[x]+thisy[x]*(thisERRL[x]-thisERRa[x])-_evaluatePotentials(self._pot,thisRL[x],0.))-thisLzs[x]**2./thisRL[x]**2.),
-                                                               thisLzs[x]/thisRL[x],
-                                                               0.,0.,
-                                                            _justjr=True,
-                                                            **kwargs)[0]),
-                                        range((nEr-1)*nLz),
-                                        numcores=numcores)
-                jr[:,0:-1]= numpy.reshape(mjr,(nLz,nEr-1))
-                jrERRa[0:nLz]= jr[:,0]
-            else:
-                for ii in range(nLz):
-                    for jj in range(nEr-1): #Last one is zero by construction
-                        try:
-                            jr[ii,jj]= self._aA(self._RL[ii],
-                                                numpy.sqrt(2.*(self._ERRa[ii]+y[jj]*(self._ERRL[ii]-self._ERRa[ii])-_evaluatePotentials(self._pot,self._RL[ii],0.))-self._Lzs[ii]**2./self._RL[ii]**2.),
-                                                self._Lzs[ii]/self._RL[ii],
-                                                0.,0.,
-                                                _justjr=True,
-                                                   **kwargs)[0]
-                        except UnboundError: #pragma: no cover
-                            raise
-                        if jj == 0: 
-                            jrERRa[ii]= jr[ii,jj]
+        thisy= (numpy.tile(yr[0:-1],(nLz,1))).flatten()
+        # Grid points for JR: in the plane at the guiding-center radius, 
+        # the last one for each Lz is a circular orbit with JR=0
+        rR= thisRL
+        rvR= numpy.sqrt(2.*(thisERRa+thisy*(thisERRL-thisERRa)
+                            -_evaluatePotentials(self._pot,thisRL,
+                                                 numpy.zeros((nEr-1)*nLz)))
+                        -thisLzs**2./thisRL**2.)
+        rvT= thisLzs/thisRL
+        #Compute both grids at once
+        mjz, mjr= self._grid_actions(zR,zvz,rR,rvR,rvT,numcores,**kwargs)
+        jz= numpy.reshape(mjz,(nR,nEz))
+        jzEzzmax= jz[:,nEz-1].copy()
+        for ii in range(nR): jz[ii,:]/= jzEzzmax[ii]
+        #First interpolate Ez=Ezmax
+        self._jzEzmaxInterp= interpolate.InterpolatedUnivariateSpline(self._Rs,numpy.log(jzEzzmax+10.**-5.),k=3)
+        self._jz= jz
+        self._jzInterp= interpolate.RectBivariateSpline(self._Rs,
+                                                        yz,
+                                                        jz,
+                                                        kx=3,ky=3,s=0.)
+        jr= numpy.zeros((nLz,nEr))
+        jr[:,0:-1]= numpy.reshape(mjr,(nLz,nEr-1))
+        jrERRa= jr[:,0].copy()
         for ii in range(nLz): jr[ii,:]/= jrERRa[ii]
         #First interpolate Ez=Ezmax
         self._jr= jr
         self._jrERRaInterp= interpolate.InterpolatedUnivariateSpline(self._Lzs,
                                                                      numpy.log(jrERRa+10.**-5.),k=3)
         self._jrInterp= interpolate.RectBivariateSpline(self._Lzs,
-                                                        y,
+                                                        yr,
                                                         jr,
                                                         kx=3,ky=3,s=0.)
-        # Check the units
-        self._check_consistent_units()
         return None
 
+    def _grid_actions(self,zR,zvz,rR,rvR,rvT,numcores,**kwargs):
+        """Compute Jz for the in-plane points (zR,vz=zvz) and JR for the in-plane points (rR,rvR,rvT); using C, this is done in a single OpenMP-parallel call, otherwise using the vectorized Python code in parallel over numcores"""
+        nz= len(zR)
+        if self._c:
+            # Dummy in-plane velocities for the Jz points, 
+            # which have JR computed as well
+            jr, _, jz= self._aA(numpy.hstack((zR,rR)),
+                                numpy.hstack((numpy.zeros(nz),rvR)),
+                                numpy.hstack((numpy.ones(nz),rvT)),
+                                numpy.zeros(nz+len(rR)),
+                                numpy.hstack((zvz,numpy.zeros(len(rR)))),
+                                **kwargs)
+            jz, jr= jz[:nz], jr[nz:]
+            # The C code fails (returning 9999.99) for apocenters beyond
+            # its root-finding bracket, compute these in python
+            indx= jr > 9999.
+            if numpy.any(indx):
+                jr[indx]= actionAngleAdiabatic(pot=self._pot,
+                                               gamma=self._gamma)(\
+                    rR[indx],rvR[indx],rvT[indx],numpy.zeros(numpy.sum(indx)),
+                    numpy.zeros(numpy.sum(indx)),_justjr=True,**kwargs)[0]
+            return (jz,jr)
+        # Each core computes an equal-sized (padded) chunk of both grids
+        nr= len(rR)
+        mz= -(-nz//numcores)
+        mr= -(-nr//numcores)
+        def compute_chunk(indx):
+            out= numpy.zeros(mz+mr)
+            zchunk= slice(indx*mz,min((indx+1)*mz,nz))
+            thisnz= zchunk.stop-zchunk.start
+            if thisnz > 0:
+                out[:thisnz]= self._aA(zR[zchunk],numpy.zeros(thisnz),
+                                       numpy.ones(thisnz),#these two r dummies
+                                       numpy.zeros(thisnz),zvz[zchunk],
+                                       _justjz=True,**kwargs)[2]
+            rchunk= slice(indx*mr,min((indx+1)*mr,nr))
+            thisnr= rchunk.stop-rchunk.start
+            if thisnr > 0:
+                out[mz:mz+thisnr]= self._aA(rR[rchunk],rvR[rchunk],rvT[rchunk],
+                                            numpy.zeros(thisnr),
+                                            numpy.zeros(thisnr),
+                                            _justjr=True,**kwargs)[0]
+            return out
+        if numcores > 1:
+            out= numpy.array(list(multi.parallel_map(compute_chunk,
+                                                     range(numcores),
+                                                     numcores=numcores)))
+        else:
+            out= numpy.atleast_2d(compute_chunk(0))
+        return (out[:,:mz].flatten()[:nz],out[:,mz:].flatten()[:nr])
+
+    def save(self,filename):
+        """
+        NAME:
+           save
+        PURPOSE:
+           save the grids and their interpolations to a file, such that an identical actionAngleAdiabaticGrid can be loaded instantly with actionAngleAdiabaticGrid.load
+        INPUT:
+           filename - name of the file to save to
+        OUTPUT:
+           (none)
+        HISTORY:
+           2026-10-19 - Written - agent
+        """
+        save_pickles(filename,self.__dict__)
+        return None
+
+    @classmethod
+    def load(cls,filename):
+        """
+        NAME:
+           load
+        PURPOSE:
+           load an actionAngleAdiabaticGrid instance saved with save
+        INPUT:
+           filename - name of the file written by save
+        OUTPUT:
+           actionAngleAdiabaticGrid instance
+        HISTORY:
+           2026-10-19 - Written - agent
+        """
+        with open(filename,'rb') as savefile:
+            state= pickle.load(savefile)
+        out= cls.__new__(cls)
+        out.__dict__.update(state)
+        return out
+
     def _evaluate(self,*args,**kwargs):
         """
         NAME:
@@ -214,6 +279,7 @@ class actionAngleAdiabaticGrid(actionAngle):
            (jr,lz,jz)
         HISTORY:
            2012-07-27 - Written - Bovy (IAS@MPIA)
+           2026-10-19 - Evaluate all points off the grid in a single call - agent
         NOTE:
            For a Miyamoto-Nagai potential, this seems accurate to 0.1% and takes ~0.13 ms
            For a MWPotential, this takes ~ 0.17 ms
@@ -239,22 +305,15 @@ class actionAngleAdiabaticGrid(actionAngle):
         #Bigger than Ezzmax?
         thisEzZmax= numpy.exp(self._EzZmaxsInterp(R))
         if isinstance(R,numpy.ndarray):
-            indx= (R > self._Rmax)
-            indx+= (R < self._Rmin)
-            indx+= (Ez != 0.)*(numpy.log(Ez) > thisEzZmax)
-            indxc= True^indx
-            jz= numpy.empty(R.shape)
+            indxz= (R > self._Rmax)
+            indxz+= (R < self._Rmin)
+            indxz+= (Ez != 0.)*(numpy.log(Ez) > thisEzZmax)
+            indxc= True^indxz
+            # Points off the Ez grid are evaluated directly below
+            jz= numpy.zeros(R.shape)
             if numpy.sum(indxc) > 0:
                 jz[indxc]= (self._jzInterp.ev(R[indxc],Ez[indxc]/thisEzZmax[indxc])\
                                 *(numpy.exp(self._jzEzmaxInterp(R[indxc]))-10.**-5.))
-            if numpy.sum(indx) > 0:
-                jz[indx]= self._aA(R[indx],
-                                   numpy.zeros(numpy.sum(indx)),
-                                   numpy.ones(numpy.sum(indx)),#these two r dummies
-                                   numpy.zeros(numpy.sum(indx)),
-                                   numpy.sqrt(2.*Ez[indx]),
-                                   _justjz=True,
-                                   **kwargs)[2]
         else:
             if R > self._Rmax or R < self._Rmin or (Ez != 0 and numpy.log(Ez) > thisEzZmax): #Outside of the grid
                 if _PRINTOUTSIDEGRID: #pragma: no cover
@@ -283,6 +342,7 @@ class actionAngleAdiabaticGrid(actionAngle):
             indx+= (ERLz > self._Lzmax)
             indx+= ((ER-thisERRa)/(thisERRL-thisERRa) > 1.)
             indx+= ((ER-thisERRa)/(thisERRL-thisERRa) < 0.)
+            indx+= indxz
             indxc= True^indx
             jr= numpy.empty(R.shape)
             if numpy.sum(indxc) > 0:
@@ -290,13 +350,9 @@ class actionAngleAdiabaticGrid(actionAngle):
                                               (ER[indxc]-thisERRa[indxc])/(thisERRL[indxc]-thisERRa[indxc]))\
                                 *(numpy.exp(self._jrERRaInterp(ERLz[indxc]))-10.**-5.))
             if numpy.sum(indx) > 0:
-                jr[indx]= self._aA(thisRL[indx],
-                                   numpy.sqrt(2.*(ER[indx]-_evaluatePotentials(self._pot,thisRL[indx],0.))-ERLz[indx]**2./thisRL[indx]**2.),
-                                   ERLz[indx]/thisRL[indx],
-                                   numpy.zeros(len(thisRL)),
-                                   numpy.zeros(len(thisRL)),
-                                   _justjr=True,
-                                   **kwargs)[0]                
+                # All points off either grid in a single direct call
+                jr[indx], _, jz[indx]= self._aA(R[indx],vR[indx],vT[indx],
+                                                z[indx],vz[indx],**kwargs)
         else:
             if (ER-thisERRa)/(thisERRL-thisERRa) > 1. \
                     and ((ER-thisERRa)/(thisERRL-thisERRa)-1.) < 10.**-2.:
@@ -15,12 +15,10 @@
 ###############################################################################
 import numpy
 from scipy import optimize, integrate
-from .actionAngle import UnboundError
+from .actionAngle import UnboundError, _fixed_quad_vec
 from .actionAngleVertical import actionAngleVertical
 from ..potential.planarPotential import _evaluateplanarPotentials
-from ..potential.Potential import epifreq
-from ..potential import vcirc
-_EPS= 10.**-15.
+from ..potential.Potential import epifreq, _illinois
 class actionAngleAxi(actionAngleVertical):
     """Action-angle formalism for axisymmetric potentials"""
     def __init__(self,*args,**kwargs):
@@ -276,10 +274,15 @@ class actionAngleAxi(actionAngleVertical):
             return self._rperirap
         EL= self.calcEL(**kwargs)
         E, L= EL
-        if self._vR == 0. and numpy.fabs(self._vT - vcirc(self._pot,self._R,use_physical=False)) < _EPS: #We are on a circular orbit
+        if self._vR == 0.:
+            # Use the effective potential, which includes gamma Jz in L, to
+            # determine whether we are at a turning point
+            fm= _rapRperiAxiEq(self._R*(1.-10.**-6.),E,L,self._pot)
+            fp= _rapRperiAxiEq(self._R*(1.+10.**-6.),E,L,self._pot)
+        if self._vR == 0. and fm <= 0. and fp <= 0.: #We are on a circular orbit
             rperi= self._R
             rap = self._R
-        elif self._vR == 0. and self._vT > vcirc(self._pot,self._R,use_physical=False): #We are exactly at pericenter
+        elif self._vR == 0. and fp > 0.: #We are exactly at pericenter
             rperi= self._R
             if self._gamma != 0.:
                 startsign= _rapRperiAxiEq(self._R+10.**-8.,E,L,self._pot)
@@ -290,7 +293,7 @@ class actionAngleAxi(actionAngleVertical):
             rap= optimize.brentq(_rapRperiAxiEq,rperi+0.00001,rend,
                                  args=(E,L,self._pot))
 #                                   fprime=_rapRperiAxiDeriv)
-        elif self._vR == 0. and self._vT < vcirc(self._pot,self._R,use_physical=False): #We are exactly at apocenter
+        elif self._vR == 0.: #We are exactly at apocenter
             rap= self._R
             if self._gamma != 0.:
                 startsign= _rapRperiAxiEq(self._R-10.**-8.,E,L,self._pot)
@@ -420,3 +423,101 @@ def _rapRperiAxiFindStart(R,E,L,pot,rap=False,startsign=1.):
     if rtry < 0.000000001: return 0.
     return rtry
 
+
+def _calcRapRperiAxi_vec(R,vR,E,L,potfunc):
+    """
+    NAME:
+       _calcRapRperiAxi_vec
+    PURPOSE:
+       calculate the peri- and apocenter radii for arrays of phase-space points at once
+    INPUT:
+       R - Galactocentric radius (/ro; array)
+       vR - radial part of the velocity (/vc; array)
+       E - energy (array)
+       L - angular momentum (array)
+       potfunc - function potfunc(R) that returns the (planar) potential at R (array with any shape)
+    OUTPUT:
+       (rperi,rap) (arrays)
+    HISTORY:
+       2026-10-19 - Written - agent
+    """
+    eq= lambda r,indx: E[indx]-potfunc(r)-L[indx]**2./2./r**2.
+    allindx= numpy.arange(len(R))
+    rperi= numpy.array(R,dtype='float')
+    rap= numpy.array(R,dtype='float')
+    # Deal with points at a turning point
+    fm= eq(R*(1.-10.**-6.),allindx)
+    fp= eq(R*(1.+10.**-6.),allindx)
+    circ= (vR == 0.)*(fm <= 0.)*(fp <= 0.)
+    atperi= (vR == 0.)*(True^circ)*(fp > 0.)
+    atapo= (vR == 0.)*(True^circ)*(True^atperi)
+    # Pericenter: bracket by halving
+    rhi= numpy.array(R,dtype='float')
+    rhi[atapo]*= 1.-10.**-6.
+    rlo= rhi/2.
+    indx= allindx[(True^circ)*(True^atperi)]
+    while len(indx) > 0:
+        indx= indx[(eq(rlo[indx],indx) > 0.)*(rlo[indx] > 0.000000001)]
+        rhi[indx]= rlo[indx]
+        rlo[indx]/= 2.
+    indx= allindx[(True^circ)*(True^atperi)*(rlo > 0.000000001)]
+    rperi[(True^circ)*(True^atperi)*(rlo <= 0.000000001)]= 0.
+    if len(indx) > 0:
+        rperi[indx]= _illinois(lambda x,tindx: eq(x,indx[tindx]),
+                               rlo[indx],rhi[indx])
+    # Apocenter: bracket by doubling
+    rlo= numpy.array(R,dtype='float')
+    rlo[atperi]*= 1.+10.**-6.
+    rhi= 2.*rlo
+    indx= allindx[(True^circ)*(True^atapo)]
+    while len(indx) > 0:
+        indx= indx[eq(rhi[indx],indx) > 0.]
+        if numpy.any(rhi[indx] > 100.): #pragma: no cover
+            raise UnboundError("Orbit seems to be unbound")
+        rlo[indx]= rhi[indx]
+        rhi[indx]*= 2.
+    indx= allindx[(True^circ)*(True^atapo)]
+    if len(indx) > 0:
+        rap[indx]= _illinois(lambda x,tindx: eq(x,indx[tindx]),
+                             rlo[indx],rhi[indx])
+    return (rperi,rap)
+
+def _JRAxi_vec(rperi,rap,E,L,potfunc,order=20):
+    """
+    NAME:
+       _JRAxi_vec
+    PURPOSE:
+       calculate the radial action for arrays of phase-space points at once
+    INPUT:
+       rperi, rap - peri- and apocenter radii (arrays; from _calcRapRperiAxi_vec)
+       E - energy (array)
+       L - angular momentum (array)
+       potfunc - function potfunc(R) that returns the (planar) potential at R (array with any shape)
+       order= (20) order of the Gauss-Legendre quadrature
+    OUTPUT:
+       JR (array)
+    HISTORY:
+       2026-10-19 - Written - agent
+    """
+    JR= numpy.zeros(len(rperi))
+    indx= numpy.arange(len(rperi))[rap > rperi]
+    if len(indx) == 0: return JR
+    tE= E[indx][:,None]
+    tL= L[indx][:,None]
+    integrand= lambda r: numpy.sqrt(numpy.fmax(2.*(tE-potfunc(r))-tL**2./r**2.,
+                                               0.))
+    # Split at the geometric mean radius (or at rap/2 for rperi=0) and use
+    # r= rperi+t^2 and r= rap-t^2 to remove the square-root singularities at
+    # the end points
+    Rmean= numpy.sqrt(rperi[indx]*rap[indx])
+    Rmean[rperi[indx] == 0.]= rap[indx][rperi[indx] == 0.]/2.
+    trperi= rperi[indx][:,None]
+    trap= rap[indx][:,None]
+    JR[indx]= (_fixed_quad_vec(lambda t: 2.*t*integrand(trperi+t**2.),
+                               numpy.zeros(len(indx)),
+                               numpy.sqrt(Rmean-rperi[indx]),order)
+               +_fixed_quad_vec(lambda t: 2.*t*integrand(trap-t**2.),
+                                numpy.zeros(len(indx)),
+                                numpy.sqrt(rap[indx]-Rmean),order))\
+                                /numpy.pi
+    return JR
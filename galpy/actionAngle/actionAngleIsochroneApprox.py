@@ -63,6 +63,8 @@ class actionAngleIsochroneApprox(actionAngle):
 
            maxn= (default: 3) Default value for all methods when using a grid in vec(n) up to this n (zero-based)
 
+           maxmem= (default: 1.) approximate maximum memory (in GB) to use for the orbits and fits of multiple objects given as arrays; objects are processed in chunks that fit in this memory (all objects in a chunk are integrated together)
+
            ro= distance from vantage point to GC (kpc; can be Quantity)
 
            vo= circular velocity at ro (km/s; can be Quantity)
@@ -110,6 +112,7 @@ class actionAngleIsochroneApprox(actionAngle):
         self._tsJ= numpy.linspace(0.,self._tintJ,self._ntintJ)
         self._integrate_method= kwargs.get('integrate_method','dopr54_c')
         self._maxn= kwargs.get('maxn',3)
+        self._maxmem= kwargs.get('maxmem',1.)
         self._c= False
         ext_loaded= False
         if ext_loaded and (('c' in kwargs and kwargs['c'])
@@ -139,7 +142,12 @@ class actionAngleIsochroneApprox(actionAngle):
            (jr,lz,jz)
         HISTORY:
            2013-09-10 - Written - Bovy (IAS)
+           2026-10-19 - Integrate all orbits together and process them in chunks - agent
         """
+        return self._chunked(self._actions_chunk,False,*args,**kwargs)
+
+    def _actions_chunk(self,*args,**kwargs):
+        """Compute the actions for a single chunk of objects"""
         R,vR,vT,z,vz,phi= self._parse_args(False,False,*args)
         if self._c: #pragma: no cover
             pass
@@ -223,7 +231,13 @@ class actionAngleIsochroneApprox(actionAngle):
             (jr,lz,jz,Omegar,Omegaphi,Omegaz,angler,anglephi,anglez)
         HISTORY:
            2013-09-10 - Written - Bovy (IAS)
+           2026-10-19 - Integrate all orbits together, vectorize the angle fit, and process the objects in chunks - agent
         """
+        return self._chunked(self._actionsFreqsAngles_chunk,True,
+                             *args,**kwargs)
+
+    def _actionsFreqsAngles_chunk(self,*args,**kwargs):
+        """Compute the actions, frequencies, and angles for a single chunk of objects"""
         from ..orbit import Orbit
         _firstFlip= kwargs.get('_firstFlip',False)
         #If the orbit was already integrated, set ts to the integration times
@@ -299,7 +313,7 @@ class actionAngleIsochroneApprox(actionAngle):
                 nn= (2*maxn-1)**2*maxn-(maxn-1)*(2*maxn-1)-maxn
             else:
                 nn= maxn*(2*maxn-1)-maxn 
-            A= numpy.zeros((no,nt,2+nn))
+            A= numpy.empty((no,nt,2+nn))
             A[:,:,0]= 1.
             A[:,:,1]= ts
             #sorting the phi and Z grids this way makes it easy to exclude the origin
@@ -322,26 +336,19 @@ class actionAngleIsochroneApprox(actionAngle):
                 mask[:2*maxn-3:2]= False
             gridR= gridR[mask]
             gridZ= gridZ[mask]
-            tangleR= numpy.tile(angleRT.T,(nn,1,1)).T
-            tgridR= numpy.tile(gridR,(no,nt,1))
-            tangleZ= numpy.tile(angleZT.T,(nn,1,1)).T
-            tgridZ= numpy.tile(gridZ,(no,nt,1))
             if _isNonAxi(self._pot):
                 gridphi= gridphi[mask]
-                tgridphi= numpy.tile(gridphi,(no,nt,1))
-                tanglephi= numpy.tile(anglephiT.T,(nn,1,1)).T
-                sinnR= numpy.sin(tgridR*tangleR+tgridphi*tanglephi+tgridZ*tangleZ)
+                A[:,:,2:]= numpy.sin(angleRT[:,:,None]*gridR
+                                     +anglephiT[:,:,None]*gridphi
+                                     +angleZT[:,:,None]*gridZ)
             else:
-                sinnR= numpy.sin(tgridR*tangleR+tgridZ*tangleZ)
-            A[:,:,2:]= sinnR
-            #Matrix magic
-            atainv= numpy.empty((no,2+nn,2+nn))
-            AT= numpy.transpose(A,axes=(0,2,1))
-            for ii in range(no):
-                atainv[ii,:,:,]= linalg.inv(numpy.dot(AT[ii,:,:],A[ii,:,:]))
-            ATAR= numpy.sum(AT*numpy.transpose(numpy.tile(angleRT,(2+nn,1,1)),axes=(1,0,2)),axis=2)
-            ATAT= numpy.sum(AT*numpy.transpose(numpy.tile(anglephiT,(2+nn,1,1)),axes=(1,0,2)),axis=2)
-            ATAZ= numpy.sum(AT*numpy.transpose(numpy.tile(angleZT,(2+nn,1,1)),axes=(1,0,2)),axis=2)
+                A[:,:,2:]= numpy.sin(angleRT[:,:,None]*gridR
+                                     +angleZT[:,:,None]*gridZ)
+            #Matrix magic, for all objects at once
+            atainv= linalg.inv(numpy.einsum('ijk,ijl->ikl',A,A))
+            ATAR= numpy.einsum('ijk,ij->ik',A,angleRT)
+            ATAT= numpy.einsum('ijk,ij->ik',A,anglephiT)
+            ATAZ= numpy.einsum('ijk,ij->ik',A,angleZT)
             angleR= numpy.sum(atainv[:,0,:]*ATAR,axis=1)
             OmegaR= numpy.sum(atainv[:,1,:]*ATAR,axis=1)
             anglephi= numpy.sum(atainv[:,0,:]*ATAT,axis=1)
@@ -585,12 +592,12 @@ class actionAngleIsochroneApprox(actionAngle):
             else:
                 R,vR,vT, phi= args
                 z, vz= 0., 0.
-            if isinstance(R,float):
-                os= [Orbit([R,vR,vT,z,vz,phi])]
-                RasOrbit= True
-                integrated= False
-            elif len(R.shape) == 1: #not integrated yet
-                os= [Orbit([R[ii],vR[ii],vT[ii],z[ii],vz[ii],phi[ii]]) for ii in range(R.shape[0])]
+            if isinstance(R,float) or len(R.shape) == 1: #not integrated yet
+                # Set up all objects as a single Orbit instance, such that 
+                # they are integrated together
+                vxvv= numpy.array(numpy.broadcast_arrays(\
+                        *[numpy.atleast_1d(x) for x in (R,vR,vT,z,vz,phi)])).T
+                os= [Orbit(vxvv)]
                 RasOrbit= True
                 integrated= False
         if isinstance(args[0],Orbit) \
@@ -625,25 +632,7 @@ class actionAngleIsochroneApprox(actionAngle):
                         o.orbit[...,2]= -o.orbit[...,2]
                         o.orbit[...,4]= -o.orbit[...,4]
                 integrated= False
-            ntJ= os[0].getOrbit().shape[0]
-            no= len(os)
-            R= numpy.empty((no,ntJ))
-            vR= numpy.empty((no,ntJ))
-            vT= numpy.empty((no,ntJ))
-            z= numpy.zeros((no,ntJ))+10.**-7. #To avoid numpy warnings for
-            vz= numpy.zeros((no,ntJ))+10.**-7. #planarOrbits
-            phi= numpy.empty((no,ntJ))
-            for ii in range(len(os)):
-                this_orbit= os[ii].getOrbit()
-                R[ii,:]= this_orbit[:,0]
-                vR[ii,:]= this_orbit[:,1]
-                vT[ii,:]= this_orbit[:,2]
-                if this_orbit.shape[1] == 6:
-                    z[ii,:]= this_orbit[:,3]
-                    vz[ii,:]= this_orbit[:,4]
-                    phi[ii,:]= this_orbit[:,5]
-                else:
-                    phi[ii,:]= this_orbit[:,3]
+            R,vR,vT,z,vz,phi= _extract_orbits(os)
         if freqsAngles and not integrated: #also integrate backwards in time, such that the requested point is not at the edge
             no= R.shape[0]
             nt= R.shape[1]
@@ -667,39 +656,64 @@ class actionAngleIsochroneApprox(actionAngle):
                 oz[:,nt-1:]= z
                 ovz[:,nt-1:]= vz
                 ophi[:,nt-1:]= phi
-            #load orbits
+            #load orbits, all objects together
             if _firstFlip:
-                os= [Orbit([R[ii,0],vR[ii,0],vT[ii,0],z[ii,0],vz[ii,0],phi[ii,0]]) for ii in range(R.shape[0])]
+                os= Orbit(numpy.array([R[:,0],vR[:,0],vT[:,0],
+                                       z[:,0],vz[:,0],phi[:,0]]).T)
             else:
-                os= [Orbit([R[ii,0],-vR[ii,0],-vT[ii,0],z[ii,0],-vz[ii,0],phi[ii,0]]) for ii in range(R.shape[0])]
+                os= Orbit(numpy.array([R[:,0],-vR[:,0],-vT[:,0],
+                                       z[:,0],-vz[:,0],phi[:,0]]).T)
             #integrate orbits
-            [o.integrate(self._tsJ,pot=self._pot,
+            os.integrate(self._tsJ,pot=self._pot,
                          method=self._integrate_method,
-                         dt=self._integrate_dt) for o in os]
+                         dt=self._integrate_dt)
             #extract phase-space points along the orbit
-            ts= self._tsJ
+            tR,tvR,tvT,tz,tvz,tphi= _extract_orbits([os])
             if _firstFlip:
-                for ii in range(no):
-                    oR[ii,nt:]= os[ii].R(ts[1:]) #drop t=0, which we have
-                    ovR[ii,nt:]= os[ii].vR(ts[1:]) #already
-                    ovT[ii,nt:]= os[ii].vT(ts[1:]) # reverse, such that 
-                    if os[ii].getOrbit().shape[1] == 6:
-                        oz[ii,nt:]= os[ii].z(ts[1:]) #everything is in the 
-                        ovz[ii,nt:]= os[ii].vz(ts[1:]) #right order
-                    ophi[ii,nt:]= os[ii].phi(ts[1:]) #!
+                oR[:,nt:]= tR[:,1:] #drop t=0, which we have
+                ovR[:,nt:]= tvR[:,1:] #already
+                ovT[:,nt:]= tvT[:,1:] # reverse, such that 
+                oz[:,nt:]= tz[:,1:] #everything is in the 
+                ovz[:,nt:]= tvz[:,1:] #right order
+                ophi[:,nt:]= tphi[:,1:] #!
             else:
-                for ii in range(no):
-                    oR[ii,:nt-1]= os[ii].R(ts[1:])[::-1] #drop t=0, which we have
-                    ovR[ii,:nt-1]= -os[ii].vR(ts[1:])[::-1] #already
-                    ovT[ii,:nt-1]= -os[ii].vT(ts[1:])[::-1] # reverse, such that 
-                    if os[ii].getOrbit().shape[1] == 6:
-                        oz[ii,:nt-1]= os[ii].z(ts[1:])[::-1] #everything is in the 
-                        ovz[ii,:nt-1]= -os[ii].vz(ts[1:])[::-1] #right order
-                    ophi[ii,:nt-1]= os[ii].phi(ts[1:])[::-1] #!
+                oR[:,:nt-1]= tR[:,1:][:,::-1] #drop t=0, which we have
+                ovR[:,:nt-1]= -tvR[:,1:][:,::-1] #already
+                ovT[:,:nt-1]= -tvT[:,1:][:,::-1] # reverse, such that 
+                oz[:,:nt-1]= tz[:,1:][:,::-1] #everything is in the 
+                ovz[:,:nt-1]= -tvz[:,1:][:,::-1] #right order
+                ophi[:,:nt-1]= tphi[:,1:][:,::-1] #!
             return (oR,ovR,ovT,oz,ovz,ophi)
         else:
             return (R,vR,vT,z,vz,phi)
 
+    def _chunked(self,func,freqsAngles,*args,**kwargs):
+        """Helper function to apply func to chunks of stars given as arrays, such that the orbit samples of all stars do not have to be stored at once"""
+        if not (len(args) == 6 or len(args) == 4) \
+                or not isinstance(args[0],numpy.ndarray) \
+                or len(args[0].shape) != 1 \
+                or '_acfs' in kwargs or kwargs.get('_retacfs',False):
+            return func(*args,**kwargs)
+        # Approximate memory per star: phase-space samples, isochrone
+        # actions/angles/frequencies, and (for the angle fit) the design
+        # matrix with (2*maxn-1)**2*maxn terms at most
+        if freqsAngles:
+            nt= 2*self._ntintJ-1
+            nn= (2*kwargs.get('maxn',self._maxn)-1)**2\
+                *kwargs.get('maxn',self._maxn)
+        else:
+            nt= self._ntintJ
+            nn= 0
+        nchunk= int(numpy.amax([1,self._maxmem*1024.**3./(8.*nt*(30+2*nn))]))
+        nobj= args[0].shape[0]
+        if nobj <= nchunk:
+            return func(*args,**kwargs)
+        out= [func(*[numpy.broadcast_to(arg,args[0].shape)[ii:ii+nchunk]
+                     for arg in args],**kwargs)
+              for ii in range(0,nobj,nchunk)]
+        return tuple([numpy.concatenate([o[jj] for o in out],axis=0)
+                      for jj in range(len(out[0]))])
+
 @potential_physical_input
 @physical_conversion('position',pop=True)
 def estimateBIsochrone(pot,R,z,phi=None):
@@ -756,6 +770,25 @@ def estimateBIsochrone(pot,R,z,phi=None):
             b= numpy.nan
         return b
 
+def _extract_orbits(os):
+    """Extract the phase-space samples of a list of integrated (possibly multi-object) Orbit instances as [nobj,nt] arrays"""
+    orbits= [numpy.reshape(o.getOrbit(),(o.size,)+o.getOrbit().shape[-2:])
+             for o in os]
+    this_orbit= numpy.concatenate(orbits,axis=0)
+    no, ntJ= this_orbit.shape[:2]
+    R= this_orbit[:,:,0]
+    vR= this_orbit[:,:,1]
+    vT= this_orbit[:,:,2]
+    z= numpy.zeros((no,ntJ))+10.**-7. #To avoid numpy warnings for
+    vz= numpy.zeros((no,ntJ))+10.**-7. #planarOrbits
+    if this_orbit.shape[2] == 6:
+        z= this_orbit[:,:,3]
+        vz= this_orbit[:,:,4]
+        phi= this_orbit[:,:,5]
+    else:
+        phi= this_orbit[:,:,3]
+    return (R,vR,vT,z,vz,phi)
+
 def dePeriod(arr):
     """make an array of periodic angles increase linearly"""
     diff= arr-numpy.roll(arr,1,axis=1)
@@ -8,7 +8,6 @@
 #
 ###############################################################################
 import numpy
-from scipy import optimize
 from galpy.potential import IsochronePotential
 from .actionAngleInverse import actionAngleInverse
 _APY_LOADED= True
@@ -153,6 +152,8 @@ class actionAngleIsochroneInverse(actionAngleInverse):
 
            2017-11-15 - Written - Bovy (UofT)
 
+           2026-10-19 - Solve for eta for all angles at once - agent
+
         """
         L= jz+numpy.fabs(jphi) # total angular momentum
         L2= L**2.
@@ -169,17 +170,7 @@ class actionAngleIsochroneInverse(actionAngleInverse):
         angler= (numpy.atleast_1d(angler) % (-2.*numpy.pi)) % (2.*numpy.pi)
         anglephi= numpy.atleast_1d(anglephi)
         anglez= numpy.atleast_1d(anglez)
-        eta= numpy.empty(len(angler))
-        for ii,ar in enumerate(angler):
-            try:
-                eta[ii]= optimize.newton(lambda x: x-a*e/ab*numpy.sin(x)-ar,
-                                         0.,
-                                         lambda x: 1-a*e/ab*numpy.cos(x))
-            except RuntimeError:
-                # Newton-Raphson did not converge, this has to work, 
-                # bc 0 <= ra < 2pi the following start x have different signs
-                eta[ii]= optimize.brentq(lambda x: x-a*e/ab*numpy.sin(x)-ar,
-                                         0.,2.*numpy.pi)
+        eta= _solve_eta(angler,a*e/ab)
         coseta= numpy.cos(eta)
         r= a*numpy.sqrt((1.-e*coseta)*(1.-e*coseta+2.*self.b/a))
         vr= numpy.sqrt(self.amp/ab)*a*e*numpy.sin(eta)/r
@@ -245,3 +236,23 @@ class actionAngleIsochroneInverse(actionAngleInverse):
         omegaz= (1.+L/sqrtfourbkL2)/2.*omegar
         return (omegar,numpy.sign(jphi)*omegaz,omegaz)
 
+
+def _solve_eta(angler,ecc,tol=1e-12,maxiter=100):
+    """Solve the Kepler-like equation eta-ecc*sin(eta) = angler for all angler 
+    (0 <= angler < 2pi) at once using Newton-Raphson, safeguarded by bisection 
+    on the bracket [0,2pi] (ecc < 1, so the function is monotonic)"""
+    lo= numpy.zeros_like(angler)
+    hi= numpy.full_like(angler,2.*numpy.pi)
+    eta= angler+ecc*numpy.sin(angler) # good starting point for small ecc
+    for ii in range(maxiter):
+        f= eta-ecc*numpy.sin(eta)-angler
+        todo= numpy.fabs(f) >= tol
+        if not numpy.any(todo): break
+        lo[todo*(f < 0.)]= eta[todo*(f < 0.)]
+        hi[todo*(f > 0.)]= eta[todo*(f > 0.)]
+        neta= eta[todo]-f[todo]/(1.-ecc*numpy.cos(eta[todo]))
+        # Bisect when the Newton step leaves the bracket
+        outside= (neta <= lo[todo])+(neta >= hi[todo])
+        neta[outside]= 0.5*(lo[todo][outside]+hi[todo][outside])
+        eta[todo]= neta
+    return eta
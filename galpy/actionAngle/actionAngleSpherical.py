@@ -10,13 +10,17 @@
 #
 ###############################################################################
 import copy
+import warnings
 import numpy
 from scipy import integrate
 from ..potential import epifreq, omegac, _dim
-from ..potential.Potential import _evaluatePotentials
+from ..potential.Potential import _evaluatePotentials, _check_c
 from ..potential.Potential import flatten as flatten_potential
+from ..util import galpyWarning
 from .actionAngle import actionAngle
 from .actionAngleAxi import actionAngleAxi, potentialAxi
+from . import actionAngleSpherical_c
+from .actionAngleSpherical_c import _ext_loaded as ext_loaded
 class actionAngleSpherical(actionAngle):
     """Action-angle formalism for spherical potentials"""
     def __init__(self,*args,**kwargs):
@@ -33,6 +37,10 @@ class actionAngleSpherical(actionAngle):
 
            pot= a Spherical potential
 
+           c= (False) if True, use C for calculations when the potential has a C implementation
+
+           order= (10) number of points to use in the Gauss-Legendre numerical integration of the relevant action, frequency, and angle integrals when using C
+
            ro= distance from vantage point to GC (kpc; can be Quantity)
 
            vo= circular velocity at ro (km/s; can be Quantity)
@@ -45,6 +53,8 @@ class actionAngleSpherical(actionAngle):
 
            2013-12-28 - Written - Bovy (IAS)
 
+           2026-10-19 - Added C implementation - agent
+
         """
         actionAngle.__init__(self,
                              ro=kwargs.get('ro',None),vo=kwargs.get('vo',None))
@@ -58,14 +68,14 @@ class actionAngleSpherical(actionAngle):
             self._2dpot= [p.toPlanar() for p in self._pot]
         else:
             self._2dpot= self._pot.toPlanar()
-        #The following for if we ever implement this code in C
-        self._c= False
-        ext_loaded= False
-        if ext_loaded and (('c' in kwargs and kwargs['c'])
-                           or not 'c' in kwargs):
-            self._c= True #pragma: no cover
+        if ext_loaded and 'c' in kwargs and kwargs['c']:
+            # C requires a 3D potential
+            self._c= _check_c(self._pot) and _dim(self._pot) == 3
+            if not self._c:
+                warnings.warn("C module not used because potential does not have a C implementation",galpyWarning) #pragma: no cover
         else:
             self._c= False
+        self._order= kwargs.get('order',10)
         # Check the units
         self._check_consistent_units()
         return None
@@ -82,14 +92,18 @@ class actionAngleSpherical(actionAngle):
                  1) floats: phase-space value for single object (phi is optional) (each can be a Quantity)
                  2) numpy.ndarray: [N] phase-space values for N objects (each can be a Quantity)
               b) Orbit instance: initial condition used if that's it, orbit(t) if there is a time given as well as the second argument
-           fixed_quad= (False) if True, use n=10 fixed_quad integration
-           scipy.integrate.quadrature or .fixed_quad keywords
+           c= (object-wide default, bool) True/False to override the object-wide setting for whether or not to use the C implementation
+           order= (object-wide default, int) number of points to use in the Gauss-Legendre numerical integration of the relevant integrals when using C
+           When not using C:
+              fixed_quad= (False) if True, use n=10 fixed_quad integration
+              scipy.integrate.quadrature or .fixed_quad keywords
         OUTPUT:
            (jr,lz,jz)
         HISTORY:
            2013-12-28 - Written - Bovy (IAS)
         """
         fixed_quad= kwargs.pop('fixed_quad',False)
+        order= kwargs.pop('order',self._order)
         if len(args) == 5: #R,vR.vT, z, vz
             R,vR,vT, z, vz= args
         elif len(args) == 6: #R,vR.vT, z, vz, phi
@@ -107,8 +121,15 @@ class actionAngleSpherical(actionAngle):
             vT= numpy.array([vT])
             z= numpy.array([z])
             vz= numpy.array([vz])
-        if self._c: #pragma: no cover
-            pass
+        if self._use_c(kwargs):
+            Lz= R*vT
+            L= numpy.sqrt(Lz**2.+(z*vT)**2.+(z*vR-R*vz)**2.)
+            jr, err= actionAngleSpherical_c.actionAngleSpherical_c(\
+                self._pot,R,vR,vT,z,vz,order=order)
+            if err == 0:
+                return (jr,Lz,L-numpy.fabs(Lz))
+            else: #pragma: no cover
+                raise RuntimeError("C-code for calculation actions failed; try with c=False")
         else:
             Lz= R*vT
             Lx= -z*vT
@@ -147,14 +168,18 @@ class actionAngleSpherical(actionAngle):
                  1) floats: phase-space value for single object (phi is optional) (each can be a Quantity)
                  2) numpy.ndarray: [N] phase-space values for N objects (each can be a Quantity)
               b) Orbit instance: initial condition used if that's it, orbit(t) if there is a time given as well as the second argument
-           fixed_quad= (False) if True, use n=10 fixed_quad integration
-           scipy.integrate.quadrature or .fixed_quad keywords
+           c= (object-wide default, bool) True/False to override the object-wide setting for whether or not to use the C implementation
+           order= (object-wide default, int) number of points to use in the Gauss-Legendre numerical integration of the relevant integrals when using C
+           When not using C:
+              fixed_quad= (False) if True, use n=10 fixed_quad integration
+              scipy.integrate.quadrature or .fixed_quad keywords
         OUTPUT:
             (jr,lz,jz,Omegar,Omegaphi,Omegaz)
         HISTORY:
            2013-12-28 - Written - Bovy (IAS)
         """
         fixed_quad= kwargs.pop('fixed_quad',False)
+        order= kwargs.pop('order',self._order)
         if len(args) == 5: #R,vR.vT, z, vz
             R,vR,vT, z, vz= args
         elif len(args) == 6: #R,vR.vT, z, vz, phi
@@ -172,8 +197,16 @@ class actionAngleSpherical(actionAngle):
             vT= numpy.array([vT])
             z= numpy.array([z])
             vz= numpy.array([vz])
-        if self._c: #pragma: no cover
-            pass
+        if self._use_c(kwargs):
+            Lz= R*vT
+            L= numpy.sqrt(Lz**2.+(z*vT)**2.+(z*vR-R*vz)**2.)
+            jr, Or, Op, Oz, err= \
+                actionAngleSpherical_c.actionAngleFreqSpherical_c(\
+                self._pot,R,vR,vT,z,vz,order=order)
+            if err == 0:
+                return (jr,Lz,L-numpy.fabs(Lz),Or,Op,Oz)
+            else: #pragma: no cover
+                raise RuntimeError("C-code for calculation actions failed; try with c=False")
         else:
             Lz= R*vT
             Lx= -z*vT
@@ -225,14 +258,18 @@ class actionAngleSpherical(actionAngle):
                  1) floats: phase-space value for single object (phi is optional) (each can be a Quantity)
                  2) numpy.ndarray: [N] phase-space values for N objects (each can be a Quantity)
               b) Orbit instance: initial condition used if that's it, orbit(t) if there is a time given as well as the second argument
-           fixed_quad= (False) if True, use n=10 fixed_quad integration
-           scipy.integrate.quadrature or .fixed_quad keywords
+           c= (object-wide default, bool) True/False to override the object-wide setting for whether or not to use the C implementation
+           order= (object-wide default, int) number of points to use in the Gauss-Legendre numerical integration of the relevant integrals when using C
+           When not using C:
+              fixed_quad= (False) if True, use n=10 fixed_quad integration
+              scipy.integrate.quadrature or .fixed_quad keywords
         OUTPUT:
             (jr,lz,jz,Omegar,Omegaphi,Omegaz,ar,aphi,az)
         HISTORY:
            2013-12-29 - Written - Bovy (IAS)
         """
         fixed_quad= kwargs.pop('fixed_quad',False)
+        order= kwargs.pop('order',self._order)
         if len(args) == 5: #R,vR.vT, z, vz pragma: no cover
             raise IOError("You need to provide phi when calculating angles")
         elif len(args) == 6: #R,vR.vT, z, vz, phi
@@ -252,8 +289,16 @@ class actionAngleSpherical(actionAngle):
             z= numpy.array([z])
             vz= numpy.array([vz])
             phi= numpy.array([phi])
-        if self._c: #pragma: no cover
-            pass
+        if self._use_c(kwargs):
+            Lz= R*vT
+            L= numpy.sqrt(Lz**2.+(z*vT)**2.+(z*vR-R*vz)**2.)
+            jr, Or, Op, Oz, ar, ap, az, err= \
+                actionAngleSpherical_c.actionAngleFreqAngleSpherical_c(\
+                self._pot,R,vR,vT,z,vz,phi,order=order)
+            if err == 0:
+                return (jr,Lz,L-numpy.fabs(Lz),Or,Op,Oz,ar,ap,az)
+            else: #pragma: no cover
+                raise RuntimeError("C-code for calculation actions failed; try with c=False")
         else:
             Lz= R*vT
             Lx= -z*vT
@@ -326,6 +371,7 @@ class actionAngleSpherical(actionAngle):
                  1) floats: phase-space value for single object (phi is optional) (each can be a Quantity)
                  2) numpy.ndarray: [N] phase-space values for N objects (each can be a Quantity)
               b) Orbit instance: initial condition used if that's it, orbit(t) if there is a time given as well as the second argument
+           c= (object-wide default, bool) True/False to override the object-wide setting for whether or not to use the C implementation
         OUTPUT:
            (e,zmax,rperi,rap)
         HISTORY:
@@ -348,8 +394,17 @@ class actionAngleSpherical(actionAngle):
             vT= numpy.array([vT])
             z= numpy.array([z])
             vz= numpy.array([vz])
-        if self._c: #pragma: no cover
-            pass
+        if self._use_c(kwargs):
+            Lz= R*vT
+            L2= Lz**2.+(z*vT)**2.+(z*vR-R*vz)**2.
+            rperi, rap, err= \
+                actionAngleSpherical_c.actionAngleRperiRapSpherical_c(\
+                self._pot,R,vR,vT,z,vz)
+            if err == 0:
+                return ((rap-rperi)/(rap+rperi),rap*numpy.sqrt(1.-Lz**2./L2),
+                        rperi,rap)
+            else: #pragma: no cover
+                raise RuntimeError("C-code for calculation actions failed; try with c=False")
         else:
             Lz= R*vT
             Lx= -z*vT
@@ -372,6 +427,17 @@ class actionAngleSpherical(actionAngle):
             return ((rap-rperi)/(rap+rperi),rap*numpy.sqrt(1.-Lz**2./L2),
                     rperi,rap)
 
+    def _use_c(self,kwargs):
+        """Determine whether to use C, removing the c= keyword from kwargs"""
+        c= kwargs.pop('c',None)
+        if ((self._c and not (not c is None and not c))\
+                or (ext_loaded and (not c is None and c))) \
+                and _check_c(self._pot) and _dim(self._pot) == 3:
+            return True
+        if not c is None and c and not self._c: #pragma: no cover
+            warnings.warn("C module not used because potential does not have a C implementation",galpyWarning)
+        return False
+
     def _calc_jr(self,rperi,rap,E,L,fixed_quad,**kwargs):
         if fixed_quad:
             return integrate.fixed_quad(_JrSphericalIntegrand,
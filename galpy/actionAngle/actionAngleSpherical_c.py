@@ -0,0 +1,311 @@
+import ctypes
+import ctypes.util
+import numpy
+from numpy.ctypeslib import ndpointer
+from ..util import _load_extension_libs
+
+_lib, _ext_loaded= _load_extension_libs.load_libgalpy()
+
+def actionAngleSpherical_c(pot,R,vR,vT,z,vz,order=10):
+    """
+    NAME:
+       actionAngleSpherical_c
+    PURPOSE:
+       Use C to calculate the radial action in a spherical potential
+    INPUT:
+       pot - Potential or list of such instances
+       R, vR, vT, z, vz - coordinates (arrays)
+       order= (10) order of Gauss-Legendre integration of the relevant integrals
+    OUTPUT:
+       (jr,err)
+       jr : array, shape (len(R))
+       err - non-zero if error occured
+    HISTORY:
+       2026-10-19 - Written - agent
+    """
+    #Parse the potential
+    from ..orbit.integrateFullOrbit import _parse_pot
+    npot, pot_type, pot_args= _parse_pot(pot,potforactions=True)
+
+    #Set up result arrays
+    jr= numpy.empty(len(R))
+    err= ctypes.c_int(0)
+
+    #Set up the C code
+    ndarrayFlags= ('C_CONTIGUOUS','WRITEABLE')
+    actionAngleSpherical_actionsFunc= _lib.actionAngleSpherical_actions
+    actionAngleSpherical_actionsFunc.argtypes= [ctypes.c_int,
+                               ndpointer(dtype=numpy.float64,flags=ndarrayFlags),
+                               ndpointer(dtype=numpy.float64,flags=ndarrayFlags),
+                               ndpointer(dtype=numpy.float64,flags=ndarrayFlags),
+                               ndpointer(dtype=numpy.float64,flags=ndarrayFlags),
+                               ndpointer(dtype=numpy.float64,flags=ndarrayFlags),
+                               ctypes.c_int,
+                               ndpointer(dtype=numpy.int32,flags=ndarrayFlags),
+                               ndpointer(dtype=numpy.float64,flags=ndarrayFlags),
+                               ctypes.c_int,
+                               ndpointer(dtype=numpy.float64,flags=ndarrayFlags),
+                               ctypes.POINTER(ctypes.c_int)]
+
+    #Array requirements
+    R= numpy.require(R,dtype=numpy.float64,requirements=['C','W'])
+    vR= numpy.require(vR,dtype=numpy.float64,requirements=['C','W'])
+    vT= numpy.require(vT,dtype=numpy.float64,requirements=['C','W'])
+    z= numpy.require(z,dtype=numpy.float64,requirements=['C','W'])
+    vz= numpy.require(vz,dtype=numpy.float64,requirements=['C','W'])
+    jr= numpy.require(jr,dtype=numpy.float64,requirements=['C','W'])
+
+    #Run the C code
+    actionAngleSpherical_actionsFunc(len(R),
+                                     R,
+                                     vR,
+                                     vT,
+                                     z,
+                                     vz,
+                                     ctypes.c_int(npot),
+                                     pot_type,
+                                     pot_args,
+                                     ctypes.c_int(order),
+                                     jr,
+                                     ctypes.byref(err))
+
+    return (jr,err.value)
+
+def actionAngleFreqSpherical_c(pot,R,vR,vT,z,vz,order=10):
+    """
+    NAME:
+       actionAngleFreqSpherical_c
+    PURPOSE:
+       Use C to calculate the radial action and the frequencies in a spherical potential
+    INPUT:
+       pot - Potential or list of such instances
+       R, vR, vT, z, vz - coordinates (arrays)
+       order= (10) order of Gauss-Legendre integration of the relevant integrals
+    OUTPUT:
+       (jr,Omegar,Omegaphi,Omegaz,err)
+       jr,Omegar,Omegaphi,Omegaz : array, shape (len(R))
+       err - non-zero if error occured
+    HISTORY:
+       2026-10-19 - Written - agent
+    """
+    #Parse the potential
+    from ..orbit.integrateFullOrbit import _parse_pot
+    npot, pot_type, pot_args= _parse_pot(pot,potforactions=True)
+
+    #Set up result arrays
+    jr= numpy.empty(len(R))
+    Omegar= numpy.empty(len(R))
+    Omegaphi= numpy.empty(len(R))
+    Omegaz= numpy.empty(len(R))
+    err= ctypes.c_int(0)
+
+    #Set up the C code
+    ndarrayFlags= ('C_CONTIGUOUS','WRITEABLE')
+    actionAngleSpherical_actionsFunc= _lib.actionAngleSpherical_actionsFreqs
+    actionAngleSpherical_actionsFunc.argtypes= [ctypes.c_int,
+                               ndpointer(dtype=numpy.float64,flags=ndarrayFlags),
+                               ndpointer(dtype=numpy.float64,flags=ndarrayFlags),
+                               ndpointer(dtype=numpy.float64,flags=ndarrayFlags),
+                               ndpointer(dtype=numpy.float64,flags=ndarrayFlags),
+                               ndpointer(dtype=numpy.float64,flags=ndarrayFlags),
+                               ctypes.c_int,
+                               ndpointer(dtype=numpy.int32,flags=ndarrayFlags),
+                               ndpointer(dtype=numpy.float64,flags=ndarrayFlags),
+                               ctypes.c_int,
+                               ndpointer(dtype=numpy.float64,flags=ndarrayFlags),
+                               ndpointer(dtype=numpy.float64,flags=ndarrayFlags),
+                               ndpointer(dtype=numpy.float64,flags=ndarrayFlags),
+                               ndpointer(dtype=numpy.float64,flags=ndarrayFlags),
+                               ctypes.POINTER(ctypes.c_int)]
+
+    #Array requirements
+    R= numpy.require(R,dtype=numpy.float64,requirements=['C','W'])
+    vR= numpy.require(vR,dtype=numpy.float64,requirements=['C','W'])
+    vT= numpy.require(vT,dtype=numpy.float64,requirements=['C','W'])
+    z= numpy.require(z,dtype=numpy.float64,requirements=['C','W'])
+    vz= numpy.require(vz,dtype=numpy.float64,requirements=['C','W'])
+    jr= numpy.require(jr,dtype=numpy.float64,requirements=['C','W'])
+    Omegar= numpy.require(Omegar,dtype=numpy.float64,requirements=['C','W'])
+    Omegaphi= numpy.require(Omegaphi,dtype=numpy.float64,
+                            requirements=['C','W'])
+    Omegaz= numpy.require(Omegaz,dtype=numpy.float64,requirements=['C','W'])
+
+    #Run the C code
+    actionAngleSpherical_actionsFunc(len(R),
+                                     R,
+                                     vR,
+                                     vT,
+                                     z,
+                                     vz,
+                                     ctypes.c_int(npot),
+                                     pot_type,
+                                     pot_args,
+                                     ctypes.c_int(order),
+                                     jr,
+                                     Omegar,
+                                     Omegaphi,
+                                     Omegaz,
+                                     ctypes.byref(err))
+
+    return (jr,Omegar,Omegaphi,Omegaz,err.value)
+
+def actionAngleFreqAngleSpherical_c(pot,R,vR,vT,z,vz,phi,order=10):
+    """
+    NAME:
+       actionAngleFreqAngleSpherical_c
+    PURPOSE:
+       Use C to calculate the radial action, the frequencies, and the angles in a spherical potential
+    INPUT:
+       pot - Potential or list of such instances
+       R, vR, vT, z, vz, phi - coordinates (arrays)
+       order= (10) order of Gauss-Legendre integration of the relevant integrals
+    OUTPUT:
+       (jr,Omegar,Omegaphi,Omegaz,Angler,Anglephi,Anglez,err)
+       jr,Omegar,Omegaphi,Omegaz,Angler,Anglephi,Anglez : array, shape (len(R))
+       err - non-zero if error occured
+    HISTORY:
+       2026-10-19 - Written - agent
+    """
+    #Parse the potential
+    from ..orbit.integrateFullOrbit import _parse_pot
+    npot, pot_type, pot_args= _parse_pot(pot,potforactions=True)
+
+    #Set up result arrays
+    jr= numpy.empty(len(R))
+    Omegar= numpy.empty(len(R))
+    Omegaphi= numpy.empty(len(R))
+    Omegaz= numpy.empty(len(R))
+    Angler= numpy.empty(len(R))
+    Anglephi= numpy.empty(len(R))
+    Anglez= numpy.empty(len(R))
+    err= ctypes.c_int(0)
+
+    #Set up the C code
+    ndarrayFlags= ('C_CONTIGUOUS','WRITEABLE')
+    actionAngleSpherical_actionsFunc= \
+        _lib.actionAngleSpherical_actionsFreqsAngles
+    actionAngleSpherical_actionsFunc.argtypes= [ctypes.c_int,
+                               ndpointer(dtype=numpy.float64,flags=ndarrayFlags),
+                               ndpointer(dtype=numpy.float64,flags=ndarrayFlags),
+                               ndpointer(dtype=numpy.float64,flags=ndarrayFlags),
+                               ndpointer(dtype=numpy.float64,flags=ndarrayFlags),
+                               ndpointer(dtype=numpy.float64,flags=ndarrayFlags),
+                               ndpointer(dtype=numpy.float64,flags=ndarrayFlags),
+                               ctypes.c_int,
+                               ndpointer(dtype=numpy.int32,flags=ndarrayFlags),
+                               ndpointer(dtype=numpy.float64,flags=ndarrayFlags),
+                               ctypes.c_int,
+                               ndpointer(dtype=numpy.float64,flags=ndarrayFlags),
+                               ndpointer(dtype=numpy.float64,flags=ndarrayFlags),
+                               ndpointer(dtype=numpy.float64,flags=ndarrayFlags),
+                               ndpointer(dtype=numpy.float64,flags=ndarrayFlags),
+                               ndpointer(dtype=numpy.float64,flags=ndarrayFlags),
+                               ndpointer(dtype=numpy.float64,flags=ndarrayFlags),
+                               ndpointer(dtype=numpy.float64,flags=ndarrayFlags),
+                               ctypes.POINTER(ctypes.c_int)]
+
+    #Array requirements
+    R= numpy.require(R,dtype=numpy.float64,requirements=['C','W'])
+    vR= numpy.require(vR,dtype=numpy.float64,requirements=['C','W'])
+    vT= numpy.require(vT,dtype=numpy.float64,requirements=['C','W'])
+    z= numpy.require(z,dtype=numpy.float64,requirements=['C','W'])
+    vz= numpy.require(vz,dtype=numpy.float64,requirements=['C','W'])
+    phi= numpy.require(phi,dtype=numpy.float64,requirements=['C','W'])
+    jr= numpy.require(jr,dtype=numpy.float64,requirements=['C','W'])
+    Omegar= numpy.require(Omegar,dtype=numpy.float64,requirements=['C','W'])
+    Omegaphi= numpy.require(Omegaphi,dtype=numpy.float64,
+                            requirements=['C','W'])
+    Omegaz= numpy.require(Omegaz,dtype=numpy.float64,requirements=['C','W'])
+    Angler= numpy.require(Angler,dtype=numpy.float64,requirements=['C','W'])
+    Anglephi= numpy.require(Anglephi,dtype=numpy.float64,
+                            requirements=['C','W'])
+    Anglez= numpy.require(Anglez,dtype=numpy.float64,requirements=['C','W'])
+
+    #Run the C code
+    actionAngleSpherical_actionsFunc(len(R),
+                                     R,
+                                     vR,
+                                     vT,
+                                     z,
+                                     vz,
+                                     phi,
+                                     ctypes.c_int(npot),
+                                     pot_type,
+                                     pot_args,
+                                     ctypes.c_int(order),
+                                     jr,
+                                     Omegar,
+                                     Omegaphi,
+                                     Omegaz,
+                                     Angler,
+                                     Anglephi,
+                                     Anglez,
+                                     ctypes.byref(err))
+
+    return (jr,Omegar,Omegaphi,Omegaz,Angler,Anglephi,Anglez,err.value)
+
+def actionAngleRperiRapSpherical_c(pot,R,vR,vT,z,vz):
+    """
+    NAME:
+       actionAngleRperiRapSpherical_c
+    PURPOSE:
+       Use C to calculate the peri- and apocenter radii in a spherical potential
+    INPUT:
+       pot - Potential or list of such instances
+       R, vR, vT, z, vz - coordinates (arrays)
+    OUTPUT:
+       (rperi,rap,err)
+       rperi,rap : array, shape (len(R))
+       err - non-zero if error occured
+    HISTORY:
+       2026-10-19 - Written - agent
+    """
+    #Parse the potential
+    from ..orbit.integrateFullOrbit import _parse_pot
+    npot, pot_type, pot_args= _parse_pot(pot,potforactions=True)
+
+    #Set up result arrays
+    rperi= numpy.empty(len(R))
+    rap= numpy.empty(len(R))
+    err= ctypes.c_int(0)
+
+    #Set up the C code
+    ndarrayFlags= ('C_CONTIGUOUS','WRITEABLE')
+    actionAngleSpherical_RperiRapFunc= _lib.actionAngleSpherical_RperiRap
+    actionAngleSpherical_RperiRapFunc.argtypes= [ctypes.c_int,
+                               ndpointer(dtype=numpy.float64,flags=ndarrayFlags),
+                               ndpointer(dtype=numpy.float64,flags=ndarrayFlags),
+                               ndpointer(dtype=numpy.float64,flags=ndarrayFlags),
+                               ndpointer(dtype=numpy.float64,flags=ndarrayFlags),
+                               ndpointer(dtype=numpy.float64,flags=ndarrayFlags),
+                               ctypes.c_int,
+                               ndpointer(dtype=numpy.int32,flags=ndarrayFlags),
+                               ndpointer(dtype=numpy.float64,flags=ndarrayFlags),
+                               ndpointer(dtype=numpy.float64,flags=ndarrayFlags),
+                               ndpointer(dtype=numpy.float64,flags=ndarrayFlags),
+                               ctypes.POINTER(ctypes.c_int)]
+
+    #Array requirements
+    R= numpy.require(R,dtype=numpy.float64,requirements=['C','W'])
+    vR= numpy.require(vR,dtype=numpy.float64,requirements=['C','W'])
+    vT= numpy.require(vT,dtype=numpy.float64,requirements=['C','W'])
+    z= numpy.require(z,dtype=numpy.float64,requirements=['C','W'])
+    vz= numpy.require(vz,dtype=numpy.float64,requirements=['C','W'])
+    rperi= numpy.require(rperi,dtype=numpy.float64,requirements=['C','W'])
+    rap= numpy.require(rap,dtype=numpy.float64,requirements=['C','W'])
+
+    #Run the C code
+    actionAngleSpherical_RperiRapFunc(len(R),
+                                      R,
+                                      vR,
+                                      vT,
+                                      z,
+                                      vz,
+                                      ctypes.c_int(npot),
+                                      pot_type,
+                                      pot_args,
+                                      rperi,
+                                      rap,
+                                      ctypes.byref(err))
+
+    return (rperi,rap,err.value)
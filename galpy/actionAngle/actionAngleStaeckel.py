@@ -13,7 +13,7 @@
 import copy
 import warnings
 import numpy
-from scipy import optimize, integrate
+from scipy import optimize, integrate, interpolate
 from ..potential import evaluateR2derivs, evaluatez2derivs, \
     evaluateRzderivs, epifreq, omegac, verticalfreq, MWPotential
 from ..potential.Potential import _evaluatePotentials, \
@@ -21,6 +21,7 @@ from ..potential.Potential import _evaluatePotentials, \
 from ..potential.Potential import flatten as flatten_potential
 from ..util import bovy_coords #for prolate confocal transforms
 from ..util import galpyWarning
+from ..util.cache import cached_setup
 from ..util.bovy_conversion import physical_conversion, \
     potential_physical_input
 from .actionAngle import actionAngle, UnboundError
@@ -43,7 +44,7 @@ class actionAngleStaeckel(actionAngle):
         INPUT:
            pot= potential or list of potentials (3D)
 
-           delta= focus (can be Quantity)
+           delta= focus (can be Quantity); can also be a function delta(R,z) (e.g., an interpDeltaStaeckel instance) that returns the focus to use for each phase-space point
 
            useu0 - use u0 to calculate dV (NOT recommended)
 
@@ -102,7 +103,7 @@ class actionAngleStaeckel(actionAngle):
                  1) floats: phase-space value for single object (phi is optional) (each can be a Quantity)
                  2) numpy.ndarray: [N] phase-space values for N objects (each can be a Quantity)
               b) Orbit instance: initial condition used if that's it, orbit(t) if there is a time given as well as the second argument 
-           delta= (object-wide default) can be used to override the object-wide focal length; can also be an array with length N to allow different delta for different phase-space points
+           delta= (object-wide default) can be used to override the object-wide focal length; can also be an array with length N to allow different delta for different phase-space points or a function delta(R,z) (e.g., an interpDeltaStaeckel instance) that returns the delta for each point
            u0= (None) if object-wide option useu0 is set, u0 to use (if useu0 and useu0 is None, a good value will be computed)
            c= (object-wide default, bool) True/False to override the object-wide setting for whether or not to use the C implementation
            order= (object-wide default, int) number of points to use in the Gauss-Legendre numerical integration of the relevant action integrals  
@@ -134,6 +135,7 @@ class actionAngleStaeckel(actionAngle):
             vT= numpy.array([vT])
             z= numpy.array([z])
             vz= numpy.array([vz])
+        if callable(delta): delta= delta(R,z)
         if ((self._c and not ('c' in kwargs and not kwargs['c']))\
                 or (ext_loaded and (('c' in kwargs and kwargs['c'])))) \
                 and _check_c(self._pot):
@@ -180,7 +182,7 @@ class actionAngleStaeckel(actionAngle):
                 #Set up the actionAngleStaeckelSingle object
                 aASingle= actionAngleStaeckelSingle(R[0],vR[0],vT[0],
                                                     z[0],vz[0],pot=self._pot,
-                                                    delta=delta)
+                                                    delta=numpy.atleast_1d(delta)[0])
                 return (numpy.atleast_1d(aASingle.JR(**copy.copy(kwargs))),
                         numpy.atleast_1d(aASingle._R*aASingle._vT),
                         numpy.atleast_1d(aASingle.Jz(**copy.copy(kwargs))))
@@ -197,7 +199,7 @@ class actionAngleStaeckel(actionAngle):
                  1) floats: phase-space value for single object (phi is optional) (each can be a Quantity)
                  2) numpy.ndarray: [N] phase-space values for N objects (each can be a Quantity)
               b) Orbit instance: initial condition used if that's it, orbit(t) if there is a time given as well as the second argument 
-           delta= (object-wide default) can be used to override the object-wide focal length; can also be an array with length N to allow different delta for different phase-space points
+           delta= (object-wide default) can be used to override the object-wide focal length; can also be an array with length N to allow different delta for different phase-space points or a function delta(R,z) (e.g., an interpDeltaStaeckel instance) that returns the delta for each point
            u0= (None) if object-wide option useu0 is set, u0 to use (if useu0 and useu0 is None, a good value will be computed)
            c= (object-wide default, bool) True/False to override the object-wide setting for whether or not to use the C implementation
            order= (10) number of points to use in the Gauss-Legendre numerical integration of the relevant action and frequency integrals
@@ -231,6 +233,7 @@ class actionAngleStaeckel(actionAngle):
                 vT= numpy.array([vT])
                 z= numpy.array([z])
                 vz= numpy.array([vz])
+            if callable(delta): delta= delta(R,z)
             Lz= R*vT
             if self._useu0:
                 #First calculate u0
@@ -273,7 +276,7 @@ class actionAngleStaeckel(actionAngle):
                  1) floats: phase-space value for single object (phi is optional) (each can be a Quantity)
                  2) numpy.ndarray: [N] phase-space values for N objects (each can be a Quantity)
               b) Orbit instance: initial condition used if that's it, orbit(t) if there is a time given as well as the second argument 
-           delta= (object-wide default) can be used to override the object-wide focal length; can also be an array with length N to allow different delta for different phase-space points
+           delta= (object-wide default) can be used to override the object-wide focal length; can also be an array with length N to allow different delta for different phase-space points or a function delta(R,z) (e.g., an interpDeltaStaeckel instance) that returns the delta for each point
            u0= (None) if object-wide option useu0 is set, u0 to use (if useu0 and useu0 is None, a good value will be computed)
            c= (object-wide default, bool) True/False to override the object-wide setting for whether or not to use the C implementation
            order= (10) number of points to use in the Gauss-Legendre numerical integration of the relevant action, frequency, and angle integrals
@@ -309,6 +312,7 @@ class actionAngleStaeckel(actionAngle):
                 z= numpy.array([z])
                 vz= numpy.array([vz])
                 phi= numpy.array([phi])
+            if callable(delta): delta= delta(R,z)
             Lz= R*vT
             if self._useu0:
                 #First calculate u0
@@ -351,7 +355,7 @@ class actionAngleStaeckel(actionAngle):
                  1) floats: phase-space value for single object (phi is optional) (each can be a Quantity)
                  2) numpy.ndarray: [N] phase-space values for N objects (each can be a Quantity)
               b) Orbit instance: initial condition used if that's it, orbit(t) if there is a time given as well as the second argument 
-           delta= (object-wide default) can be used to override the object-wide focal length; can also be an array with length N to allow different delta for different phase-space points
+           delta= (object-wide default) can be used to override the object-wide focal length; can also be an array with length N to allow different delta for different phase-space points or a function delta(R,z) (e.g., an interpDeltaStaeckel instance) that returns the delta for each point
            u0= (None) if object-wide option useu0 is set, u0 to use (if useu0 and useu0 is None, a good value will be computed)
            c= (object-wide default, bool) True/False to override the object-wide setting for whether or not to use the C implementation
         OUTPUT:
@@ -360,6 +364,15 @@ class actionAngleStaeckel(actionAngle):
            2017-12-12 - Written - Bovy (UofT)
         """
         delta= kwargs.get('delta',self._delta)
+        if callable(delta):
+            if len(args) == 5 or len(args) == 6:
+                R, z= args[0], args[3]
+            else:
+                self._parse_eval_args(*args)
+                R= self._eval_R
+                z= self._eval_z
+            delta= delta(R,z)
+            kwargs['delta']= delta
         umin, umax, vmin= self._uminumaxvmin(*args,**kwargs)
         rperi= bovy_coords.uv_to_Rz(umin,numpy.pi/2.,delta=delta)[0]
         rap_tmp, zmax= bovy_coords.uv_to_Rz(umax,vmin,delta=delta)
@@ -402,6 +415,7 @@ class actionAngleStaeckel(actionAngle):
             vT= numpy.array([vT])
             z= numpy.array([z])
             vz= numpy.array([vz])
+        if callable(delta): delta= delta(R,z)
         if ((self._c and not ('c' in kwargs and not kwargs['c']))\
                 or (ext_loaded and (('c' in kwargs and kwargs['c'])))) \
                 and _check_c(self._pot):
@@ -449,7 +463,7 @@ class actionAngleStaeckel(actionAngle):
                 #Set up the actionAngleStaeckelSingle object
                 aASingle= actionAngleStaeckelSingle(R[0],vR[0],vT[0],
                                                     z[0],vz[0],pot=self._pot,
-                                                    delta=delta)
+                                                    delta=numpy.atleast_1d(delta)[0])
                 umin, umax= aASingle.calcUminUmax()
                 vmin= aASingle.calcVmin()
                 return (numpy.atleast_1d(umin),
@@ -1052,24 +1066,111 @@ def estimateDeltaStaeckel(pot,R,z, no_median=False):
     HISTORY:
        2013-08-28 - Written - Bovy (IAS)
        2016-02-20 - Changed input order to allow physical conversions - Bovy (UofT)
+       2026-10-19 - Evaluate all points at once for array input - agent
     """
     if isinstance(R,numpy.ndarray):
-        delta2= numpy.array([(z[ii]**2.-R[ii]**2. #eqn. (9) has a sign error
-                           +(3.*R[ii]*_evaluatezforces(pot,R[ii],z[ii])
-                             -3.*z[ii]*_evaluateRforces(pot,R[ii],z[ii])
-                             +R[ii]*z[ii]*(evaluateR2derivs(pot,R[ii],z[ii],
-                                                            use_physical=False)
-                                           -evaluatez2derivs(pot,R[ii],z[ii],
-                                                             use_physical=False)))/evaluateRzderivs(pot,R[ii],z[ii],use_physical=False)) for ii in range(len(R))])
+        z= z*numpy.ones_like(R)
+        try:
+            delta2= _delta2Staeckel(pot,R,z)*numpy.ones_like(R)
+        except (TypeError,ValueError,IndexError):
+            # Potentials that do not support array input
+            delta2= numpy.array([_delta2Staeckel(pot,R[ii],z[ii])
+                                 for ii in range(len(R))])
         indx= (delta2 < 0.)*(delta2 > -10.**-10.)
         delta2[indx]= 0.
         if not no_median:
         	delta2= numpy.median(delta2[True^numpy.isnan(delta2)])
     else:
-        delta2= (z**2.-R**2. #eqn. (9) has a sign error
-                 +(3.*R*_evaluatezforces(pot,R,z)
-                   -3.*z*_evaluateRforces(pot,R,z)
-                   +R*z*(evaluateR2derivs(pot,R,z,use_physical=False)
-                         -evaluatez2derivs(pot,R,z,use_physical=False)))/evaluateRzderivs(pot,R,z,use_physical=False))
+        delta2= _delta2Staeckel(pot,R,z)
         if delta2 < 0. and delta2 > -10.**-10.: delta2= 0.
     return numpy.sqrt(delta2)
+
+def _delta2Staeckel(pot,R,z):
+    """Square of the focal length from eqn. (9) in Sanders (2012) for (arrays of) R,z"""
+    return (z**2.-R**2. #eqn. (9) has a sign error
+            +(3.*R*_evaluatezforces(pot,R,z)
+              -3.*z*_evaluateRforces(pot,R,z)
+              +R*z*(evaluateR2derivs(pot,R,z,use_physical=False)
+                    -evaluatez2derivs(pot,R,z,use_physical=False)))\
+                /evaluateRzderivs(pot,R,z,use_physical=False))
+
+class interpDeltaStaeckel(object):
+    """Interpolation table of the focal length delta estimated with estimateDeltaStaeckel on a grid in (R,|z|)"""
+    def __init__(self,pot=None,Rgrid=(0.01,20.,101),zgrid=(0.,10.,101),
+                 logR=True,logz=True,cache=None):
+        """
+        NAME:
+           __init__
+        PURPOSE:
+           initialize an interpDeltaStaeckel object, which returns the per-point focal length delta for arrays of (R,z) by interpolating a grid of estimateDeltaStaeckel estimates; can be given as delta= to actionAngleStaeckel to use a different delta for each phase-space point
+        INPUT:
+           pot= potential or list of potentials (3D, axisymmetric)
+           Rgrid= (0.01,20.,101) R grid to use (Rmin,Rmax,nR)
+           zgrid= (0.,10.,101) |z| grid to use (zmin,zmax,nz)
+           logR= (True) if True, the R grid is logarithmically spaced between Rmin and Rmax
+           logz= (True) if True, the |z| grid is logarithmically spaced between zmax/10^4 (or zmin if larger) and zmax, with an additional point at zmin=0, to resolve the rapid variation of delta close to the plane
+           cache= (None) if True, save the grid to the persistent cache (see galpy.util.cache) and load it from there when the same interpDeltaStaeckel is set up again; can also be set to the directory to use for the cache
+        OUTPUT:
+           instance
+        HISTORY:
+           2026-10-19 - Written - agent
+        """
+        if pot is None: #pragma: no cover
+            raise IOError("Must specify pot= for interpDeltaStaeckel")
+        self._pot= flatten_potential(pot)
+        if logR:
+            self._Rgrid= numpy.exp(numpy.linspace(numpy.log(Rgrid[0]),
+                                                  numpy.log(Rgrid[1]),
+                                                  Rgrid[2]))
+        else:
+            self._Rgrid= numpy.linspace(*Rgrid)
+        if logz and zgrid[0] > 0.:
+            self._zgrid= numpy.exp(numpy.linspace(numpy.log(zgrid[0]),
+                                                  numpy.log(zgrid[1]),
+                                                  zgrid[2]))
+        elif logz:
+            self._zgrid= numpy.zeros(zgrid[2])
+            self._zgrid[1:]= numpy.exp(\
+                numpy.linspace(numpy.log(10.**-4.*zgrid[1]),
+                               numpy.log(zgrid[1]),zgrid[2]-1))
+        else:
+            self._zgrid= numpy.linspace(*zgrid)
+        cached_setup(self,self._setup_grid,cache)
+        self._deltaInterp= interpolate.RectBivariateSpline(\
+            self._Rgrid,self._zgrid,self._deltagrid,kx=3,ky=3,s=0.)
+        return None
+
+    def _setup_grid(self):
+        """Compute the grid of delta estimates"""
+        RR,zz= numpy.meshgrid(self._Rgrid,self._zgrid,indexing='ij')
+        # Eqn. (9) is 0/0 in the plane, so evaluate just above it
+        zz[zz < 1e-8]= 1e-8
+        deltagrid= estimateDeltaStaeckel(self._pot,RR.flatten(),zz.flatten(),
+                                         no_median=True,
+                                         use_physical=False)
+        deltagrid= numpy.reshape(deltagrid,RR.shape)
+        # Fill points where the estimate fails with the median estimate
+        indx= numpy.isnan(deltagrid)
+        deltagrid[indx]= numpy.median(deltagrid[True^indx])
+        self._deltagrid= deltagrid
+        return None
+
+    def __call__(self,R,z):
+        """
+        NAME:
+           __call__
+        PURPOSE:
+           evaluate the interpolated focal length
+        INPUT:
+           R - Galactocentric radius (can be array)
+           z - height (can be array)
+        OUTPUT:
+           delta (array if R,z is array); points outside of the grid get the value at the nearest edge of the grid
+        HISTORY:
+           2026-10-19 - Written - agent
+        """
+        R= numpy.clip(R,self._Rgrid[0],self._Rgrid[-1])
+        z= numpy.clip(numpy.fabs(z),self._zgrid[0],self._zgrid[-1])
+        out= numpy.fmax(self._deltaInterp.ev(R,z),0.)
+        if numpy.ndim(out) == 0: return float(out)
+        return out
@@ -8,8 +8,12 @@
 #
 #      methods:
 #             __call__: returns (jr,lz,jz)
+#             actionsFreqs: returns (jr,lz,jz,Or,Op,Oz)
+#             save: save the grids to a file
+#             load: load an instance from a file written by save
 #
 ###############################################################################
+import pickle
 import numpy
 from scipy import interpolate, optimize, ndimage
 from . import actionAngleStaeckel
@@ -19,7 +23,9 @@ from .actionAngleStaeckel_c import _ext_loaded as ext_loaded
 from .. import potential
 from ..potential.Potential import _evaluatePotentials
 from ..potential.Potential import flatten as flatten_potential
-from ..util import multi, bovy_coords
+from ..potential.Potential import _check_c
+from ..util import multi, bovy_coords, save_pickles
+from ..util.cache import cached, cached_setup
 _PRINTOUTSIDEGRID= False
 _APY_LOADED= True
 try:
@@ -30,7 +36,8 @@ class actionAngleStaeckelGrid(actionAngle):
     """Action-angle formalism for axisymmetric potentials using Binney (2012)'s Staeckel approximation, grid-based interpolation"""
     def __init__(self,pot=None,delta=None,Rmax=5.,
                  nE=25,npsi=25,nLz=30,numcores=1,
-                 interpecc=False,
+                 interpecc=False,interpfreqs=False,refinecirc=False,
+                 cache=None,
                  **kwargs):
         """
         NAME:
@@ -48,7 +55,15 @@ class actionAngleStaeckelGrid(actionAngle):
 
            interpecc= (False) if True, also interpolate the approximate eccentricity, zmax, rperi, and rapo
 
-           numcores= number of cpus to use to parallellize
+           interpfreqs= (False) if True, also interpolate the frequencies, such that actionsFreqs can be used (requires the C implementation; angles are not tabulated, use actionAngleStaeckel for those)
+
+           refinecirc= (False) if True, space the energy grid more finely close to circular orbits (uniform in 1-sqrt(1-y) rather than y, where y=0 and 1 are the energies of orbits that reach Ra and of circular orbits)
+
+           c= (False) if True, compute the grid with the C implementation of actionAngleStaeckel (in a single OpenMP-parallel call over all points of the grid)
+
+           numcores= number of cpus to use to parallellize the Python grid construction (when not using C)
+
+           cache= (None) if True, save the grids to the persistent cache (see galpy.util.cache) and load them from there when the same actionAngleStaeckelGrid is set up again; can also be set to the directory to use for the cache; when not using C, the grids are computed and cached one Lz at a time, such that an interrupted grid construction resumes where it left off
 
            ro= distance from vantage point to GC (kpc; can be Quantity)
 
@@ -64,6 +79,12 @@ class actionAngleStaeckelGrid(actionAngle):
 
             2017-12-15 - Written - Bovy (UofT)
 
+            2026-10-19 - Added cache= - agent
+
+            2026-10-19 - Build the grid in a single C call or one Lz at a time in Python (in parallel and resumable), and added refinecirc= - agent
+
+            2026-10-19 - Added interpfreqs= - agent
+
         """
         actionAngle.__init__(self,
                              ro=kwargs.get('ro',None),vo=kwargs.get('vo',None))
@@ -72,17 +93,32 @@ class actionAngleStaeckelGrid(actionAngle):
         self._pot= flatten_potential(pot)
         if delta is None:
             raise IOError("Must specify delta= for actionAngleStaeckelGrid")
-        if ext_loaded and 'c' in kwargs and kwargs['c']:
-            self._c= True
+        if ext_loaded and kwargs.get('c',False):
+            self._c= _check_c(self._pot)
         else:
             self._c= False
+        if interpfreqs and not self._c:
+            raise NotImplementedError("interpfreqs=True for actionAngleStaeckelGrid requires the C implementation of actionAngleStaeckel")
+        self._interpfreqs= interpfreqs
         self._delta= delta
         if _APY_LOADED and isinstance(self._delta,units.Quantity):
             self._delta= self._delta.to(units.kpc).value/self._ro
         self._Rmax= Rmax
         self._Rmin= 0.01
+        self._refinecirc= refinecirc
         #Set up the actionAngleStaeckel object that we will use to interpolate
         self._aA= actionAngleStaeckel.actionAngleStaeckel(pot=self._pot,delta=self._delta,c=self._c)
+        #Build the grids or load them from the cache
+        cached_setup(self,lambda: self._setup_grids(nE,npsi,nLz,numcores,
+                                                    interpecc,interpfreqs,
+                                                    cache),
+                     cache,nE,npsi,nLz,interpecc,interpfreqs)
+        # Check the units
+        self._check_consistent_units()
+        return None
+
+    def _setup_grids(self,nE,npsi,nLz,numcores,interpecc,interpfreqs,cache):
+        """Build the action grids and their interpolations"""
         #Build grid
         self._Lzmin= 0.01
         self._Lzs= numpy.linspace(self._Lzmin,
@@ -92,7 +128,7 @@ class actionAngleStaeckelGrid(actionAngle):
         self._Lzmax= self._Lzs[-1]
         self._nLz= nLz
         #Calculate E_c(R=RL), energy of circular orbit
-        self._RL= numpy.array([potential.rl(self._pot,l) for l in self._Lzs])
+        self._RL= potential.rl(self._pot,self._Lzs)
         self._RLInterp= interpolate.InterpolatedUnivariateSpline(self._Lzs,
                                                                  self._RL,k=3)
         self._ERL= _evaluatePotentials(self._pot,self._RL,
@@ -108,6 +144,8 @@ class actionAngleStaeckelGrid(actionAngle):
         self._ERaInterp= interpolate.InterpolatedUnivariateSpline(self._Lzs,
                                                                   numpy.log(-(self._ERa-self._ERamax)),k=3)
         y= numpy.linspace(0.,1.,nE)
+        if self._refinecirc:
+            y= 1.-(1.-y)**2.
         self._nE= nE
         psis= numpy.linspace(0.,1.,npsi)*numpy.pi/2.
         self._npsi= npsi
@@ -152,19 +190,38 @@ class actionAngleStaeckelGrid(actionAngle):
         thisLzs= numpy.tile(thisLzs.T,(npsi,1,1)).T.flatten()
         thisR= numpy.tile(thisR.T,(npsi,1,1)).T.flatten()
         thisv= numpy.tile(thisv.T,(npsi,1,1)).T.flatten()
-        mjr, mlz, mjz= self._aA(thisR, #R
-                                thisv*numpy.cos(thispsi), #vR
-                                thisLzs/thisR, #vT
-                                numpy.zeros(len(thisR)), #z
-                                thisv*numpy.sin(thispsi), #vz
-                                fixed_quad=True) 
+        if self._c:
+            # The C code is OpenMP-parallel over all points of the grid
+            out= self._grid_actions(thisR,thisv,thisLzs,thispsi,interpecc,
+                                    interpfreqs)
+        else:
+            # Compute the actions one Lz at a time, such that the 
+            # calculation can be parallelized and resumed from the cache 
+            # when interrupted
+            nslab= nE*npsi
+            def compute_slab(ii):
+                slab= slice(ii*nslab,(ii+1)*nslab)
+                return cached(lambda: self._grid_actions(thisR[slab],
+                                                         thisv[slab],
+                                                         thisLzs[slab],
+                                                         thispsi[slab],
+                                                         interpecc,
+                                                         interpfreqs),
+                              cache,'actionAngleStaeckelGrid-Lz',self._pot,
+                              self._delta,thisR[slab],thisv[slab],
+                              thisLzs[slab],thispsi[slab],interpecc,
+                              interpfreqs)
+            if numcores > 1:
+                out= multi.parallel_map(compute_slab,range(nLz),
+                                        numcores=numcores)
+            else:
+                out= list(map(compute_slab,range(nLz)))
+            out= numpy.concatenate(list(out),axis=1)
+        mjr, mjz= out[0], out[1]
         if interpecc:
-            mecc, mzmax, mrperi, mrap=\
-                self._aA.EccZmaxRperiRap(thisR, #R
-                                         thisv*numpy.cos(thispsi), #vR
-                                         thisLzs/thisR, #vT
-                                         numpy.zeros(len(thisR)), #z
-                                         thisv*numpy.sin(thispsi)) #vz
+            mecc, mzmax, mrperi, mrap= out[2], out[3], out[4], out[5]
+        if interpfreqs:
+            mOr, mOp, mOz= out[-3], out[-2], out[-1]
         if isinstance(self._pot,potential.interpRZPotential) and hasattr(self._pot,'_origPot'):
             #Interpolated potentials have problems with extreme orbits
             indx= (mjr == 9999.99)
@@ -184,6 +241,13 @@ class actionAngleStaeckelGrid(actionAngle):
                                              thisLzs[indx]/thisR[indx], #vT
                                              numpy.zeros(numpy.sum(indx)), #z
                                              thisv[indx]*numpy.sin(thispsi[indx])) #vz
+            if interpfreqs:
+                mOr[indx], mOp[indx], mOz[indx]=\
+                    tmpaA.actionsFreqs(thisR[indx], #R
+                                       thisv[indx]*numpy.cos(thispsi[indx]), #vR
+                                       thisLzs[indx]/thisR[indx], #vT
+                                       numpy.zeros(numpy.sum(indx)), #z
+                                       thisv[indx]*numpy.sin(thispsi[indx]))[3:] #vz
         jr= numpy.reshape(mjr,(nLz,nE,npsi))
         jz= numpy.reshape(mjz,(nLz,nE,npsi))
         if interpecc:
@@ -274,10 +338,89 @@ class actionAngleStaeckelGrid(actionAngle):
             self._zmaxFiltered= ndimage.spline_filter(numpy.log(self._zmax+10.**-10.),order=3)
             self._rperiFiltered= ndimage.spline_filter(numpy.log(self._rperi+10.**-10.),order=3)
             self._rapFiltered= ndimage.spline_filter(numpy.log(self._rap+10.**-10.),order=3)
-        # Check the units
-        self._check_consistent_units()
+        if interpfreqs:
+            #Frequencies only depend on the integrals, so interpolate them
+            #on the same grid, after filling in failed grid points
+            self._OrFiltered= ndimage.spline_filter(\
+                numpy.log(_fill_grid(numpy.reshape(mOr,(nLz,nE,npsi)))),
+                order=3)
+            self._OpFiltered= ndimage.spline_filter(\
+                numpy.log(_fill_grid(numpy.reshape(mOp,(nLz,nE,npsi)))),
+                order=3)
+            self._OzFiltered= ndimage.spline_filter(\
+                numpy.log(_fill_grid(numpy.reshape(mOz,(nLz,nE,npsi)))),
+                order=3)
         return None
 
+    def _grid_actions(self,R,v,Lz,psi,interpecc,interpfreqs=False):
+        """Compute the actions (and eccentricity etc. if interpecc and frequencies if interpfreqs) for grid points in the plane at R with velocity v at angle psi"""
+        if interpfreqs:
+            jr, lz, jz, Or, Op, Oz=\
+                self._aA.actionsFreqs(R, #R
+                                      v*numpy.cos(psi), #vR
+                                      Lz/R, #vT
+                                      numpy.zeros(len(R)), #z
+                                      v*numpy.sin(psi)) #vz
+        else:
+            jr, lz, jz= self._aA(R, #R
+                                 v*numpy.cos(psi), #vR
+                                 Lz/R, #vT
+                                 numpy.zeros(len(R)), #z
+                                 v*numpy.sin(psi), #vz
+                                 fixed_quad=True)
+        out= [jr,jz]
+        if interpecc:
+            out.extend(self._aA.EccZmaxRperiRap(R, #R
+                                                v*numpy.cos(psi), #vR
+                                                Lz/R, #vT
+                                                numpy.zeros(len(R)), #z
+                                                v*numpy.sin(psi))) #vz
+        if interpfreqs:
+            out.extend([Or,Op,Oz])
+        return numpy.array(out)
+
+    def _Ecoord(self,y):
+        """Convert the scaled energy y to the coordinate along the energy axis of the grid"""
+        if self._refinecirc:
+            y= 1.-numpy.sqrt(numpy.fmax(1.-y,0.))
+        return y*(self._nE-1.)
+
+    def save(self,filename):
+        """
+        NAME:
+           save
+        PURPOSE:
+           save the grids and their interpolations to a file, such that an identical actionAngleStaeckelGrid can be loaded instantly with actionAngleStaeckelGrid.load
+        INPUT:
+           filename - name of the file to save to
+        OUTPUT:
+           (none)
+        HISTORY:
+           2026-10-19 - Written - agent
+        """
+        save_pickles(filename,self.__dict__)
+        return None
+
+    @classmethod
+    def load(cls,filename):
+        """
+        NAME:
+           load
+        PURPOSE:
+           load an actionAngleStaeckelGrid instance saved with save
+        INPUT:
+           filename - name of the file written by save
+        OUTPUT:
+           actionAngleStaeckelGrid instance
+        HISTORY:
+           2026-10-19 - Written - agent
+        """
+        with open(filename,'rb') as savefile:
+            state= pickle.load(savefile)
+        out= cls.__new__(cls)
+        out.__dict__.update(state)
+        return out
+
     def _evaluate(self,*args,**kwargs):
         """
         NAME:
@@ -307,6 +450,10 @@ class actionAngleStaeckelGrid(actionAngle):
             vT= self._eval_vT
             z= self._eval_z
             vz= self._eval_vz
+        return self._interp_actionsFreqs(R,vR,vT,z,vz,False,**kwargs)
+
+    def _interp_actionsFreqs(self,R,vR,vT,z,vz,freqs,**kwargs):
+        """Interpolate the actions (and the frequencies if freqs) on the grid, computing them directly for off-grid points"""
         Lz= R*vT
         Phi= _evaluatePotentials(self._pot,R,z)
         E= Phi+vR**2./2.+vT**2./2.+vz**2./2.
@@ -326,6 +473,10 @@ class actionAngleStaeckelGrid(actionAngle):
             indxc= True^indx
             jr= numpy.empty(R.shape)
             jz= numpy.empty(R.shape)
+            if freqs:
+                Or= numpy.empty(R.shape)
+                Op= numpy.empty(R.shape)
+                Oz= numpy.empty(R.shape)
             if numpy.sum(indxc) > 0:
                 u0= numpy.exp(self._logu0Interp.ev(Lz[indxc],
                                                    (_Efunc(E[indxc],thisERL[indxc])-_Efunc(thisERa[indxc],thisERL[indxc]))/(_Efunc(thisERL[indxc],thisERL[indxc])-_Efunc(thisERa[indxc],thisERL[indxc]))))
@@ -345,7 +496,7 @@ class actionAngleStaeckelGrid(actionAngle):
                 coords= numpy.empty((3,numpy.sum(indxc)))
                 coords[0,:]= (Lz[indxc]-self._Lzmin)/(self._Lzmax-self._Lzmin)*(self._nLz-1.)
                 y= (_Efunc(E[indxc],thisERL[indxc])-_Efunc(thisERa[indxc],thisERL[indxc]))/(_Efunc(thisERL[indxc],thisERL[indxc])-_Efunc(thisERa[indxc],thisERL[indxc]))
-                coords[1,:]= y*(self._nE-1.)
+                coords[1,:]= self._Ecoord(y)
                 coords[2,:]= psi/numpy.pi*2.*(self._npsi-1.)
                 jr[indxc]= (numpy.exp(ndimage.interpolation.map_coordinates(self._jrFiltered,
                                                                             coords,
@@ -366,7 +517,27 @@ class actionAngleStaeckelGrid(actionAngle):
                                                                            newcoords,
                                                                            order=3,
                                                                            prefilter=False))-10.**-10.)*(numpy.exp(self._jzLzInterp(Lz[indxc]))-10.**-5.)
-            if numpy.sum(indx) > 0:
+                if freqs:
+                    freqcoords= coords[:,True^indxSin2psi]
+                    Or[indxc]= numpy.exp(ndimage.interpolation.map_coordinates(self._OrFiltered,
+                                                                               freqcoords,
+                                                                               order=3,
+                                                                               prefilter=False))
+                    Op[indxc]= numpy.exp(ndimage.interpolation.map_coordinates(self._OpFiltered,
+                                                                               freqcoords,
+                                                                               order=3,
+                                                                               prefilter=False))
+                    Oz[indxc]= numpy.exp(ndimage.interpolation.map_coordinates(self._OzFiltered,
+                                                                               freqcoords,
+                                                                               order=3,
+                                                                               prefilter=False))
+            if numpy.sum(indx) > 0 and freqs:
+                jrindiv, lzindiv, jzindiv, Or[indx], Op[indx], Oz[indx]=\
+                    self._aA.actionsFreqs(R[indx],vR[indx],vT[indx],
+                                          z[indx],vz[indx],**kwargs)
+                jr[indx]= jrindiv
+                jz[indx]= jzindiv
+            elif numpy.sum(indx) > 0:
                 jrindiv, lzindiv, jzindiv= self._aA(R[indx],
                                                     vR[indx],
                                                     vT[indx],
@@ -396,17 +567,52 @@ class actionAngleStaeckelGrid(actionAngle):
                 jz[indx]= jzindiv
                 """
         else:
-            jr,Lz, jz= self(numpy.array([R]),
-                            numpy.array([vR]),
-                            numpy.array([vT]),
-                            numpy.array([z]),
-                            numpy.array([vz]),
-                            **kwargs)
-            return (jr[0],Lz[0],jz[0])
+            out= self._interp_actionsFreqs(numpy.array([R]),
+                                           numpy.array([vR]),
+                                           numpy.array([vT]),
+                                           numpy.array([z]),
+                                           numpy.array([vz]),
+                                           freqs,**kwargs)
+            return tuple([x[0] for x in out])
         jr[jr < 0.]= 0.
         jz[jz < 0.]= 0.
+        if freqs:
+            return (jr,R*vT,jz,Or,Op,Oz)
         return (jr,R*vT,jz)
 
+    def _actionsFreqs(self,*args,**kwargs):
+        """
+        NAME:
+           actionsFreqs (_actionsFreqs)
+        PURPOSE:
+           evaluate the actions and frequencies (jr,lz,jz,Omegar,Omegaphi,Omegaz); angles depend on the phase along the orbit rather than only on the integrals of motion and are not tabulated, use actionAngleStaeckel.actionsFreqsAngles for angles
+        INPUT:
+           Either:
+              a) R,vR,vT,z,vz[,phi]:
+                 1) floats: phase-space value for single object (phi is optional) (each can be a Quantity)
+                 2) numpy.ndarray: [N] phase-space values for N objects (each can be a Quantity)
+              b) Orbit instance: initial condition used if that's it, orbit(t) if there is a time given as well as the second argument
+           Keywords for actionAngleStaeckel.actionsFreqs for off-the-grid evaluations
+        OUTPUT:
+            (jr,lz,jz,Omegar,Omegaphi,Omegaz)
+        HISTORY:
+           2026-10-19 - Written - agent
+        """
+        if not self._interpfreqs:
+            raise NotImplementedError("actionsFreqs for actionAngleStaeckelGrid requires setting up the instance with interpfreqs=True")
+        if len(args) == 5: #R,vR.vT, z, vz
+            R,vR,vT, z, vz= args
+        elif len(args) == 6: #R,vR.vT, z, vz, phi
+            R,vR,vT, z, vz, phi= args
+        else:
+            self._parse_eval_args(*args)
+            R= self._eval_R
+            vR= self._eval_vR
+            vT= self._eval_vT
+            z= self._eval_z
+            vz= self._eval_vz
+        return self._interp_actionsFreqs(R,vR,vT,z,vz,True,**kwargs)
+
     def Jz(self,*args,**kwargs):
         """
         NAME:
@@ -513,7 +719,7 @@ class actionAngleStaeckelGrid(actionAngle):
                 coords= numpy.empty((3,numpy.sum(indxc)))
                 coords[0,:]= (Lz[indxc]-self._Lzmin)/(self._Lzmax-self._Lzmin)*(self._nLz-1.)
                 y= (_Efunc(E[indxc],thisERL[indxc])-_Efunc(thisERa[indxc],thisERL[indxc]))/(_Efunc(thisERL[indxc],thisERL[indxc])-_Efunc(thisERa[indxc],thisERL[indxc]))
-                coords[1,:]= y*(self._nE-1.)
+                coords[1,:]= self._Ecoord(y)
                 coords[2,:]= psi/numpy.pi*2.*(self._npsi-1.)
                 ecc[indxc]= (numpy.exp(ndimage.interpolation.map_coordinates(self._eccFiltered,
                                                                             coords,
@@ -682,3 +888,17 @@ def _invEfunc(Ef,*args):
     """Inverse of Efunc"""
 #    return Ef**2.+args[0]
     return numpy.exp(Ef)+args[0]-10.**-10.
+
+def _fill_grid(grid):
+    """Fill in failed (non-finite or 9999.99) entries of a (Lz,E,psi) grid with their nearest good neighbor along psi and then along E"""
+    grid= numpy.where(numpy.isfinite(grid)*(grid != 9999.99),grid,numpy.nan)
+    for axis in [2,1]:
+        grid= numpy.moveaxis(grid,axis,0)
+        for ii in range(1,grid.shape[0]):
+            bad= numpy.isnan(grid[ii])
+            grid[ii][bad]= grid[ii-1][bad]
+        for ii in range(grid.shape[0]-2,-1,-1):
+            bad= numpy.isnan(grid[ii])
+            grid[ii][bad]= grid[ii+1][bad]
+        grid= numpy.moveaxis(grid,0,axis)
+    return grid
@@ -7,13 +7,16 @@
 #
 ###############################################################################
 import warnings
+from collections import OrderedDict
 import numpy
+from scipy import ndimage
 from ..potential import MWPotential, _isNonAxi
 from ..util import galpyWarning
 from . import actionAngleTorus_c
 from .actionAngleTorus_c import _ext_loaded as ext_loaded
 from ..potential.Potential import _check_c
 from ..potential.Potential import flatten as flatten_potential
+_NPAD= 4 # padding of the periodic angle grids of cached tori
 _autofit_errvals= {}
 _autofit_errvals[-1]= 'something wrong with input, usually bad starting values for the parameters'
 _autofit_errvals[-2]= 'Fit failed the goal by a factor <= 2'
@@ -39,6 +42,12 @@ class actionAngleTorus(object):
 
            dJ= default action difference when computing derivatives (Hessian or Jacobian)
 
+           maxcache= (0) number of fitted tori to keep in a least-recently-used torus cache; if > 0, each torus that (x,v) are requested for is tabulated once on a grid in (angler,anglez) together with d(x,v)/dJ, the frequencies, and dO/dJ, and later requests for the same torus are interpolated on this grid rather than fitting the torus again
+
+           interptol= (0.) if > 0, also use a cached torus for actions J' with |J'-J|/|J| < interptol of its actions J, correcting the (x,v) and frequencies to first order in J'-J using d(x,v)/dJ and dO/dJ
+
+           nangle= (64) number of radial and vertical angles of the grid that cached tori are tabulated on
+
         OUTPUT:
 
            instance
@@ -47,6 +56,8 @@ class actionAngleTorus(object):
 
            2015-08-07 - Written - Bovy (UofT)
 
+           2026-10-19 - Added torus cache - agent
+
         """
         if not 'pot' in kwargs: #pragma: no cover
             raise IOError("Must specify pot= for actionAngleTorus")
@@ -64,6 +75,10 @@ class actionAngleTorus(object):
             raise RuntimeError('actionAngleTorus instances cannot be used, because the actionAngleTorus_c extension failed to load')
         self._tol= kwargs.get('tol',0.001)
         self._dJ= kwargs.get('dJ',0.001)
+        self._maxcache= kwargs.get('maxcache',0)
+        self._interptol= kwargs.get('interptol',0.)
+        self._nangle= kwargs.get('nangle',64)
+        self._torus_cache= OrderedDict()
         return None
     
     def __call__(self,jr,jphi,jz,angler,anglephi,anglez,**kwargs):
@@ -101,6 +116,9 @@ class actionAngleTorus(object):
            2015-08-07 - Written - Bovy (UofT)
 
         """
+        if self._maxcache > 0:
+            return self._xvFreqs_cached(jr,jphi,jz,angler,anglephi,anglez,
+                                        kwargs.get('tol',self._tol))[0]
         out= actionAngleTorus_c.actionAngleTorus_xvFreqs_c(\
             self._pot,
             jr,jphi,jz,
@@ -146,6 +164,9 @@ class actionAngleTorus(object):
            2015-08-07 - Written - Bovy (UofT)
 
         """
+        if self._maxcache > 0:
+            return self._xvFreqs_cached(jr,jphi,jz,angler,anglephi,anglez,
+                                        kwargs.get('tol',self._tol))
         out= actionAngleTorus_c.actionAngleTorus_xvFreqs_c(\
             self._pot,
             jr,jphi,jz,
@@ -185,6 +206,13 @@ class actionAngleTorus(object):
            2015-08-07 - Written - Bovy (UofT)
 
         """
+        if self._maxcache > 0:
+            # Use a cached torus if there is one, but don't fit and 
+            # tabulate a new one just for the frequencies
+            torus, dJ= self._find_torus(jr,jphi,jz,kwargs.get('tol',self._tol))
+            if not torus is None:
+                Omegas= torus['Omegas']+numpy.dot(torus['dOdJ'],dJ)
+                return (Omegas[0],Omegas[1],Omegas[2],torus['flag'])
         out= actionAngleTorus_c.actionAngleTorus_Freqs_c(\
             self._pot,
             jr,jphi,jz,
@@ -227,6 +255,13 @@ class actionAngleTorus(object):
            2016-07-15 - Written - Bovy (UofT)
 
         """
+        if self._maxcache > 0 and not kwargs.get('nosym',False) \
+                and kwargs.get('dJ',self._dJ) == self._dJ:
+            torus, dJ= self._find_torus(jr,jphi,jz,kwargs.get('tol',self._tol))
+            if not torus is None:
+                Omegas= torus['Omegas']+numpy.dot(torus['dOdJ'],dJ)
+                return (torus['dOdJ'],Omegas[0],Omegas[1],Omegas[2],
+                        torus['flag'])
         out= actionAngleTorus_c.actionAngleTorus_hessian_c(\
             self._pot,
             jr,jphi,jz,
@@ -310,3 +345,79 @@ class actionAngleTorus(object):
             out[7][:]= 0.5*(out[7]+out[7].T)
         return (numpy.array(out[:6]).T,out[6],out[7],
                 out[8],out[9],out[10],out[11])
+
+    def _find_torus(self,jr,jphi,jz,tol):
+        """Find the cached torus with the same actions or, if interptol > 0, the nearest one within interptol; returns (torus,J-J_torus), (None,None) if there is none"""
+        J= numpy.array([jr,jphi,jz])
+        key= (jr,jphi,jz,tol)
+        if key in self._torus_cache:
+            self._torus_cache.move_to_end(key)
+            return (self._torus_cache[key],numpy.zeros(3))
+        if self._interptol <= 0.: return (None,None)
+        best_key, best_dist= None, self._interptol
+        normJ= numpy.sqrt(numpy.sum(J**2.))
+        for tkey in self._torus_cache:
+            if tkey[3] != tol: continue
+            dist= numpy.sqrt(numpy.sum((J-numpy.array(tkey[:3]))**2.))/normJ
+            if dist < best_dist:
+                best_key, best_dist= tkey, dist
+        if best_key is None: return (None,None)
+        self._torus_cache.move_to_end(best_key)
+        return (self._torus_cache[best_key],J-numpy.array(best_key[:3]))
+
+    def _tabulate_torus(self,jr,jphi,jz,tol):
+        """Fit a torus and tabulate (x,v), d(x,v)/dJ on a grid in (angler,anglez), and its frequencies and dO/dJ, adding it to the torus cache"""
+        angles= numpy.linspace(0.,2.*numpy.pi,self._nangle,endpoint=False)
+        angler, anglez= numpy.meshgrid(angles,angles,indexing='ij')
+        xv, dxvdJa, dOdJ, Omegar, Omegaphi, Omegaz, flag=\
+            self.xvJacobianFreqs(jr,jphi,jz,angler.flatten(),
+                                 numpy.zeros(self._nangle**2),
+                                 anglez.flatten(),tol=tol,dJ=self._dJ)
+        # Tabulate phi-anglephi, which only depends on (angler,anglez) for
+        # axisymmetric potentials, relative to its circular mean, such that
+        # it does not wrap around
+        dphi0= numpy.arctan2(numpy.mean(numpy.sin(xv[:,5])),
+                             numpy.mean(numpy.cos(xv[:,5])))
+        xv[:,5]= (xv[:,5]-dphi0+numpy.pi) % (2.*numpy.pi)-numpy.pi
+        # Spline-filter all quantities on the periodic grid, padded such that
+        # the interpolation near the edges uses the periodic values
+        tab= numpy.concatenate((xv,numpy.reshape(dxvdJa[:,:,:3],(-1,18))),
+                               axis=1)
+        tab= numpy.reshape(tab,(self._nangle,self._nangle,24))
+        tab= numpy.pad(tab,((_NPAD,_NPAD),(_NPAD,_NPAD),(0,0)),mode='wrap')
+        tab= numpy.array([ndimage.spline_filter(tab[:,:,ii],order=3)
+                          for ii in range(24)])
+        if flag != 0:
+            warnings.warn("actionAngleTorus' AutoFit exited with non-zero return status %i: %s" % (flag,_autofit_errvals[flag]),
+                          galpyWarning)
+        torus= {'tab': tab,
+                'dphi0': dphi0,
+                'Omegas': numpy.array([Omegar,Omegaphi,Omegaz]),
+                'dOdJ': dOdJ,
+                'flag': flag}
+        self._torus_cache[(jr,jphi,jz,tol)]= torus
+        while len(self._torus_cache) > self._maxcache:
+            self._torus_cache.popitem(last=False)
+        return torus
+
+    def _xvFreqs_cached(self,jr,jphi,jz,angler,anglephi,anglez,tol):
+        """xvFreqs using the torus cache"""
+        torus, dJ= self._find_torus(jr,jphi,jz,tol)
+        if torus is None:
+            torus= self._tabulate_torus(jr,jphi,jz,tol)
+            dJ= numpy.zeros(3)
+        angler= numpy.atleast_1d(angler)
+        anglephi= numpy.atleast_1d(anglephi)
+        anglez= numpy.atleast_1d(anglez)
+        coords= numpy.array([(angler % (2.*numpy.pi))/2./numpy.pi*self._nangle,
+                             (anglez % (2.*numpy.pi))/2./numpy.pi*self._nangle])\
+                             +_NPAD
+        tab= numpy.array([ndimage.map_coordinates(torus['tab'][ii],coords,
+                                                  order=3,prefilter=False)
+                          for ii in range(24)])
+        # (x,v) at the tabulated actions, corrected to first order in dJ
+        xv= tab[:6].T+numpy.einsum('ijk,j->ki',
+                                   numpy.reshape(tab[6:],(6,3,-1)),dJ)
+        xv[:,5]= (xv[:,5]+torus['dphi0']+anglephi) % (2.*numpy.pi)
+        Omegas= torus['Omegas']+numpy.dot(torus['dOdJ'],dJ)
+        return (xv,Omegas[0],Omegas[1],Omegas[2],torus['flag'])
@@ -12,7 +12,8 @@
 ###############################################################################
 import numpy
 from scipy import optimize, integrate
-from .actionAngle import actionAngle
+from .actionAngle import actionAngle, _fixed_quad_vec
+from ..potential.Potential import _illinois
 from ..potential.linearPotential import evaluatelinearPotentials
 class actionAngleVertical(actionAngle):
     """Action-angle formalism for vertical integral using the adiabatic approximation"""
@@ -213,3 +214,68 @@ def _zmaxFindStart(z,Ez,pot):
             raise OverflowError
     return ztry
 
+
+def _calczmax_vec(z,vz,Ez,potfunc):
+    """
+    NAME:
+       _calczmax_vec
+    PURPOSE:
+       calculate the maximum height for arrays of phase-space points at once
+    INPUT:
+       z - height (/ro; array)
+       vz - vertical part of the velocity (/vc; array)
+       Ez - vertical energy (array)
+       potfunc - function potfunc(z,indx) that returns the vertical potential of the points indx at heights z (array with shape [len(indx)] or [len(indx),M])
+    OUTPUT:
+       zmax (array; -9999.99 for unbound orbits)
+    HISTORY:
+       2026-10-19 - Written - agent
+    """
+    z= numpy.fabs(z)
+    zmax= numpy.array(z,dtype='float')
+    # Bracket the maximum height by doubling
+    zend= 2.*z
+    zend[z == 0.]= 0.00001
+    unbound= numpy.zeros(len(z),dtype='bool')
+    indx= numpy.arange(len(z))[vz != 0.]
+    while len(indx) > 0:
+        indx= indx[(Ez[indx]-potfunc(zend[indx],indx)) > 0.]
+        zend[indx]*= 2.
+        unbound[indx[zend[indx] > 100.]]= True
+        indx= indx[zend[indx] <= 100.]
+    indx= numpy.arange(len(z))[(vz != 0.)*(True^unbound)]
+    if len(indx) > 0:
+        zmax[indx]= _illinois(\
+            lambda x,tindx: Ez[indx[tindx]]-potfunc(x,indx[tindx]),
+            z[indx],zend[indx])
+    zmax[unbound]= -9999.99
+    return zmax
+
+def _Jz_vec(zmax,Ez,potfunc,order=20):
+    """
+    NAME:
+       _Jz_vec
+    PURPOSE:
+       calculate the vertical action for arrays of phase-space points at once
+    INPUT:
+       zmax - maximum height (array; from _calczmax_vec)
+       Ez - vertical energy (array)
+       potfunc - function potfunc(z,indx) that returns the vertical potential of the points indx at heights z (array with shape [len(indx),order])
+       order= (20) order of the Gauss-Legendre quadrature
+    OUTPUT:
+       Jz (array; 9999.99 for unbound orbits)
+    HISTORY:
+       2026-10-19 - Written - agent
+    """
+    Jz= numpy.zeros(len(zmax))
+    Jz[zmax == -9999.99]= 9999.99
+    indx= numpy.arange(len(zmax))[zmax > 0.]
+    if len(indx) == 0: return Jz
+    # z= zmax-t^2 removes the square-root singularity at zmax
+    tEz= Ez[indx][:,None]
+    tzmax= zmax[indx][:,None]
+    Jz[indx]= 2.*_fixed_quad_vec(\
+        lambda t: 2.*t*numpy.sqrt(numpy.fmax(2.*(tEz-potfunc(tzmax-t**2.,
+                                                              indx)),0.)),
+        numpy.zeros(len(indx)),numpy.sqrt(zmax[indx]),order)/numpy.pi
+    return Jz
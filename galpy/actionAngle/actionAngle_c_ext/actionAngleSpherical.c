@@ -0,0 +1,744 @@
+/*
+  C code for the action-angle calculation in spherical potentials
+*/
+#ifdef _WIN32
+#include <Python.h>
+#endif
+#include <stdio.h>
+#include <stdlib.h>
+#include <stdbool.h>
+#include <math.h>
+#include <gsl/gsl_math.h>
+#include <gsl/gsl_errno.h>
+#include <gsl/gsl_roots.h>
+#include <gsl/gsl_integration.h>
+#ifdef _OPENMP
+#include <omp.h>
+#endif
+#define CHUNKSIZE 10
+//Potentials
+#include <galpy_potentials.h>
+#include <integrateFullOrbit.h>
+#include <actionAngle.h>
+#ifndef M_PI
+#define M_PI 3.14159265358979323846
+#endif
+//Macros to export functions in DLL on different OS
+#if defined(_WIN32)
+#define EXPORT __declspec(dllexport)
+#elif defined(__GNUC__)
+#define EXPORT __attribute__((visibility("default")))
+#else
+// Just do nothing?
+#define EXPORT
+#endif
+/*
+  Structure Declarations
+*/
+struct JRSphericalArg{
+  double E;
+  double L2;
+  double rperi;
+  double rap;
+  int nargs;
+  struct potentialArg * actionAngleArgs;
+};
+/*
+  Function Declarations
+*/
+EXPORT void actionAngleSpherical_RperiRap(int,double *,double *,double *,
+					  double *,double *,int,int *,double *,
+					  double *,double *,int *);
+EXPORT void actionAngleSpherical_actions(int,double *,double *,double *,
+					 double *,double *,int,int *,double *,
+					 int,double *,int *);
+EXPORT void actionAngleSpherical_actionsFreqs(int,double *,double *,double *,
+					      double *,double *,int,int *,
+					      double *,int,double *,double *,
+					      double *,double *,int *);
+EXPORT void actionAngleSpherical_actionsFreqsAngles(int,double *,double *,
+						    double *,double *,double *,
+						    double *,int,int *,
+						    double *,int,double *,
+						    double *,double *,double *,
+						    double *,double *,double *,
+						    int *);
+void calcRperiRapSpherical(int,double *,double *,double *,double *,double *,
+			   double *,int,struct potentialArg *);
+void calcJRSpherical(int,double *,double *,double *,double *,double *,
+		     int,struct potentialArg *,int);
+void calcFreqsSpherical(int,double *,double *,double *,double *,double *,
+			double *,double *,double *,int,struct potentialArg *,
+			int);
+void calcAnglesSpherical(int,double *,double *,double *,double *,double *,
+			 double *,double *,double *,double *,double *,double *,
+			 double *,double *,double *,int,struct potentialArg *,
+			 int);
+double JRSphericalIntegrandSquared(double,void *);
+double JRSphericalIntegrand(double,void *);
+double JRSphericalIntegrandSmall(double,void *);
+double JRSphericalIntegrandLarge(double,void *);
+double TrSphericalIntegrandSmall(double,void *);
+double TrSphericalIntegrandLarge(double,void *);
+double ISphericalIntegrandSmall(double,void *);
+double ISphericalIntegrandLarge(double,void *);
+double evaluatePotentials(double,double,int, struct potentialArg *);
+/*
+  Actual functions, inlines first
+*/
+static inline void calcELSpherical(int ndata,
+				   double *R,
+				   double *vR,
+				   double *vT,
+				   double *z,
+				   double *vz,
+				   double *r,
+				   double *vr,
+				   double *vtheta,
+				   double *E,
+				   double *L,
+				   int nargs,
+				   struct potentialArg * actionAngleArgs){
+  int ii;
+  double Lx, Ly, Lz;
+  for (ii=0; ii < ndata; ii++){
+    *(r+ii)= sqrt( *(R+ii) * *(R+ii) + *(z+ii) * *(z+ii) );
+    *(vr+ii)= ( *(R+ii) * *(vR+ii) + *(z+ii) * *(vz+ii) ) / *(r+ii);
+    *(vtheta+ii)= ( *(z+ii) * *(vR+ii) - *(R+ii) * *(vz+ii) ) / *(r+ii);
+    *(E+ii)= evaluatePotentials(*(r+ii),0.,nargs,actionAngleArgs)
+      + 0.5 * *(vR+ii) * *(vR+ii)
+      + 0.5 * *(vT+ii) * *(vT+ii)
+      + 0.5 * *(vz+ii) * *(vz+ii);
+    Lz= *(R+ii) * *(vT+ii);
+    Lx= - *(z+ii) * *(vT+ii);
+    Ly= *(z+ii) * *(vR+ii) - *(R+ii) * *(vz+ii);
+    *(L+ii)= sqrt( Lx * Lx + Ly * Ly + Lz * Lz );
+  }
+}
+static inline double solveRootSpherical(gsl_root_fsolver * s,
+					gsl_function * F,
+					double r_lo,
+					double r_hi,
+					int * status){
+  int iter, max_iter = 100;
+  *status = gsl_root_fsolver_set (s, F, r_lo, r_hi);
+  if (*status == GSL_EINVAL) return -9999.99;
+  iter= 0;
+  do
+    {
+      iter++;
+      *status = gsl_root_fsolver_iterate (s);
+      r_lo = gsl_root_fsolver_x_lower (s);
+      r_hi = gsl_root_fsolver_x_upper (s);
+      *status = gsl_root_test_interval (r_lo, r_hi,
+					9.9999999999999998e-13,
+					4.4408920985006262e-16);
+    }
+  while (*status == GSL_CONTINUE && iter < max_iter);
+  return gsl_root_fsolver_root (s);
+}
+static inline double mod2pi(double x){
+  x= fmod(x,2.*M_PI);
+  return x < 0. ? x + 2.*M_PI : x;
+}
+/*
+  MAIN FUNCTIONS
+ */
+void actionAngleSpherical_RperiRap(int ndata,
+				   double *R,
+				   double *vR,
+				   double *vT,
+				   double *z,
+				   double *vz,
+				   int npot,
+				   int * pot_type,
+				   double * pot_args,
+				   double *rperi,
+				   double *rap,
+				   int * err){
+  //Set up the potentials
+  struct potentialArg * actionAngleArgs= (struct potentialArg *) malloc ( npot * sizeof (struct potentialArg) );
+  parse_leapFuncArgs_Full(npot,actionAngleArgs,&pot_type,&pot_args);
+  //r,vr,E,L
+  double *r= (double *) malloc ( ndata * sizeof(double) );
+  double *vr= (double *) malloc ( ndata * sizeof(double) );
+  double *vtheta= (double *) malloc ( ndata * sizeof(double) );
+  double *E= (double *) malloc ( ndata * sizeof(double) );
+  double *L= (double *) malloc ( ndata * sizeof(double) );
+  calcELSpherical(ndata,R,vR,vT,z,vz,r,vr,vtheta,E,L,npot,actionAngleArgs);
+  //Calculate peri and apocenters
+  calcRperiRapSpherical(ndata,rperi,rap,r,vr,E,L,npot,actionAngleArgs);
+  //Free
+  free_potentialArgs(npot,actionAngleArgs);
+  free(actionAngleArgs);
+  free(r);
+  free(vr);
+  free(vtheta);
+  free(E);
+  free(L);
+  *err= 0;
+}
+void actionAngleSpherical_actions(int ndata,
+				  double *R,
+				  double *vR,
+				  double *vT,
+				  double *z,
+				  double *vz,
+				  int npot,
+				  int * pot_type,
+				  double * pot_args,
+				  int order,
+				  double *jr,
+				  int * err){
+  //Set up the potentials
+  struct potentialArg * actionAngleArgs= (struct potentialArg *) malloc ( npot * sizeof (struct potentialArg) );
+  parse_leapFuncArgs_Full(npot,actionAngleArgs,&pot_type,&pot_args);
+  //r,vr,E,L
+  double *r= (double *) malloc ( ndata * sizeof(double) );
+  double *vr= (double *) malloc ( ndata * sizeof(double) );
+  double *vtheta= (double *) malloc ( ndata * sizeof(double) );
+  double *E= (double *) malloc ( ndata * sizeof(double) );
+  double *L= (double *) malloc ( ndata * sizeof(double) );
+  calcELSpherical(ndata,R,vR,vT,z,vz,r,vr,vtheta,E,L,npot,actionAngleArgs);
+  //Calculate peri and apocenters
+  double *rperi= (double *) malloc ( ndata * sizeof(double) );
+  double *rap= (double *) malloc ( ndata * sizeof(double) );
+  calcRperiRapSpherical(ndata,rperi,rap,r,vr,E,L,npot,actionAngleArgs);
+  //Calculate the radial action
+  calcJRSpherical(ndata,jr,rperi,rap,E,L,npot,actionAngleArgs,order);
+  //Free
+  free_potentialArgs(npot,actionAngleArgs);
+  free(actionAngleArgs);
+  free(r);
+  free(vr);
+  free(vtheta);
+  free(E);
+  free(L);
+  free(rperi);
+  free(rap);
+  *err= 0;
+}
+void actionAngleSpherical_actionsFreqs(int ndata,
+				       double *R,
+				       double *vR,
+				       double *vT,
+				       double *z,
+				       double *vz,
+				       int npot,
+				       int * pot_type,
+				       double * pot_args,
+				       int order,
+				       double *jr,
+				       double *Omegar,
+				       double *Omegaphi,
+				       double *Omegaz,
+				       int * err){
+  int ii;
+  //Set up the potentials
+  struct potentialArg * actionAngleArgs= (struct potentialArg *) malloc ( npot * sizeof (struct potentialArg) );
+  parse_leapFuncArgs_Full(npot,actionAngleArgs,&pot_type,&pot_args);
+  //r,vr,E,L
+  double *r= (double *) malloc ( ndata * sizeof(double) );
+  double *vr= (double *) malloc ( ndata * sizeof(double) );
+  double *vtheta= (double *) malloc ( ndata * sizeof(double) );
+  double *E= (double *) malloc ( ndata * sizeof(double) );
+  double *L= (double *) malloc ( ndata * sizeof(double) );
+  calcELSpherical(ndata,R,vR,vT,z,vz,r,vr,vtheta,E,L,npot,actionAngleArgs);
+  //Calculate peri and apocenters
+  double *rperi= (double *) malloc ( ndata * sizeof(double) );
+  double *rap= (double *) malloc ( ndata * sizeof(double) );
+  calcRperiRapSpherical(ndata,rperi,rap,r,vr,E,L,npot,actionAngleArgs);
+  //Calculate the radial action
+  calcJRSpherical(ndata,jr,rperi,rap,E,L,npot,actionAngleArgs,order);
+  //Calculate the frequencies
+  calcFreqsSpherical(ndata,Omegar,Omegaz,jr,r,rperi,rap,E,L,
+		     npot,actionAngleArgs,order);
+  for (ii=0; ii < ndata; ii++)
+    *(Omegaphi+ii)= *(vT+ii) < 0. ? - *(Omegaz+ii) : *(Omegaz+ii);
+  //Free
+  free_potentialArgs(npot,actionAngleArgs);
+  free(actionAngleArgs);
+  free(r);
+  free(vr);
+  free(vtheta);
+  free(E);
+  free(L);
+  free(rperi);
+  free(rap);
+  *err= 0;
+}
+void actionAngleSpherical_actionsFreqsAngles(int ndata,
+					     double *R,
+					     double *vR,
+					     double *vT,
+					     double *z,
+					     double *vz,
+					     double *phi,
+					     int npot,
+					     int * pot_type,
+					     double * pot_args,
+					     int order,
+					     double *jr,
+					     double *Omegar,
+					     double *Omegaphi,
+					     double *Omegaz,
+					     double *angler,
+					     double *anglephi,
+					     double *anglez,
+					     int * err){
+  int ii;
+  double Lz, inc, sinu, u;
+  //Set up the potentials
+  struct potentialArg * actionAngleArgs= (struct potentialArg *) malloc ( npot * sizeof (struct potentialArg) );
+  parse_leapFuncArgs_Full(npot,actionAngleArgs,&pot_type,&pot_args);
+  //r,vr,E,L
+  double *r= (double *) malloc ( ndata * sizeof(double) );
+  double *vr= (double *) malloc ( ndata * sizeof(double) );
+  double *vtheta= (double *) malloc ( ndata * sizeof(double) );
+  double *E= (double *) malloc ( ndata * sizeof(double) );
+  double *L= (double *) malloc ( ndata * sizeof(double) );
+  calcELSpherical(ndata,R,vR,vT,z,vz,r,vr,vtheta,E,L,npot,actionAngleArgs);
+  //Calculate peri and apocenters
+  double *rperi= (double *) malloc ( ndata * sizeof(double) );
+  double *rap= (double *) malloc ( ndata * sizeof(double) );
+  calcRperiRapSpherical(ndata,rperi,rap,r,vr,E,L,npot,actionAngleArgs);
+  //Calculate the radial action
+  calcJRSpherical(ndata,jr,rperi,rap,E,L,npot,actionAngleArgs,order);
+  //Calculate the frequencies
+  calcFreqsSpherical(ndata,Omegar,Omegaz,jr,r,rperi,rap,E,L,
+		     npot,actionAngleArgs,order);
+  //Calculate the angles
+  double *Lzs= (double *) malloc ( ndata * sizeof(double) );
+  for (ii=0; ii < ndata; ii++)
+    *(Lzs+ii)= *(R+ii) * *(vT+ii);
+  calcAnglesSpherical(ndata,angler,anglez,Omegar,Omegaz,r,vr,vtheta,z,phi,
+		      Lzs,rperi,rap,E,L,npot,actionAngleArgs,order);
+  for (ii=0; ii < ndata; ii++){
+    //Longitude of the ascending node
+    Lz= *(Lzs+ii);
+    inc= acos(Lz / *(L+ii));
+    sinu= *(z+ii) / *(R+ii) / tan(inc);
+    if ( isfinite(sinu) && sinu > 1. ) sinu= 1.;
+    else if ( isfinite(sinu) && sinu < -1. ) sinu= -1.;
+    u= asin(sinu);
+    if ( *(vtheta+ii) > 0. ) u= M_PI - u;
+    // For non-inclined orbits, we set Omega=0 by convention
+    if ( ! isfinite(u) ) u= *(phi+ii);
+    *(anglephi+ii)= *(phi+ii) - u;
+    if ( *(vT+ii) < 0. ) {
+      *(Omegaphi+ii)= - *(Omegaz+ii);
+      *(anglephi+ii)-= *(anglez+ii);
+    }
+    else {
+      *(Omegaphi+ii)= *(Omegaz+ii);
+      *(anglephi+ii)+= *(anglez+ii);
+    }
+    *(angler+ii)= mod2pi(*(angler+ii));
+    *(anglephi+ii)= mod2pi(*(anglephi+ii));
+    *(anglez+ii)= mod2pi(*(anglez+ii));
+  }
+  //Free
+  free_potentialArgs(npot,actionAngleArgs);
+  free(actionAngleArgs);
+  free(r);
+  free(vr);
+  free(vtheta);
+  free(E);
+  free(L);
+  free(rperi);
+  free(rap);
+  free(Lzs);
+  *err= 0;
+}
+void calcRperiRapSpherical(int ndata,
+			   double * rperi,
+			   double * rap,
+			   double * r,
+			   double * vr,
+			   double * E,
+			   double * L,
+			   int nargs,
+			   struct potentialArg * actionAngleArgs){
+  int ii, tid, nthreads;
+#ifdef _OPENMP
+  nthreads = omp_get_max_threads();
+#else
+  nthreads = 1;
+#endif
+  double peps, meps;
+  gsl_function * JRRoot= (gsl_function *) malloc ( nthreads * sizeof(gsl_function) );
+  struct JRSphericalArg * params= (struct JRSphericalArg *) malloc ( nthreads * sizeof (struct JRSphericalArg) );
+  //Setup solver
+  int status;
+  const gsl_root_fsolver_type *T;
+  struct pragmasolver *s= (struct pragmasolver *) malloc ( nthreads * sizeof (struct pragmasolver) );
+  double r_lo, r_hi;
+  T = gsl_root_fsolver_brent;
+  for (tid=0; tid < nthreads; tid++){
+    (params+tid)->nargs= nargs;
+    (params+tid)->actionAngleArgs= actionAngleArgs;
+    (s+tid)->s= gsl_root_fsolver_alloc (T);
+  }
+  UNUSED int chunk= CHUNKSIZE;
+  gsl_set_error_handler_off();
+#pragma omp parallel for schedule(static,chunk)				\
+  private(tid,ii,status,r_lo,r_hi,meps,peps)				\
+  shared(rperi,rap,JRRoot,params,s,r,vr,E,L)
+  for (ii=0; ii < ndata; ii++){
+#ifdef _OPENMP
+    tid= omp_get_thread_num();
+#else
+    tid = 0;
+#endif
+    //Setup function
+    (params+tid)->E= *(E+ii);
+    (params+tid)->L2= *(L+ii) * *(L+ii);
+    (JRRoot+tid)->function = &JRSphericalIntegrandSquared;
+    (JRRoot+tid)->params = params+tid;
+    peps= GSL_FN_EVAL(JRRoot+tid,*(r+ii) * (1.+0.000001));
+    meps= GSL_FN_EVAL(JRRoot+tid,*(r+ii) * (1.-0.000001));
+    if ( fabs(*(vr+ii)) < 0.0000001 && peps <= 0. && meps <= 0. ) {//circular
+      *(rperi+ii) = *(r+ii);
+      *(rap+ii) = *(r+ii);
+      continue;
+    }
+    //Pericenter
+    if ( fabs(*(vr+ii)) < 0.0000001 && meps < 0. ) // at pericenter
+      *(rperi+ii)= *(r+ii);
+    else {
+      r_lo= 0.9 * *(r+ii);
+      r_hi= *(r+ii);
+      while ( GSL_FN_EVAL(JRRoot+tid,r_lo) >= 0. && r_lo > 0.000000001){
+	r_hi= r_lo; //this makes sure that brent evaluates using previous
+	r_lo*= 0.9;
+      }
+      if ( r_lo <= 0.000000001 )
+	*(rperi+ii)= 0.;//Assume zero if below 0.000000001
+      else
+	*(rperi+ii)= solveRootSpherical((s+tid)->s,JRRoot+tid,r_lo,r_hi,
+					&status);
+    }
+    //Apocenter
+    if ( fabs(*(vr+ii)) < 0.0000001 && peps < 0. ) // at apocenter
+      *(rap+ii)= *(r+ii);
+    else {
+      r_lo= *(r+ii);
+      r_hi= 1.1 * *(r+ii);
+      while ( GSL_FN_EVAL(JRRoot+tid,r_hi) > 0. && r_hi < 200.) {
+	r_lo= r_hi; //this makes sure that brent evaluates using previous
+	r_hi*= 1.1;
+      }
+      *(rap+ii)= solveRootSpherical((s+tid)->s,JRRoot+tid,r_lo,r_hi,
+				    &status);
+    }
+    if ( *(rperi+ii) == -9999.99 || *(rap+ii) == -9999.99 ) {//unbound
+      *(rperi+ii) = -9999.99;
+      *(rap+ii) = -9999.99;
+    }
+  }
+  gsl_set_error_handler (NULL);
+  for (tid=0; tid < nthreads; tid++)
+    gsl_root_fsolver_free( (s+tid)->s);
+  free(s);
+  free(JRRoot);
+  free(params);
+}
+void calcJRSpherical(int ndata,
+		     double * jr,
+		     double * rperi,
+		     double * rap,
+		     double * E,
+		     double * L,
+		     int nargs,
+		     struct potentialArg * actionAngleArgs,
+		     int order){
+  int ii, tid, nthreads;
+#ifdef _OPENMP
+  nthreads = omp_get_max_threads();
+#else
+  nthreads = 1;
+#endif
+  double rmean;
+  gsl_function * JRInt= (gsl_function *) malloc ( nthreads * sizeof(gsl_function) );
+  struct JRSphericalArg * params= (struct JRSphericalArg *) malloc ( nthreads * sizeof (struct JRSphericalArg) );
+  for (tid=0; tid < nthreads; tid++){
+    (params+tid)->nargs= nargs;
+    (params+tid)->actionAngleArgs= actionAngleArgs;
+  }
+  //Setup integrator
+  gsl_integration_glfixed_table * T= gsl_integration_glfixed_table_alloc (order);
+  UNUSED int chunk= CHUNKSIZE;
+#pragma omp parallel for schedule(static,chunk)				\
+  private(tid,ii,rmean)							\
+  shared(jr,rperi,rap,JRInt,params,T,E,L)
+  for (ii=0; ii < ndata; ii++){
+#ifdef _OPENMP
+    tid= omp_get_thread_num();
+#else
+    tid = 0;
+#endif
+    if ( *(rperi+ii) == -9999.99 || *(rap+ii) == -9999.99 ){
+      *(jr+ii)= 9999.99;
+      continue;
+    }
+    if ( (*(rap+ii) - *(rperi+ii)) / *(rap+ii) < 0.000001 ){//circular
+      *(jr+ii) = 0.;
+      continue;
+    }
+    //Setup function
+    (params+tid)->E= *(E+ii);
+    (params+tid)->L2= *(L+ii) * *(L+ii);
+    (params+tid)->rperi= *(rperi+ii);
+    (params+tid)->rap= *(rap+ii);
+    (JRInt+tid)->params = params+tid;
+    //Integrate, splitting at the geometric mean of peri and apocenter and
+    //using r= rperi+t^2 and r= rap-t^2 to remove the sqrt singularities
+    rmean= sqrt( *(rperi+ii) * *(rap+ii) );
+    (JRInt+tid)->function = &JRSphericalIntegrandSmall;
+    *(jr+ii)= gsl_integration_glfixed (JRInt+tid,0.,
+				       sqrt(rmean - *(rperi+ii)),T);
+    (JRInt+tid)->function = &JRSphericalIntegrandLarge;
+    *(jr+ii)+= gsl_integration_glfixed (JRInt+tid,0.,
+					sqrt(*(rap+ii) - rmean),T);
+    *(jr+ii)/= M_PI;
+  }
+  free(JRInt);
+  free(params);
+  gsl_integration_glfixed_table_free ( T );
+}
+void calcFreqsSpherical(int ndata,
+			double * Omegar,
+			double * Omegaz,
+			double * jr,
+			double * r,
+			double * rperi,
+			double * rap,
+			double * E,
+			double * L,
+			int nargs,
+			struct potentialArg * actionAngleArgs,
+			int order){
+  int ii, tid, nthreads;
+#ifdef _OPENMP
+  nthreads = omp_get_max_threads();
+#else
+  nthreads = 1;
+#endif
+  double rmean, Tr, I, Rforce, dr, dRforcedr;
+  gsl_function * FreqInt= (gsl_function *) malloc ( nthreads * sizeof(gsl_function) );
+  struct JRSphericalArg * params= (struct JRSphericalArg *) malloc ( nthreads * sizeof (struct JRSphericalArg) );
+  for (tid=0; tid < nthreads; tid++){
+    (params+tid)->nargs= nargs;
+    (params+tid)->actionAngleArgs= actionAngleArgs;
+  }
+  //Setup integrator
+  gsl_integration_glfixed_table * T= gsl_integration_glfixed_table_alloc (order);
+  UNUSED int chunk= CHUNKSIZE;
+#pragma omp parallel for schedule(static,chunk)				\
+  private(tid,ii,rmean,Tr,I,Rforce,dr,dRforcedr)			\
+  shared(Omegar,Omegaz,jr,r,rperi,rap,FreqInt,params,T,E,L)
+  for (ii=0; ii < ndata; ii++){
+#ifdef _OPENMP
+    tid= omp_get_thread_num();
+#else
+    tid = 0;
+#endif
+    if ( *(rperi+ii) == -9999.99 || *(rap+ii) == -9999.99 ){
+      *(Omegar+ii)= 9999.99;
+      *(Omegaz+ii)= 9999.99;
+      continue;
+    }
+    if ( *(jr+ii) < 0.000000001 ){//circular: epicycle and circular frequency
+      Rforce= calcRforce(*(r+ii),0.,0.,0.,nargs,actionAngleArgs);
+      dr= 0.000001 * *(r+ii);
+      dRforcedr= ( calcRforce(*(r+ii)+dr,0.,0.,0.,nargs,actionAngleArgs)
+		   - calcRforce(*(r+ii)-dr,0.,0.,0.,nargs,actionAngleArgs) )
+	/ 2. / dr;
+      *(Omegar+ii)= sqrt( - dRforcedr - 3. * Rforce / *(r+ii) );
+      *(Omegaz+ii)= sqrt( - Rforce / *(r+ii) );
+      continue;
+    }
+    //Setup function
+    (params+tid)->E= *(E+ii);
+    (params+tid)->L2= *(L+ii) * *(L+ii);
+    (params+tid)->rperi= *(rperi+ii);
+    (params+tid)->rap= *(rap+ii);
+    (FreqInt+tid)->params = params+tid;
+    rmean= sqrt( *(rperi+ii) * *(rap+ii) );
+    //Radial period
+    (FreqInt+tid)->function = &TrSphericalIntegrandSmall;
+    Tr= gsl_integration_glfixed (FreqInt+tid,0.,sqrt(rmean - *(rperi+ii)),T);
+    (FreqInt+tid)->function = &TrSphericalIntegrandLarge;
+    Tr+= gsl_integration_glfixed (FreqInt+tid,0.,sqrt(*(rap+ii) - rmean),T);
+    *(Omegar+ii)= M_PI / Tr;
+    //Azimuthal period
+    (FreqInt+tid)->function = &ISphericalIntegrandSmall;
+    I= gsl_integration_glfixed (FreqInt+tid,0.,sqrt(rmean - *(rperi+ii)),T);
+    (FreqInt+tid)->function = &ISphericalIntegrandLarge;
+    I+= gsl_integration_glfixed (FreqInt+tid,0.,sqrt(*(rap+ii) - rmean),T);
+    *(Omegaz+ii)= I * *(L+ii) * *(Omegar+ii) / M_PI;
+  }
+  free(FreqInt);
+  free(params);
+  gsl_integration_glfixed_table_free ( T );
+}
+void calcAnglesSpherical(int ndata,
+			 double * angler,
+			 double * anglez,
+			 double * Omegar,
+			 double * Omegaz,
+			 double * r,
+			 double * vr,
+			 double * vtheta,
+			 double * z,
+			 double * phi,
+			 double * Lz,
+			 double * rperi,
+			 double * rap,
+			 double * E,
+			 double * L,
+			 int nargs,
+			 struct potentialArg * actionAngleArgs,
+			 int order){
+  int ii, tid, nthreads;
+#ifdef _OPENMP
+  nthreads = omp_get_max_threads();
+#else
+  nthreads = 1;
+#endif
+  double rmean, wr, wz, dpsi, psi, sinpsi;
+  gsl_function * AngleInt= (gsl_function *) malloc ( nthreads * sizeof(gsl_function) );
+  struct JRSphericalArg * params= (struct JRSphericalArg *) malloc ( nthreads * sizeof (struct JRSphericalArg) );
+  for (tid=0; tid < nthreads; tid++){
+    (params+tid)->nargs= nargs;
+    (params+tid)->actionAngleArgs= actionAngleArgs;
+  }
+  //Setup integrator
+  gsl_integration_glfixed_table * T= gsl_integration_glfixed_table_alloc (order);
+  UNUSED int chunk= CHUNKSIZE;
+#pragma omp parallel for schedule(static,chunk)				\
+  private(tid,ii,rmean,wr,wz,dpsi,psi,sinpsi)				\
+  shared(angler,anglez,Omegar,Omegaz,r,vr,vtheta,z,phi,Lz,rperi,rap,AngleInt,params,T,E,L)
+  for (ii=0; ii < ndata; ii++){
+#ifdef _OPENMP
+    tid= omp_get_thread_num();
+#else
+    tid = 0;
+#endif
+    if ( *(rperi+ii) == -9999.99 || *(rap+ii) == -9999.99 ){
+      *(angler+ii)= 9999.99;
+      *(anglez+ii)= 9999.99;
+      continue;
+    }
+    //Setup function
+    (params+tid)->E= *(E+ii);
+    (params+tid)->L2= *(L+ii) * *(L+ii);
+    (params+tid)->rperi= *(rperi+ii);
+    (params+tid)->rap= *(rap+ii);
+    (AngleInt+tid)->params = params+tid;
+    rmean= sqrt( *(rperi+ii) * *(rap+ii) );
+    //Radial angle and dS_r/dL
+    if ( *(r+ii) < rmean ){
+      if ( *(r+ii) > *(rperi+ii) ){
+	(AngleInt+tid)->function = &TrSphericalIntegrandSmall;
+	wr= *(Omegar+ii)
+	  * gsl_integration_glfixed (AngleInt+tid,0.,
+				     sqrt(*(r+ii) - *(rperi+ii)),T);
+	(AngleInt+tid)->function = &ISphericalIntegrandSmall;
+	wz= *(L+ii) * gsl_integration_glfixed (AngleInt+tid,0.,
+					       sqrt(*(r+ii) - *(rperi+ii)),T);
+      }
+      else {
+	wr= 0.;
+	wz= 0.;
+      }
+      if ( *(vr+ii) < 0. ) wr= 2. * M_PI - wr;
+    }
+    else {
+      if ( *(r+ii) < *(rap+ii) ){
+	(AngleInt+tid)->function = &TrSphericalIntegrandLarge;
+	wr= *(Omegar+ii)
+	  * gsl_integration_glfixed (AngleInt+tid,0.,
+				     sqrt(*(rap+ii) - *(r+ii)),T);
+	(AngleInt+tid)->function = &ISphericalIntegrandLarge;
+	wz= *(L+ii) * gsl_integration_glfixed (AngleInt+tid,0.,
+					       sqrt(*(rap+ii) - *(r+ii)),T);
+      }
+      else {
+	wr= M_PI;
+	wz= 0.;
+      }
+      if ( *(vr+ii) < 0. ) wr= M_PI + wr;
+      else wr= M_PI - wr;
+    }
+    *(angler+ii)= wr;
+    //Vertical angle: first calculate psi
+    sinpsi= *(z+ii) / *(r+ii) / sin(acos(*(Lz+ii) / *(L+ii)));
+    if ( isfinite(sinpsi) ){
+      if ( sinpsi > 1. ) sinpsi= 1.;
+      else if ( sinpsi < -1. ) sinpsi= -1.;
+      psi= asin(sinpsi);
+      if ( *(vtheta+ii) > 0. ) psi= M_PI - psi;
+    }
+    else
+      psi= *(phi+ii);
+    psi= mod2pi(psi);
+    dpsi= *(Omegaz+ii) / *(Omegar+ii) * 2. * M_PI; //this is the full I integral
+    if ( *(r+ii) < rmean ){
+      if ( *(vr+ii) < 0. ) wz= dpsi - wz;
+    }
+    else {
+      if ( *(vr+ii) < 0. ) wz= dpsi / 2. + wz;
+      else wz= dpsi / 2. - wz;
+    }
+    *(anglez+ii)= - wz + psi + *(Omegaz+ii) / *(Omegar+ii) * wr;
+  }
+  free(AngleInt);
+  free(params);
+  gsl_integration_glfixed_table_free ( T );
+}
+double JRSphericalIntegrandSquared(double r,
+				   void * p){
+  struct JRSphericalArg * params= (struct JRSphericalArg *) p;
+  return params->E - evaluatePotentials(r,0.,params->nargs,
+					params->actionAngleArgs)
+    - 0.5 * params->L2 / r / r;
+}
+double JRSphericalIntegrand(double r,
+			    void * p){
+  double out= JRSphericalIntegrandSquared(r,p);
+  if ( out <= 0. ) return 0.;
+  else return sqrt(2. * out);
+}
+double JRSphericalIntegrandSmall(double t,
+				 void * p){
+  struct JRSphericalArg * params= (struct JRSphericalArg *) p;
+  return 2. * t * JRSphericalIntegrand(params->rperi + t * t,p);
+}
+double JRSphericalIntegrandLarge(double t,
+				 void * p){
+  struct JRSphericalArg * params= (struct JRSphericalArg *) p;
+  return 2. * t * JRSphericalIntegrand(params->rap - t * t,p);
+}
+double TrSphericalIntegrandSmall(double t,
+				 void * p){
+  struct JRSphericalArg * params= (struct JRSphericalArg *) p;
+  return 2. * t / JRSphericalIntegrand(params->rperi + t * t,p);
+}
+double TrSphericalIntegrandLarge(double t,
+				 void * p){
+  struct JRSphericalArg * params= (struct JRSphericalArg *) p;
+  return 2. * t / JRSphericalIntegrand(params->rap - t * t,p);
+}
+double ISphericalIntegrandSmall(double t,
+				void * p){
+  struct JRSphericalArg * params= (struct JRSphericalArg *) p;
+  double r= params->rperi + t * t;
+  return 2. * t / JRSphericalIntegrand(r,p) / r / r;
+}
+double ISphericalIntegrandLarge(double t,
+				void * p){
+  struct JRSphericalArg * params= (struct JRSphericalArg *) p;
+  double r= params->rap - t * t;
+  return 2. * t / JRSphericalIntegrand(r,p) / r / r;
+}
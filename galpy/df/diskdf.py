@@ -28,6 +28,7 @@ from .surfaceSigmaProfile import surfaceSigmaProfile, expSurfaceSigmaProfile
 from ..orbit import Orbit
 from ..util.bovy_ars import bovy_ars
 from ..util import save_pickles
+from ..util.cache import cached
 from ..util.bovy_conversion import physical_conversion, \
     potential_physical_input, _APY_UNITS, surfdens_in_msolpc2
 from ..potential import PowerSphericalPotential
@@ -67,6 +68,7 @@ class diskdf(df):
                         could be anything that class takes
            beta - power-law index of the rotation curve
            correct - correct the DF (i.e., DFcorrection kwargs are also given)
+           cache= (None) if True, save the corrections to the persistent cache (see galpy.util.cache) instead of to savedir and load them from there when they are needed again; can also be set to the directory to use for the cache
            + DFcorrection kwargs (except for those already specified)
         OUTPUT:
         HISTORY:
@@ -1647,6 +1649,8 @@ class dehnendf(diskdf):
 
            correct - if True, correct the DF
 
+           cache= (None) if True, save the corrections (when correct=True) to the persistent cache (see galpy.util.cache) instead of to savedir and load them from there when they are needed again; can also be set to the directory to use for the cache
+
            ro= distance from vantage point to GC (kpc; can be Quantity)
 
            vo= circular velocity at ro (km/s; can be Quantity)
@@ -1956,6 +1960,8 @@ class shudf(diskdf):
 
            correct - if True, correct the DF
 
+           cache= (None) if True, save the corrections (when correct=True) to the persistent cache (see galpy.util.cache) instead of to savedir and load them from there when they are needed again; can also be set to the directory to use for the cache
+
            ro= distance from vantage point to GC (kpc; can be Quantity)
 
            vo= circular velocity at ro (km/s; can be Quantity)
@@ -2207,6 +2213,8 @@ class schwarzschilddf(shudf):
 
            correct - if True, correct the DF
 
+           cache= (None) if True, save the corrections (when correct=True) to the persistent cache (see galpy.util.cache) instead of to savedir and load them from there when they are needed again; can also be set to the directory to use for the cache
+
            ro= distance from vantage point to GC (kpc; can be Quantity)
 
            vo= circular velocity at ro (km/s; can be Quantity)
@@ -2303,6 +2311,7 @@ class DFcorrection(object):
            npoints - number of points from 0 to Rmax
            rmax - correct up to this radius (/ro) (default: 5)
            savedir - save the corrections in this directory
+           cache - if True, save the corrections to the persistent cache (see galpy.util.cache) rather than to savedir and load them from there when they are needed again; can also be set to the directory to use for the cache
            surfaceSigmaProfile - target surfacemass and sigma_R^2 instance
            beta - power-law index of the rotation curve (when calculating)
            dftype - classname of the DF
@@ -2311,6 +2320,7 @@ class DFcorrection(object):
         OUTPUT:
         HISTORY:
            2010-03-10 - Written - Bovy (NYU)
+           2026-10-19 - Added cache - agent
         """
         if not 'surfaceSigmaProfile' in kwargs:
             raise DFcorrectionError("surfaceSigmaProfile not given")
@@ -2336,12 +2346,18 @@ class DFcorrection(object):
         else:
             self._savedir= kwargs.get('savedir',_CORRECTIONSDIR)
             self._savefilename= self._createSavefilename(self._niter)
+            self._cache= kwargs.get('cache',None)
             if os.path.exists(self._savefilename):
                 savefile= open(self._savefilename,'rb')
                 self._corrections= numpy.array(pickle.load(savefile))
                 savefile.close()
-            else: #Calculate the corrections
-                self._corrections= self._calc_corrections()
+            else: #Calculate the corrections or load them from the cache
+                self._corrections= cached(self._calc_corrections,self._cache,
+                                          'DFcorrection',self._dftype,
+                                          self._surfaceSigmaProfile,
+                                          self._beta,self._npoints,
+                                          self._rmax,self._niter,
+                                          self._interp_k)
         #Interpolation; smoothly go to zero
         interpRs= numpy.append(self._rs,2.*self._rmax)
         self._surfaceInterpolate= interpolate.InterpolatedUnivariateSpline(interpRs,
@@ -2487,11 +2503,12 @@ class DFcorrection(object):
                                                  use_physical=False)
                 #print(jj, newcorrections[jj,:])
             corrections*= newcorrections
-        #Save
-        picklethis= []
-        for arr in list(corrections):
-            picklethis.append([float(a) for a in arr])
-        save_pickles(self._savefilename,picklethis) #We pickle a list for platform-independence)
+        #Save, unless they are saved to the cache
+        if self._cache is None or self._cache is False:
+            picklethis= []
+            for arr in list(corrections):
+                picklethis.append([float(a) for a in arr])
+            save_pickles(self._savefilename,picklethis) #We pickle a list for platform-independence)
         return corrections
     
 class DFcorrectionError(Exception):
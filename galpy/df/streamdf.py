@@ -21,6 +21,7 @@ from ..util.bovy_conversion import physical_conversion, _APY_UNITS
 from ..actionAngle.actionAngleIsochroneApprox import dePeriod
 from ..potential import flatten as flatten_potential
 from ..util import galpyWarning
+from ..util.cache import cached_setup
 if _APY_LOADED:
     from astropy import units
 _INTERPDURINGSETUP= True
@@ -57,7 +58,7 @@ class streamdf(df):
                  multi=None,interpTrack=_INTERPDURINGSETUP,
                  useInterp=_USEINTERP,nosetup=False,nospreadsetup=False,
                  approxConstTrackFreq=False,useTMHessian=False,
-                 custom_transform=None):
+                 custom_transform=None,cache=None):
         """
         NAME:
 
@@ -116,6 +117,8 @@ class streamdf(df):
 
            multi= (None) if set, use multi-processing
 
+           cache= (None) if True, save the stream track and spread to the persistent cache (see galpy.util.cache) and load them from there when the same stream is set up again; can also be set to the directory to use for the cache
+
            Coordinate transformation inputs:
 
               vo= (220) circular velocity to normalize velocities with [used to be Vnorm; can be Quantity]
@@ -144,6 +147,8 @@ class streamdf(df):
 
            2013-11-25 - Started over - Bovy (IAS)
 
+           2026-10-19 - Added cache= - agent
+
         """
         if ro is None and not Rnorm is None:
             warnings.warn("WARNING: Rnorm keyword input to streamdf is deprecated in favor of the standard ro keyword", galpyWarning)
@@ -206,14 +211,27 @@ class streamdf(df):
         self._setup_coord_transform(R0,Zsun,vsun,progenitor,custom_transform)
         #Determine the stream track
         if not nosetup:
-            self._determine_nTrackIterations(nTrackIterations)
-            self._determine_stream_track(nTrackChunks)
-            self._useInterp= useInterp
-            if interpTrack or self._useInterp:
-                self._interpolate_stream_track()
-                self._interpolate_stream_track_aA()
-            self.calc_stream_lb()
-            if not nospreadsetup: self._determine_stream_spread()
+            cached_setup(self,
+                         lambda: self._setup_stream_track(nTrackIterations,
+                                                          nTrackChunks,
+                                                          useInterp,
+                                                          interpTrack,
+                                                          nospreadsetup),
+                         cache,nTrackIterations,nTrackChunks,useInterp,
+                         interpTrack,nospreadsetup)
+        return None
+
+    def _setup_stream_track(self,nTrackIterations,nTrackChunks,useInterp,
+                            interpTrack,nospreadsetup):
+        """The part of the setup that determines the stream track"""
+        self._determine_nTrackIterations(nTrackIterations)
+        self._determine_stream_track(nTrackChunks)
+        self._useInterp= useInterp
+        if interpTrack or self._useInterp:
+            self._interpolate_stream_track()
+            self._interpolate_stream_track_aA()
+        self.calc_stream_lb()
+        if not nospreadsetup: self._determine_stream_spread()
         return None
 
     def _progenitor_setup(self,progenitor,leading,useTMHessian):
@@ -12,6 +12,7 @@ from ..potential import evaluateRforces, MovingObjectPotential, \
     PlummerPotential
 from .df import df, _APY_LOADED
 from ..util.bovy_conversion import physical_conversion
+from ..util.cache import cached_setup
 from . import streamdf
 from .streamdf import _determine_stream_track_single
 from ..potential import flatten as flatten_potential
@@ -79,6 +80,8 @@ class streamgapdf(streamdf.streamdf):
 
            higherorderTrack= (False) if True, calculate the track using higher-order terms
 
+           cache= (None) if True, save the impact setup, kicks, and stream track to the persistent cache (see galpy.util.cache) and load them from there when the same stream gap is set up again; can also be set to the directory to use for the cache
+
         OUTPUT:
 
            object
@@ -87,6 +90,8 @@ class streamgapdf(streamdf.streamdf):
 
            2015-06-02 - Started - Bovy (IAS)
 
+           2026-10-19 - Added cache= - agent
+
         """
         df.__init__(self,ro=kwargs.get('ro',None),vo=kwargs.get('vo',None))
         # Parse kwargs
@@ -142,8 +147,37 @@ class streamgapdf(streamdf.streamdf):
         kwargs['nosetup']= True
         super(streamgapdf,self).__init__(*args,**kwargs)
         # Setup the machinery to go between (x,v) and (Omega,theta)
+        # near the impact, compute the kicks, and determine the stream track,
+        # or load all of these from the cache
+        cached_setup(self,
+                     lambda: self._setup_impact(kwargs.get('nTrackIterations',
+                                                           None),
+                                                deltaAngleTrackImpact,
+                                                nTrackChunksImpact,
+                                                timpact,impact_angle,
+                                                nKickPoints,nokicksetup,
+                                                impactb,subhalovel,GM,rs,
+                                                subhalopot,spline_order,
+                                                hernquist,higherorderTrack,
+                                                nTrackChunks,interpTrack,
+                                                useInterp),
+                     kwargs.get('cache',None),
+                     kwargs.get('nTrackIterations',None),
+                     deltaAngleTrackImpact,nTrackChunksImpact,timpact,
+                     impact_angle,nKickPoints,nokicksetup,impactb,subhalovel,
+                     GM,rs,subhalopot,spline_order,hernquist,higherorderTrack,
+                     nTrackChunks,interpTrack,useInterp)
+        return None
+
+    def _setup_impact(self,nTrackIterations,deltaAngleTrackImpact,
+                      nTrackChunksImpact,timpact,impact_angle,nKickPoints,
+                      nokicksetup,impactb,subhalovel,GM,rs,subhalopot,
+                      spline_order,hernquist,higherorderTrack,nTrackChunks,
+                      interpTrack,useInterp):
+        """The part of the setup relating to the impact: coordinate transformation near the impact, kicks, and the stream track"""
+        # Setup the machinery to go between (x,v) and (Omega,theta)
         # near the impact
-        self._determine_nTrackIterations(kwargs.get('nTrackIterations',None))
+        self._determine_nTrackIterations(nTrackIterations)
         self._determine_deltaAngleTrackImpact(deltaAngleTrackImpact,timpact)
         self._determine_impact_coordtransform(self._deltaAngleTrackImpact,
                                               nTrackChunksImpact,
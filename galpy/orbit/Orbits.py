@@ -31,7 +31,7 @@ from ..potential import toPlanarPotential, PotentialError, evaluatePotentials,\
     evaluateplanarPotentials, evaluatelinearPotentials
 from ..potential import flatten as flatten_potential
 from ..potential.Potential import _check_c
-from ..potential import rl, _isNonAxi
+from ..potential import rl, rtide, ttensor, _isNonAxi
 from ..potential.DissipativeForce import _isDissipative
 from .integrateLinearOrbit import integrateLinearOrbit_c, _ext_loaded, \
     integrateLinearOrbit
@@ -68,6 +68,8 @@ try:
 except KeyError:
     import multiprocessing
     _NUMCORES= multiprocessing.cpu_count()
+# Number of previous actionAngle setups (and their results) to keep for re-use
+_MAX_PREV_ACTIONANGLES= config.__config__.getint('cache','orbit-actionangles')
 # named_objects file
 def _named_objects_key_formatting(name):
     # Remove punctuation, spaces, and make lowercase
@@ -1106,6 +1108,7 @@ class Orbit(object):
         # Delete attributes for interpolation and rperi etc. determination
         if hasattr(self,'_orbInterp'): delattr(self,'_orbInterp')
         if hasattr(self,'rs'): delattr(self,'rs')
+        self._reset_aA_time_results()
         if self.dim() == 2:
             thispot= toPlanarPotential(pot)
         else:
@@ -1272,6 +1275,7 @@ class Orbit(object):
         # Delete attributes for interpolation and rperi etc. determination
         if hasattr(self,'_orbInterp'): delattr(self,'_orbInterp')
         if hasattr(self,'rs'): delattr(self,'rs')
+        self._reset_aA_time_results()
         if self.dim() == 2:
             thispot= toPlanarPotential(pot)
         self.t= numpy.array(t)
@@ -1829,6 +1833,126 @@ class Orbit(object):
         kwargs.pop('dontreshape')
         return out
 
+    @physical_conversion('position')
+    @shapeDecorator
+    def rtide(self,*args,**kwargs):
+        """
+        NAME:
+
+           rtide
+
+        PURPOSE:
+
+           calculate the tidal radius of an object of mass M along the orbit (see galpy.potential.rtide)
+
+        INPUT:
+
+           t - (optional) time at which to get the tidal radius (can be Quantity)
+
+           M= mass of the object (can be Quantity)
+
+           pot= Potential instance or list of such instances
+
+           ro= (Object-wide default) physical scale for distances to use to convert (can be Quantity)
+
+           use_physical= use to override Object-wide default for using a physical scale for output
+
+        OUTPUT:
+
+           tidal radius [*input_shape,nt]
+
+        HISTORY:
+
+           2026-10-19 - Written - agent
+
+        """
+        M= kwargs.pop('M',None)
+        if _APY_LOADED and isinstance(M,units.Quantity):
+            M= M.to(units.Msun).value\
+                /bovy_conversion.mass_in_msol(self._vo,self._ro)
+        pot,R,z,phi,t,onet= self._setup_tidal(*args,**kwargs)
+        out= rtide(pot,R,z,phi=phi,t=t,M=M,use_physical=False)
+        if onet:
+            return out[:,0]
+        else:
+            return out
+
+    @physical_conversion('forcederivative')
+    @shapeDecorator
+    def ttensor(self,*args,**kwargs):
+        """
+        NAME:
+
+           ttensor
+
+        PURPOSE:
+
+           calculate the tidal tensor (or its eigenvalues) along the orbit (see galpy.potential.ttensor)
+
+        INPUT:
+
+           t - (optional) time at which to get the tidal tensor (can be Quantity)
+
+           eigenval= (False) if True, return the eigenvalues of the tidal tensor
+
+           pot= Potential instance or list of such instances
+
+           ro= (Object-wide default) physical scale for distances to use to convert (can be Quantity)
+
+           vo= (Object-wide default) physical scale for velocities to use to convert (can be Quantity)
+
+           use_physical= use to override Object-wide default for using a physical scale for output
+
+        OUTPUT:
+
+           tidal tensor [*input_shape,nt,3,3] or its eigenvalues [*input_shape,nt,3]
+
+        HISTORY:
+
+           2026-10-19 - Written - agent
+
+        """
+        eigenval= kwargs.pop('eigenval',False)
+        pot,R,z,phi,t,onet= self._setup_tidal(*args,**kwargs)
+        out= ttensor(pot,R,z,phi=phi,t=t,eigenval=eigenval,use_physical=False)
+        if onet:
+            return out[:,0]
+        else:
+            return out
+
+    def _setup_tidal(self,*args,**kwargs):
+        """Return the potential and the (R,z,phi,t) [norb,nt] at which to compute tidal quantities along the orbit, and whether a single time was requested"""
+        if not self.dim() == 3:
+            raise AttributeError("Tidal quantities can only be computed for 3D orbits")
+        if not kwargs.get('pot',None) is None: kwargs['pot']= flatten_potential(kwargs.get('pot'))
+        _check_consistent_units(self,kwargs.get('pot',None))
+        if kwargs.get('pot',None) is None:
+            try:
+                pot= self._pot
+            except AttributeError:
+                raise AttributeError("Integrate orbits or specify pot=")
+        else:
+            pot= kwargs['pot']
+        if len(args) > 0:
+            t= args[0]
+        else:
+            t= 0.
+        if _APY_LOADED and isinstance(t,units.Quantity):
+            t= t.to(units.Gyr).value\
+                /bovy_conversion.time_in_Gyr(self._vo,self._ro)
+        #Get orbit
+        thiso= self._call_internal(*args)
+        onet= (len(thiso.shape) == 2)
+        if onet:
+            thiso= thiso[:,numpy.newaxis,:]
+            t= numpy.atleast_1d(t)
+        if self.phasedim() == 6:
+            phi= thiso[-1].T
+        else:
+            phi= numpy.zeros_like(thiso[0].T)
+        return (pot,thiso[0].T,thiso[3].T,phi,
+                numpy.tile(t,thiso[0].T.shape[:-1]+(1,)),onet)
+
     def _setupaA(self,pot=None,type='staeckel',**kwargs):
         """
         NAME:
@@ -1842,6 +1966,7 @@ class Orbit(object):
               2) 'staeckel'
               3) 'isochroneApprox'
               4) 'spherical'
+              None: keep the type of the current setup if the setup is otherwise unchanged and use the default type for a new setup
         OUTPUT:
         HISTORY:
            2019-02-25 - Written based on OrbitTop._setupaA - Bovy (UofT)
@@ -1866,26 +1991,33 @@ class Orbit(object):
                 pot= self._pot
             except AttributeError:
                 raise AttributeError("Integrate orbit or specify pot=")
+        # Type of a new setup
+        if type is None:
+            newtype= 'spherical' if self.dim() == 2 else 'staeckel'
+        else:
+            newtype= type
         if hasattr(self,'_aA'):
-            if (not pot is None and pot != self._aAPot) \
-                    or (not type is None and type != self._aAType) \
-                    or (not delta is None and hasattr(self._aA,'_delta') 
-                        and numpy.any(delta != self._aA._delta)) \
-                    or (delta is None
-                        and hasattr(self,'_aA_delta_automagic')
-                        and not self._aA_delta_automagic) \
-                    or (not b is None and hasattr(self._aA,'_aAI') 
-                        and numpy.any(b != self._aA._aAI.b)) \
-                    or ('ip' in kwargs and hasattr(self._aA,'_aAI') 
-                        and (numpy.any(kwargs['ip'].b != self._aA._aAI.b) \
-                        or numpy.any(kwargs['ip']._amp != self._aA._aAI.amp))):
+            if _aA_setup_differs(self.__dict__,pot,type,delta,b,kwargs):
+                # Keep the current setup and its results around for re-use
+                if not hasattr(self,'_prev_actionAngles'):
+                    self._prev_actionAngles= []
+                self._prev_actionAngles.insert(0,
+                    dict((attr,self.__dict__[attr])
+                         for attr in self.__dict__ if '_aA' in attr))
+                del self._prev_actionAngles[_MAX_PREV_ACTIONANGLES:]
                 for attr in list(self.__dict__):
                     if '_aA' in attr: delattr(self,attr)
+                # Re-use a previous setup if one matches the requested one
+                for ii,prev in enumerate(self._prev_actionAngles[1:]):
+                    if not _aA_setup_differs(prev,pot,newtype,delta,b,
+                                             kwargs):
+                        self.__dict__.update(self._prev_actionAngles.pop(ii+1))
+                        return None
             else:
                 return None
         _check_consistent_units(self,pot)
         self._aAPot= pot
-        self._aAType= type
+        self._aAType= newtype
         #Setup
         if self._aAType.lower() == 'adiabatic':
             self._aA= actionAngle.actionAngleAdiabatic(pot=self._aAPot,
@@ -1954,32 +2086,63 @@ class Orbit(object):
                                      use_physical=False)
         return None        
 
-    def _setup_actionsFreqsAngles(self,pot=None,**kwargs):
-        """Internal function to compute the actions, frequencies, and angles and cache them for re-use"""
+    def _setup_actionsFreqsAngles(self,pot=None,t=None,**kwargs):
+        """Internal function to compute the actions, frequencies, and angles (for the initial conditions or at times t), cache them for re-use, and return them"""
         self._setupaA(pot=pot,**kwargs)
-        if hasattr(self,'_aA_jr'): return None
+        if _APY_LOADED and isinstance(t,units.Quantity):
+            t= t.to(units.Gyr).value\
+                /bovy_conversion.time_in_Gyr(self._vo,self._ro)
+        if t is None:
+            tkey= None
+        else:
+            tkey= (numpy.ndim(t),numpy.array(t,dtype='float').tobytes())
+        if not hasattr(self,'_aA_results'):
+            self._aA_results= {}
+        elif tkey in self._aA_results:
+            return self._aA_results[tkey]
+        targs= () if t is None else (t,)
+        tR= self.R(*targs,use_physical=False,dontreshape=True)
         if self.dim() == 3:
+            tz= self.z(*targs,use_physical=False,dontreshape=True)
             # try to make sure this is not 0
-            tz= self.z(use_physical=False,dontreshape=True)\
-                +(numpy.fabs(self.z(use_physical=False,
-                                    dontreshape=True)) < 1e-8) \
-                * (2.*(self.z(use_physical=False,
-                              dontreshape=True) >= 0)-1.)*1e-10
-            tvz= self.vz(use_physical=False,dontreshape=True)
+            tz= tz+(numpy.fabs(tz) < 1e-8)*(2.*(tz >= 0)-1.)*1e-10
+            tvz= self.vz(*targs,use_physical=False,dontreshape=True)
         elif self.dim() == 2:
-            tz= numpy.zeros(self.size)
-            tvz= numpy.zeros(self.size)
+            tz= numpy.zeros_like(tR)
+            tvz= numpy.zeros_like(tR)
         # self.dim() == 1 error caught by _setupaA
-        self._aA_jr, self._aA_jp, self._aA_jz, \
-            self._aA_Or, self._aA_Op, self._aA_Oz, \
-            self._aA_wr, self._aA_wp, self._aA_wz= \
-               self._aA.actionsFreqsAngles(\
-                  self.R(use_physical=False,dontreshape=True),
-                  self.vR(use_physical=False,dontreshape=True),
-                  self.vT(use_physical=False,dontreshape=True),
-                  tz,tvz,
-                  self.phi(use_physical=False,dontreshape=True),
-                  use_physical=False)
+        if t is None or numpy.ndim(t) == 0:
+            out_shape= (self.size,)
+        else:
+            out_shape= (self.size,len(t))
+        aAkwargs= {}
+        if numpy.prod(out_shape) > self.size \
+                and hasattr(self._aA,'_delta') \
+                and not callable(self._aA._delta) \
+                and numpy.size(self._aA._delta) == self.size \
+                and self.size > 1:
+            # Use each orbit's delta at all of its times
+            aAkwargs['delta']= numpy.repeat(\
+                numpy.reshape(self._aA._delta,(self.size,)),out_shape[1])
+        out= self._aA.actionsFreqsAngles(\
+            tR.flatten(),
+            self.vR(*targs,use_physical=False,dontreshape=True).flatten(),
+            self.vT(*targs,use_physical=False,dontreshape=True).flatten(),
+            tz.flatten(),tvz.flatten(),
+            self.phi(*targs,use_physical=False,dontreshape=True).flatten(),
+            use_physical=False,**aAkwargs)
+        self._aA_results[tkey]= tuple([numpy.reshape(x,out_shape) 
+                                       for x in out])
+        return self._aA_results[tkey]
+
+    def _reset_aA_time_results(self):
+        """Internal function to remove actions, frequencies, and angles computed along a previously integrated orbit"""
+        aAs= [self.__dict__]+self.__dict__.get('_prev_actionAngles',[])
+        for aA in aAs:
+            if '_aA_results' in aA:
+                aA['_aA_results']= dict((tkey,aA['_aA_results'][tkey])
+                                        for tkey in aA['_aA_results']
+                                        if tkey is None)
         return None
 
     @shapeDecorator
@@ -2161,6 +2324,8 @@ class Orbit(object):
 
            2019-03-02 - Written as thin wrapper around Potential.rl - Bovy (UofT)
 
+           2026-10-19 - Use vectorized Potential.rl - agent
+
         """
         pot= kwargs.get('pot',self.__dict__.get('_pot',None))
         if pot is None:
@@ -2171,21 +2336,7 @@ class Orbit(object):
         _check_consistent_units(self,pot)
         Lz= numpy.atleast_1d(self.Lz(*args,use_physical=False,
                                       dontreshape=True))
-        Lz_shape= Lz.shape
-        Lz= Lz.flatten()
-        if len(Lz) > 500:
-            # Build interpolation grid, 500 ~ 1s
-            precomputergLzgrid= numpy.linspace(numpy.nanmin(Lz),
-                                               numpy.nanmax(Lz),
-                                               500)
-            rls= numpy.array([rl(pot,lz,use_physical=False)
-                              for lz in precomputergLzgrid])
-            #Spline interpolate
-            return interpolate.InterpolatedUnivariateSpline(\
-                precomputergLzgrid,rls,k=3)(Lz).reshape(Lz_shape)
-        else:
-            return numpy.array([rl(pot,lz,use_physical=False)
-                                for lz in Lz]).reshape(Lz_shape)
+        return rl(pot,Lz,use_physical=False)
 
     @physical_conversion('position')
     @shapeDecorator
@@ -2265,6 +2416,8 @@ class Orbit(object):
 
               4) 'spherical'
               
+           t= (None) time or array of times at which to compute this along the integrated orbit (default: for the initial conditions; can be Quantity)
+
            +actionAngle module setup kwargs
 
            ro= (Object-wide default) physical scale for distances to use to convert (can be Quantity)
@@ -2275,15 +2428,16 @@ class Orbit(object):
 
         OUTPUT:
 
-           jr [*input_shape]
+           jr [*input_shape(,nt)]
 
         HISTORY:
 
            2019-02-27 - Written - Bovy (UofT)
 
+           2026-10-19 - Added t= - agent
+
         """
-        self._setup_actionsFreqsAngles(pot=pot,**kwargs)
-        return self._aA_jr
+        return self._setup_actionsFreqsAngles(pot=pot,**kwargs)[0]
 
     @physical_conversion('action')
     @shapeDecorator
@@ -2311,6 +2465,8 @@ class Orbit(object):
 
               4) 'spherical'
               
+           t= (None) time or array of times at which to compute this along the integrated orbit (default: for the initial conditions; can be Quantity)
+
            +actionAngle module setup kwargs
 
            ro= (Object-wide default) physical scale for distances to use to convert (can be Quantity)
@@ -2321,15 +2477,16 @@ class Orbit(object):
 
         OUTPUT:
 
-           jp [*input_shape]
+           jp [*input_shape(,nt)]
 
         HISTORY:
 
            2019-02-26 - Written - Bovy (UofT)
 
+           2026-10-19 - Added t= - agent
+
         """
-        self._setup_actionsFreqsAngles(pot=pot,**kwargs)
-        return self._aA_jp
+        return self._setup_actionsFreqsAngles(pot=pot,**kwargs)[1]
 
     @physical_conversion('action')
     @shapeDecorator
@@ -2357,6 +2514,8 @@ class Orbit(object):
 
               4) 'spherical'
               
+           t= (None) time or array of times at which to compute this along the integrated orbit (default: for the initial conditions; can be Quantity)
+
            +actionAngle module setup kwargs
 
            ro= (Object-wide default) physical scale for distances to use to convert (can be Quantity)
@@ -2367,15 +2526,16 @@ class Orbit(object):
 
         OUTPUT:
 
-           jz [*input_shape]
+           jz [*input_shape(,nt)]
 
         HISTORY:
 
            2019-02-27 - Written - Bovy (UofT)
 
+           2026-10-19 - Added t= - agent
+
         """
-        self._setup_actionsFreqsAngles(pot=pot,**kwargs)
-        return self._aA_jz
+        return self._setup_actionsFreqsAngles(pot=pot,**kwargs)[2]
 
     @physical_conversion('angle')
     @shapeDecorator
@@ -2403,19 +2563,22 @@ class Orbit(object):
 
               4) 'spherical'
               
+           t= (None) time or array of times at which to compute this along the integrated orbit (default: for the initial conditions; can be Quantity)
+
            +actionAngle module setup kwargs
 
         OUTPUT:
 
-           wr [*input_shape]
+           wr [*input_shape(,nt)]
 
         HISTORY:
 
            2019-02-27 - Written - Bovy (UofT)
 
+           2026-10-19 - Added t= - agent
+
         """
-        self._setup_actionsFreqsAngles(pot=pot,**kwargs)
-        return self._aA_wr
+        return self._setup_actionsFreqsAngles(pot=pot,**kwargs)[6]
 
     @physical_conversion('angle')
     @shapeDecorator
@@ -2443,19 +2606,22 @@ class Orbit(object):
 
               4) 'spherical'
               
+           t= (None) time or array of times at which to compute this along the integrated orbit (default: for the initial conditions; can be Quantity)
+
            +actionAngle module setup kwargs
 
         OUTPUT:
 
-           wp [*input_shape]
+           wp [*input_shape(,nt)]
 
         HISTORY:
 
            2019-02-27 - Written - Bovy (UofT)
 
+           2026-10-19 - Added t= - agent
+
         """
-        self._setup_actionsFreqsAngles(pot=pot,**kwargs)
-        return self._aA_wp
+        return self._setup_actionsFreqsAngles(pot=pot,**kwargs)[7]
 
     @physical_conversion('angle')
     @shapeDecorator
@@ -2483,19 +2649,22 @@ class Orbit(object):
 
               4) 'spherical'
               
+           t= (None) time or array of times at which to compute this along the integrated orbit (default: for the initial conditions; can be Quantity)
+
            +actionAngle module setup kwargs
 
         OUTPUT:
 
-           wz [*input_shape]
+           wz [*input_shape(,nt)]
 
         HISTORY:
 
            2019-02-27 - Written - Bovy (UofT)
 
+           2026-10-19 - Added t= - agent
+
         """
-        self._setup_actionsFreqsAngles(pot=pot,**kwargs)
-        return self._aA_wz
+        return self._setup_actionsFreqsAngles(pot=pot,**kwargs)[8]
 
     @physical_conversion('time')
     @shapeDecorator
@@ -2523,6 +2692,8 @@ class Orbit(object):
 
               4) 'spherical'
               
+           t= (None) time or array of times at which to compute this along the integrated orbit (default: for the initial conditions; can be Quantity)
+
            +actionAngle module setup kwargs
 
            ro= (Object-wide default) physical scale for distances to use to convert (can be Quantity)
@@ -2533,15 +2704,17 @@ class Orbit(object):
 
         OUTPUT:
 
-           Tr [*input_shape]
+           Tr [*input_shape(,nt)]
 
         HISTORY:
 
            2019-02-27 - Written - Bovy (UofT)
 
+           2026-10-19 - Added t= - agent
+
         """
-        self._setup_actionsFreqsAngles(pot=pot,**kwargs)
-        return 2.*numpy.pi/self._aA_Or
+        return 2.*numpy.pi\
+            /self._setup_actionsFreqsAngles(pot=pot,**kwargs)[3]
 
     @physical_conversion('time')
     @shapeDecorator
@@ -2569,6 +2742,8 @@ class Orbit(object):
 
               4) 'spherical'
               
+           t= (None) time or array of times at which to compute this along the integrated orbit (default: for the initial conditions; can be Quantity)
+
            +actionAngle module setup kwargs
 
            ro= (Object-wide default) physical scale for distances to use to convert (can be Quantity)
@@ -2579,15 +2754,17 @@ class Orbit(object):
 
         OUTPUT:
 
-           Tp [*input_shape]
+           Tp [*input_shape(,nt)]
 
         HISTORY:
 
            2019-02-27 - Written - Bovy (UofT)
 
+           2026-10-19 - Added t= - agent
+
         """
-        self._setup_actionsFreqsAngles(pot=pot,**kwargs)
-        return 2.*numpy.pi/self._aA_Op
+        return 2.*numpy.pi\
+            /self._setup_actionsFreqsAngles(pot=pot,**kwargs)[4]
 
     @shapeDecorator
     def TrTp(self,pot=None,**kwargs):
@@ -2614,19 +2791,23 @@ class Orbit(object):
 
               4) 'spherical'
               
+           t= (None) time or array of times at which to compute this along the integrated orbit (default: for the initial conditions; can be Quantity)
+
            +actionAngle module setup kwargs
 
         OUTPUT:
 
-           Tr/Tp*pi [*input_shape]
+           Tr/Tp*pi [*input_shape(,nt)]
 
         HISTORY:
 
            2019-02-27 - Written - Bovy (UofT)
 
+           2026-10-19 - Added t= - agent
+
         """
-        self._setup_actionsFreqsAngles(pot=pot,**kwargs)
-        return self._aA_Op/self._aA_Or*numpy.pi
+        aAout= self._setup_actionsFreqsAngles(pot=pot,**kwargs)
+        return aAout[4]/aAout[3]*numpy.pi
  
     @physical_conversion('time')
     @shapeDecorator
@@ -2654,6 +2835,8 @@ class Orbit(object):
 
               4) 'spherical'
               
+           t= (None) time or array of times at which to compute this along the integrated orbit (default: for the initial conditions; can be Quantity)
+
            +actionAngle module setup kwargs
 
            ro= (Object-wide default) physical scale for distances to use to convert (can be Quantity)
@@ -2664,15 +2847,17 @@ class Orbit(object):
 
         OUTPUT:
 
-           Tz [*input_shape]
+           Tz [*input_shape(,nt)]
 
         HISTORY:
 
            2019-02-27 - Written - Bovy (UofT)
 
+           2026-10-19 - Added t= - agent
+
         """
-        self._setup_actionsFreqsAngles(pot=pot,**kwargs)
-        return 2.*numpy.pi/self._aA_Oz
+        return 2.*numpy.pi\
+            /self._setup_actionsFreqsAngles(pot=pot,**kwargs)[5]
 
     @physical_conversion('frequency')
     @shapeDecorator
@@ -2700,6 +2885,8 @@ class Orbit(object):
 
               4) 'spherical'
               
+           t= (None) time or array of times at which to compute this along the integrated orbit (default: for the initial conditions; can be Quantity)
+
            +actionAngle module setup kwargs
 
            ro= (Object-wide default) physical scale for distances to use to convert (can be Quantity)
@@ -2710,15 +2897,16 @@ class Orbit(object):
 
         OUTPUT:
 
-           Or [*input_shape]
+           Or [*input_shape(,nt)]
 
         HISTORY:
 
            2019-02-27 - Written - Bovy (UofT)
 
+           2026-10-19 - Added t= - agent
+
         """
-        self._setup_actionsFreqsAngles(pot=pot,**kwargs)
-        return self._aA_Or
+        return self._setup_actionsFreqsAngles(pot=pot,**kwargs)[3]
 
     @physical_conversion('frequency')
     @shapeDecorator
@@ -2746,6 +2934,8 @@ class Orbit(object):
 
               4) 'spherical'
               
+           t= (None) time or array of times at which to compute this along the integrated orbit (default: for the initial conditions; can be Quantity)
+
            +actionAngle module setup kwargs
 
            ro= (Object-wide default) physical scale for distances to use to convert (can be Quantity)
@@ -2756,15 +2946,16 @@ class Orbit(object):
 
         OUTPUT:
 
-           Op [*input_shape]
+           Op [*input_shape(,nt)]
 
         HISTORY:
 
            2019-02-27 - Written - Bovy (UofT)
 
+           2026-10-19 - Added t= - agent
+
         """
-        self._setup_actionsFreqsAngles(pot=pot,**kwargs)
-        return self._aA_Op
+        return self._setup_actionsFreqsAngles(pot=pot,**kwargs)[4]
 
     @physical_conversion('frequency')
     @shapeDecorator
@@ -2792,6 +2983,8 @@ class Orbit(object):
 
               4) 'spherical'
               
+           t= (None) time or array of times at which to compute this along the integrated orbit (default: for the initial conditions; can be Quantity)
+
            +actionAngle module setup kwargs
 
            ro= (Object-wide default) physical scale for distances to use to convert (can be Quantity)
@@ -2802,15 +2995,16 @@ class Orbit(object):
 
         OUTPUT:
 
-           Oz [*input_shape]
+           Oz [*input_shape(,nt)]
 
         HISTORY:
 
            2019-02-27 - Written - Bovy (UofT)
 
+           2026-10-19 - Added t= - agent
+
         """
-        self._setup_actionsFreqsAngles(pot=pot,**kwargs)
-        return self._aA_Oz
+        return self._setup_actionsFreqsAngles(pot=pot,**kwargs)[5]
 
     @physical_conversion('time')
     def time(self,*args,**kwargs):
@@ -5778,3 +5972,18 @@ def _check_potential_dim(orb,pot):
 def _check_consistent_units(orb,pot):
     if pot is None: return None
     assert physical_compatible(orb,pot), 'Physical conversion for the Orbit object is not consistent with that of the Potential given to it'
+
+def _aA_setup_differs(aAstate,pot,type,delta,b,kwargs):
+    """Internal function to check whether the actionAngle setup in aAstate (a dictionary of an Orbit's _aA attributes) differs from the requested setup"""
+    aA= aAstate['_aA']
+    return (not pot is None and pot != aAstate['_aAPot']) \
+        or (not type is None and type != aAstate['_aAType']) \
+        or (not delta is None and hasattr(aA,'_delta') 
+            and numpy.any(delta != aA._delta)) \
+        or (delta is None
+            and not aAstate.get('_aA_delta_automagic',True)) \
+        or (not b is None and hasattr(aA,'_aAI') 
+            and numpy.any(b != aA._aAI.b)) \
+        or ('ip' in kwargs and hasattr(aA,'_aAI') 
+            and (numpy.any(kwargs['ip'].b != aA._aAI.b) \
+                 or numpy.any(kwargs['ip']._amp != aA._aAI.amp)))
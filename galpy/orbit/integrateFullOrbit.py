@@ -151,6 +151,15 @@ def _parse_pot(pot,potforactions=False,potfortorus=False):
                                   /numpy.sqrt(( 1.+(p._b2-1.)*p._glx[ii]**2.)
                                            *(1.+(p._c2-1.)*p._glx[ii]**2.))
                              for ii in range(p._glorder)])
+            # Tabulated forces
+            if p._force_table is None:
+                pot_args.append(0)
+            else:
+                pot_args.append(1)
+                pot_args.extend(_parse_ellipsoidal_force_table(p))
+        elif isinstance(p,potential.TimeDependentSCFPotential):
+            pot_type.append(37)
+            pot_args.extend(_parse_tdscf_pot(p))
         elif isinstance(p,potential.SCFPotential):
             # Type 24, see stand-alone parser below
             pt,pa= _parse_scf_pot(p)
@@ -162,31 +171,11 @@ def _parse_pot(pot,potforactions=False,potfortorus=False):
             pot_args.extend([0.,0.,0.,0.,0.,0.,0.]) # for caching
         elif isinstance(p,potential.DiskSCFPotential):
             # Need to pull this apart into: (a) SCF part, (b) constituent
-            # [Sigma_i,h_i] parts
-            # (a) SCF, multiply in any add'l amp
-            pt,pa= _parse_scf_pot(p._scf,extra_amp=p._amp)
-            pot_type.append(pt)
+            # [Sigma_i,h_i] parts, see stand-alone parser below
+            pt,pa= _parse_diskscf_pot(p)
+            npot+= len(pt)-1
+            pot_type.extend(pt)
             pot_args.extend(pa)
-            # (b) constituent [Sigma_i,h_i] parts
-            for Sigma,hz in zip(p._Sigma_dict,p._hz_dict):
-                npot+= 1
-                pot_type.append(26)
-                stype= Sigma.get('type','exp')
-                if stype == 'exp' and not 'Rhole' in Sigma:
-                    pot_args.extend([3,0,
-                                     4.*numpy.pi*Sigma.get('amp',1.)*p._amp,
-                                     Sigma.get('h',1./3.)])
-                elif stype == 'expwhole' \
-                        or (stype == 'exp' and 'Rhole' in Sigma):
-                    pot_args.extend([4,1,
-                                     4.*numpy.pi*Sigma.get('amp',1.)*p._amp,
-                                     Sigma.get('h',1./3.),
-                                     Sigma.get('Rhole',0.5)])
-                hztype= hz.get('type','exp')
-                if hztype == 'exp':
-                    pot_args.extend([0,hz.get('h',0.0375)])
-                elif hztype == 'sech2':
-                    pot_args.extend([1,hz.get('h',0.0375)])
         elif isinstance(p, potential.SpiralArmsPotential):
             pot_type.append(27)
             pot_args.extend([len(p._Cs), p._amp, p._N, p._sin_alpha, p._tan_alpha, p._r_ref, p._phi_ref,
@@ -204,6 +193,27 @@ def _parse_pot(pot,potforactions=False,potfortorus=False):
         elif isinstance(p,potential.HomogeneousSpherePotential):
             pot_type.append(35)
             pot_args.extend([p._amp,p._R2,p._R3])
+        elif isinstance(p,potential.CylindricalSplinePotential):
+            pot_type.append(36)
+            pot_args.extend(_parse_cylspline_pot(p))
+        elif isinstance(p,potential.FerrersPotential):
+            pot_type.append(38)
+            pot_args.extend([p._amp*numpy.pi*p._rhoc_M*p.a**3*p._b*p._c,
+                             p._a2,p._b2*p._a2,p._c2*p._a2,p.n,
+                             p._omegab,p._pa,p._glorder])
+            pot_args.extend(list(p._glx))
+            pot_args.extend(list(p._glw))
+            pot_args.extend([0.,0.,0.,0.,0.,0.,0.]) # for caching
+        elif isinstance(p,potential.MovingObjectPopulationPotential):
+            pot_type.append(40)
+            pot_args.extend(_parse_mopop_pot(p))
+        elif isinstance(p,potential.RazorThinExponentialDiskPotential):
+            pot_type.append(39)
+            pot_args.extend([p._amp,p._alpha,p._kzmax,p._nzeros,p._hankelorder])
+            pot_args.extend(list(p._glx))
+            pot_args.extend(list(p._glw))
+            pot_args.extend(list(p._j0zeros))
+            pot_args.extend(list(p._j1zeros))
         ############################## WRAPPERS ###############################
         elif isinstance(p,potential.DehnenSmoothWrapperPotential):
             pot_type.append(-1)
@@ -291,6 +301,118 @@ def _parse_scf_pot(p,extra_amp=1.):
     pot_args.extend([-1.,0,0,0,0,0,0])    
     return (24,pot_args)
 
+def _parse_diskscf_pot(p):
+    # Stand-alone parser for DiskSCFPotential, bc re-used
+    # (a) SCF, multiply in any add'l amp
+    pot_type, pot_args= _parse_scf_pot(p._scf,extra_amp=p._amp)
+    pot_type= [pot_type]
+    # (b) constituent [Sigma_i,h_i] parts
+    for ii in range(p._nsigma):
+        pot_type.append(26)
+        if p._Sigma_dict is None: # tabulated
+            pot_args.extend([2,2,4.*numpy.pi*p._Sigma_amp[ii]*p._amp])
+        else:
+            Sigma= p._Sigma_dict[ii]
+            stype= Sigma.get('type','exp')
+            if stype == 'exp' and not 'Rhole' in Sigma:
+                pot_args.extend([3,0,4.*numpy.pi*Sigma.get('amp',1.)*p._amp,
+                                 Sigma.get('h',1./3.)])
+            elif stype == 'expwhole' \
+                    or (stype == 'exp' and 'Rhole' in Sigma):
+                pot_args.extend([4,1,4.*numpy.pi*Sigma.get('amp',1.)*p._amp,
+                                 Sigma.get('h',1./3.),
+                                 Sigma.get('Rhole',0.5)])
+        if p._hz_dict is None: # tabulated
+            pot_args.extend([2,0.])
+        else:
+            hz= p._hz_dict[ii]
+            hztype= hz.get('type','exp')
+            if hztype == 'exp':
+                pot_args.extend([0,hz.get('h',0.0375)])
+            elif hztype == 'sech2':
+                pot_args.extend([1,hz.get('h',0.0375)])
+        # Tabulated profiles, turned into splines in C
+        if p._Sigma_dict is None:
+            pot_args.append(p._Sigma_tab[ii].shape[1])
+            pot_args.extend(p._Sigma_tab[ii].flatten(order='C'))
+        if p._hz_dict is None:
+            pot_args.append(p._hz_tab[ii].shape[1])
+            pot_args.extend(p._hz_tab[ii].flatten(order='C'))
+    return (pot_type,pot_args)
+
+def _parse_tdscf_pot(p):
+    # Stand-alone parser for TimeDependentSCFPotential, bc re-used
+    isNonAxi= p.isNonAxi
+    N,L,M= p._Acos_times.shape[1:]
+    pot_args= [p._a,isNonAxi,N,L,M,len(p._times),p._interp_order,numpy.nan]
+    pot_args.extend(p._times)
+    # Coefficients are stored as an [Acos,[Asin]] block for each time
+    ntimes= len(p._times)
+    if isNonAxi:
+        coeffs= numpy.concatenate(\
+            (p._Acos_times.reshape(ntimes,-1),
+             p._Asin_times.reshape(ntimes,-1)),axis=1)
+    else:
+        coeffs= p._Acos_times.reshape(ntimes,-1)
+    pot_args.extend(p._amp*coeffs.flatten(order='C'))
+    if p._interp_order == 3:
+        if isNonAxi:
+            d2coeffs= numpy.concatenate(\
+                (p._Acos_times_d2.reshape(ntimes,-1),
+                 p._Asin_times_d2.reshape(ntimes,-1)),axis=1)
+        else:
+            d2coeffs= p._Acos_times_d2.reshape(ntimes,-1)
+        pot_args.extend(p._amp*d2coeffs.flatten(order='C'))
+    # Block of SCFPotential arguments holding the interpolated coefficients
+    pot_args.extend([p._a,isNonAxi,N,L,M])
+    pot_args.extend(numpy.zeros((1+isNonAxi)*N*L*M))
+    pot_args.extend([-1.,0,0,0,0,0,0])
+    return pot_args
+
+def _parse_ellipsoidal_force_table(p):
+    # Stand-alone parser for the force table of EllipsoidalPotentials, bc re-used
+    lnrmin, lnrmax, table= p._force_table
+    return [lnrmin,lnrmax]+list(table.shape[1:])\
+        +list(numpy.moveaxis(table,0,-1).flatten())
+
+def _parse_mopop_pot(p):
+    # Stand-alone parser for MovingObjectPopulationPotential, bc re-used
+    if p._nbins == 0:
+        ncells= 0
+        offsets= []
+    else:
+        ncells= numpy.sum([len(o)-1 for o in p._index[1]])
+        offsets= p._index[1]
+    pot_args= [p._amp,p._profile,
+               -1. if p._cutoff is None else p._cutoff,
+               p._nobj,len(p._times),p._nbins,p._times[0],
+               0. if p._tbin is None else p._tbin,ncells]
+    pot_args.extend(p._times)
+    pot_args.extend(p._masses)
+    pot_args.extend(p._rs)
+    pot_args.extend(p._pos.flatten().tolist())
+    pot_args.extend(p._vel.flatten().tolist())
+    if p._nbins > 0:
+        pot_args.extend(p._index[0].flatten().tolist())
+    pot_args.extend(numpy.hstack((0,numpy.cumsum([len(o) for o in offsets])))\
+                        .tolist())
+    for o in offsets:
+        pot_args.extend(o.tolist())
+    if p._nbins > 0:
+        pot_args.extend(p._index[2].flatten().tolist())
+    pot_args.extend([numpy.nan,0.,0.,0.,0.,0.,0.]) # for caching
+    return pot_args
+
+def _parse_cylspline_pot(p):
+    # Stand-alone parser for CylindricalSplinePotential, bc re-used
+    pot_args= [p._amp,len(p._rgrid),len(p._zgrid),p._npad,p._rmin,p._rmax,
+               p._zmin,p._zmax,p._mmax,p._mass]
+    for m in range(p._mmax+1):
+        pot_args.extend(p._cosGrid_splinecoeffs[m].flatten(order='C'))
+    for m in range(p._mmax+1):
+        pot_args.extend(p._sinGrid_splinecoeffs[m].flatten(order='C'))
+    return pot_args
+
 def integrateFullOrbit_c(pot,yo,t,int_method,rtol=None,atol=None,dt=None):
     """
     NAME:
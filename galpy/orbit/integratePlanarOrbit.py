@@ -18,7 +18,9 @@ _lib, _ext_loaded= _load_extension_libs.load_libgalpy()
 
 def _parse_pot(pot):
     """Parse the potential so it can be fed to C"""
-    from .integrateFullOrbit import _parse_scf_pot
+    from .integrateFullOrbit import _parse_scf_pot, _parse_cylspline_pot, \
+        _parse_tdscf_pot, _parse_diskscf_pot, _parse_mopop_pot, \
+        _parse_ellipsoidal_force_table
     #Figure out what's in pot
     if not isinstance(pot,list):
         pot= [pot]
@@ -181,6 +183,16 @@ def _parse_pot(pot):
                             /numpy.sqrt(( 1.+(p._Pot._b2-1.)*p._Pot._glx[ii]**2.)
                                      *(1.+(p._Pot._c2-1.)*p._Pot._glx[ii]**2.))
                              for ii in range(p._Pot._glorder)])
+            # Tabulated forces
+            if p._Pot._force_table is None:
+                pot_args.append(0)
+            else:
+                pot_args.append(1)
+                pot_args.extend(_parse_ellipsoidal_force_table(p._Pot))
+        elif (isinstance(p,planarPotentialFromFullPotential) or isinstance(p,planarPotentialFromRZPotential)) \
+                 and isinstance(p._Pot,potential.TimeDependentSCFPotential):
+            pot_type.append(37)
+            pot_args.extend(_parse_tdscf_pot(p._Pot))
         elif (isinstance(p,planarPotentialFromFullPotential) or isinstance(p,planarPotentialFromRZPotential)) \
                  and isinstance(p._Pot,potential.SCFPotential):
             pt,pa= _parse_scf_pot(p._Pot)
@@ -195,31 +207,11 @@ def _parse_pot(pot):
         elif (isinstance(p,planarPotentialFromFullPotential) or isinstance(p,planarPotentialFromRZPotential)) \
                 and isinstance(p._Pot,potential.DiskSCFPotential):
             # Need to pull this apart into: (a) SCF part, (b) constituent
-            # [Sigma_i,h_i] parts
-            # (a) SCF, multiply in any add'l amp
-            pt,pa= _parse_scf_pot(p._Pot._scf,extra_amp=p._Pot._amp)
-            pot_type.append(pt)
+            # [Sigma_i,h_i] parts, see stand-alone parser in Full
+            pt,pa= _parse_diskscf_pot(p._Pot)
+            npot+= len(pt)-1
+            pot_type.extend(pt)
             pot_args.extend(pa)
-            # (b) constituent [Sigma_i,h_i] parts
-            for Sigma,hz in zip(p._Pot._Sigma_dict,p._Pot._hz_dict):
-                npot+= 1
-                pot_type.append(26)
-                stype= Sigma.get('type','exp')
-                if stype == 'exp' and not 'Rhole' in Sigma:
-                    pot_args.extend([3,0,
-                                     4.*numpy.pi*Sigma.get('amp',1.)*p._Pot._amp,
-                                     Sigma.get('h',1./3.)])
-                elif stype == 'expwhole' \
-                        or (stype == 'exp' and 'Rhole' in Sigma):
-                    pot_args.extend([4,1,
-                                     4.*numpy.pi*Sigma.get('amp',1.)*p._Pot._amp,
-                                     Sigma.get('h',1./3.),
-                                     Sigma.get('Rhole',0.5)])
-                hztype= hz.get('type','exp')
-                if hztype == 'exp':
-                    pot_args.extend([0,hz.get('h',0.0375)])
-                elif hztype == 'sech2':
-                    pot_args.extend([1,hz.get('h',0.0375)])
         elif isinstance(p,planarPotentialFromFullPotential) \
                 and isinstance(p._Pot, potential.SpiralArmsPotential):
             pot_type.append(27)
@@ -249,6 +241,34 @@ def _parse_pot(pot):
                  and isinstance(p._Pot,potential.HomogeneousSpherePotential):
             pot_type.append(35)
             pot_args.extend([p._Pot._amp,p._Pot._R2,p._Pot._R3])
+        elif (isinstance(p,planarPotentialFromFullPotential) or isinstance(p,planarPotentialFromRZPotential)) \
+                and isinstance(p._Pot,potential.CylindricalSplinePotential):
+            pot_type.append(36)
+            pot_args.extend(_parse_cylspline_pot(p._Pot))
+        elif (isinstance(p,planarPotentialFromFullPotential) or isinstance(p,planarPotentialFromRZPotential)) \
+                and isinstance(p._Pot,potential.FerrersPotential):
+            pot_type.append(38)
+            pot_args.extend([p._Pot._amp*numpy.pi*p._Pot._rhoc_M*p._Pot.a**3
+                             *p._Pot._b*p._Pot._c,
+                             p._Pot._a2,p._Pot._b2*p._Pot._a2,
+                             p._Pot._c2*p._Pot._a2,p._Pot.n,
+                             p._Pot._omegab,p._Pot._pa,p._Pot._glorder])
+            pot_args.extend(list(p._Pot._glx))
+            pot_args.extend(list(p._Pot._glw))
+            pot_args.extend([0.,0.,0.,0.,0.,0.,0.]) # for caching
+        elif (isinstance(p,planarPotentialFromFullPotential) or isinstance(p,planarPotentialFromRZPotential)) \
+                and isinstance(p._Pot,potential.MovingObjectPopulationPotential):
+            pot_type.append(40)
+            pot_args.extend(_parse_mopop_pot(p._Pot))
+        elif (isinstance(p,planarPotentialFromFullPotential) or isinstance(p,planarPotentialFromRZPotential)) \
+                and isinstance(p._Pot,potential.RazorThinExponentialDiskPotential):
+            pot_type.append(39)
+            pot_args.extend([p._Pot._amp,p._Pot._alpha,p._Pot._kzmax,
+                             p._Pot._nzeros,p._Pot._hankelorder])
+            pot_args.extend(list(p._Pot._glx))
+            pot_args.extend(list(p._Pot._glw))
+            pot_args.extend(list(p._Pot._j0zeros))
+            pot_args.extend(list(p._Pot._j1zeros))
         ############################## WRAPPERS ###############################
         elif ((isinstance(p,planarPotentialFromFullPotential) or isinstance(p,planarPotentialFromRZPotential)) \
               and isinstance(p._Pot,potential.DehnenSmoothWrapperPotential)) \
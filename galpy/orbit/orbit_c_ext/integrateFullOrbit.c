@@ -287,8 +287,7 @@ void parse_leapFuncArgs_Full(int npot,
       potentialArgs->psi= &TriaxialHernquistPotentialpsi;
       potentialArgs->mdens= &TriaxialHernquistPotentialmdens;
       potentialArgs->mdensDeriv= &TriaxialHernquistPotentialmdensDeriv;
-      potentialArgs->nargs = (int) (21 + *(*pot_args+7) + 2 * *(*pot_args 
-					    + (int) (*(*pot_args+7) + 20)));
+      potentialArgs->nargs = EllipsoidalPotentialnargs(*pot_args);
       potentialArgs->requiresVelocity= false;
       break;
     case 22: //TriaxialNFWPotential, lots of arguments
@@ -301,8 +300,7 @@ void parse_leapFuncArgs_Full(int npot,
       potentialArgs->psi= &TriaxialNFWPotentialpsi;
       potentialArgs->mdens= &TriaxialNFWPotentialmdens;
       potentialArgs->mdensDeriv= &TriaxialNFWPotentialmdensDeriv;
-      potentialArgs->nargs = (int) (21 + *(*pot_args+7) + 2 * *(*pot_args 
-					    + (int) (*(*pot_args+7) + 20)));
+      potentialArgs->nargs = EllipsoidalPotentialnargs(*pot_args);
       potentialArgs->requiresVelocity= false;
       break;
     case 23: //TriaxialJaffePotential, lots of arguments
@@ -315,8 +313,7 @@ void parse_leapFuncArgs_Full(int npot,
       potentialArgs->psi= &TriaxialJaffePotentialpsi;
       potentialArgs->mdens= &TriaxialJaffePotentialmdens;
       potentialArgs->mdensDeriv= &TriaxialJaffePotentialmdensDeriv;
-      potentialArgs->nargs = (int) (21 + *(*pot_args+7) + 2 * *(*pot_args 
-					    + (int) (*(*pot_args+7) + 20)));
+      potentialArgs->nargs = EllipsoidalPotentialnargs(*pot_args);
       potentialArgs->requiresVelocity= false;
       break;
     case 24: //SCFPotential, many arguments
@@ -372,8 +369,7 @@ void parse_leapFuncArgs_Full(int npot,
       potentialArgs->psi= &PerfectEllipsoidPotentialpsi;
       potentialArgs->mdens= &PerfectEllipsoidPotentialmdens;
       potentialArgs->mdensDeriv= &PerfectEllipsoidPotentialmdensDeriv;
-      potentialArgs->nargs = (int) (21 + *(*pot_args+7) + 2 * *(*pot_args 
-					    + (int) (*(*pot_args+7) + 20)));
+      potentialArgs->nargs = EllipsoidalPotentialnargs(*pot_args);
       potentialArgs->requiresVelocity= false;
       break;
     // 31: KGPotential
@@ -411,6 +407,47 @@ void parse_leapFuncArgs_Full(int npot,
       potentialArgs->nargs= 3;
       potentialArgs->requiresVelocity= false;
       break;
+    case 36: //CylindricalSplinePotential, 10+2*(mmax+1)*(nR+2npad)*(nz+2npad) arguments
+      potentialArgs->potentialEval= &CylindricalSplinePotentialEval;
+      potentialArgs->Rforce= &CylindricalSplinePotentialRforce;
+      potentialArgs->zforce= &CylindricalSplinePotentialzforce;
+      potentialArgs->phiforce= &CylindricalSplinePotentialphiforce;
+      potentialArgs->nargs= (int) (10 + 2 * (1 + *(*pot_args + 8)) * ( *(*pot_args+1) + 2 * *(*pot_args+3) ) * ( *(*pot_args+2) + 2 * *(*pot_args+3) ));
+      potentialArgs->requiresVelocity= false;
+      break;
+    case 37: //TimeDependentSCFPotential, many arguments
+      potentialArgs->potentialEval= &TimeDependentSCFPotentialEval;
+      potentialArgs->Rforce= &TimeDependentSCFPotentialRforce;
+      potentialArgs->zforce= &TimeDependentSCFPotentialzforce;
+      potentialArgs->phiforce= &TimeDependentSCFPotentialphiforce;
+      potentialArgs->dens= &TimeDependentSCFPotentialDens;
+      potentialArgs->nargs= (int) (8 + *(*pot_args+5) + (1 + *(*pot_args + 1)) * *(*pot_args+2) * *(*pot_args+3) * *(*pot_args+4) * (*(*pot_args+5) * (1 + (*(*pot_args+6) == 3)) + 1) + 5 + 7);
+      potentialArgs->requiresVelocity= false;
+      break;
+    case 38: //FerrersPotential, 15+2*glorder arguments
+      potentialArgs->potentialEval= &FerrersPotentialEval;
+      potentialArgs->Rforce= &FerrersPotentialRforce;
+      potentialArgs->zforce= &FerrersPotentialzforce;
+      potentialArgs->phiforce= &FerrersPotentialphiforce;
+      potentialArgs->nargs= (int) (15 + 2 * *(*pot_args+7));
+      potentialArgs->requiresVelocity= false;
+      break;
+    case 39: //RazorThinExponentialDiskPotential, 7+2*glorder+2*nzeros args
+      potentialArgs->potentialEval= &RazorThinExponentialDiskPotentialEval;
+      potentialArgs->Rforce= &RazorThinExponentialDiskPotentialRforce;
+      potentialArgs->zforce= &RazorThinExponentialDiskPotentialzforce;
+      potentialArgs->phiforce= &ZeroForce;
+      potentialArgs->nargs= (int) (7 + 2 * *(*pot_args+4) + 2 * *(*pot_args+3));
+      potentialArgs->requiresVelocity= false;
+      break;
+    case 40: //MovingObjectPopulationPotential, many arguments
+      potentialArgs->potentialEval= &MovingObjectPopulationPotentialEval;
+      potentialArgs->Rforce= &MovingObjectPopulationPotentialRforce;
+      potentialArgs->zforce= &MovingObjectPopulationPotentialzforce;
+      potentialArgs->phiforce= &MovingObjectPopulationPotentialphiforce;
+      potentialArgs->nargs= (int) (17 + *(*pot_args+4) + 2 * *(*pot_args+3) + 6 * *(*pot_args+3) * *(*pot_args+4) + 9 * *(*pot_args+5) + *(*pot_args+8) + *(*pot_args+3) * *(*pot_args+5));
+      potentialArgs->requiresVelocity= false;
+      break;
 //////////////////////////////// WRAPPERS /////////////////////////////////////
     case -1: //DehnenSmoothWrapperPotential
       potentialArgs->potentialEval= &DehnenSmoothWrapperPotentialEval;
@@ -459,6 +496,7 @@ void parse_leapFuncArgs_Full(int npot,
     }
     int setupMovingObjectSplines = *(*pot_type-1) == -6 ? 1 : 0;
     int setupChandrasekharDynamicalFrictionSplines = *(*pot_type-1) == -7 ? 1 : 0;
+    int setupDiskSCFSplines = *(*pot_type-1) == 26 ? 1 : 0;
     if ( *(*pot_type-1) < 0 ) { // Parse wrapped potential for wrappers
       potentialArgs->nwrapped= (int) *(*pot_args)++;
       potentialArgs->wrappedPotentialArg= \
@@ -478,6 +516,8 @@ void parse_leapFuncArgs_Full(int npot,
       potentialArgs->args++;
     }
     potentialArgs->args-= potentialArgs->nargs;
+    if (setupDiskSCFSplines)
+      initDiskSCFSplines(potentialArgs,pot_args);
     potentialArgs++;
   }
   potentialArgs-= npot;
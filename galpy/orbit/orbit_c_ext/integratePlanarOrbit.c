@@ -227,8 +227,7 @@ void parse_leapFuncArgs(int npot,struct potentialArg * potentialArgs,
       potentialArgs->psi= &TriaxialHernquistPotentialpsi;
       potentialArgs->mdens= &TriaxialHernquistPotentialmdens;
       potentialArgs->mdensDeriv= &TriaxialHernquistPotentialmdensDeriv;
-      potentialArgs->nargs = (int) (21 + *(*pot_args+7) + 2 * *(*pot_args 
-					    + (int) (*(*pot_args+7) + 20)));
+      potentialArgs->nargs = EllipsoidalPotentialnargs(*pot_args);
       break;    
     case 22: // TriaxialNFWPotential, lots of arguments
       potentialArgs->planarRforce = &EllipsoidalPotentialPlanarRforce;
@@ -240,8 +239,7 @@ void parse_leapFuncArgs(int npot,struct potentialArg * potentialArgs,
       potentialArgs->psi= &TriaxialNFWPotentialpsi;
       potentialArgs->mdens= &TriaxialNFWPotentialmdens;
       potentialArgs->mdensDeriv= &TriaxialNFWPotentialmdensDeriv;
-      potentialArgs->nargs = (int) (21 + *(*pot_args+7) + 2 * *(*pot_args 
-					    + (int) (*(*pot_args+7) + 20)));
+      potentialArgs->nargs = EllipsoidalPotentialnargs(*pot_args);
       break;    
     case 23: // TriaxialJaffePotential, lots of arguments
       potentialArgs->planarRforce = &EllipsoidalPotentialPlanarRforce;
@@ -253,8 +251,7 @@ void parse_leapFuncArgs(int npot,struct potentialArg * potentialArgs,
       potentialArgs->psi= &TriaxialJaffePotentialpsi;
       potentialArgs->mdens= &TriaxialJaffePotentialmdens;
       potentialArgs->mdensDeriv= &TriaxialJaffePotentialmdensDeriv;
-      potentialArgs->nargs = (int) (21 + *(*pot_args+7) + 2 * *(*pot_args 
-					    + (int) (*(*pot_args+7) + 20)));
+      potentialArgs->nargs = EllipsoidalPotentialnargs(*pot_args);
       break;    
     case 24: //SCFPotential, many arguments
       potentialArgs->potentialEval= &SCFPotentialEval;
@@ -311,8 +308,7 @@ void parse_leapFuncArgs(int npot,struct potentialArg * potentialArgs,
       potentialArgs->psi= &PerfectEllipsoidPotentialpsi;
       potentialArgs->mdens= &PerfectEllipsoidPotentialmdens;
       potentialArgs->mdensDeriv= &PerfectEllipsoidPotentialmdensDeriv;
-      potentialArgs->nargs = (int) (21 + *(*pot_args+7) + 2 * *(*pot_args 
-					    + (int) (*(*pot_args+7) + 20)));
+      potentialArgs->nargs = EllipsoidalPotentialnargs(*pot_args);
       break;
     // 31: KGPotential
     // 32: IsothermalDiskPotential
@@ -343,6 +339,45 @@ void parse_leapFuncArgs(int npot,struct potentialArg * potentialArgs,
       potentialArgs->planarRphideriv= &ZeroPlanarForce;
       potentialArgs->nargs= 3;
       break;
+    case 36: //CylindricalSplinePotential, 10+2*(mmax+1)*(nR+2npad)*(nz+2npad) arguments
+      potentialArgs->potentialEval= &CylindricalSplinePotentialEval;
+      potentialArgs->planarRforce= &CylindricalSplinePotentialPlanarRforce;
+      potentialArgs->planarphiforce= &CylindricalSplinePotentialPlanarphiforce;
+      potentialArgs->nargs= (int) (10 + 2 * (1 + *(*pot_args + 8)) * ( *(*pot_args+1) + 2 * *(*pot_args+3) ) * ( *(*pot_args+2) + 2 * *(*pot_args+3) ));
+      break;
+    case 37: //TimeDependentSCFPotential, many arguments
+      potentialArgs->potentialEval= &TimeDependentSCFPotentialEval;
+      potentialArgs->planarRforce= &TimeDependentSCFPotentialPlanarRforce;
+      potentialArgs->planarphiforce= &TimeDependentSCFPotentialPlanarphiforce;
+      potentialArgs->planarR2deriv= &TimeDependentSCFPotentialPlanarR2deriv;
+      potentialArgs->planarphi2deriv= &TimeDependentSCFPotentialPlanarphi2deriv;
+      potentialArgs->planarRphideriv= &TimeDependentSCFPotentialPlanarRphideriv;
+      potentialArgs->nargs= (int) (8 + *(*pot_args+5) + (1 + *(*pot_args + 1)) * *(*pot_args+2) * *(*pot_args+3) * *(*pot_args+4) * (*(*pot_args+5) * (1 + (*(*pot_args+6) == 3)) + 1) + 5 + 7);
+      break;
+    case 38: //FerrersPotential, 15+2*glorder arguments
+      potentialArgs->potentialEval= &FerrersPotentialEval;
+      potentialArgs->planarRforce= &FerrersPotentialPlanarRforce;
+      potentialArgs->planarphiforce= &FerrersPotentialPlanarphiforce;
+      potentialArgs->planarR2deriv= &FerrersPotentialPlanarR2deriv;
+      potentialArgs->planarphi2deriv= &FerrersPotentialPlanarphi2deriv;
+      potentialArgs->planarRphideriv= &FerrersPotentialPlanarRphideriv;
+      potentialArgs->nargs= (int) (15 + 2 * *(*pot_args+7));
+      break;
+    case 39: //RazorThinExponentialDiskPotential, 7+2*glorder+2*nzeros args
+      potentialArgs->potentialEval= &RazorThinExponentialDiskPotentialEval;
+      potentialArgs->planarRforce= &RazorThinExponentialDiskPotentialPlanarRforce;
+      potentialArgs->planarphiforce= &ZeroPlanarForce;
+      potentialArgs->planarR2deriv= &RazorThinExponentialDiskPotentialPlanarR2deriv;
+      potentialArgs->planarphi2deriv= &ZeroPlanarForce;
+      potentialArgs->planarRphideriv= &ZeroPlanarForce;
+      potentialArgs->nargs= (int) (7 + 2 * *(*pot_args+4) + 2 * *(*pot_args+3));
+      break;
+    case 40: //MovingObjectPopulationPotential, many arguments
+      potentialArgs->potentialEval= &MovingObjectPopulationPotentialEval;
+      potentialArgs->planarRforce= &MovingObjectPopulationPotentialPlanarRforce;
+      potentialArgs->planarphiforce= &MovingObjectPopulationPotentialPlanarphiforce;
+      potentialArgs->nargs= (int) (17 + *(*pot_args+4) + 2 * *(*pot_args+3) + 6 * *(*pot_args+3) * *(*pot_args+4) + 9 * *(*pot_args+5) + *(*pot_args+8) + *(*pot_args+3) * *(*pot_args+5));
+      break;
 //////////////////////////////// WRAPPERS /////////////////////////////////////
     case -1: //DehnenSmoothWrapperPotential
       potentialArgs->potentialEval= &DehnenSmoothWrapperPotentialEval;
@@ -384,6 +419,7 @@ void parse_leapFuncArgs(int npot,struct potentialArg * potentialArgs,
       break;
     }
     int setupSplines = *(*pot_type-1) == -6 ? 1 : 0;
+    int setupDiskSCFSplines = *(*pot_type-1) == 26 ? 1 : 0;
     if ( *(*pot_type-1) < 0) { // Parse wrapped potential for wrappers
       potentialArgs->nwrapped= (int) *(*pot_args)++;
       potentialArgs->wrappedPotentialArg= \
@@ -400,6 +436,8 @@ void parse_leapFuncArgs(int npot,struct potentialArg * potentialArgs,
       potentialArgs->args++;
     }
     potentialArgs->args-= potentialArgs->nargs;
+    if (setupDiskSCFSplines)
+      initDiskSCFSplines(potentialArgs,pot_args);
     potentialArgs++;
   }
   potentialArgs-= npot;
@@ -0,0 +1,560 @@
+###############################################################################
+#   CylindricalSplinePotential.py: general potential computed by direct
+#                                  quadrature of a density on a cylindrical
+#                                  grid, expanded in azimuthal harmonics
+###############################################################################
+import inspect
+import numpy
+from numpy.polynomial.legendre import leggauss
+from scipy import interpolate, special
+from .Potential import Potential
+from ..util import multi
+from ..util import _load_extension_libs
+_lib, ext_loaded= _load_extension_libs.load_libgalpy()
+# Switch between forward and backward recurrence for the toroidal functions
+# at this value of chi
+_CHI_SWITCH= 1.5
+# Number of extra orders at which to start the backward recurrence
+_MILLER_EXTRA= 20
+# Number of grid points by which to extend the grid by mirroring it
+_NPAD= 20
+class CylindricalSplinePotential(Potential):
+    """Class that implements a general, non-axisymmetric potential obtained by solving the Poisson equation for a given density through direct quadrature on a cylindrical :math:`(R,z)` grid. The potential is expanded in azimuthal Fourier harmonics
+
+    .. math::
+
+        \\Phi(R,\\phi,z) = \\sum_{m=0}^{M} \\left[\\Phi_{c,m}(R,z)\\,\\cos(m\\phi)+\\Phi_{s,m}(R,z)\\,\\sin(m\\phi)\\right]\\,,
+
+    where each harmonic is computed as
+
+    .. math::
+
+        \\Phi_{c/s,m}(R,z) = -\\frac{2G}{\\sqrt{R}}\\,\\int\\mathrm{d}R'\\,\\mathrm{d}z'\\,\\sqrt{R'}\\,\\rho_{c/s,m}(R',z')\\,Q_{m-1/2}\\left(\\frac{R^2+R'^2+(z-z')^2}{2RR'}\\right)\\,,
+
+    with :math:`\\rho_{c/s,m}(R,z)` the Fourier components of the density and :math:`Q_{m-1/2}` the Legendre function of the second kind of half-integer degree (e.g., `Cohl & Tohline 1999 <http://adsabs.harvard.edu/abs/1999ApJ...527...86C>`__). Each harmonic is interpolated on the :math:`(R,z)` grid using 2D cubic splines, such that the potential and forces can be evaluated quickly in both python and C. This is well suited for bars and spiral disks, for which a spherical basis-function expansion converges slowly. Outside of the grid, the potential is approximated as that of a point mass with the total mass contained in the grid.
+
+    """
+    def __init__(self,amp=1.,
+                 dens=lambda R,z,phi: 13.5*numpy.exp(-3.*R)\
+                     *numpy.exp(-27.*numpy.fabs(z))\
+                     *(1.+0.1*numpy.cos(2.*phi)),
+                 Rgrid=(0.,2.,41),zgrid=(0.,1.,41),mmax=4,zsym=True,
+                 ngl=4,nphi=None,numcores=None,normalize=False,
+                 ro=None,vo=None):
+        """
+        NAME:
+
+           __init__
+
+        PURPOSE:
+
+           initialize a CylindricalSplinePotential
+
+        INPUT:
+
+           amp - amplitude to be applied to the potential (default: 1); cannot have units currently
+
+           dens= function of R,z[,phi optional] that gives the density [in natural units, cannot return a Quantity currently]; should be able to take array inputs; or a galpy Potential instance or list of such instances, in which case its density is used
+
+           Rgrid= R grid to be given to linspace as in Rs= linspace(*Rgrid); the grid needs to start at R=0 and should enclose all of the relevant mass
+
+           zgrid= z grid to be given to linspace as in zs= linspace(*zgrid); if zsym, the grid needs to start at z=0
+
+           mmax= (4) maximum azimuthal harmonic to include (ignored for axisymmetric densities)
+
+           zsym= (True) if True, the density is assumed to be symmetric around z=0
+
+           ngl= (4) order of the Gauss-Legendre quadrature used in each (R,z) cell of the grid when computing the potential
+
+           nphi= (None) number of azimuths used to compute the Fourier components of the density (default: 4*mmax+4)
+
+           numcores= (None) if set to an integer, use this many cores to compute the potential on the grid
+
+           normalize - if True, normalize such that vc(1.,0.)=1., or, if given as a number, such that the force is this fraction of the force necessary to make vc(1.,0.)=1.
+
+           ro=, vo= distance and velocity scales for translation into internal units (default from configuration file)
+
+        OUTPUT:
+
+           CylindricalSplinePotential object
+
+        HISTORY:
+
+           2026-10-19 - Written - agent
+
+        """
+        Potential.__init__(self,amp=amp,ro=ro,vo=vo,amp_units=None)
+        # Parse the input density
+        if isinstance(dens,(Potential,list)):
+            from .Potential import evaluateDensities, _isNonAxi
+            self.isNonAxi= _isNonAxi(dens)
+            densPot= dens
+            self._inputdens= lambda R,z,phi: \
+                evaluateDensities(densPot,R,z,phi=phi,use_physical=False)
+        else:
+            self.isNonAxi= _dens_nargs(dens) >= 3
+            if self.isNonAxi:
+                self._inputdens= dens
+            else:
+                self._inputdens= lambda R,z,phi: dens(R,z)
+        if not self.isNonAxi: mmax= 0
+        self._mmax= mmax
+        self._zsym= zsym
+        # Set up the grid
+        self._rgrid= numpy.linspace(*Rgrid)
+        self._zgrid= numpy.linspace(*zgrid)
+        if self._rgrid[0] != 0.:
+            raise ValueError("Rgrid needs to start at R=0")
+        if zsym and self._zgrid[0] != 0.:
+            raise ValueError("zgrid needs to start at z=0 when zsym=True")
+        if nphi is None: nphi= 4*mmax+4
+        # Compute the potential harmonics on the grid
+        self._cosGrid, self._sinGrid, self._mass= \
+            _compute_cylspline_grid(self._inputdens,self._rgrid,self._zgrid,
+                                    mmax,zsym,ngl,nphi,self.isNonAxi,
+                                    numcores=numcores)
+        # Mirror the grid to R < 0 using that the m-th harmonic has parity
+        # (-1)^m, such that the splines are smooth at R=0 (and similarly
+        # around z=0 for symmetric densities)
+        parity= (-1.)**numpy.arange(mmax+1)[:,None,None]
+        self._rgrid= numpy.hstack((-self._rgrid[:0:-1],self._rgrid))
+        self._cosGrid= numpy.concatenate((parity*self._cosGrid[:,:0:-1],
+                                          self._cosGrid),axis=1)
+        self._sinGrid= numpy.concatenate((parity*self._sinGrid[:,:0:-1],
+                                          self._sinGrid),axis=1)
+        if zsym:
+            self._zgrid= numpy.hstack((-self._zgrid[:0:-1],self._zgrid))
+            self._cosGrid= numpy.concatenate((self._cosGrid[:,:,:0:-1],
+                                              self._cosGrid),axis=2)
+            self._sinGrid= numpy.concatenate((self._sinGrid[:,:,:0:-1],
+                                              self._sinGrid),axis=2)
+        self._rmin, self._rmax= self._rgrid[0], self._rgrid[-1]
+        self._zmin, self._zmax= self._zgrid[0], self._zgrid[-1]
+        # Mirror the grid beyond its edges before setting up the splines,
+        # such that the python and C splines, which have different boundary
+        # conditions, agree and are smooth up to the edge of the grid
+        self._npad= min(_NPAD,len(self._rgrid)-1,len(self._zgrid)-1)
+        rpad, cosPad= _mirror_pad(self._rgrid,self._cosGrid,1,self._npad)
+        rpad, sinPad= _mirror_pad(self._rgrid,self._sinGrid,1,self._npad)
+        zpad, cosPad= _mirror_pad(self._zgrid,cosPad,2,self._npad)
+        zpad, sinPad= _mirror_pad(self._zgrid,sinPad,2,self._npad)
+        self._cosInterp= [interpolate.RectBivariateSpline(\
+                    rpad,zpad,cosPad[m],kx=3,ky=3,s=0.)
+                          for m in range(mmax+1)]
+        self._sinInterp= [interpolate.RectBivariateSpline(\
+                    rpad,zpad,sinPad[m],kx=3,ky=3,s=0.)
+                          for m in range(mmax+1)]
+        if ext_loaded:
+            from .interpRZPotential import calc_2dsplinecoeffs_c
+            self._cosGrid_splinecoeffs= \
+                [calc_2dsplinecoeffs_c(cosPad[m]) for m in range(mmax+1)]
+            self._sinGrid_splinecoeffs= \
+                [calc_2dsplinecoeffs_c(sinPad[m]) for m in range(mmax+1)]
+        # The C implementation needs the spline coefficients computed above
+        self.hasC= ext_loaded
+        self.hasC_dxdv= False
+        if normalize or \
+                (isinstance(normalize,(int,float)) \
+                     and not isinstance(normalize,bool)):
+            self.normalize(normalize)
+        return None
+
+    def _ingrid(self,R,z):
+        """Determine which points are inside of the grid"""
+        return (R <= self._rmax)*(z >= self._zmin)*(z <= self._zmax)
+
+    def _eval_harmonics(self,R,z,phi,dR=0,dz=0,dphi=0):
+        """Evaluate the sum over the azimuthal harmonics of the (derivatives
+        of the) interpolated potential"""
+        out= numpy.zeros_like(R)
+        for m in range(self._mmax+1):
+            cosm, sinm= numpy.cos(m*phi), numpy.sin(m*phi)
+            if dphi == 0:
+                cfac, sfac= cosm, sinm
+            elif dphi == 1:
+                cfac, sfac= -m*sinm, m*cosm
+            else:
+                cfac, sfac= -m**2.*cosm, -m**2.*sinm
+            out+= cfac*self._cosInterp[m].ev(R,z,dx=dR,dy=dz)
+            if m > 0:
+                out+= sfac*self._sinInterp[m].ev(R,z,dx=dR,dy=dz)
+        return out
+
+    def _evaluate_generic(self,R,z,phi,dR=0,dz=0,dphi=0):
+        """Evaluate the potential or its derivatives, falling back onto the
+        point-mass potential outside of the grid"""
+        if phi is None: phi= 0. # axisymmetric evaluation
+        R= numpy.array(R,dtype='float')
+        z= numpy.array(z,dtype='float')
+        phi= numpy.array(phi,dtype='float')
+        shape= (R*z*phi).shape
+        R= R*numpy.ones(shape)
+        z= z*numpy.ones(shape)
+        phi= phi*numpy.ones(shape)
+        out= numpy.empty(shape)
+        indx= self._ingrid(R,z)
+        if numpy.any(indx):
+            out[indx]= self._eval_harmonics(R[indx],z[indx],phi[indx],
+                                            dR=dR,dz=dz,dphi=dphi)
+        if numpy.any(True^indx):
+            Ro, zo= R[True^indx], z[True^indx]
+            r2= Ro**2.+zo**2.
+            if dphi > 0:
+                out[True^indx]= 0.
+            elif dR == 0 and dz == 0:
+                out[True^indx]= -self._mass/numpy.sqrt(r2)
+            elif dR == 1 and dz == 0:
+                out[True^indx]= self._mass*Ro/r2**1.5
+            elif dR == 0 and dz == 1:
+                out[True^indx]= self._mass*zo/r2**1.5
+            elif dR == 2:
+                out[True^indx]= self._mass*(zo**2.-2.*Ro**2.)/r2**2.5
+            elif dz == 2:
+                out[True^indx]= self._mass*(Ro**2.-2.*zo**2.)/r2**2.5
+            else: # dR == 1, dz == 1
+                out[True^indx]= -3.*self._mass*Ro*zo/r2**2.5
+        if shape == (): return out[()]
+        return out
+
+    def _evaluate(self,R,z,phi=0.,t=0.):
+        """
+        NAME:
+           _evaluate
+        PURPOSE:
+           evaluate the potential at (R,z,phi)
+        INPUT:
+           R - Cylindrical Galactocentric radius
+           z - vertical height
+           phi - azimuth
+           t - time
+        OUTPUT:
+           potential at (R,z,phi)
+        HISTORY:
+           2026-10-19 - Written - agent
+        """
+        return self._evaluate_generic(R,z,phi)
+
+    def _Rforce(self,R,z,phi=0.,t=0.):
+        """
+        NAME:
+           _Rforce
+        PURPOSE:
+           evaluate the radial force at (R,z,phi)
+        INPUT:
+           R - Cylindrical Galactocentric radius
+           z - vertical height
+           phi - azimuth
+           t - time
+        OUTPUT:
+           radial force at (R,z,phi)
+        HISTORY:
+           2026-10-19 - Written - agent
+        """
+        return -self._evaluate_generic(R,z,phi,dR=1)
+
+    def _zforce(self,R,z,phi=0.,t=0.):
+        """
+        NAME:
+           _zforce
+        PURPOSE:
+           evaluate the vertical force at (R,z,phi)
+        INPUT:
+           R - Cylindrical Galactocentric radius
+           z - vertical height
+           phi - azimuth
+           t - time
+        OUTPUT:
+           vertical force at (R,z,phi)
+        HISTORY:
+           2026-10-19 - Written - agent
+        """
+        return -self._evaluate_generic(R,z,phi,dz=1)
+
+    def _phiforce(self,R,z,phi=0.,t=0.):
+        """
+        NAME:
+           _phiforce
+        PURPOSE:
+           evaluate the azimuthal force at (R,z,phi)
+        INPUT:
+           R - Cylindrical Galactocentric radius
+           z - vertical height
+           phi - azimuth
+           t - time
+        OUTPUT:
+           azimuthal force at (R,z,phi)
+        HISTORY:
+           2026-10-19 - Written - agent
+        """
+        return -self._evaluate_generic(R,z,phi,dphi=1)
+
+    def _R2deriv(self,R,z,phi=0.,t=0.):
+        """
+        NAME:
+           _R2deriv
+        PURPOSE:
+           evaluate the second radial derivative at (R,z,phi)
+        INPUT:
+           R - Cylindrical Galactocentric radius
+           z - vertical height
+           phi - azimuth
+           t - time
+        OUTPUT:
+           second radial derivative at (R,z,phi)
+        HISTORY:
+           2026-10-19 - Written - agent
+        """
+        return self._evaluate_generic(R,z,phi,dR=2)
+
+    def _z2deriv(self,R,z,phi=0.,t=0.):
+        """
+        NAME:
+           _z2deriv
+        PURPOSE:
+           evaluate the second vertical derivative at (R,z,phi)
+        INPUT:
+           R - Cylindrical Galactocentric radius
+           z - vertical height
+           phi - azimuth
+           t - time
+        OUTPUT:
+           second vertical derivative at (R,z,phi)
+        HISTORY:
+           2026-10-19 - Written - agent
+        """
+        return self._evaluate_generic(R,z,phi,dz=2)
+
+    def _Rzderiv(self,R,z,phi=0.,t=0.):
+        """
+        NAME:
+           _Rzderiv
+        PURPOSE:
+           evaluate the mixed R,z derivative at (R,z,phi)
+        INPUT:
+           R - Cylindrical Galactocentric radius
+           z - vertical height
+           phi - azimuth
+           t - time
+        OUTPUT:
+           d2phi/dR/dz at (R,z,phi)
+        HISTORY:
+           2026-10-19 - Written - agent
+        """
+        return self._evaluate_generic(R,z,phi,dR=1,dz=1)
+
+    def _phi2deriv(self,R,z,phi=0.,t=0.):
+        """
+        NAME:
+           _phi2deriv
+        PURPOSE:
+           evaluate the second azimuthal derivative at (R,z,phi)
+        INPUT:
+           R - Cylindrical Galactocentric radius
+           z - vertical height
+           phi - azimuth
+           t - time
+        OUTPUT:
+           second azimuthal derivative at (R,z,phi)
+        HISTORY:
+           2026-10-19 - Written - agent
+        """
+        return self._evaluate_generic(R,z,phi,dphi=2)
+
+    def _Rphideriv(self,R,z,phi=0.,t=0.):
+        """
+        NAME:
+           _Rphideriv
+        PURPOSE:
+           evaluate the mixed radial, azimuthal derivative at (R,z,phi)
+        INPUT:
+           R - Cylindrical Galactocentric radius
+           z - vertical height
+           phi - azimuth
+           t - time
+        OUTPUT:
+           d2phi/dR/dphi at (R,z,phi)
+        HISTORY:
+           2026-10-19 - Written - agent
+        """
+        return self._evaluate_generic(R,z,phi,dR=1,dphi=1)
+
+    def _dens(self,R,z,phi=0.,t=0.):
+        """
+        NAME:
+           _dens
+        PURPOSE:
+           evaluate the density at (R,z,phi)
+        INPUT:
+           R - Cylindrical Galactocentric radius
+           z - vertical height
+           phi - azimuth
+           t - time
+        OUTPUT:
+           density at (R,z,phi)
+        HISTORY:
+           2026-10-19 - Written - agent
+        """
+        return self._inputdens(R,z,phi)
+
+    def OmegaP(self):
+        """
+        NAME:
+           OmegaP
+        PURPOSE:
+           return the pattern speed
+        INPUT:
+           (none)
+        OUTPUT:
+           pattern speed
+        HISTORY:
+           2026-10-19 - Written - agent
+        """
+        return 0.
+
+def _dens_nargs(dens):
+    """Number of positional arguments that a density function takes (2 for R,z and 3 for R,z,phi)"""
+    try:
+        params= inspect.signature(dens).parameters.values()
+    except (TypeError,ValueError): # cannot inspect, assume dens(R,z)
+        return 2
+    if any([p.kind == p.VAR_POSITIONAL for p in params]):
+        return 3
+    return len([p for p in params
+                if p.kind in (p.POSITIONAL_ONLY,p.POSITIONAL_OR_KEYWORD)])
+
+def _mirror_pad(grid,vals,axis,npad):
+    """Extend a regular grid and the values on it by npad points by mirroring them around the first and last grid point along axis"""
+    dx= grid[1]-grid[0]
+    grid= numpy.hstack((grid[0]-dx*numpy.arange(npad,0,-1),grid,
+                        grid[-1]+dx*numpy.arange(1,npad+1)))
+    vals= numpy.concatenate(\
+        (numpy.flip(numpy.take(vals,numpy.arange(1,npad+1),axis=axis),
+                    axis=axis),
+         vals,
+         numpy.flip(numpy.take(vals,numpy.arange(-npad-1,-1),axis=axis),
+                    axis=axis)),axis=axis)
+    return (grid,vals)
+
+def _compute_cylspline_grid(dens,rgrid,zgrid,mmax,zsym,ngl,nphi,isNonAxi,
+                            numcores=None):
+    """
+    NAME:
+       _compute_cylspline_grid
+    PURPOSE:
+       compute the azimuthal harmonics of the potential of a density on a cylindrical (R,z) grid using direct quadrature
+    INPUT:
+       dens - density function of (R,z,phi) that can take array inputs
+       rgrid, zgrid - grid in R and z
+       mmax - maximum azimuthal harmonic
+       zsym - if True, assume that the density is symmetric around z=0
+       ngl - order of the Gauss-Legendre quadrature in each (R,z) cell
+       nphi - number of azimuths to compute the Fourier components of the density
+       isNonAxi - if False, the density is axisymmetric
+       numcores= (None) number of cores to use
+    OUTPUT:
+       (cosine harmonics [mmax+1,nR,nz],sine harmonics [mmax+1,nR,nz],total mass)
+    HISTORY:
+       2026-10-19 - Written - agent
+    """
+    # Quadrature nodes: Gauss-Legendre in each cell of the grid
+    glx, glw= leggauss(ngl)
+    Rp= (0.5*(rgrid[1:]-rgrid[:-1])[:,None]*(glx[None,:]+1.)
+         +rgrid[:-1,None]).flatten()
+    wRp= (0.5*(rgrid[1:]-rgrid[:-1])[:,None]*glw[None,:]).flatten()
+    zp= (0.5*(zgrid[1:]-zgrid[:-1])[:,None]*(glx[None,:]+1.)
+         +zgrid[:-1,None]).flatten()
+    wzp= (0.5*(zgrid[1:]-zgrid[:-1])[:,None]*glw[None,:]).flatten()
+    Rp, zp= numpy.meshgrid(Rp,zp,indexing='ij')
+    wp= numpy.outer(wRp,wzp).flatten()
+    Rp= Rp.flatten()
+    zp= zp.flatten()
+    # Fourier components of the density at the quadrature nodes
+    if isNonAxi:
+        phis= numpy.arange(nphi)/float(nphi)*2.*numpy.pi
+        dens_phi= numpy.array([dens(Rp,zp,phi*numpy.ones_like(Rp))
+                               for phi in phis])
+        densfft= numpy.fft.rfft(dens_phi,axis=0)/nphi
+        rhoc= 2.*densfft.real[:mmax+1]
+        rhos= -2.*densfft.imag[:mmax+1]
+        rhoc[0]/= 2.
+    else:
+        rhoc= numpy.atleast_2d(dens(Rp,zp,numpy.zeros_like(Rp)))
+        rhos= numpy.zeros_like(rhoc)
+    # Multiply in the quadrature weights and constant factors
+    rhoc*= -2.*wp
+    rhos*= -2.*wp
+    mass= -numpy.pi*numpy.sum(Rp*rhoc[0])
+    if zsym: mass*= 2.
+    def compute_row(ii):
+        cosRow= numpy.empty((mmax+1,len(zgrid)))
+        sinRow= numpy.empty((mmax+1,len(zgrid)))
+        for jj in range(len(zgrid)):
+            kernel= _cylspline_kernel(mmax,rgrid[ii],Rp,zgrid[jj]-zp)
+            if zsym:
+                kernel+= _cylspline_kernel(mmax,rgrid[ii],Rp,zgrid[jj]+zp)
+            cosRow[:,jj]= numpy.sum(kernel*rhoc,axis=1)
+            sinRow[:,jj]= numpy.sum(kernel*rhos,axis=1)
+        return (cosRow,sinRow)
+    if numcores is None:
+        out= [compute_row(ii) for ii in range(len(rgrid))]
+    else:
+        out= multi.parallel_map(compute_row,list(range(len(rgrid))),
+                                numcores=numcores)
+    cosGrid= numpy.array([o[0] for o in out]).transpose(1,0,2)
+    sinGrid= numpy.array([o[1] for o in out]).transpose(1,0,2)
+    return (cosGrid,sinGrid,mass)
+
+def _cylspline_kernel(mmax,R,Rp,dz):
+    """
+    NAME:
+       _cylspline_kernel
+    PURPOSE:
+       compute the kernel sqrt(R'/R) Q_{m-1/2}(chi) for m=0,...,mmax with chi= (R^2+R'^2+dz^2)/(2RR')
+    INPUT:
+       mmax - maximum azimuthal harmonic
+       R - target radius (float)
+       Rp - array of source radii
+       dz - array of vertical offsets
+    OUTPUT:
+       kernel array [mmax+1,len(Rp)]
+    HISTORY:
+       2026-10-19 - Written - agent
+    """
+    out= numpy.empty((mmax+1,len(Rp)))
+    D= R**2.+Rp**2.+dz**2.
+    x= 2.*R*Rp/D # = 1/chi
+    near= x > 1./_CHI_SWITCH
+    # Near field: Q_{-1/2} and Q_{1/2} from complete elliptic integrals and
+    # forward recurrence, which is stable close to chi=1
+    if numpy.any(near):
+        chi= 1./x[near]
+        k2= 2./(chi+1.)
+        Q= numpy.empty((mmax+1,len(chi)))
+        Q[0]= numpy.sqrt(k2)*special.ellipk(k2)
+        if mmax > 0:
+            Q[1]= chi*Q[0]-numpy.sqrt(2.*(chi+1.))*special.ellipe(k2)
+        for m in range(1,mmax):
+            Q[m+1]= 4.*m/(2.*m+1.)*chi*Q[m]-(2.*m-1.)/(2.*m+1.)*Q[m-1]
+        out[:,near]= Q*numpy.sqrt(Rp[near]/R)
+    # Far field: scaled q_m = Q_{m-1/2}(chi) (2chi)^(m+1/2) from backward
+    # recurrence (Miller's algorithm), which is stable for this minimal
+    # solution, normalized using q_0 from the complete elliptic integral
+    far= True^near
+    if numpy.any(far):
+        xf= x[far]
+        x2= xf**2.
+        q= numpy.empty((mmax+1,len(xf)))
+        qp1= numpy.zeros_like(xf)
+        qm= numpy.ones_like(xf)
+        for m in range(mmax+_MILLER_EXTRA,0,-1):
+            if m <= mmax: q[m]= qm
+            qm, qp1= (8.*m/(2.*m+1.)*qm-x2*qp1)\
+                /(4.*(2.*m-1.)/(2.*m+1.)), qm
+        q[0]= qm
+        # Normalize and convert to the kernel: q_m R'^(m+1) R^m / D^(m+1/2)
+        Rpf, Df= Rp[far], D[far]
+        q*= 2./numpy.sqrt(1.+xf)*special.ellipk(2.*xf/(1.+xf))/qm\
+            *Rpf/numpy.sqrt(Df)
+        q[1:]*= numpy.cumprod(numpy.tile(R*Rpf/Df,(mmax,1)),axis=0)
+        out[:,far]= q
+    return out
@@ -3,8 +3,10 @@
 ###############################################################################
 from pkg_resources import parse_version
 import copy
+import warnings
 import numpy
 import scipy
+from scipy import interpolate
 _SCIPY_VERSION= parse_version(scipy.__version__)
 if _SCIPY_VERSION < parse_version('0.10'): #pragma: no cover
     from scipy.maxentropy import logsumexp
@@ -15,8 +17,16 @@ else:
 from .Potential import Potential, _APY_LOADED
 from .SCFPotential import SCFPotential, \
     scf_compute_coeffs_axi, scf_compute_coeffs
+from ..util import galpyWarning
+from ..util.cache import cached
 if _APY_LOADED:
     from astropy import units
+# Tabulation of user-supplied Sigma and hz functions for the C implementation:
+# relative tolerance of the splines, maximum number of points, and maximum
+# radius/height considered
+_TAB_RTOL= 1e-8
+_TAB_MAXPTS= 10001
+_TAB_XMAX= 1000.
 class DiskSCFPotential(Potential):
     """Class that implements a basis-function-expansion technique for solving the Poisson equation for disk (+halo) systems. We solve the Poisson equation for a given density :math:`\\rho(R,\phi,z)` by introducing *K* helper function pairs :math:`[\\Sigma_i(R),h_i(z)]`, with :math:`h_i(z) = \mathrm{d}^2 H(z) / \mathrm{d} z^2` and search for solutions of the form
 
@@ -44,7 +54,7 @@ This technique was introduced by `Kuijken & Dubinski (1995) <http://adsabs.harva
                  Sigma_amp=None,dSigmadR=None,d2SigmadR2=None,
                  Hz=None,dHzdz=None,
                  N=10,L=10,a=1.,radial_order=None,costheta_order=None,
-                 phi_order=None,
+                 phi_order=None,cache=None,
                  ro=None,vo=None):
         """
         NAME:
@@ -67,6 +77,8 @@ This technique was introduced by `Kuijken & Dubinski (1995) <http://adsabs.harva
 
            N=, L=, a=, radial_order=, costheta_order=, phi_order= keywords setting parameters for SCF solution for Phi_ME (see :ref:`scf_compute_coeffs_axi <scf_compute_coeffs_axi>` or :ref:`scf_compute_coeffs <scf_compute_coeffs>` depending on whether :math:`\\rho(R,\phi,z)` is axisymmetric or not)
 
+           cache= (None) if True, save the SCF coefficients for Phi_ME to the persistent cache (see galpy.util.cache) and load them from there when the same DiskSCFPotential is set up again; can also be set to the directory to use for the cache
+
            Either:
 
               (a) Sigma= Dictionary of surface density (example: {'type':'exp','h':1./3.,'amp':1.,'Rhole':0.} for amp x exp(-Rhole/R-R/h) )
@@ -87,7 +99,7 @@ This technique was introduced by `Kuijken & Dubinski (1995) <http://adsabs.harva
 
                   dHzdz= function of z that gives d Hz(z) / d z
 
-              In both of these cases lists of arguments can be given for multiple disk components; can't mix (a) and (b) in these lists;  if hz is a single item the same vertical profile is assumed for all Sigma
+              In both of these cases lists of arguments can be given for multiple disk components; can't mix (a) and (b) in these lists;  if hz is a single item the same vertical profile is assumed for all Sigma; functions given in (b) are tabulated on adaptive grids for use in the C implementation
 
         OUTPUT:
 
@@ -96,6 +108,10 @@ This technique was introduced by `Kuijken & Dubinski (1995) <http://adsabs.harva
         HISTORY:
 
            2016-12-26 - Written - Bovy (UofT)
+
+           2026-10-19 - Added C implementation for user-supplied Sigma and hz functions - agent
+
+           2026-10-19 - Added cache= - agent
         """        
         Potential.__init__(self,amp=amp,ro=ro,vo=vo,amp_units=None)
         if _APY_LOADED and isinstance(a,units.Quantity): 
@@ -115,24 +131,31 @@ This technique was introduced by `Kuijken & Dubinski (1995) <http://adsabs.harva
                                               self._d2SigmadR2,
                                               self._hz,self._Hz,
                                               self._dHzdz,self._Sigma_amp)
-            Acos, Asin= scf_compute_coeffs_axi(dens_func,N,L,a=a,
-                                               radial_order=radial_order,
-                                               costheta_order=costheta_order)
+            Acos, Asin= cached(lambda: scf_compute_coeffs_axi(dens_func,N,L,a=a,
+                                        radial_order=radial_order,
+                                        costheta_order=costheta_order),
+                               cache,'DiskSCFPotential',dens,Sigma_amp,Sigma,
+                               dSigmadR,d2SigmadR2,hz,Hz,dHzdz,N,L,a,
+                               radial_order,costheta_order)
         else:
             dens_func= lambda R,z,phi: phiME_dens(R,z,phi,self._inputdens,
                                                   self._Sigma,self._dSigmadR,
                                                   self._d2SigmadR2,
                                                   self._hz,self._Hz,
                                                   self._dHzdz,self._Sigma_amp)
-            Acos, Asin= scf_compute_coeffs(dens_func,N,L,a=a,
-                                           radial_order=radial_order,
-                                           costheta_order=costheta_order,
-                                           phi_order=phi_order)
+            Acos, Asin= cached(lambda: scf_compute_coeffs(dens_func,N,L,a=a,
+                                        radial_order=radial_order,
+                                        costheta_order=costheta_order,
+                                        phi_order=phi_order),
+                               cache,'DiskSCFPotential',dens,Sigma_amp,Sigma,
+                               dSigmadR,d2SigmadR2,hz,Hz,dHzdz,N,L,a,
+                               radial_order,costheta_order,phi_order)
         self._phiME_dens_func= dens_func
         self._scf= SCFPotential(amp=1.,Acos=Acos,Asin=Asin,a=a,ro=None,vo=None)
-        if not self._Sigma_dict is None and not self._hz_dict is None:
-            self.hasC= True
-            self.hasC_dens= True
+        # Tabulate user-supplied functions, such that the C code can use them
+        self._tabulate_profiles()
+        self.hasC= True
+        self.hasC_dens= True
         if normalize or \
                 (isinstance(normalize,(int,float)) \
                      and not isinstance(normalize,bool)): 
@@ -270,6 +293,28 @@ This technique was introduced by `Kuijken & Dubinski (1995) <http://adsabs.harva
             tdH= lambda z, tzd= zd: numpy.tanh(z/2./tzd)/2.
         return (th,tH,tdH)
     
+    def _tabulate_profiles(self):
+        """
+        NAME:
+           _tabulate_profiles
+        PURPOSE:
+           Tabulate user-supplied Sigma and hz functions on adaptive grids for use with cubic splines in C
+        HISTORY:
+           2026-10-19 - Written - agent
+        """
+        if self._Sigma_dict is None:
+            self._Sigma_tab= [_tabulate_profile([s,ds,d2s])
+                              for s,ds,d2s in zip(self._Sigma,self._dSigmadR,
+                                                  self._d2SigmadR2)]
+        else:
+            self._Sigma_tab= None
+        if self._hz_dict is None:
+            self._hz_tab= [_tabulate_profile([h,H,dH],symmetric=True)
+                           for h,H,dH in zip(self._hz,self._Hz,self._dHzdz)]
+        else:
+            self._hz_tab= None
+        return None
+
     def _evaluate(self,R,z,phi=0.,t=0.):
         """
         NAME:
@@ -477,3 +522,63 @@ def phiME_dens(R,z,phi,dens,Sigma,dSigmadR,d2SigmadR2,hz,Hz,dHzdz,Sigma_amp):
             in zip(Sigma_amp,Sigma,dSigmadR,d2SigmadR2,hz,Hz,dHzdz):
         out-= a*(s(r)*h(z)+d2s(r)*H(z)+2./r*ds(r)*(H(z)+z*dH(z)))
     return out
+
+def _eval_profile(func,x):
+    """Evaluate a Sigma or hz function for an array x, even if the function does not support arrays"""
+    with numpy.errstate(all='ignore'):
+        try:
+            out= numpy.array(func(x),dtype=float)*numpy.ones_like(x)
+        except (TypeError,ValueError):
+            out= numpy.array([func(xx) for xx in x],dtype=float)
+    return out
+
+def _tabulate_profile(funcs,symmetric=False):
+    """
+    NAME:
+       _tabulate_profile
+    PURPOSE:
+       tabulate a function and its two derivatives on an adaptive grid, such that a natural cubic spline through the tabulated points agrees with each of the functions to a relative precision _TAB_RTOL
+    INPUT:
+       funcs - [f,df,d2f] (Sigma) or [h,H,dH] (hz)
+       symmetric= (False) if True, tabulate for x in [-xmax,xmax] and determine the range from the first function only (hz), otherwise for x in [0,xmax] and determine the range from all functions (Sigma)
+    OUTPUT:
+       array [x,f,df,d2f] with shape (4,npts)
+    HISTORY:
+       2026-10-19 - Written - agent
+    """
+    # Determine the range over which the profile is non-negligible
+    xs= numpy.geomspace(10.**-6.,_TAB_XMAX,241)
+    if symmetric:
+        x= numpy.hstack((-xs[::-1],[0.],xs))
+    else:
+        x= numpy.hstack(([0.],xs))
+    vals= numpy.array([_eval_profile(f,x) for f in funcs])
+    x= x[numpy.all(numpy.isfinite(vals),axis=0)]
+    vals= vals[:,numpy.all(numpy.isfinite(vals),axis=0)]
+    if symmetric: vals= vals[:1]
+    scale= numpy.amax(numpy.fabs(vals),axis=1)
+    scale[scale == 0.]= 1.
+    significant= numpy.any(numpy.fabs(vals) > _TAB_RTOL*scale[:,None],axis=0)
+    indx= numpy.arange(len(x))[significant]
+    if len(indx) > 0:
+        lo= 0 if not symmetric else numpy.amax([indx[0]-1,0])
+        x= x[lo:numpy.amin([indx[-1]+2,len(x)])]
+    # Refine the grid where the spline does not represent the functions well
+    while True:
+        vals= numpy.array([_eval_profile(f,x) for f in funcs])
+        xm= 0.5*(x[1:]+x[:-1])
+        bad= numpy.zeros(len(xm),dtype='bool')
+        for val,f in zip(vals,funcs):
+            fm= _eval_profile(f,xm)
+            scale= numpy.amax(numpy.fabs(val))
+            if scale == 0.: scale= 1.
+            spl= interpolate.CubicSpline(x,val,bc_type='natural')
+            with numpy.errstate(invalid='ignore'):
+                bad+= numpy.fabs(spl(xm)-fm) > _TAB_RTOL*scale
+        if not numpy.any(bad):
+            break
+        if len(x)+numpy.sum(bad) > _TAB_MAXPTS:
+            warnings.warn("Tabulating a DiskSCFPotential Sigma or hz function for the C implementation did not reach the requested relative precision of {:g}; orbit integration in C may be less accurate than in Python".format(_TAB_RTOL),galpyWarning)
+            break
+        x= numpy.sort(numpy.hstack((x,xm[bad])))
+    return numpy.vstack((x,vals))
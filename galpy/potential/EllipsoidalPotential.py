@@ -9,14 +9,16 @@
 #
 ###############################################################################
 import hashlib
+import warnings
 import numpy
 from scipy import integrate
-from ..util import bovy_coords
+from ..util import bovy_coords, galpyWarning
 from ..util import _rotate_to_arbitrary_vector
 from .Potential import Potential, _APY_LOADED, \
     check_potential_inputs_not_arrays
 if _APY_LOADED:
     from astropy import units
+_TAB_MAXPTS= 2000000
 class EllipsoidalPotential(Potential):
     """Base class for potentials corresponding to density profiles that are stratified on ellipsoids:
 
@@ -33,11 +35,14 @@ class EllipsoidalPotential(Potential):
         \psi(m) = -\\int_{m^2}^\\infty d m^2 \\rho(m^2)
 
     See PerfectEllipsoidPotential for an example and `Merritt & Fridman (1996) <http://adsabs.harvard.edu/abs/1996ApJ...460..136M>`_ for the formalism.
+
+    The forces require a one-dimensional integral at every position; with ``tabulate=True``, the force integrals are instead pre-computed when setting up the potential on a grid in :math:`(\ln r,\cos^2\theta,\sin^2\phi)`, with :math:`(r,\theta,\phi)` spherical coordinates in the frame aligned with the ellipsoid, whose resolution is chosen adaptively such that 6-point Lagrange interpolation represents each force component to a relative precision ``tabulate_tol``. The forces are then interpolated in this table (in Python and in C) for :math:`r` within ``tabulate_rrange`` and computed by direct integration outside of this range. This speeds up orbit integration, especially for large ``glorder``.
     """
     def __init__(self,amp=1.,
                  b=1.,c=1.,
                  zvec=None,pa=None,glorder=50,
-                 ro=None,vo=None,amp_units=None):
+                 ro=None,vo=None,amp_units=None,
+                 tabulate=False,tabulate_rrange=None,tabulate_tol=1e-8):
         """
         NAME:
 
@@ -65,6 +70,12 @@ class EllipsoidalPotential(Potential):
 
            ro=, vo= distance and velocity scales for translation into internal units (default from configuration file)
 
+           tabulate= (False) if True, pre-compute the force integrals on an adaptive grid and interpolate the forces (requires glorder to be set; the table is set up by the inheriting class through _setup_force_table once the density is defined)
+
+           tabulate_rrange= (None) range in spherical radius r covered by the table (can be Quantity); default: [10^-3,10^2] times the scale radius
+
+           tabulate_tol= (1e-8) relative precision of the interpolated forces
+
         OUTPUT:
 
            (none)
@@ -73,6 +84,8 @@ class EllipsoidalPotential(Potential):
 
            2018-08-06 - Started - Bovy (UofT)
 
+           2026-10-19 - Added tabulated forces - agent
+
         """
         Potential.__init__(self,amp=amp,ro=ro,vo=vo,amp_units=amp_units)
         # Setup axis ratios
@@ -87,6 +100,15 @@ class EllipsoidalPotential(Potential):
         self._setup_gl(glorder)
         if not self._aligned or numpy.fabs(self._b-1.) > 10.**-10.:
             self.isNonAxi= True
+        # Setup tabulation of the forces, done in _setup_force_table
+        if tabulate and self._glorder is None:
+            raise ValueError("Tabulating the forces of an EllipsoidalPotential requires glorder= to be set")
+        if _APY_LOADED and isinstance(tabulate_rrange,units.Quantity):
+            tabulate_rrange= tabulate_rrange.to(units.kpc).value/self._ro
+        self._tabulate= tabulate
+        self._tabulate_rrange= tabulate_rrange
+        self._tabulate_tol= tabulate_tol
+        self._force_table= None
         return None
 
     def _setup_zvec_pa(self,zvec,pa):
@@ -126,6 +148,30 @@ class EllipsoidalPotential(Potential):
             self._glw*= 0.5
         return None
 
+    def _setup_force_table(self):
+        """Tabulate the force integrals if requested, to be called by the inheriting class at the end of its initialization"""
+        if not self._tabulate: return None
+        if self._tabulate_rrange is None:
+            scale= getattr(self,'_scale',1.)
+            rrange= [10.**-3.*scale,10.**2.*scale]
+        else:
+            rrange= self._tabulate_rrange
+        self._force_table= _tabulate_forceInt(\
+            numpy.log(rrange[0]),numpy.log(rrange[1]),
+            lambda m: self._mdens(m),self._b,self._c,self._glx,self._glw,
+            self._tabulate_tol)
+        return None
+
+    def _forces_xyz(self,x,y,z):
+        """Evaluation of all force components as a function of (x,y,z) in the aligned coordinate frame, using the table when possible"""
+        if not self._force_table is None:
+            out= _interp_forceInt_table(self._force_table,x,y,z)
+            if not out is None:
+                return (-x*out[0],-y*out[1],-z*out[2])
+        return (self._force_xyz(x,y,z,0),
+                self._force_xyz(x,y,z,1),
+                self._force_xyz(x,y,z,2))
+
     @check_potential_inputs_not_arrays
     def _evaluate(self,R,z,phi=0.,t=0.):
         """
@@ -191,9 +237,7 @@ class EllipsoidalPotential(Potential):
             else:
                 xyzp= numpy.dot(self._rot,numpy.array([x,y,z]))
                 xp, yp, zp= xyzp[0], xyzp[1], xyzp[2]
-            Fx= self._force_xyz(xp,yp,zp,0)
-            Fy= self._force_xyz(xp,yp,zp,1)
-            Fz= self._force_xyz(xp,yp,zp,2)
+            Fx, Fy, Fz= self._forces_xyz(xp,yp,zp)
             self._force_hash= new_hash
             self._cached_Fx= Fx
             self._cached_Fy= Fy
@@ -235,9 +279,7 @@ class EllipsoidalPotential(Potential):
             else:
                 xyzp= numpy.dot(self._rot,numpy.array([x,y,z]))
                 xp, yp, zp= xyzp[0], xyzp[1], xyzp[2]
-            Fx= self._force_xyz(xp,yp,zp,0)
-            Fy= self._force_xyz(xp,yp,zp,1)
-            Fz= self._force_xyz(xp,yp,zp,2)
+            Fx, Fy, Fz= self._forces_xyz(xp,yp,zp)
             self._force_hash= new_hash
             self._cached_Fx= Fx
             self._cached_Fy= Fy
@@ -279,9 +321,7 @@ class EllipsoidalPotential(Potential):
             else:
                 xyzp= numpy.dot(self._rot,numpy.array([x,y,z]))
                 xp, yp, zp= xyzp[0], xyzp[1], xyzp[2]
-            Fx= self._force_xyz(xp,yp,zp,0)
-            Fy= self._force_xyz(xp,yp,zp,1)
-            Fz= self._force_xyz(xp,yp,zp,2)
+            Fx, Fy, Fz= self._forces_xyz(xp,yp,zp)
             self._force_hash= new_hash
             self._cached_Fx= Fx
             self._cached_Fy= Fy
@@ -526,3 +566,115 @@ def _2ndDerivInt(x,y,z,dens,densDeriv,b2,c2,i,j,glx=None,glw=None):
     else:
         return numpy.sum(glw*integrand(glx))
 
+def _forceInt_table_values(x2,y2,z2,dens,b,c,glx,glw):
+    """-F_i/x_i for all three components at the points (x2,y2,z2) = (x^2,y^2,z^2), same as _forceInt, vectorized over the points"""
+    b2, c2= b**2., c**2.
+    t= 1./glx**2.-1.
+    w= 4.*numpy.pi*b*c*glw/numpy.sqrt((1.+(b2-1.)*glx**2.)
+                                      *(1.+(c2-1.)*glx**2.))
+    out= numpy.empty((3,len(x2)))
+    chunk= 10000
+    for ii in range(0,len(x2),chunk):
+        tx2= x2[ii:ii+chunk,None]
+        ty2= y2[ii:ii+chunk,None]
+        tz2= z2[ii:ii+chunk,None]
+        td= w*dens(numpy.sqrt(tx2/(1.+t)+ty2/(b2+t)+tz2/(c2+t)))
+        out[0,ii:ii+chunk]= numpy.sum(td/(1.+t),axis=1)
+        out[1,ii:ii+chunk]= numpy.sum(td/(b2+t),axis=1)
+        out[2,ii:ii+chunk]= numpy.sum(td/(c2+t),axis=1)
+    return out
+
+def _forceInt_table_grid(lnr,u,v,dens,b,c,glx,glw):
+    """ln(-F_i/x_i) on the grid of (ln r,u,v)"""
+    lnr, u, v= numpy.meshgrid(lnr,u,v,indexing='ij')
+    r2= numpy.exp(2.*lnr.flatten())
+    u, v= u.flatten(), v.flatten()
+    with numpy.errstate(divide='ignore',invalid='ignore'):
+        out= numpy.log(_forceInt_table_values(r2*(1.-u)*(1.-v),
+                                              r2*(1.-u)*v,r2*u,
+                                              dens,b,c,glx,glw))
+    if not numpy.all(numpy.isfinite(out)):
+        raise ValueError("Tabulating the forces of an EllipsoidalPotential requires a positive density")
+    return numpy.reshape(out,(3,)+lnr.shape)
+
+_LAGRANGE6_DENOM= [-120.,24.,-12.,12.,-24.,120.]
+def _lagrange6(q,n):
+    """Start of the 6-point stencil and Lagrange weights for interpolating at (fractional) grid index q on a grid of n points"""
+    if numpy.ndim(q) == 0:
+        i0= min(max(int(q//1)-2,0),n-6)
+        p= float(q-i0)
+        d01= p*(p-1.)
+        d23= (p-2.)*(p-3.)
+        d45= (p-4.)*(p-5.)
+        return (i0,numpy.array([(p-1.)*d23*d45/-120.,p*d23*d45/24.,
+                                d01*(p-3.)*d45/-12.,d01*(p-2.)*d45/12.,
+                                d01*d23*(p-5.)/-24.,d01*d23*(p-4.)/120.]))
+    i0= numpy.clip(numpy.floor(q).astype('int')-2,0,n-6)
+    d= numpy.subtract.outer(q-i0,numpy.arange(6))
+    return (i0,numpy.array([numpy.prod(numpy.delete(d,jj,axis=1),axis=1)
+                            /_LAGRANGE6_DENOM[jj] for jj in range(6)]))
+
+def _tabulate_forceInt(lnrmin,lnrmax,dens,b,c,glx,glw,tol):
+    """
+    NAME:
+       _tabulate_forceInt
+    PURPOSE:
+       tabulate ln(-F_i/x_i) on a uniform grid in (ln r, u = z^2/r^2, v = y^2/[x^2+y^2]), with a resolution in each dimension that is increased until 6-point Lagrange interpolation halfway between the grid points agrees with the direct integral to tol/3
+    INPUT:
+       lnrmin, lnrmax - range in ln r
+       dens - density as a function of m
+       b, c - axis ratios
+       glx, glw - Gauss-Legendre points and weights on [0,1]
+       tol - tolerance
+    OUTPUT:
+       (lnrmin,lnrmax,table[3,nr,nu,nv])
+    HISTORY:
+       2026-10-19 - Written - agent
+    """
+    ns= [max(int(numpy.ceil(2.*(lnrmax-lnrmin)))+1,6),9,9]
+    while True:
+        grids= [numpy.linspace(lnrmin,lnrmax,ns[0]),
+                numpy.linspace(0.,1.,ns[1]),
+                numpy.linspace(0.,1.,ns[2])]
+        table= _forceInt_table_grid(grids[0],grids[1],grids[2],
+                                    dens,b,c,glx,glw)
+        # Check the interpolation halfway between the grid points in each
+        # dimension
+        refine= []
+        for ii in range(3):
+            mgrids= list(grids)
+            mgrids[ii]= 0.5*(grids[ii][1:]+grids[ii][:-1])
+            direct= _forceInt_table_grid(mgrids[0],mgrids[1],mgrids[2],
+                                         dens,b,c,glx,glw)
+            i0, w= _lagrange6(numpy.arange(ns[ii]-1)+0.5,ns[ii])
+            interp= numpy.zeros_like(direct)
+            for jj in range(6):
+                interp+= numpy.expand_dims(w[jj],
+                                           axis=tuple(set(range(4))-{ii+1}))\
+                    *numpy.take(table,i0+jj,axis=ii+1)
+            # Interpolation errors elsewhere can be somewhat larger than
+            # halfway between the grid points
+            refine.append(numpy.amax(numpy.fabs(interp-direct)) > tol/3.)
+        if not numpy.any(refine): break
+        newns= [2*n-1 if r else n for n,r in zip(ns,refine)]
+        if numpy.prod(newns) > _TAB_MAXPTS:
+            warnings.warn("Tabulating the forces of an EllipsoidalPotential did not reach the requested relative precision of {:g}".format(tol),galpyWarning)
+            break
+        ns= newns
+    return (lnrmin,lnrmax,table)
+
+def _interp_forceInt_table(force_table,x,y,z):
+    """Interpolate -F_i/x_i from the table, same as in the C implementation; returns None when r is outside of the range of the table"""
+    lnrmin, lnrmax, table= force_table
+    R2= x**2.+y**2.
+    r2= R2+z**2.
+    if r2 == 0.: return None
+    lnr= 0.5*numpy.log(r2)
+    if lnr < lnrmin or lnr > lnrmax: return None
+    nr, nu, nv= table.shape[1:]
+    ir, wr= _lagrange6((lnr-lnrmin)/(lnrmax-lnrmin)*(nr-1),nr)
+    iu, wu= _lagrange6(z**2./r2*(nu-1),nu)
+    iv, wv= _lagrange6((y**2./R2 if R2 > 0. else 0.)*(nv-1),nv)
+    return numpy.exp(numpy.einsum('ijkl,j,k,l->i',
+                                  table[:,ir:ir+6,iu:iu+6,iv:iv+6],
+                                  wr,wu,wv))
@@ -32,11 +32,11 @@ class FerrersPotential(Potential):
     and :math:`(x',y',z')` is a rotated frame wrt :math:`(x,y,z)`
     so that the major axis is aligned with :math:`x'`.
 
-    Note that this potential has not yet been optimized for speed and has no C implementation, so orbit integration is currently slow.
+    Note that the Python implementation of this potential is slow; orbit integration uses the much faster C implementation, which computes the integrals with Gauss-Legendre quadrature.
     """
 
     def __init__(self,amp=1.,a=1.,n=2,b=0.35,c=0.2375,omegab=0.,
-                 pa=0.,normalize=False,ro=None,vo=None):
+                 pa=0.,normalize=False,ro=None,vo=None,glorder=50):
         """
         NAME:
 
@@ -66,10 +66,16 @@ class FerrersPotential(Potential):
 
            ro=, vo= distance and velocity scales for translation into internal units (default from configuration file)
 
+           glorder= (50) order of the Gauss-Legendre quadrature used to compute the potential, forces, and second derivatives in the C implementation
+
         OUTPUT:
 
            (none)
 
+        HISTORY:
+
+           2026-10-19 - Added glorder for the C implementation - agent
+
         """
         Potential.__init__(self,amp=amp,ro=ro,vo=vo,amp_units='mass')
         if _APY_LOADED and isinstance(a,units.Quantity):
@@ -93,12 +99,19 @@ class FerrersPotential(Potential):
         self._force_hash= None
         self._pa = pa
         self._rhoc_M = gamma(n+2.5)/gamma(n+1) / numpy.pi**1.5/a**3/b/c
+        # Gauss-Legendre quadrature on (0,1) for the C implementation
+        self._glorder= glorder
+        self._glx, self._glw= numpy.polynomial.legendre.leggauss(glorder)
+        self._glx= 0.5*self._glx+0.5
+        self._glw*= 0.5
         if normalize or \
                 (isinstance(normalize,(int,float)) \
                      and not isinstance(normalize,bool)): #pragma: no cover
             self.normalize(normalize)
         if numpy.fabs(self._b-1.) > 10.**-10.:
             self.isNonAxi= True
+        self.hasC= True
+        self.hasC_dxdv= True
         return None
 
     def _evaluate(self,R,z,phi=0.,t=0.):
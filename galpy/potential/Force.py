@@ -6,6 +6,7 @@
 import copy
 import numpy
 from ..util import config
+from ..util import serialize
 from ..util import bovy_conversion
 from ..util.bovy_conversion import physical_conversion, \
     potential_physical_input, physical_compatible
@@ -295,6 +296,31 @@ class Force(object):
             self._vo= vo
         return None
 
+    def to_bytes(self):
+        """
+        NAME:
+
+           to_bytes
+
+        PURPOSE:
+
+           serialize the force to a compact byte string, e.g., to send it to other processes (load with galpy.potential.from_bytes; only works with the same Python and galpy versions)
+
+        INPUT:
+
+           (none)
+
+        OUTPUT:
+
+           bytes
+
+        HISTORY:
+
+           2026-10-19 - Written - agent
+
+        """
+        return serialize.dumps(self)
+
     @potential_physical_input
     @physical_conversion('force',pop=True)
     def rforce(self,*args,**kwargs):
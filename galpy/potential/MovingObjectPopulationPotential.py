@@ -0,0 +1,321 @@
+###############################################################################
+#   MovingObjectPopulationPotential.py: class that implements the potential
+#                                       of a population of moving objects
+#                                       (e.g., subhalos)
+###############################################################################
+import numpy
+from ..util import bovy_conversion
+from .Potential import Potential, _APY_LOADED
+if _APY_LOADED:
+    from astropy import units
+_PROFILES= {'plummer':0,'hernquist':1}
+class MovingObjectPopulationPotential(Potential):
+    """Class that implements the potential of a population of moving objects (e.g., a population of dark-matter subhalos), each of which is a Plummer or Hernquist sphere
+
+    .. math::
+
+        \\Phi(\\vec{x},t) = -\\sum_i \\frac{\\mathrm{amp}\\,M_i}{\\sqrt{|\\vec{x}-\\vec{x}_i(t)|^2+r_{s,i}^2}}\\quad\\mathrm{(Plummer)}\\,,\\qquad \\Phi(\\vec{x},t) = -\\sum_i \\frac{\\mathrm{amp}\\,M_i}{|\\vec{x}-\\vec{x}_i(t)|+r_{s,i}}\\quad\\mathrm{(Hernquist)}
+
+    where the trajectories :math:`\\vec{x}_i(t)` are given by integrated orbits, which are interpolated using cubic Hermite splines based on the orbit's positions and velocities. All trajectories are stored in contiguous arrays. When a ``cutoff`` is given, objects further than ``cutoff`` from the evaluation point are ignored and a time-binned spatial index is used to quickly find the nearby objects, such that the cost of a force evaluation scales with the number of nearby objects rather than with the total number of objects (in the C implementation).
+    """
+    def __init__(self,orbits,masses,rs,profile='plummer',cutoff=None,
+                 tbin=None,amp=1.,ro=None,vo=None):
+        """
+        NAME:
+
+           __init__
+
+        PURPOSE:
+
+           initialize a MovingObjectPopulationPotential
+
+        INPUT:
+
+           orbits - the integrated orbits of the objects (Orbit instance containing all objects, all integrated on the same time grid)
+
+           masses - masses of the objects (array or Quantity)
+
+           rs - scale radii of the objects (array or Quantity)
+
+           profile= ('plummer') density profile of the objects: 'plummer' or 'hernquist'
+
+           cutoff= (None) if set, ignore objects that are further than this distance from the evaluation point (can be Quantity)
+
+           tbin= (None) width of the time bins of the spatial index that is used when cutoff is set; default: cutoff divided by the maximum speed of the objects (can be Quantity)
+
+           amp (=1.) another amplitude to apply to the potential
+
+           ro=, vo= distance and velocity scales for translation into internal units (default from configuration file)
+
+        OUTPUT:
+
+           (none)
+
+        HISTORY:
+
+           2026-10-19 - Written - agent
+
+        """
+        Potential.__init__(self,amp=amp,ro=ro,vo=vo)
+        if not profile.lower() in _PROFILES:
+            raise ValueError("profile= must be either 'plummer' or 'hernquist'")
+        self._profile= _PROFILES[profile.lower()]
+        if _APY_LOADED and isinstance(masses,units.Quantity):
+            masses= masses.to(units.Msun).value\
+                /bovy_conversion.mass_in_msol(self._vo,self._ro)
+        if _APY_LOADED and isinstance(rs,units.Quantity):
+            rs= rs.to(units.kpc).value/self._ro
+        if _APY_LOADED and isinstance(cutoff,units.Quantity):
+            cutoff= cutoff.to(units.kpc).value/self._ro
+        if _APY_LOADED and isinstance(tbin,units.Quantity):
+            tbin= tbin.to(units.Gyr).value\
+                /bovy_conversion.time_in_Gyr(self._vo,self._ro)
+        # Store the trajectories in contiguous arrays
+        if not hasattr(orbits,'orbit'):
+            raise RuntimeError("orbits= must have been integrated before setting up a MovingObjectPopulationPotential")
+        times= numpy.array(orbits.t,dtype=float)
+        if len(times) < 2:
+            raise RuntimeError("orbits= must have been integrated at more than one time")
+        pos= numpy.empty((orbits.size,len(times),3))
+        vel= numpy.empty((orbits.size,len(times),3))
+        pos[...,0]= numpy.atleast_2d(orbits.x(times,use_physical=False))
+        pos[...,1]= numpy.atleast_2d(orbits.y(times,use_physical=False))
+        vel[...,0]= numpy.atleast_2d(orbits.vx(times,use_physical=False))
+        vel[...,1]= numpy.atleast_2d(orbits.vy(times,use_physical=False))
+        if orbits.dim() == 3:
+            pos[...,2]= numpy.atleast_2d(orbits.z(times,use_physical=False))
+            vel[...,2]= numpy.atleast_2d(orbits.vz(times,use_physical=False))
+        else:
+            pos[...,2]= 0.
+            vel[...,2]= 0.
+        if times[1] < times[0]: # integrated backwards
+            times= times[::-1]
+            pos= pos[:,::-1]
+            vel= vel[:,::-1]
+        self._times= times
+        self._pos= numpy.ascontiguousarray(pos)
+        self._vel= numpy.ascontiguousarray(vel)
+        self._nobj= orbits.size
+        self._masses= numpy.array(masses,dtype=float)*numpy.ones(self._nobj)
+        self._rs= numpy.array(rs,dtype=float)*numpy.ones(self._nobj)
+        self._cutoff= cutoff
+        # Set up the time-binned spatial index
+        if self._cutoff is None:
+            self._tbin= None
+            self._nbins= 0
+        else:
+            if tbin is None:
+                tbin= self._cutoff/numpy.amax(numpy.sqrt(numpy.sum(\
+                            self._vel**2.,axis=-1)))
+            self._tbin= tbin
+            self._nbins= int(numpy.ceil((self._times[-1]-self._times[0])\
+                                            /self._tbin))
+            self._index= _build_spatial_index(self._times,self._pos,
+                                              self._vel,self._cutoff,
+                                              self._tbin,self._nbins)
+        self.isNonAxi= True
+        self.hasC= True
+        return None
+
+    def _xyzforces(self,x,y,z,t):
+        """Potential and rectangular forces at (x,y,z,t) for scalar inputs"""
+        opos= _hermite_interp(self._times,self._pos,self._vel,t)
+        dx= opos[:,0]-x
+        dy= opos[:,1]-y
+        dz= opos[:,2]-z
+        r= numpy.sqrt(dx**2.+dy**2.+dz**2.)
+        if self._cutoff is None:
+            indx= numpy.ones(self._nobj,dtype='bool')
+        else:
+            indx= r <= self._cutoff
+        dx, dy, dz, r= dx[indx], dy[indx], dz[indx], r[indx]
+        masses, rs= self._masses[indx], self._rs[indx]
+        if self._profile == 0:
+            pot= -numpy.sum(masses/numpy.sqrt(r**2.+rs**2.))
+            fac= masses/(r**2.+rs**2.)**1.5
+        else:
+            pot= -numpy.sum(masses/(r+rs))
+            with numpy.errstate(divide='ignore',invalid='ignore'):
+                fac= masses/r/(r+rs)**2.
+            # An object exerts no force at its own center
+            fac[r == 0.]= 0.
+        return (pot,numpy.sum(fac*dx),numpy.sum(fac*dy),numpy.sum(fac*dz))
+
+    def _call_xyz(self,func,R,z,phi,t):
+        """Evaluate func(pot,Fx,Fy,Fz,R,phi) at all (R,z,phi,t)"""
+        if numpy.ndim(R) == 0 and numpy.ndim(z) == 0 \
+                and numpy.ndim(phi) == 0 and numpy.ndim(t) == 0:
+            return func(*self._xyzforces(R*numpy.cos(phi),R*numpy.sin(phi),
+                                         z,t),R=R,phi=phi)
+        R,z,phi,t= numpy.broadcast_arrays(R,z,phi,t)
+        out= numpy.empty(R.shape)
+        for ii in numpy.ndindex(R.shape):
+            out[ii]= func(*self._xyzforces(R[ii]*numpy.cos(phi[ii]),
+                                           R[ii]*numpy.sin(phi[ii]),
+                                           z[ii],t[ii]),R=R[ii],phi=phi[ii])
+        return out
+
+    def _evaluate(self,R,z,phi=0.,t=0.):
+        """
+        NAME:
+           _evaluate
+        PURPOSE:
+           evaluate the potential at R,z, phi
+        INPUT:
+           R - Galactocentric cylindrical radius
+           z - vertical height
+           phi - azimuth
+           t - time
+        OUTPUT:
+           Phi(R,z,phi)
+        HISTORY:
+           2026-10-19 - Written - agent
+        """
+        return self._call_xyz(lambda pot,Fx,Fy,Fz,R,phi: pot,R,z,phi,t)
+
+    def _Rforce(self,R,z,phi=0.,t=0.):
+        """
+        NAME:
+           _Rforce
+        PURPOSE:
+           evaluate the radial force for this potential
+        INPUT:
+           R - Galactocentric cylindrical radius
+           z - vertical height
+           phi - azimuth
+           t - time
+        OUTPUT:
+           the radial force
+        HISTORY:
+           2026-10-19 - Written - agent
+        """
+        return self._call_xyz(\
+            lambda pot,Fx,Fy,Fz,R,phi: numpy.cos(phi)*Fx+numpy.sin(phi)*Fy,
+            R,z,phi,t)
+
+    def _zforce(self,R,z,phi=0.,t=0.):
+        """
+        NAME:
+           _zforce
+        PURPOSE:
+           evaluate the vertical force for this potential
+        INPUT:
+           R - Galactocentric cylindrical radius
+           z - vertical height
+           phi - azimuth
+           t - time
+        OUTPUT:
+           the vertical force
+        HISTORY:
+           2026-10-19 - Written - agent
+        """
+        return self._call_xyz(lambda pot,Fx,Fy,Fz,R,phi: Fz,R,z,phi,t)
+
+    def _phiforce(self,R,z,phi=0.,t=0.):
+        """
+        NAME:
+           _phiforce
+        PURPOSE:
+           evaluate the azimuthal force for this potential
+        INPUT:
+           R - Galactocentric cylindrical radius
+           z - vertical height
+           phi - azimuth
+           t - time
+        OUTPUT:
+           the azimuthal force
+        HISTORY:
+           2026-10-19 - Written - agent
+        """
+        return self._call_xyz(\
+            lambda pot,Fx,Fy,Fz,R,phi: \
+                R*(-numpy.sin(phi)*Fx+numpy.cos(phi)*Fy),
+            R,z,phi,t)
+
+    def _dens(self,R,z,phi=0.,t=0.):
+        """
+        NAME:
+           _dens
+        PURPOSE:
+           evaluate the density for this potential
+        INPUT:
+           R - Galactocentric cylindrical radius
+           z - vertical height
+           phi - azimuth
+           t - time
+        OUTPUT:
+           the density
+        HISTORY:
+           2026-10-19 - Written - agent
+        """
+        if numpy.ndim(R) > 0 or numpy.ndim(z) > 0 \
+                or numpy.ndim(phi) > 0 or numpy.ndim(t) > 0:
+            R,z,phi,t= numpy.broadcast_arrays(R,z,phi,t)
+            out= numpy.empty(R.shape)
+            for ii in numpy.ndindex(R.shape):
+                out[ii]= self._dens(R[ii],z[ii],phi=phi[ii],t=t[ii])
+            return out
+        opos= _hermite_interp(self._times,self._pos,self._vel,t)
+        r= numpy.sqrt((opos[:,0]-R*numpy.cos(phi))**2.
+                      +(opos[:,1]-R*numpy.sin(phi))**2.
+                      +(opos[:,2]-z)**2.)
+        if self._profile == 0:
+            return numpy.sum(3.*self._masses*self._rs**2.
+                             /(r**2.+self._rs**2.)**2.5)/4./numpy.pi
+        else: # infinite at the center of an object, as for HernquistPotential
+            with numpy.errstate(divide='ignore'):
+                return numpy.sum(self._masses*self._rs/r/(r+self._rs)**3.)\
+                    /2./numpy.pi
+
+def _hermite_interp(times,pos,vel,t):
+    """Interpolate the positions of all objects to time(s) t using cubic Hermite splines, same as in the C implementation; positions are held fixed outside of the range of times"""
+    t= numpy.atleast_1d(t)
+    k= numpy.clip(numpy.searchsorted(times,t,side='right')-1,0,len(times)-2)
+    h= times[k+1]-times[k]
+    s= numpy.clip((t-times[k])/h,0.,1.)
+    h00= 2.*s**3.-3.*s**2.+1.
+    h10= (s**3.-2.*s**2.+s)*h
+    h01= -2.*s**3.+3.*s**2.
+    h11= (s**3.-s**2.)*h
+    out= h00[:,None]*pos[:,k]+h10[:,None]*vel[:,k]\
+        +h01[:,None]*pos[:,k+1]+h11[:,None]*vel[:,k+1]
+    if out.shape[1] == 1: return out[:,0]
+    else: return out
+
+def _build_spatial_index(times,pos,vel,cutoff,tbin,nbins):
+    """Build the time-binned spatial index: in each time bin, each object is assigned to the cell of a uniform grid that contains the center of the bounding box of its trajectory during the bin, with cells large enough that all objects within cutoff of a point are in the 27 cells around it"""
+    nobj= pos.shape[0]
+    ncellmax= max(1,int(numpy.ceil(nobj**(1./3.))))
+    grids= numpy.empty((nbins,7))
+    offsets= []
+    entries= numpy.empty((nbins,nobj),dtype='int')
+    for ii in range(nbins):
+        tlo= times[0]+ii*tbin
+        thi= min(times[0]+(ii+1)*tbin,times[-1])
+        # Sample the trajectories at the bin edges, the orbit times in the
+        # bin, and in between the orbit times to capture the Hermite
+        # interpolant's curvature
+        ts= times[(times > tlo)*(times < thi)]
+        ts= numpy.hstack((tlo,ts,thi))
+        ts= numpy.hstack((ts,0.5*(ts[1:]+ts[:-1]),0.75*ts[1:]+0.25*ts[:-1],
+                          0.25*ts[1:]+0.75*ts[:-1]))
+        tpos= _hermite_interp(times,pos,vel,ts)
+        bmin= numpy.amin(tpos,axis=1)
+        bmax= numpy.amax(tpos,axis=1)
+        centers= 0.5*(bmin+bmax)
+        halfext= numpy.amax(0.5*(bmax-bmin))
+        cmin= numpy.amin(centers,axis=0)
+        cmax= numpy.amax(centers,axis=0)
+        # Objects within cutoff of a point are at most cutoff+halfext away
+        # in each dimension from the point, pad by a tiny amount for
+        # round-off
+        cs= max((cutoff+halfext)*(1.+1e-10),
+                numpy.amax(cmax-cmin)/ncellmax)
+        ns= numpy.maximum(1,numpy.ceil((cmax-cmin)/cs).astype('int'))
+        cells= numpy.minimum(((centers-cmin)/cs).astype('int'),ns-1)
+        cellindx= (cells[:,0]*ns[1]+cells[:,1])*ns[2]+cells[:,2]
+        entries[ii]= numpy.argsort(cellindx,kind='stable')
+        offsets.append(numpy.hstack((0,numpy.cumsum(\
+                        numpy.bincount(cellindx,minlength=numpy.prod(ns))))))
+        grids[ii]= [cmin[0],cmin[1],cmin[2],cs,ns[0],ns[1],ns[2]]
+    return (grids,offsets,entries)
@@ -23,7 +23,8 @@ class PerfectEllipsoidPotential(EllipsoidalPotential):
     """
     def __init__(self,amp=1.,a=5.,b=1.,c=1.,
                  zvec=None,pa=None,glorder=50,
-                 normalize=False,ro=None,vo=None):
+                 normalize=False,ro=None,vo=None,
+                 tabulate=False,tabulate_rrange=None,tabulate_tol=1e-8):
         """
         NAME:
 
@@ -49,6 +50,12 @@ class PerfectEllipsoidPotential(EllipsoidalPotential):
 
            glorder= (50) if set, compute the relevant force and potential integrals with Gaussian quadrature of this order
 
+           tabulate= (False) if True, pre-compute the force integrals on an adaptive grid and interpolate the forces (see EllipsoidalPotential)
+
+           tabulate_rrange= (None) range in spherical radius covered by the table (can be Quantity); default: [10^-3,10^2] a
+
+           tabulate_tol= (1e-8) relative precision of the interpolated forces
+
            ro=, vo= distance and velocity scales for translation into internal units (default from configuration file)
 
         OUTPUT:
@@ -62,7 +69,10 @@ class PerfectEllipsoidPotential(EllipsoidalPotential):
         """
         EllipsoidalPotential.__init__(self,amp=amp,b=b,c=c,
                                       zvec=zvec,pa=pa,glorder=glorder,
-                                      ro=ro,vo=vo,amp_units='mass')
+                                      ro=ro,vo=vo,amp_units='mass',
+                                      tabulate=tabulate,
+                                      tabulate_rrange=tabulate_rrange,
+                                      tabulate_tol=tabulate_tol)
         if _APY_LOADED and isinstance(a,units.Quantity):
             a= a.to(units.kpc).value/self._ro
         self.a= a
@@ -70,6 +80,7 @@ class PerfectEllipsoidPotential(EllipsoidalPotential):
         self._scale= self.a
         # Adjust amp
         self._amp*= self.a/(numpy.pi**2*self._b*self._c)
+        self._setup_force_table()
         if normalize or \
                 (isinstance(normalize,(int,float)) \
                      and not isinstance(normalize,bool)): #pragma: no cover
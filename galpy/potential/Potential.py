@@ -16,13 +16,16 @@
 from __future__  import division, print_function
 
 import os, os.path
+import math
 import pickle
+import numbers
 from functools import wraps
 import warnings
 import numpy
-from scipy import optimize, integrate
+from scipy import optimize, integrate, interpolate
 from ..util import bovy_plot as plot
 from ..util import bovy_coords
+from ..util import serialize
 from ..util.bovy_conversion import velocity_in_kpcGyr, \
     physical_conversion, potential_physical_input, freq_in_Gyr, \
     get_physical
@@ -75,6 +78,7 @@ class Potential(Force):
         self.hasC= False
         self.hasC_dxdv= False
         self.hasC_dens= False
+        self._circ_cache= None
         return None
 
     @potential_physical_input
@@ -398,6 +402,8 @@ class Potential(Force):
         """
         if self.isNonAxi:
             raise NotImplementedError('mass for non-axisymmetric potentials is not currently supported')
+        if z is None and not forceint and self._use_circular_cache(t):
+            return self._circular_cached('mass',R)
         try:
             if forceint: raise AttributeError #Hack!
             return self._amp*self._mass(R,z=z,t=t)
@@ -603,6 +609,7 @@ class Potential(Force):
 
         """
         self._amp*= norm/numpy.fabs(self.Rforce(1.,0.,use_physical=False))
+        self._reset_circular_cache()
 
     @potential_physical_input
     @physical_conversion('force',pop=True)
@@ -962,6 +969,241 @@ class Potential(Force):
                              justcontours=justcontours,
                              aspect=aspect,log=log)
 
+    def turn_circular_cache_on(self,Rmin=0.001,Rmax=1000.,nR=2001):
+        """
+        NAME:
+
+           turn_circular_cache_on
+
+        PURPOSE:
+
+           turn on caching of the circular-orbit quantities vcirc, dvcircdR, omegac, epifreq, verticalfreq, vesc, and mass (for z=None) at t=0; each quantity is tabulated on a logarithmic grid in R the first time it is requested and subsequently obtained through cubic-spline interpolation (in log-log when possible), with exact evaluation outside of the tabulated range
+
+        INPUT:
+
+           Rmin= (0.001) minimum radius of the tables (can be Quantity)
+
+           Rmax= (1000.) maximum radius of the tables (can be Quantity)
+
+           nR= (2001) number of radii in the tables
+
+        OUTPUT:
+
+           (none)
+
+        HISTORY:
+
+           2026-10-19 - Written - agent
+
+        NOTE:
+
+           the tables are rebuilt automatically when the amplitude of the potential changes (e.g., through normalize or by multiplying the potential with a number); other parameters are not tracked, so call turn_circular_cache_on again after changing those (e.g., pot.a= ...)
+
+        """
+        if self.isNonAxi:
+            raise RuntimeError('Caching of circular-orbit quantities requires an axisymmetric potential')
+        if _APY_LOADED and isinstance(Rmin,units.Quantity):
+            Rmin= Rmin.to(units.kpc).value/self._ro
+        if _APY_LOADED and isinstance(Rmax,units.Quantity):
+            Rmax= Rmax.to(units.kpc).value/self._ro
+        self._circ_cache= {'lnR':numpy.linspace(numpy.log(Rmin),
+                                                numpy.log(Rmax),nR),
+                           'amp':self._amp,
+                           'tables':{}}
+        return None
+
+    def turn_circular_cache_off(self):
+        """
+        NAME:
+
+           turn_circular_cache_off
+
+        PURPOSE:
+
+           turn off caching of circular-orbit quantities and remove the tables
+
+        INPUT:
+
+           (none)
+
+        OUTPUT:
+
+           (none)
+
+        HISTORY:
+
+           2026-10-19 - Written - agent
+
+        """
+        self._circ_cache= None
+        return None
+
+    def _reset_circular_cache(self):
+        """Remove the cached circular-orbit tables, such that they are rebuilt when next used"""
+        cache= getattr(self,'_circ_cache',None)
+        if not cache is None:
+            cache['amp']= self._amp
+            cache['tables']= {}
+        return None
+
+    def turn_physical_off(self):
+        """
+        NAME:
+
+           turn_physical_off
+
+        PURPOSE:
+
+           turn off automatic returning of outputs in physical units
+
+        INPUT:
+
+           (none)
+
+        OUTPUT:
+
+           (none)
+
+        HISTORY:
+
+           2016-01-30 - Written - Bovy (UofT)
+
+           2026-10-19 - Reset the circular-orbit cache - agent
+
+        """
+        Force.turn_physical_off(self)
+        self._reset_circular_cache()
+        return None
+
+    def turn_physical_on(self,ro=None,vo=None):
+        """
+        NAME:
+
+           turn_physical_on
+
+        PURPOSE:
+
+           turn on automatic returning of outputs in physical units
+
+        INPUT:
+
+           ro= reference distance (kpc; can be Quantity)
+
+           vo= reference velocity (km/s; can be Quantity)
+
+        OUTPUT:
+
+           (none)
+
+        HISTORY:
+
+           2016-01-30 - Written - Bovy (UofT)
+
+           2020-04-22 - Don't turn on a parameter when it is False - Bovy (UofT)
+
+           2026-10-19 - Reset the circular-orbit cache - agent
+
+        """
+        Force.turn_physical_on(self,ro=ro,vo=vo)
+        self._reset_circular_cache()
+        return None
+
+    def _circular_exact(self,quant,R):
+        """Evaluate the quantity quant (one of the linear-in-potential quantities vc2, dvc2dR, kappa2, nu2, vesc2, or mass) exactly"""
+        if quant == 'mass':
+            cache= self._circ_cache
+            self._circ_cache= None
+            try:
+                return _vectorized_eval(lambda x: self.mass(x,
+                                                            use_physical=False),
+                                        R)
+            finally:
+                self._circ_cache= cache
+        elif quant == 'vesc2':
+            return 2.*(self(_INF,0.,use_physical=False)
+                       -_vectorized_eval(lambda x: self(x,0.,
+                                                        use_physical=False),R))
+        elif quant == 'nu2':
+            return _vectorized_eval(lambda x: self.z2deriv(x,0.,
+                                                           use_physical=False),
+                                    R)
+        Rforce= _vectorized_eval(lambda x: self.Rforce(x,0.,
+                                                       use_physical=False),R)
+        if quant == 'vc2':
+            return -R*Rforce
+        R2deriv= _vectorized_eval(lambda x: self.R2deriv(x,0.,
+                                                         use_physical=False),R)
+        if quant == 'dvc2dR':
+            return -Rforce+R*R2deriv
+        else: # kappa2
+            return R2deriv-3./R*Rforce
+
+    def _circular_cached(self,quant,R):
+        """Evaluate the quantity quant (see _circular_exact) using the cached tables, building the table if necessary"""
+        cache= self._circ_cache
+        if cache['amp'] != self._amp: # e.g., after multiplying by a number
+            self._reset_circular_cache()
+        if not quant in cache['tables']:
+            with warnings.catch_warnings():
+                warnings.simplefilter('ignore')
+                vals= self._circular_exact(quant,numpy.exp(cache['lnR']))
+            if not numpy.all(numpy.isfinite(vals)):
+                cache['tables'][quant]= None
+            else:
+                uselog= numpy.all(vals > 0.)
+                # Store the spline's polynomial coefficients, both as an
+                # array and as a list for fast scalar evaluation
+                coeffs= interpolate.CubicSpline(\
+                    cache['lnR'],numpy.log(vals) if uselog else vals).c
+                cache['tables'][quant]= (uselog,coeffs,coeffs.T.tolist())
+        table= cache['tables'][quant]
+        if quant == 'mass' and not hasattr(self,'_mass'):
+            warnings.warn("Vertical height z not specified for mass "
+                          "calculation...assuming spherical potential"
+                          " (for the mass of axisymmetric potentials"
+                          ", specify z)",galpyWarning)
+        if table is None:
+            return self._circular_exact(quant,R)
+        lnR0= cache['lnR'][0]
+        nR= len(cache['lnR'])
+        dlnR= (cache['lnR'][-1]-lnR0)/(nR-1)
+        if isinstance(R,numbers.Real):
+            x= (math.log(R)-lnR0)/dlnR if R > 0. else -1.
+            if x < 0. or x > nR-1:
+                with warnings.catch_warnings():
+                    warnings.simplefilter('ignore')
+                    return self._circular_exact(quant,R)
+            ii= min(int(x),nR-2)
+            dx= (x-ii)*dlnR
+            c0,c1,c2,c3= table[2][ii]
+            out= ((c0*dx+c1)*dx+c2)*dx+c3
+            return math.exp(out) if table[0] else out
+        scalarOut= numpy.ndim(R) == 0
+        R= numpy.atleast_1d(numpy.asarray(R,dtype=float))
+        with numpy.errstate(divide='ignore',invalid='ignore'):
+            x= (numpy.log(R)-lnR0)/dlnR
+        indx= (x >= 0.)*(x <= nR-1)
+        out= numpy.empty(R.shape)
+        ii= numpy.minimum(x[indx].astype(int),nR-2)
+        dx= (x[indx]-ii)*dlnR
+        c= table[1][:,ii]
+        out[indx]= ((c[0]*dx+c[1])*dx+c[2])*dx+c[3]
+        if table[0]: out[indx]= numpy.exp(out[indx])
+        if numpy.any(True^indx):
+            with warnings.catch_warnings():
+                warnings.simplefilter('ignore')
+                out[True^indx]= self._circular_exact(quant,R[True^indx])
+        if scalarOut: return out[0]
+        else: return out
+
+    def _use_circular_cache(self,t,phi=None):
+        """Whether to use the cached circular-orbit quantities"""
+        if getattr(self,'_circ_cache',None) is None or not phi is None:
+            return False
+        if isinstance(t,numbers.Number):
+            return t == 0.
+        return numpy.all(numpy.asarray(t) == 0.)
+
     @potential_physical_input
     @physical_conversion('velocity',pop=True)
     def vcirc(self,R,phi=None,t=0.):
@@ -994,6 +1236,8 @@ class Potential(Force):
        2016-06-15 - Added phi= keyword for non-axisymmetric potential - Bovy (UofT)
 
         """  
+        if self._use_circular_cache(t,phi=phi):
+            return numpy.sqrt(self._circular_cached('vc2',R))
         return numpy.sqrt(R*-self.Rforce(R,0.,phi=phi,t=t,use_physical=False))
 
     @potential_physical_input
@@ -1029,6 +1273,9 @@ class Potential(Force):
             2016-06-28 - Added phi= keyword for non-axisymmetric potential - Bovy (UofT)
 
         """
+        if self._use_circular_cache(t,phi=phi):
+            return 0.5*self._circular_cached('dvc2dR',R)\
+                /numpy.sqrt(self._circular_cached('vc2',R))
         return 0.5*(-self.Rforce(R,0.,phi=phi,t=t,use_physical=False)\
                          +R*self.R2deriv(R,0.,phi=phi,t=t,use_physical=False))\
                          /self.vcirc(R,phi=phi,t=t,use_physical=False)
@@ -1061,6 +1308,8 @@ class Potential(Force):
             2011-10-09 - Written - Bovy (IAS)
         
         """
+        if self._use_circular_cache(t):
+            return numpy.sqrt(self._circular_cached('vc2',R))/R
         return numpy.sqrt(-self.Rforce(R,0.,t=t,use_physical=False)/R)
 
     @potential_physical_input
@@ -1091,6 +1340,8 @@ class Potential(Force):
            2011-10-09 - Written - Bovy (IAS)
         
         """
+        if self._use_circular_cache(t):
+            return numpy.sqrt(self._circular_cached('kappa2',R))
         return numpy.sqrt(self.R2deriv(R,0.,t=t,use_physical=False)\
                            -3./R*self.Rforce(R,0.,t=t,use_physical=False))
 
@@ -1122,6 +1373,8 @@ class Potential(Force):
            2012-07-25 - Written - Bovy (IAS@MPIA)
         
         """
+        if self._use_circular_cache(t):
+            return numpy.sqrt(self._circular_cached('nu2',R))
         return numpy.sqrt(self.z2deriv(R,0.,t=t,use_physical=False))
 
     @physical_conversion('position',pop=True)
@@ -1138,21 +1391,23 @@ class Potential(Force):
         
         INPUT:
         
-           OmegaP - pattern speed (can be Quantity)
+           OmegaP - pattern speed (can be Quantity; can be an array, in which case the resonances are found simultaneously using vectorized root finding)
 
            m= order of the resonance (as in m(O-Op)=kappa (negative m for outer)
               use m='corotation' for corotation
-              +scipy.optimize.brentq xtol,rtol,maxiter kwargs
+              +scipy.optimize.brentq kwargs (for array OmegaP, only xtol, rtol, and maxiter are used and other brentq kwargs are ignored)
 
            t - time (optional; can be Quantity)
         
         OUTPUT:
         
-           radius of Linblad resonance, None if there is no resonance
+           radius of Linblad resonance, None if there is no resonance (for array OmegaP, an array with NaN where there is no resonance)
         
         HISTORY:
         
            2011-10-09 - Written - Bovy (IAS)
+
+           2026-10-19 - Allow array OmegaP - agent
         
         """
         if _APY_LOADED and isinstance(OmegaP,units.Quantity):
@@ -1187,6 +1442,8 @@ class Potential(Force):
             2011-10-09 - Written - Bovy (IAS)
 
         """
+        if self._use_circular_cache(t):
+            return numpy.sqrt(self._circular_cached('vesc2',R))
         return numpy.sqrt(2.*(self(_INF,0.,t=t,use_physical=False)\
                                -self(R,0.,t=t,use_physical=False)))
         
@@ -1204,7 +1461,7 @@ class Potential(Force):
         INPUT:
         
         
-            lz - Angular momentum (can be Quantity)
+            lz - Angular momentum (can be Quantity; can be an array, in which case the radii are found simultaneously using vectorized root finding)
 
             t - time (optional; can be Quantity)
         
@@ -1215,11 +1472,13 @@ class Potential(Force):
         HISTORY:
         
             2012-07-30 - Written - Bovy (IAS@MPIA)
+
+            2026-10-19 - Vectorized root finding for array input - agent
         
         NOTE:
         
             seems to take about ~0.5 ms for a Miyamoto-Nagai potential; 
-            ~0.75 ms for a MWPotential
+            ~0.75 ms for a MWPotential; array input is much faster per lz
         
         """
         if _APY_LOADED and isinstance(lz,units.Quantity):
@@ -1295,6 +1554,11 @@ class Potential(Force):
             sinl= numpy.sin(l/180.*numpy.pi)
         else:
             sinl= numpy.sin(l)
+        if numpy.ndim(sinl) > 0:
+            return sinl*(_vectorized_eval(\
+                    lambda x: self.omegac(x,t=t,use_physical=False),
+                    numpy.fabs(sinl))
+                         -self.omegac(1.,t=t,use_physical=False))
         return sinl*(self.omegac(numpy.fabs(sinl),t=t,use_physical=False)\
                          -self.omegac(1.,t=t,use_physical=False))
 
@@ -1485,7 +1749,7 @@ class Potential(Force):
 
         INPUT:
         
-            R - Galactocentric radius (can be Quantity)
+            R - Galactocentric radius (can be Quantity; can be an array, as can z, phi, t, and M, which are broadcast against each other)
             
             z - height (can be Quantity)
             
@@ -1497,20 +1761,16 @@ class Potential(Force):
             
         OUTPUT:
             
-            Tidal Radius
+            Tidal Radius (array if the inputs are arrays)
         
         HISTORY:
             
             2018-03-21 - Written - Webb (UofT)
+
+            2026-10-19 - Vectorized - agent
             
         """
-        if M is None:
-            #Make sure an object mass is given
-            raise PotentialError("Mass parameter M= needs to be set to compute tidal radius")
-        r= numpy.sqrt(R**2.+z**2.)
-        omegac2= -self.rforce(R,z,phi=phi,t=t,use_physical=False)/r
-        d2phidr2= self.r2deriv(R,z,phi=phi,t=t,use_physical=False)
-        return (M/(omegac2-d2phidr2))**(1./3.)
+        return _rtide(self,R,z,phi=phi,t=t,M=M)
 
     @potential_physical_input
     @physical_conversion('forcederivative',pop=True)
@@ -1527,7 +1787,7 @@ class Potential(Force):
             
         INPUT:
         
-            R - Galactocentric radius (can be Quantity)
+            R - Galactocentric radius (can be Quantity; can be an array, as can z, phi, and t, which are broadcast against each other)
             
             z - height (can be Quantity)
             
@@ -1539,50 +1799,16 @@ class Potential(Force):
             
         OUTPUT:
         
-            Tidal Tensor
+            Tidal Tensor [3,3] or its eigenvalues [3]; for array inputs [*input_shape,3,3] or [*input_shape,3]
         
         HISTORY:
         
             2018-03-21 - Written - Webb (UofT)
 
+            2026-10-19 - Vectorized - agent
+
         """
-        if self.isNonAxi:
-            raise PotentialError("Tidal tensor calculation is currently only implemented for axisymmetric potentials")
-        #Evaluate forces, angles and derivatives
-        Rderiv= -self.Rforce(R,z,phi=phi,t=t,use_physical=False)       
-        phideriv= -self.phiforce(R,z,phi=phi,t=t,use_physical=False)
-        R2deriv= self.R2deriv(R,z,phi=phi,t=t,use_physical=False)
-        z2deriv= self.z2deriv(R,z,phi=phi,t=t,use_physical=False)
-        phi2deriv= self.phi2deriv(R,z,phi=phi,t=t,use_physical=False)
-        Rzderiv= self.Rzderiv(R,z,phi=phi,t=t,use_physical=False)
-        Rphideriv= self.Rphideriv(R,z,phi=phi,t=t,use_physical=False)
-        #Temporarily set zphideriv to zero until zphideriv is added to Class
-        zphideriv=0.0
-        cosphi=numpy.cos(phi)
-        sinphi=numpy.sin(phi)
-        cos2phi=cosphi**2.0
-        sin2phi=sinphi**2.0
-        R2=R**2.0
-        R3=R**3.0
-        # Tidal tensor
-        txx= R2deriv*cos2phi-Rphideriv*2.*cosphi*sinphi/R+Rderiv*sin2phi/R\
-            +phi2deriv*sin2phi/R2+phideriv*2.*cosphi*sinphi/R2
-        tyx= R2deriv*sinphi*cosphi+Rphideriv*(cos2phi-sin2phi)/R\
-            -Rderiv*sinphi*cosphi/R-phi2deriv*sinphi*cosphi/R2\
-            +phideriv*(sin2phi-cos2phi)/R2      
-        tzx=Rzderiv*cosphi-zphideriv*sinphi/R
-        tyy=R2deriv*sin2phi+Rphideriv*2.*cosphi*sinphi/R+Rderiv*cos2phi/R\
-            +phi2deriv*cos2phi/R2-phideriv*2.*sinphi*cosphi/R2
-        txy=tyx
-        tzy=Rzderiv*sinphi+zphideriv*cosphi/R
-        txz=tzx
-        tyz=tzy
-        tzz=z2deriv
-        tij=-numpy.array([[txx,txy,txz],[tyx,tyy,tyz],[tzx,tzy,tzz]])
-        if eigenval:
-           return numpy.linalg.eigvals(tij)
-        else:
-            return tij
+        return _ttensor(self,R,z,phi=phi,t=t,eigenval=eigenval)
 
 class PotentialError(Exception): #pragma: no cover
     def __init__(self, value):
@@ -2554,6 +2780,8 @@ def epifreq(Pot,R,t=0.):
     from .planarPotential import planarPotential
     if isinstance(Pot,(Potential,planarPotential)):
         return Pot.epifreq(R,t=t,use_physical=False)
+    if _use_circular_cache(Pot,t):
+        return numpy.sqrt(_circular_cached(Pot,'kappa2',R))
     from ..potential import evaluateplanarRforces, evaluateplanarR2derivs
     from ..potential import PotentialError
     try:
@@ -2598,6 +2826,8 @@ def verticalfreq(Pot,R,t=0.):
     from .planarPotential import planarPotential
     if isinstance(Pot,(Potential,planarPotential)):
         return Pot.verticalfreq(R,t=t,use_physical=False)
+    if _use_circular_cache(Pot,t):
+        return numpy.sqrt(_circular_cached(Pot,'nu2',R))
     return numpy.sqrt(evaluatez2derivs(Pot,R,0.,t=t,use_physical=False))
 
 @potential_physical_input
@@ -2674,6 +2904,10 @@ def vterm(Pot,l,t=0.,deg=True):
         sinl= numpy.sin(l/180.*numpy.pi)
     else:
         sinl= numpy.sin(l)
+    if numpy.ndim(sinl) > 0:
+        return sinl*(_vectorized_eval(\
+                lambda x: omegac(Pot,x,t=t,use_physical=False),sinl)
+                     -omegac(Pot,1.,t=t,use_physical=False))
     return sinl*(omegac(Pot,sinl,t=t,use_physical=False)
                  -omegac(Pot,1.,t=t,use_physical=False))
 
@@ -2692,7 +2926,7 @@ def rl(Pot,lz,t=0.):
 
        Pot - Potential instance or list thereof
 
-       lz - Angular momentum (can be Quantity)
+       lz - Angular momentum (can be Quantity; can be an array, in which case the radii are found simultaneously using vectorized root finding)
 
        t - time (optional; can be Quantity)
 
@@ -2704,10 +2938,12 @@ def rl(Pot,lz,t=0.):
 
        2012-07-30 - Written - Bovy (IAS@MPIA)
 
+       2026-10-19 - Vectorized root finding for array input - agent
+
     NOTE:
 
        seems to take about ~0.5 ms for a Miyamoto-Nagai potential; 
-       ~0.75 ms for a MWPotential
+       ~0.75 ms for a MWPotential; array input is much faster per lz
 
     """
     Pot= flatten(Pot)
@@ -2716,39 +2952,87 @@ def rl(Pot,lz,t=0.):
             lz= lz.to(units.km/units.s*units.kpc).value/Pot._vo/Pot._ro
         elif hasattr(Pot[0],'_ro'):
             lz= lz.to(units.km/units.s*units.kpc).value/Pot[0]._vo/Pot[0]._ro
-    #Find interval
-    rstart= _rlFindStart(numpy.fabs(lz),#assumes vo=1.
-                         numpy.fabs(lz),
-                         Pot, t=t)
+    if numpy.ndim(lz) == 0:
+        return float(_rl_array(Pot,numpy.atleast_1d(numpy.fabs(lz)),t=t)[0])
+    lz= numpy.fabs(numpy.asarray(lz,dtype=float))
+    return _rl_array(Pot,lz.flatten(),t=t).reshape(lz.shape)
+
+def _rl_array(Pot,lz,t=0.):
+    """Solve r vc(r) = lz for an array of lz simultaneously"""
+    out= numpy.full(lz.shape,numpy.nan)
+    out[lz == 0.]= 0.
+    indx= numpy.isfinite(lz)*(lz > 0.)
+    if numpy.sum(indx) == 0: return out
+    tlz= lz[indx]
+    func= lambda r,ii: _vectorized_eval(\
+        lambda x: vcirc(Pot,x,t=t,use_physical=False),r)*r-tlz[ii]
+    #Find the interval: double the upper end (assumes vo=1.) and halve the
+    #lower end until they bracket the root
+    rhi= 2.*tlz
+    fhi= func(rhi,Ellipsis)
+    neg= fhi < 0.
+    while numpy.any(neg):
+        rhi[neg]*= 2.
+        fhi[neg]= func(rhi[neg],neg)
+        neg[neg]= fhi[neg] < 0.
+    rlo= numpy.full_like(tlz,10.**-5.)
+    flo= func(rlo,Ellipsis)
+    pos= flo > 0.
+    while numpy.any(pos): #Probably lz small
+        rlo[pos]/= 2.
+        flo[pos]= func(rlo[pos],pos)
+        pos[pos]= flo[pos] > 0.
+    out[indx]= _illinois(func,rlo,rhi,flo,fhi,maxiter=200)
+    return out
+
+def _vectorized_eval(func,R):
+    """Evaluate func on an array R, looping for potentials that do not accept array input"""
     try:
-        return optimize.brentq(_rlfunc,10.**-5.,rstart,
-                               args=(numpy.fabs(lz),
-                                     Pot,
-                                     t),
-                               maxiter=200,disp=False)
-    except ValueError: #Probably lz small and starting lz to great
-        rlower= _rlFindStart(10.**-5.,
-                             numpy.fabs(lz),
-                             Pot,t=t,lower=True)
-        return optimize.brentq(_rlfunc,rlower,rstart,
-                               args=(numpy.fabs(lz),
-                                     Pot,t))
-        
-
-def _rlfunc(rl,lz,pot,t=0.):
-    """Function that gives rvc-lz"""
-    thisvcirc= vcirc(pot,rl,t=t,use_physical=False)
-    return rl*thisvcirc-lz
-
-def _rlFindStart(rl,lz,pot,t=0.,lower=False):
-    """find a starting interval for rl"""
-    rtry= 2.*rl
-    while (2.*lower-1.)*_rlfunc(rtry,lz,pot,t=t) > 0.:
-        if lower:
-            rtry/= 2.
-        else:
-            rtry*= 2.
-    return rtry
+        return numpy.asarray(func(R),dtype=float)*numpy.ones_like(R)
+    except (TypeError,ValueError):
+        return numpy.array([func(r) for r in R])
+
+def _illinois(func,a,b,fa=None,fb=None,xtol=2e-12,
+              rtol=4.*numpy.finfo(float).eps,maxiter=100):
+    """Vectorized bracketed root finding using the Illinois variant of the regula-falsi method; func(x,indx) evaluates the function for the elements indx (a boolean array) of the brackets [a,b], which need to satisfy fa*fb <= 0 (fa and fb are computed if not given)"""
+    a= numpy.array(a,dtype=float)
+    b= numpy.array(b,dtype=float)
+    if fa is None: fa= func(a,numpy.ones(a.shape,dtype=bool))
+    if fb is None: fb= func(b,numpy.ones(b.shape,dtype=bool))
+    fa= numpy.array(fa,dtype=float)
+    fb= numpy.array(fb,dtype=float)
+    out= numpy.where(fa == 0.,a,b)
+    side= numpy.zeros(a.shape,dtype=int)
+    active= (fa != 0.)*(fb != 0.)
+    for ii in range(maxiter):
+        if not numpy.any(active): break
+        c= (a[active]*fb[active]-b[active]*fa[active])\
+            /(fb[active]-fa[active])
+        # Fall back onto bisection if regula falsi leaves the bracket
+        bad= True^((c > numpy.fmin(a[active],b[active]))
+                   *(c < numpy.fmax(a[active],b[active])))
+        c[bad]= 0.5*(a[active][bad]+b[active][bad])
+        fc= func(c,active)
+        out[active]= c
+        # Replace the endpoint with the same sign as f(c), halving the
+        # retained endpoint's function value if it was retained before
+        sameb= fc*fb[active] > 0.
+        samea= fc*fa[active] > 0.
+        aindx= numpy.arange(len(a))[active]
+        bi= aindx[sameb]
+        b[bi]= c[sameb]
+        fb[bi]= fc[sameb]
+        fa[bi[side[bi] == -1]]/= 2.
+        side[bi]= -1
+        ai= aindx[samea]
+        a[ai]= c[samea]
+        fa[ai]= fc[samea]
+        fb[ai[side[ai] == 1]]/= 2.
+        side[ai]= 1
+        done= (fc == 0.)\
+            +(numpy.fabs(b[aindx]-a[aindx]) < xtol+rtol*numpy.fabs(c))
+        active[aindx[done]]= False
+    return out
 
 @physical_conversion('position',pop=True)
 def lindbladR(Pot,OmegaP,m=2,t=0.,**kwargs):
@@ -2765,22 +3049,24 @@ def lindbladR(Pot,OmegaP,m=2,t=0.,**kwargs):
 
        Pot - Potential instance or list of such instances
 
-       OmegaP - pattern speed (can be Quantity)
+       OmegaP - pattern speed (can be Quantity; can be an array, in which case the resonances are found simultaneously using vectorized root finding)
 
        m= order of the resonance (as in m(O-Op)=kappa (negative m for outer)
           use m='corotation' for corotation
-       +scipy.optimize.brentq xtol,rtol,maxiter kwargs
+       +scipy.optimize.brentq xtol,rtol,maxiter kwargs (also used for array OmegaP)
 
        t - time (optional; can be Quantity)
 
     OUTPUT:
 
-       radius of Linblad resonance, None if there is no resonance
+       radius of Linblad resonance, None if there is no resonance (for array OmegaP, an array with NaN where there is no resonance)
 
     HISTORY:
 
        2011-10-09 - Written - Bovy (IAS)
 
+       2026-10-19 - Allow array OmegaP - agent
+
     """
     Pot= flatten(Pot)
     if _APY_LOADED and isinstance(OmegaP,units.Quantity):
@@ -2796,6 +3082,9 @@ def lindbladR(Pot,OmegaP,m=2,t=0.,**kwargs):
             raise IOError("'m' input not recognized, should be an integer or 'corotation'")
     else:
         corotation= False
+    if numpy.ndim(OmegaP) > 0:
+        return _lindbladR_array(Pot,numpy.asarray(OmegaP,dtype=float),
+                                m,corotation,t=t,**kwargs)
     if corotation:
         try:
             out= optimize.brentq(_corotationR_eq,0.0000001,1000.,
@@ -2815,6 +3104,34 @@ def lindbladR(Pot,OmegaP,m=2,t=0.,**kwargs):
             raise
         return out
 
+def _lindbladR_array(Pot,OmegaP,m,corotation,t=0.,**kwargs):
+    """Find the Lindblad resonances for an array of pattern speeds simultaneously, NaN where there is no resonance"""
+    # _illinois only supports a subset of the brentq kwargs
+    kwargs= dict((key,kwargs[key]) for key in ['xtol','rtol','maxiter']
+                 if key in kwargs)
+    tOmegaP= OmegaP.flatten()
+    if corotation:
+        func= lambda R,ii: _vectorized_eval(\
+            lambda x: omegac(Pot,x,t=t,use_physical=False),R)-tOmegaP[ii]
+    else:
+        func= lambda R,ii: m*(_vectorized_eval(\
+                lambda x: omegac(Pot,x,t=t,use_physical=False),R)
+                              -tOmegaP[ii])\
+            -_vectorized_eval(lambda x: epifreq(Pot,x,t=t,use_physical=False),
+                              R)
+    out= numpy.full(tOmegaP.shape,numpy.nan)
+    rlo= numpy.full_like(tOmegaP,0.0000001)
+    rhi= numpy.full_like(tOmegaP,1000.)
+    flo= func(rlo,Ellipsis)
+    fhi= func(rhi,Ellipsis)
+    indx= flo*fhi <= 0.
+    if numpy.any(indx):
+        iindx= numpy.arange(len(tOmegaP))[indx]
+        out[indx]= _illinois(lambda R,ii: func(R,iindx[ii]),
+                             rlo[indx],rhi[indx],flo[indx],fhi[indx],
+                             **kwargs)
+    return out.reshape(OmegaP.shape)
+
 def _corotationR_eq(R,Pot,OmegaP,t=0.):
     return omegac(Pot,R,t=t,use_physical=False)-OmegaP
 def _lindbladR_eq(R,Pot,OmegaP,m,t=0.):
@@ -2851,6 +3168,8 @@ def omegac(Pot,R,t=0.):
        2011-10-09 - Written - Bovy (IAS)
 
     """
+    if _use_circular_cache(Pot,t):
+        return numpy.sqrt(_circular_cached(Pot,'vc2',R))/R
     from ..potential import evaluateplanarRforces
     try:
         return numpy.sqrt(-evaluateplanarRforces(Pot,R,t=t,use_physical=False)/R)
@@ -2979,6 +3298,60 @@ def to_amuse(Pot,t=0.,tgalpy=0.,reverse=False,ro=None,vo=None): # pragma: no cov
         if vo is None: vo= physical_dict.get('vo')
     return amuse.galpy_profile(Pot,t=t,tgalpy=tgalpy,ro=ro,vo=vo)
 
+def to_bytes(Pot):
+    """
+    NAME:
+    
+       to_bytes
+
+    PURPOSE:
+
+       serialize a potential or (nested) list of potentials to a compact byte string, e.g., to send it to other processes; parameters and tables are stored as raw numeric buffers, functions by name or by their compiled code (load with from_bytes; only works with the same Python and galpy versions)
+
+    INPUT:
+
+       Pot - Potential, planarPotential, or linearPotential instance or (nested) list of such instances
+
+    OUTPUT:
+
+       bytes (raises TypeError if the potential holds objects other than galpy objects, their parameters, and numpy and scipy objects)
+
+    HISTORY:
+
+       2026-10-19 - Written - agent
+
+    """
+    return serialize.dumps(Pot)
+
+def from_bytes(data):
+    """
+    NAME:
+    
+       from_bytes
+
+    PURPOSE:
+
+       load a potential or list of potentials serialized with to_bytes
+
+    INPUT:
+
+       data - bytes returned by to_bytes
+
+    OUTPUT:
+
+       Potential instance or list of such instances
+
+    HISTORY:
+
+       2026-10-19 - Written - agent
+
+    NOTE:
+
+       loading the byte string runs the compiled code and unpickles the objects that it contains, so never use from_bytes on data from an untrusted source (like pickle.loads)
+
+    """
+    return serialize.loads(data)
+
 def turn_physical_off(Pot):
     """
     NAME:
@@ -3041,6 +3414,88 @@ def turn_physical_on(Pot,ro=None,vo=None):
         Pot.turn_physical_on(ro=ro,vo=vo)
     return None
 
+def turn_circular_cache_on(Pot,Rmin=0.001,Rmax=1000.,nR=2001):
+    """
+    NAME:
+
+       turn_circular_cache_on
+
+    PURPOSE:
+
+       turn on caching of the circular-orbit quantities vcirc, dvcircdR, omegac, epifreq, verticalfreq, vesc, and mass (for z=None) at t=0 using spline tables that are built when first used
+
+    INPUT:
+
+       Pot - Potential instance or list thereof
+
+       Rmin= (0.001) minimum radius of the tables (can be Quantity)
+
+       Rmax= (1000.) maximum radius of the tables (can be Quantity)
+
+       nR= (2001) number of radii in the tables
+
+    OUTPUT:
+
+        (none)
+
+    HISTORY:
+
+        2026-10-19 - Written - agent
+
+    """
+    if isinstance(Pot,list):
+        for pot in Pot:
+            turn_circular_cache_on(pot,Rmin=Rmin,Rmax=Rmax,nR=nR)
+    else:
+        Pot.turn_circular_cache_on(Rmin=Rmin,Rmax=Rmax,nR=nR)
+    return None
+
+def turn_circular_cache_off(Pot):
+    """
+    NAME:
+
+       turn_circular_cache_off
+
+    PURPOSE:
+
+       turn off caching of circular-orbit quantities and remove the tables
+
+    INPUT:
+
+       Pot - Potential instance or list thereof
+
+    OUTPUT:
+
+        (none)
+
+    HISTORY:
+
+        2026-10-19 - Written - agent
+
+    """
+    if isinstance(Pot,list):
+        for pot in Pot:
+            turn_circular_cache_off(pot)
+    else:
+        Pot.turn_circular_cache_off()
+    return None
+
+def _use_circular_cache(Pot,t,phi=None):
+    """Whether all potentials in Pot have cached circular-orbit quantities that can be used"""
+    Pot= flatten(Pot)
+    if not isinstance(Pot,list): Pot= [Pot]
+    return numpy.all([isinstance(p,Potential) \
+                          and p._use_circular_cache(t,phi=phi) for p in Pot])
+
+def _circular_cached(Pot,quant,R):
+    """Sum the cached quantity quant (linear in the potential) over Pot"""
+    Pot= flatten(Pot)
+    if not isinstance(Pot,list): Pot= [Pot]
+    out= Pot[0]._circular_cached(quant,R)
+    for p in Pot[1:]:
+        out= out+p._circular_cached(quant,R)
+    return out
+
 def _flatten_list(L):
     for item in L:
         try:
@@ -3210,7 +3665,7 @@ def rtide(Pot,R,z,phi=0.,t=0.,M=None):
         
         Pot - Potential instance or list of such instances
 
-        R - Galactocentric radius (can be Quantity)
+        R - Galactocentric radius (can be Quantity; can be an array, as can z, phi, t, and M, which are broadcast against each other)
             
         z - height (can be Quantity)
             
@@ -3222,21 +3677,16 @@ def rtide(Pot,R,z,phi=0.,t=0.,M=None):
             
     OUTPUT:
         
-        Tidal Radius
+        Tidal Radius (array if the inputs are arrays)
         
     HISTORY:
         
         2018-03-21 - Written - Webb (UofT)
+
+        2026-10-19 - Vectorized - agent
             
     """
-    Pot= flatten(Pot)
-    if M is None:
-        #Make sure an object mass is given
-        raise PotentialError("Mass parameter M= needs to be set to compute tidal radius")
-    r= numpy.sqrt(R**2.+z**2.)
-    omegac2=-evaluaterforces(Pot,R,z,phi=phi,t=t,use_physical=False)/r
-    d2phidr2= evaluater2derivs(Pot,R,z,phi=phi,t=t,use_physical=False)
-    return (M/(omegac2-d2phidr2))**(1./3.)
+    return _rtide(flatten(Pot),R,z,phi=phi,t=t,M=M)
 
 @potential_physical_input
 @physical_conversion('forcederivative',pop=True)
@@ -3255,7 +3705,7 @@ def ttensor(Pot,R,z,phi=0.,t=0.,eigenval=False):
         
         Pot - Potential instance or list of such instances
 
-        R - Galactocentric radius (can be Quantity)
+        R - Galactocentric radius (can be Quantity; can be an array, as can z, phi, and t, which are broadcast against each other)
             
         z - height (can be Quantity)
             
@@ -3267,23 +3717,40 @@ def ttensor(Pot,R,z,phi=0.,t=0.,eigenval=False):
             
     OUTPUT:
         
-        Tidal Tensor
+        Tidal Tensor [3,3] or its eigenvalues [3]; for array inputs [*input_shape,3,3] or [*input_shape,3]
         
     HISTORY:
         
         2018-03-21 - Written - Webb (UofT)
+
+        2026-10-19 - Vectorized - agent
     """
-    Pot= flatten(Pot)
+    return _ttensor(flatten(Pot),R,z,phi=phi,t=t,eigenval=eigenval)
+
+def _rtide(Pot,R,z,phi=0.,t=0.,M=None):
+    """Tidal radius for scalar or array inputs"""
+    if M is None:
+        #Make sure an object mass is given
+        raise PotentialError("Mass parameter M= needs to be set to compute tidal radius")
+    R,z,phi,t= _broadcast_inputs(R,z,phi,t)
+    r= numpy.sqrt(R**2.+z**2.)
+    omegac2= -_broadcast_eval(evaluaterforces,Pot,R,z,phi,t)/r
+    d2phidr2= _broadcast_eval(evaluater2derivs,Pot,R,z,phi,t)
+    return ((M/(omegac2-d2phidr2))**(1./3.))[()]
+
+def _ttensor(Pot,R,z,phi=0.,t=0.,eigenval=False):
+    """Tidal tensor (and its eigenvalues) for scalar or array inputs, evaluating all derivatives for all positions at once"""
     if _isNonAxi(Pot):
         raise PotentialError("Tidal tensor calculation is currently only implemented for axisymmetric potentials")
+    R,z,phi,t= _broadcast_inputs(R,z,phi,t)
     #Evaluate forces, angles and derivatives
-    Rderiv= -evaluateRforces(Pot,R,z,phi=phi,t=t,use_physical=False)
-    phideriv= -evaluatephiforces(Pot,R,z,phi=phi,t=t,use_physical=False)
-    R2deriv= evaluateR2derivs(Pot,R,z,phi=phi,t=t,use_physical=False)
-    z2deriv= evaluatez2derivs(Pot,R,z,phi=phi,t=t,use_physical=False)
-    phi2deriv= evaluatephi2derivs(Pot,R,z,phi=phi,t=t,use_physical=False)
-    Rzderiv= evaluateRzderivs(Pot,R,z,phi=phi,t=t,use_physical=False)
-    Rphideriv= evaluateRphiderivs(Pot,R,z,phi=phi,t=t,use_physical=False)
+    Rderiv= -_broadcast_eval(evaluateRforces,Pot,R,z,phi,t)
+    phideriv= -_broadcast_eval(evaluatephiforces,Pot,R,z,phi,t)
+    R2deriv= _broadcast_eval(evaluateR2derivs,Pot,R,z,phi,t)
+    z2deriv= _broadcast_eval(evaluatez2derivs,Pot,R,z,phi,t)
+    phi2deriv= _broadcast_eval(evaluatephi2derivs,Pot,R,z,phi,t)
+    Rzderiv= _broadcast_eval(evaluateRzderivs,Pot,R,z,phi,t)
+    Rphideriv= _broadcast_eval(evaluateRphiderivs,Pot,R,z,phi,t)
     #Temporarily set zphideriv to zero until zphideriv is added to Class
     zphideriv=0.0
     cosphi=numpy.cos(phi)
@@ -3291,7 +3758,6 @@ def ttensor(Pot,R,z,phi=0.,t=0.,eigenval=False):
     cos2phi=cosphi**2.0
     sin2phi=sinphi**2.0
     R2=R**2.0
-    R3=R**3.0
     # Tidal tensor
     txx= R2deriv*cos2phi-Rphideriv*2.*cosphi*sinphi/R+Rderiv*sin2phi/R\
         +phi2deriv*sin2phi/R2+phideriv*2.*cosphi*sinphi/R2
@@ -3305,8 +3771,30 @@ def ttensor(Pot,R,z,phi=0.,t=0.,eigenval=False):
     txz= tzx
     tyz= tzy
     tzz=z2deriv
-    tij= -numpy.array([[txx,txy,txz],[tyx,tyy,tyz],[tzx,tzy,tzz]])
+    # Put the tensor indices last, such that the eigenvalues of all tensors
+    # are computed at once
+    tij= numpy.moveaxis(-numpy.array([[txx,txy,txz],[tyx,tyy,tyz],
+                                       [tzx,tzy,tzz]]),(0,1),(-2,-1))
     if eigenval:
        return numpy.linalg.eigvals(tij)
     else:
        return tij
+
+def _broadcast_inputs(R,z,phi,t):
+    """Broadcast the inputs against each other (scalars remain 0D arrays)"""
+    return [numpy.array(x,dtype=float)
+            for x in numpy.broadcast_arrays(R,z,phi,t)]
+
+def _broadcast_eval(func,Pot,R,z,phi,t):
+    """Evaluate func(Pot,R,z,phi=phi,t=t) for broadcast arrays, looping for potentials that do not accept array input"""
+    if R.ndim == 0:
+        return numpy.array(func(Pot,float(R),float(z),phi=float(phi),
+                                t=float(t),use_physical=False),dtype=float)
+    try:
+        return numpy.asarray(func(Pot,R,z,phi=phi,t=t,use_physical=False),
+                             dtype=float)*numpy.ones(R.shape)
+    except (TypeError,ValueError):
+        return numpy.array([func(Pot,RR,zz,phi=pp,t=tt,use_physical=False)
+                            for RR,zz,pp,tt in zip(R.flatten(),z.flatten(),
+                                                   phi.flatten(),t.flatten())],
+                           dtype=float).reshape(R.shape)
@@ -4,13 +4,16 @@
 #
 #                                      rho(R,z) = rho_0 e^-R/h_R delta(z)
 ###############################################################################
+import warnings
 import numpy
 from scipy import special
+from ..util import galpyWarning
 from .Potential import Potential, _APY_LOADED
 if _APY_LOADED:
     from astropy import units
 _TOL= 1.4899999999999999e-15
 _MAXITER= 20
+_KZMAX= 40. # Hankel transforms are truncated when exp(-k|z|) < exp(-_KZMAX)
 class RazorThinExponentialDiskPotential(Potential):
     """Class that implements the razor-thin exponential disk potential
 
@@ -22,7 +25,7 @@ class RazorThinExponentialDiskPotential(Potential):
     def __init__(self,amp=1.,hr=1./3.,
                  maxiter=_MAXITER,tol=0.001,normalize=False,
                  ro=None,vo=None,
-                 new=True,glorder=100):
+                 new=True,glorder=None,hankelorder=10,nzeros=100):
         """
         NAME:
 
@@ -42,6 +45,12 @@ class RazorThinExponentialDiskPotential(Potential):
 
            maxiter - scipy.integrate keyword
 
+           glorder= deprecated and ignored: used to set the order of the Gauss-Legendre quadrature of the integral over a K0 kernel that was used to compute the potential and forces off the plane, which is now computed as a Hankel transform (see hankelorder=)
+
+           hankelorder= (10) order of the Gauss-Legendre quadrature used in each interval between zeros of the Bessel functions in the Hankel transforms that give the potential and forces off the plane
+
+           nzeros= (100) number of zeros of the Bessel functions to integrate the Hankel transforms up to
+
            normalize - if True, normalize such that vc(1.,0.)=1., or, if given as a number, such that the force is this fraction of the force necessary to make vc(1.,0.)=1.
 
            ro=, vo= distance and velocity scales for translation into internal units (default from configuration file)
@@ -54,18 +63,33 @@ class RazorThinExponentialDiskPotential(Potential):
 
            2012-12-27 - Written - Bovy (IAS)
 
+           2026-10-19 - Compute the potential and forces off the plane as Hankel transforms, such that they can be computed in the same way in C - agent
+
+           2026-10-19 - Deprecated glorder= in favor of hankelorder= - agent
+
         """
         Potential.__init__(self,amp=amp,ro=ro,vo=vo,amp_units='surfacedensity')
         if _APY_LOADED and isinstance(hr,units.Quantity):
             hr= hr.to(units.kpc).value/self._ro
         self._new= new
-        self._glorder= glorder
+        if not glorder is None:
+            warnings.warn("glorder= keyword of RazorThinExponentialDiskPotential is deprecated and ignored, because the potential and forces off the plane are now computed as Hankel transforms; use hankelorder= to set the order of the quadrature in each interval between zeros of the Bessel functions",galpyWarning)
+        self._hankelorder= hankelorder
         self._hr= hr
         self._scale= self._hr
         self._alpha= 1./self._hr
         self._maxiter= maxiter
         self._tol= tol
-        self._glx, self._glw= numpy.polynomial.legendre.leggauss(self._glorder)
+        self._glx, self._glw= numpy.polynomial.legendre.leggauss(self._hankelorder)
+        self._nzeros= nzeros
+        self._kzmax= _KZMAX
+        # Zeros of J0 and J1, starting at zero
+        self._j0zeros= numpy.zeros(self._nzeros+1)
+        self._j0zeros[1:]= special.jn_zeros(0,self._nzeros)
+        self._j1zeros= numpy.zeros(self._nzeros+1)
+        self._j1zeros[1:]= special.jn_zeros(1,self._nzeros)
+        self.hasC= True
+        self.hasC_dxdv= True
         if normalize or \
                 (isinstance(normalize,(int,float)) \
                      and not isinstance(normalize,bool)): #pragma: no cover
@@ -94,13 +118,9 @@ class RazorThinExponentialDiskPotential(Potential):
             if numpy.fabs(z) < 10.**-6.:
                 y= 0.5*self._alpha*R
                 return -numpy.pi*R*(special.i0(y)*special.k1(y)-special.i1(y)*special.k0(y))
-            kalphamax= 10.
-            ks= kalphamax*0.5*(self._glx+1.)
-            weights= kalphamax*self._glw
-            sqrtp= numpy.sqrt(z**2.+(ks+R)**2.)
-            sqrtm= numpy.sqrt(z**2.+(ks-R)**2.)
-            evalInt= numpy.arcsin(2.*ks/(sqrtp+sqrtm))*ks*special.k0(self._alpha*ks)
-            return -2.*self._alpha*numpy.sum(weights*evalInt)
+            return -2.*numpy.pi*self._alpha\
+                *_hankel_transform(R,z,self._alpha,0,self._j0zeros,
+                                   self._glx,self._glw,self._kzmax)
         raise NotImplementedError("Not new=True not implemented for RazorThinExponentialDiskPotential")
 
     def _Rforce(self,R,z,phi=0.,t=0.):
@@ -124,23 +144,9 @@ class RazorThinExponentialDiskPotential(Potential):
             if numpy.fabs(z) < 10.**-6.:
                 y= 0.5*self._alpha*R
                 return -2.*numpy.pi*y*(special.i0(y)*special.k0(y)-special.i1(y)*special.k1(y))
-            kalphamax1= R
-            ks1= kalphamax1*0.5*(self._glx+1.)
-            weights1= kalphamax1*self._glw
-            sqrtp= numpy.sqrt(z**2.+(ks1+R)**2.)
-            sqrtm= numpy.sqrt(z**2.+(ks1-R)**2.)
-            evalInt1= ks1**2.*special.k0(ks1*self._alpha)*((ks1+R)/sqrtp-(ks1-R)/sqrtm)/numpy.sqrt(R**2.+z**2.-ks1**2.+sqrtp*sqrtm)/(sqrtp+sqrtm)
-            if R < 10.:
-                kalphamax2= 10.
-                ks2= (kalphamax2-kalphamax1)*0.5*(self._glx+1.)+kalphamax1
-                weights2= (kalphamax2-kalphamax1)*self._glw
-                sqrtp= numpy.sqrt(z**2.+(ks2+R)**2.)
-                sqrtm= numpy.sqrt(z**2.+(ks2-R)**2.)
-                evalInt2= ks2**2.*special.k0(ks2*self._alpha)*((ks2+R)/sqrtp-(ks2-R)/sqrtm)/numpy.sqrt(R**2.+z**2.-ks2**2.+sqrtp*sqrtm)/(sqrtp+sqrtm)
-                return -2.*numpy.sqrt(2.)*self._alpha*numpy.sum(weights1*evalInt1
-                                                          +weights2*evalInt2)
-            else:
-                return -2.*numpy.sqrt(2.)*self._alpha*numpy.sum(weights1*evalInt1)
+            return -2.*numpy.pi*self._alpha\
+                *_hankel_transform(R,z,self._alpha,1,self._j1zeros,
+                                   self._glx,self._glw,self._kzmax)
         raise NotImplementedError("Not new=True not implemented for RazorThinExponentialDiskPotential")
 
     def _zforce(self,R,z,phi=0.,t=0.):
@@ -163,23 +169,9 @@ class RazorThinExponentialDiskPotential(Potential):
             #if R > 6.: return self._kp(R,z)
             if numpy.fabs(z) < 10.**-6.:
                 return 0.
-            kalphamax1= R
-            ks1= kalphamax1*0.5*(self._glx+1.)
-            weights1= kalphamax1*self._glw
-            sqrtp= numpy.sqrt(z**2.+(ks1+R)**2.)
-            sqrtm= numpy.sqrt(z**2.+(ks1-R)**2.)
-            evalInt1= ks1**2.*special.k0(ks1*self._alpha)*(1./sqrtp+1./sqrtm)/numpy.sqrt(R**2.+z**2.-ks1**2.+sqrtp*sqrtm)/(sqrtp+sqrtm)
-            if R < 10.:
-                kalphamax2= 10.
-                ks2= (kalphamax2-kalphamax1)*0.5*(self._glx+1.)+kalphamax1
-                weights2= (kalphamax2-kalphamax1)*self._glw
-                sqrtp= numpy.sqrt(z**2.+(ks2+R)**2.)
-                sqrtm= numpy.sqrt(z**2.+(ks2-R)**2.)
-                evalInt2= ks2**2.*special.k0(ks2*self._alpha)*(1./sqrtp+1./sqrtm)/numpy.sqrt(R**2.+z**2.-ks2**2.+sqrtp*sqrtm)/(sqrtp+sqrtm)
-                return -z*2.*numpy.sqrt(2.)*self._alpha*numpy.sum(weights1*evalInt1
-                                                            +weights2*evalInt2)
-            else:
-                return -z*2.*numpy.sqrt(2.)*self._alpha*numpy.sum(weights1*evalInt1)
+            return -2.*numpy.pi*self._alpha*numpy.sign(z)\
+                *_hankel_transform(R,z,self._alpha,2,self._j0zeros,
+                                   self._glx,self._glw,self._kzmax)
         raise NotImplementedError("Not new=True not implemented for RazorThinExponentialDiskPotential")
 
 
@@ -241,3 +233,47 @@ class RazorThinExponentialDiskPotential(Potential):
            2018-08-19 - Written - Bovy (UofT)
         """
         return numpy.exp(-self._alpha*R)
+
+def _hankel_transform(R,z,alpha,kind,zeros,glx,glw,kzmax):
+    """Compute the Hankel transform int_0^infty dk f(k) exp(-k|z|)/(alpha^2+k^2)^1.5 with f(k) = J0(kR) (kind=0), k J1(kR) (kind=1), or k J0(kR) (kind=2) using Gauss-Legendre quadrature between the zeros of the Bessel function (zeros, which starts at zero); intervals are split in pieces no longer than max(alpha,k) and the result is the average of the last two partial sums, unless k|z| exceeds kzmax first; this is the same as the C implementation"""
+    absz= numpy.fabs(z)
+    # First interval, split in geometrically growing pieces
+    hi= zeros[1]/R if R > 0. else numpy.inf
+    edges= [0.]
+    while edges[-1] < hi and edges[-1]*absz <= kzmax:
+        edges.append(min(edges[-1]+max(alpha,edges[-1]),hi))
+    los= [numpy.array(edges[:-1])]
+    ups= [numpy.array(edges[1:])]
+    idx= [numpy.zeros(len(edges)-1,dtype='int')]
+    cut= edges[-1] < hi
+    if not cut and len(zeros) > 2:
+        # Other intervals are split in at most two pieces
+        lo= zeros[1:-1]/R
+        hi= zeros[2:]/R
+        mid= numpy.minimum(lo+numpy.maximum(alpha,lo),hi)
+        split= mid < hi
+        tlos= numpy.hstack((lo,mid[split]))
+        tups= numpy.hstack((mid,hi[split]))
+        tidx= numpy.arange(1,len(zeros)-1)
+        tidx= numpy.hstack((tidx,tidx[split]))
+        keep= tlos*absz <= kzmax
+        cut= not numpy.all(keep)
+        los.append(tlos[keep])
+        ups.append(tups[keep])
+        idx.append(tidx[keep])
+    los= numpy.hstack(los)
+    ups= numpy.hstack(ups)
+    idx= numpy.hstack(idx)
+    ks= 0.5*numpy.outer(ups-los,glx+1.)+los[:,numpy.newaxis]
+    if kind == 0:
+        fk= special.j0(ks*R)
+    elif kind == 1:
+        fk= ks*special.j1(ks*R)
+    else:
+        fk= ks*special.j0(ks*R)
+    sums= numpy.sum(0.5*numpy.outer(ups-los,glw)*fk*numpy.exp(-ks*absz)\
+                        *(alpha**2.+ks**2.)**-1.5,axis=1)
+    if cut:
+        return numpy.sum(sums)
+    else:
+        return numpy.sum(sums)-0.5*numpy.sum(sums[idx == numpy.amax(idx)])
@@ -7,10 +7,14 @@ from .Potential import Potential, _APY_LOADED
 if _APY_LOADED:
     from astropy import units
 from ..util import bovy_coords
+from ..util import multi
 
 from .NumericalPotentialDerivativesMixin import \
     NumericalPotentialDerivativesMixin
 
+# Number of quadrature nodes per block when computing coefficients
+_SCF_BLOCK_NNODES= 1000000
+
 class SCFPotential(Potential,NumericalPotentialDerivativesMixin):
     """Class that implements the `Hernquist & Ostriker (1992) <http://adsabs.harvard.edu/abs/1992ApJ...386..375H>`_ Self-Consistent-Field-type potential. 
     Note that we divide the amplitude by 2 such that :math:`Acos = \\delta_{0n}\\delta_{0l}\\delta_{0m}` and :math:`Asin = 0` corresponds to :ref:`Galpy's Hernquist Potential <hernquist_potential>`.
@@ -519,29 +523,26 @@ def _C(xi, N,L, alpha = lambda x: 2*x + 3./2):
     NAME:
        _C
     PURPOSE:
-       Evaluate C_n,l (the Gegenbauer polynomial) for 0 <= l < L and 0<= n < N 
+       Evaluate C_n,l (the Gegenbauer polynomial) for 0 <= l < L and 0<= n < N using the standard three-term recurrence
     INPUT:
-       xi - radial transformed variable
+       xi - radial transformed variable (float or array)
        N - Size of the N dimension
        L - Size of the L dimension
        alpha = A lambda function of l. Default alpha = 2l + 3/2 
        
     OUTPUT:
-       An LxN Gegenbauer Polynomial 
+       An NxL Gegenbauer Polynomial (NxLx[shape of xi] for array xi)
     HISTORY:
        2016-05-16 - Written - Aladdin 
+       2026-10-19 - Vectorized in xi - agent
     """
-    CC = numpy.zeros((N,L), float) 
-     
-    for l in range(L):
-        for n in range(N):
-            a = alpha(l)
-            if n==0:
-                CC[n][l] = 1.
-                continue 
-            elif n==1: CC[n][l] = 2.*a*xi
-            if n + 1 != N:
-                CC[n+1][l] = (n + 1.)**-1. * (2*(n + a)*xi*CC[n][l] - (n + 2*a - 1)*CC[n-1][l])
+    xi= numpy.asarray(xi)
+    a= alpha(numpy.arange(L)).reshape((L,)+(1,)*xi.ndim)
+    CC= numpy.zeros((N,L)+xi.shape,float)
+    CC[0]= 1.
+    if N > 1: CC[1]= 2.*a*xi
+    for n in range(1,N-1):
+        CC[n+1]= (2*(n + a)*xi*CC[n] - (n + 2*a - 1)*CC[n-1])/(n + 1.)
     return CC 
     
 def _dC(xi, N, L):
@@ -551,8 +552,118 @@ def _dC(xi, N, L):
     CC[0, :] = 0
     CC *= 2*(2*l + 3./2)
     return CC
-     
-def scf_compute_coeffs_spherical(dens, N, a=1., radial_order=None):
+
+def _P(costheta, L, M):
+    """
+    NAME:
+       _P
+    PURPOSE:
+       Evaluate the associated Legendre functions P_lm(costheta) for 0 <= l < L and 0 <= m < M using the standard recurrences (including the Condon-Shortley phase, as in scipy.special.lpmn)
+    INPUT:
+       costheta - cos(theta) (array)
+       L - Size of the L dimension
+       M - Size of the M dimension
+    OUTPUT:
+       An LxMx[shape of costheta] array with the associated Legendre functions (zero for m > l)
+    HISTORY:
+       2026-10-19 - Written - agent
+    """
+    costheta= numpy.asarray(costheta)
+    sintheta= numpy.sqrt(1.-costheta**2.)
+    PP= numpy.zeros((L,M)+costheta.shape,float)
+    Pmm= numpy.ones_like(costheta)
+    for m in range(min(L,M)):
+        if m > 0: Pmm= -(2*m-1.)*sintheta*Pmm
+        PP[m,m]= Pmm
+        if m+1 < L: PP[m+1,m]= (2*m+1.)*costheta*Pmm
+        for l in range(m+2,L):
+            PP[l,m]= ((2*l-1.)*costheta*PP[l-1,m]-(l+m-1.)*PP[l-2,m])/(l-m)
+    return PP
+
+def _eval_dens_nodes(dens,R,z,phi):
+    """Evaluate the density on an array of quadrature nodes, falling back
+    onto element-by-element evaluation for functions that do not accept
+    arrays"""
+    try:
+        out= numpy.asarray(dens(R,z,phi),dtype='float')
+        return out*numpy.ones(R.shape)
+    except (ValueError,TypeError):
+        return numpy.vectorize(dens,otypes=[float])(R,z,phi)
+
+def _scf_compute_coeffs_quad(dens, N, L, M, a, xi, wxi, costheta, wcostheta,
+                             phi, wphi, numcores=1, blocksize=None):
+    """
+    NAME:
+       _scf_compute_coeffs_quad
+    PURPOSE:
+       compute the basis-function integrals 
+
+       a^3 \int dxi dcostheta dphi rho (1+xi)^(l+2) (1-xi)^(l-3) C_nl(xi) P_lm(costheta) [cos(m phi),sin(m phi)]
+
+       on a tensor-product quadrature grid, evaluating the density once per node and streaming over blocks of the flattened (xi,costheta,phi) node grid to bound the memory usage
+    INPUT:
+       dens - density function of (R,z,phi)
+       N, L, M - size of the N, L, and M dimensions
+       a - parameter used to shift the basis functions
+       xi, wxi - radial quadrature nodes and weights
+       costheta, wcostheta - costheta quadrature nodes and weights
+       phi, wphi - azimuthal quadrature nodes and weights
+       numcores= (1) number of cores to use to process the blocks in parallel
+       blocksize= (None) number of quadrature nodes per block (default: _SCF_BLOCK_NNODES)
+    OUTPUT:
+       (cosine integrals [N,L,M], sine integrals [N,L,M])
+    HISTORY:
+       2026-10-19 - Written - agent
+    """
+    # Angular parts are the same for all blocks
+    sintheta= numpy.sqrt(1.-costheta**2.)
+    PP= _P(costheta,L,M)*wcostheta
+    m= numpy.arange(M)
+    mcos= numpy.cos(m[:,None]*phi[None,:])*wphi
+    msin= numpy.sin(m[:,None]*phi[None,:])*wphi
+    l= numpy.arange(L)[:,None]
+    nxi, nct, nphi= len(xi), len(costheta), len(phi)
+    nnodes= nxi*nct*nphi
+    if blocksize is None:
+        blocksize= _SCF_BLOCK_NNODES
+    def integrate_block(start):
+        ixi,ict,iphi= numpy.unravel_index(\
+            numpy.arange(start,min(start+blocksize,nnodes)),(nxi,nct,nphi))
+        r= _xiToR(xi[ixi],a)
+        rho= _eval_dens_nodes(dens,r*sintheta[ict],r*costheta[ict],
+                              phi[iphi])
+        # phi integral -> [xi,costheta,m] for the radial nodes in this block
+        xindx= slice(ixi[0],ixi[-1]+1)
+        nxib= ixi[-1]-ixi[0]+1
+        row= (ixi-ixi[0])*nct+ict
+        rhoc= numpy.empty((nxib,nct,M))
+        rhos= numpy.empty((nxib,nct,M))
+        for mm in range(M):
+            rhoc[:,:,mm]= numpy.bincount(row,weights=rho*mcos[mm,iphi],
+                                         minlength=nxib*nct)\
+                                         .reshape((nxib,nct))
+            rhos[:,:,mm]= numpy.bincount(row,weights=rho*msin[mm,iphi],
+                                         minlength=nxib*nct)\
+                                         .reshape((nxib,nct))
+        # costheta integral -> [xi,l,m]
+        rhoc= numpy.einsum('lmc,bcm->blm',PP,rhoc)
+        rhos= numpy.einsum('lmc,bcm->blm',PP,rhos)
+        # radial integral -> [n,l,m]
+        xib= xi[xindx]
+        rad= a**3.*_C(xib,N,L)*wxi[xindx]\
+            *(1.+xib)**(l+2.)*(1.-xib)**(l-3.)
+        return (numpy.einsum('nlb,blm->nlm',rad,rhoc),
+                numpy.einsum('nlb,blm->nlm',rad,rhos))
+    starts= list(range(0,nnodes,blocksize))
+    if numcores > 1 and len(starts) > 1:
+        out= multi.parallel_map(integrate_block,starts,numcores=numcores)
+    else:
+        out= [integrate_block(start) for start in starts]
+    return (numpy.sum([o[0] for o in out],axis=0),
+            numpy.sum([o[1] for o in out],axis=0))
+
+def scf_compute_coeffs_spherical(dens, N, a=1., radial_order=None,
+                                 numcores=1):
         """
         NAME:
 
@@ -572,6 +683,8 @@ def scf_compute_coeffs_spherical(dens, N, a=1., radial_order=None):
            
            radial_order - Number of sample points of the radial integral. If None, radial_order=max(20, N + 1)
 
+           numcores= (1) number of cores to use to evaluate the integrals over blocks of quadrature points in parallel
+
         OUTPUT:
 
            (Acos,Asin) - Expansion coefficients for density dens that can be given to SCFPotential.__init__
@@ -580,6 +693,8 @@ def scf_compute_coeffs_spherical(dens, N, a=1., radial_order=None):
 
            2016-05-18 - Written - Aladdin 
 
+           2026-10-19 - Evaluate the integrals using the vectorized, block-wise quadrature engine - agent
+
         """
         numOfParam = 0
         try:
@@ -591,15 +706,8 @@ def scf_compute_coeffs_spherical(dens, N, a=1., radial_order=None):
                 numOfParam=2
             except:
                 numOfParam=3
-        param = [0]*numOfParam;
+        dens3= lambda R,z,phi: dens(*[R,z,phi][:numOfParam])
         
-        
-        def integrand(xi):
-            r = _xiToR(xi, a)
-            R = r
-            param[0] = R
-            return a**3. * dens(*param)*(1 + xi)**2. * (1 - xi)**-3. * _C(xi, N, 1)[:,0]
-               
         Acos = numpy.zeros((N,1,1), float)
         Asin = None
         
@@ -607,14 +715,19 @@ def scf_compute_coeffs_spherical(dens, N, a=1., radial_order=None):
         
         if radial_order != None:
             Ksample[0] = radial_order
-            
-        integrated = _gaussianQuadrature(integrand, [[-1., 1.]], Ksample=Ksample)
+
+        xi, wxi= leggauss(Ksample[0])
+        integrated= _scf_compute_coeffs_quad(dens3,N,1,1,a,xi,wxi,
+                                             numpy.zeros(1),numpy.ones(1),
+                                             numpy.zeros(1),numpy.ones(1),
+                                             numcores=numcores)[0][:,0,0]
         n = numpy.arange(0,N)
         K = 16*numpy.pi*(n + 3./2)/((n + 2)*(n + 1)*(1 + n*(n + 3.)/2.))
         Acos[n,0,0] = 2*K*integrated
         return Acos, Asin    
         
-def scf_compute_coeffs_axi(dens, N, L, a=1.,radial_order=None, costheta_order=None):
+def scf_compute_coeffs_axi(dens, N, L, a=1.,radial_order=None, costheta_order=None,
+                           numcores=1):
         """
         NAME:
 
@@ -638,6 +751,8 @@ def scf_compute_coeffs_axi(dens, N, L, a=1.,radial_order=None, costheta_order=No
 
            costheta_order - Number of sample points of the costheta integral. If None, If costheta_order=max(20, L + 1)
 
+           numcores= (1) number of cores to use to evaluate the integrals over blocks of quadrature points in parallel
+
         OUTPUT:
 
            (Acos,Asin) - Expansion coefficients for density dens that can be given to SCFPotential.__init__
@@ -645,6 +760,9 @@ def scf_compute_coeffs_axi(dens, N, L, a=1.,radial_order=None, costheta_order=No
         HISTORY:
 
            2016-05-20 - Written - Aladdin 
+
+           2026-10-19 - Evaluate the integrals using the vectorized, block-wise quadrature engine - agent
+
         """
         numOfParam = 0
         try:
@@ -652,19 +770,7 @@ def scf_compute_coeffs_axi(dens, N, L, a=1.,radial_order=None, costheta_order=No
             numOfParam=2
         except:
             numOfParam=3
-        param = [0]*numOfParam;
-        def integrand(xi, costheta):
-            l = numpy.arange(0, L)[numpy.newaxis, :]
-            r = _xiToR(xi,a)
-            R = r*numpy.sqrt(1 - costheta**2.)
-            z = r*costheta
-            Legandre = lpmn(0,L-1,costheta)[0].T[numpy.newaxis,:,0]
-            dV = (1. + xi)**2. * numpy.power(1. - xi, -4.) 
-            phi_nl =  a**3*(1. + xi)**l * (1. - xi)**(l + 1.)*_C(xi, N, L)[:,:] * Legandre
-            param[0] = R
-            param[1] = z
-            return  phi_nl*dV * dens(*param)
-            
+        dens3= lambda R,z,phi: dens(*[R,z,phi][:numOfParam])
                
         Acos = numpy.zeros((N,L,1), float)
         Asin = None
@@ -676,8 +782,13 @@ def scf_compute_coeffs_axi(dens, N, L, a=1.,radial_order=None, costheta_order=No
         if costheta_order != None:
             Ksample[1] = costheta_order
             
-        
-        integrated = _gaussianQuadrature(integrand, [[-1, 1], [-1, 1]], Ksample = Ksample)*(2*numpy.pi)
+        xi, wxi= leggauss(Ksample[0])
+        costheta, wcostheta= leggauss(Ksample[1])
+        integrated= _scf_compute_coeffs_quad(dens3,N,L,1,a,xi,wxi,
+                                             costheta,wcostheta,
+                                             numpy.zeros(1),
+                                             2.*numpy.pi*numpy.ones(1),
+                                             numcores=numcores)[0][:,:,0]
         n = numpy.arange(0,N)[:,numpy.newaxis]
         l = numpy.arange(0,L)[numpy.newaxis,:]
         K = .5*n*(n + 4*l + 3) + (l + 1)*(2*l + 1)
@@ -691,7 +802,8 @@ def scf_compute_coeffs_axi(dens, N, L, a=1.,radial_order=None, costheta_order=No
         
         return Acos, Asin
         
-def scf_compute_coeffs(dens, N, L, a=1., radial_order=None, costheta_order=None, phi_order=None):
+def scf_compute_coeffs(dens, N, L, a=1., radial_order=None, costheta_order=None, phi_order=None,
+                       numcores=1):
         """        
         NAME:
 
@@ -717,6 +829,8 @@ def scf_compute_coeffs(dens, N, L, a=1., radial_order=None, costheta_order=None,
 
            phi_order - Number of sample points of the phi integral. If None, If costheta_order=max(20, L + 1)
 
+           numcores= (1) number of cores to use to evaluate the integrals over blocks of quadrature points in parallel
+
         OUTPUT:
 
            (Acos,Asin) - Expansion coefficients for density dens that can be given to SCFPotential.__init__
@@ -725,22 +839,9 @@ def scf_compute_coeffs(dens, N, L, a=1., radial_order=None, costheta_order=None,
 
            2016-05-27 - Written - Aladdin 
 
+           2026-10-19 - Evaluate the integrals using the vectorized, block-wise quadrature engine - agent
+
         """
-        def integrand(xi, costheta, phi):
-            l = numpy.arange(0, L)[numpy.newaxis, :, numpy.newaxis]
-            m = numpy.arange(0, L)[numpy.newaxis,numpy.newaxis,:]
-            r = _xiToR(xi, a)
-            R = r*numpy.sqrt(1 - costheta**2.)
-            z = r*costheta
-            Legandre = lpmn(L - 1,L-1,costheta)[0].T[numpy.newaxis,:,:]
-            dV = (1. + xi)**2. * numpy.power(1. - xi, -4.)
-            
-            
-            phi_nl = - a**3*(1. + xi)**l * (1. - xi)**(l + 1.)*_C(xi, N, L)[:,:,numpy.newaxis] * Legandre
-            
-            return dens(R,z, phi) * phi_nl[numpy.newaxis, :,:,:]*numpy.array([numpy.cos(m*phi), numpy.sin(m*phi)])*dV
-            
-               
         Acos = numpy.zeros((N,L,L), float)
         Asin = numpy.zeros((N,L,L), float)
         
@@ -752,26 +853,125 @@ def scf_compute_coeffs(dens, N, L, a=1., radial_order=None, costheta_order=None,
             Ksample[1] = costheta_order
         if phi_order != None:
             Ksample[2] = phi_order
-        integrated = _gaussianQuadrature(integrand, [[-1., 1.], [-1., 1.], [0, 2*numpy.pi]], Ksample = Ksample)
-        n = numpy.arange(0,N)[:,numpy.newaxis, numpy.newaxis]
-        l = numpy.arange(0,L)[numpy.newaxis,:, numpy.newaxis]
-        m = numpy.arange(0,L)[numpy.newaxis,numpy.newaxis,:]
-        K = .5*n*(n + 4*l + 3) + (l + 1)*(2*l + 1)
-        
-        
-        Nln = .5*gammaln(l - m + 1) - .5*gammaln(l + m + 1) - (2*l)*numpy.log(2)
-        NN = numpy.e**(Nln)
-
-        NN[numpy.where(NN == numpy.inf)] = 0 ## To account for the fact that m cant be bigger than l
-            
-        constants = NN*(2*l + 1.)**.5
-        
-        lnI = -(8*l + 6)*numpy.log(2) + gammaln(n + 4*l + 3) - gammaln(n + 1) - numpy.log(n + 2*l + 3./2) - 2*gammaln(2*l + 3./2)
-        I = -K*(4*numpy.pi) * numpy.e**(lnI)
-        Acos[:,:,:],Asin[:,:,:] = 2*(I**-1.)[numpy.newaxis,:,:,:] * integrated * constants[numpy.newaxis,:,:,:]
+        xi, wxi= leggauss(Ksample[0])
+        costheta, wcostheta= leggauss(Ksample[1])
+        phi, wphi= leggauss(Ksample[2])
+        phi= numpy.pi*(phi+1.)
+        wphi*= numpy.pi
+        integrated= -numpy.array(\
+            _scf_compute_coeffs_quad(dens,N,L,L,a,xi,wxi,
+                                     costheta,wcostheta,phi,wphi,
+                                     numcores=numcores))
+        Acos[:,:,:],Asin[:,:,:] = _scf_compute_coeffs_norm(N,L)[numpy.newaxis,:,:,:] * integrated
         
         return Acos, Asin
 
+def scf_compute_coeffs_nbody(pos, mass, N, L, a=1., return_variance=False,
+                             chunksize=10000, numcores=1):
+        """
+        NAME:
+
+           scf_compute_coeffs_nbody
+
+        PURPOSE:
+
+           Compute the expansion coefficients for an N-body snapshot by direct summation over the particles
+
+        INPUT:
+
+           pos - positions of the particles in rectangular coordinates with shape [3,n]
+
+           mass - mass of the particles (array with shape [n] or float)
+
+           N - size of the Nth dimension of the expansion coefficients
+
+           L - size of the Lth and Mth dimension of the expansion coefficients
+           
+           a - parameter used to shift the basis functions
+
+           return_variance= (False) if True, also return the variance of the coefficients due to the particle noise, which can be used to truncate noisy coefficients
+
+           chunksize= (10000) number of particles to process at the same time
+
+           numcores= (1) number of cores to use to process the chunks of particles in parallel
+
+        OUTPUT:
+
+           (Acos,Asin) - Expansion coefficients for the density of the particles that can be given to SCFPotential.__init__
+
+           (Acos,Asin,Acos_var,Asin_var) if return_variance
+
+        HISTORY:
+
+           2026-10-19 - Written - agent
+
+        """
+        pos= numpy.array(pos,dtype='float')
+        npart= pos.shape[1]
+        mass= numpy.array(mass,dtype='float')*numpy.ones(npart)
+        l= numpy.arange(L)[:,None]
+        m= numpy.arange(L)[:,None]
+        def sum_chunk(indx):
+            x,y,z= pos[:,indx]
+            r= numpy.sqrt(x**2.+y**2.+z**2.)
+            costheta= z/r
+            costheta[r == 0.]= 1.
+            phi= numpy.arctan2(y,x)
+            xi= (r-a)/(r+a)
+            rad= -0.5*mass[indx]*_C(xi,N,L)*(1.+xi)**l*(1.-xi)**(l+1.)
+            PP= _P(costheta,L,L)
+            ang= [PP*numpy.cos(m*phi),PP*numpy.sin(m*phi)]
+            out= numpy.empty((4,N,L,L))
+            for ll in range(L):
+                for ii in range(2):
+                    out[ii,:,ll]= numpy.dot(rad[:,ll],ang[ii][ll].T)
+                    if return_variance:
+                        out[2+ii,:,ll]= numpy.dot(rad[:,ll]**2.,
+                                                  ang[ii][ll].T**2.)
+            return out
+        chunks= [numpy.arange(ii,min(ii+chunksize,npart))
+                 for ii in range(0,npart,chunksize)]
+        if numcores > 1 and len(chunks) > 1:
+            out= multi.parallel_map(sum_chunk,chunks,numcores=numcores)
+        else:
+            out= [sum_chunk(indx) for indx in chunks]
+        out= numpy.sum(out,axis=0)
+        norm= _scf_compute_coeffs_norm(N,L)
+        Acos, Asin= norm*out[0], norm*out[1]
+        if not return_variance:
+            return Acos, Asin
+        # Variance of the sum over particles, estimated from the particles
+        Acos_var= norm**2.*(out[2]-out[0]**2./npart)
+        Asin_var= norm**2.*(out[3]-out[1]**2./npart)
+        return Acos, Asin, Acos_var, Asin_var
+
+def _scf_compute_coeffs_norm(N,L):
+    """
+    NAME:
+       _scf_compute_coeffs_norm
+    PURPOSE:
+       compute the normalization that converts the basis-function integrals of the density into the expansion coefficients Acos and Asin
+    INPUT:
+       N - size of the Nth dimension of the expansion coefficients
+       L - size of the Lth and Mth dimension of the expansion coefficients
+    OUTPUT:
+       normalization [N,L,L]
+    HISTORY:
+       2016-05-27 - Written as part of scf_compute_coeffs - Aladdin 
+       2026-10-19 - Split off - agent
+    """
+    n = numpy.arange(0,N)[:,numpy.newaxis, numpy.newaxis]
+    l = numpy.arange(0,L)[numpy.newaxis,:, numpy.newaxis]
+    m = numpy.arange(0,L)[numpy.newaxis,numpy.newaxis,:]
+    K = .5*n*(n + 4*l + 3) + (l + 1)*(2*l + 1)
+    Nln = .5*gammaln(l - m + 1) - .5*gammaln(l + m + 1) - (2*l)*numpy.log(2)
+    NN = numpy.e**(Nln)
+    NN[numpy.where(NN == numpy.inf)] = 0 ## To account for the fact that m cant be bigger than l
+    constants = NN*(2*l + 1.)**.5
+    lnI = -(8*l + 6)*numpy.log(2) + gammaln(n + 4*l + 3) - gammaln(n + 1) - numpy.log(n + 2*l + 3./2) - 2*gammaln(2*l + 3./2)
+    I = -K*(4*numpy.pi) * numpy.e**(lnI)
+    return 2*(I**-1.) * constants
+
 def _cartesian(arraySizes, out=None):
     """
     NAME:
@@ -806,59 +1006,3 @@ def _cartesian(arraySizes, out=None):
         for j in range(1, arrays[0].size):
             out[j*m:(j+1)*m,1:] = out[0:m,1:]
     return out
-                
-def _gaussianQuadrature(integrand, bounds, Ksample=[20], roundoff=0):
-    """
-        NAME:
-           _gaussianQuadrature
-        PURPOSE:
-           Numerically take n integrals over a function that returns a float or an array 
-        INPUT:
-           integrand - The function you're integrating over.
-           bounds - The bounds of the integral in the form of [[a_0, b_0], [a_1, b_1], ... , [a_n, b_n]] 
-           where a_i is the lower bound and b_i is the upper bound
-           Ksample - Number of sample points in the form of [K_0, K_1, ..., K_n] where K_i is the sample point
-           of the ith integral.
-           roundoff - if the integral is less than this value, round it to 0.
-        OUTPUT:
-           The integral of the function integrand 
-        HISTORY:
-           2016-05-24 - Written - Aladdin 
-    """
-     
-    ##Maps the sample point and weights
-    xp = numpy.zeros((len(bounds), numpy.max(Ksample)), float)
-    wp = numpy.zeros((len(bounds), numpy.max(Ksample)), float)
-    for i in range(len(bounds)):
-        x,w = leggauss(Ksample[i]) ##Calculates the sample points and weights
-        a,b = bounds[i]
-        xp[i, :Ksample[i]] = .5*(b-a)*x + .5*(b+a)
-        wp[i, :Ksample[i]] = .5*(b - a)*w
-
-    
-    ##Determines the shape of the integrand
-    s = 0.
-    shape=None
-    s_temp = integrand(*numpy.zeros(len(bounds)))
-    if type(s_temp).__name__ == numpy.ndarray.__name__ :
-        shape = s_temp.shape
-        s = numpy.zeros(shape, float)
-        
-        
-    
-
-    #gets all combinations of indices from each integrand 
-    li = _cartesian(Ksample)
-    
-    ##Performs the actual integration
-    for i in range(li.shape[0]):
-        index = (numpy.arange(len(bounds)),li[i])
-        s+= numpy.prod(wp[index])*integrand(*xp[index])
-    
-    ##Rounds values that are less than roundoff to zero    
-    if shape!= None:
-        s[numpy.where(numpy.fabs(s) < roundoff)] = 0
-    else: s *= numpy.fabs(s) >roundoff
-    return s
-                
-        
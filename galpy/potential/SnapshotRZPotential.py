@@ -5,6 +5,7 @@ from scipy import interpolate
 from .Potential import Potential
 from .interpRZPotential import scalarVectorDecorator, \
     zsymDecorator, calc_2dsplinecoeffs_c, interpRZPotential
+from ..util import treecode
 try: 
     import pynbody
     from pynbody import gravity
@@ -14,7 +15,7 @@ except ImportError: #pragma: no cover
 else:
     _PYNBODY_LOADED= True    
 class SnapshotRZPotential(Potential):
-    """Class that implements an axisymmetrized version of the potential of an N-body snapshot (requires `pynbody <http://pynbody.github.io>`__)
+    """Class that implements an axisymmetrized version of the potential of an N-body snapshot, given as a `pynbody <http://pynbody.github.io>`__ snapshot or as arrays of positions and masses; the gravity is computed using direct summation with pynbody or using galpy's built-in Barnes-Hut tree code (galpy.util.treecode.tree_gravity)
 
     `_evaluate`, `_Rforce`, and `_zforce` calculate a hash for the
     array of points that is passed in by the user. The hash and
@@ -23,6 +24,7 @@ class SnapshotRZPotential(Potential):
     are returned and not recalculated.
     """
     def __init__(self, s, num_threads=None,nazimuths=4,
+                 gravity=None,theta=0.5,softening=0.,
                  ro=None,vo=None):
         """
         NAME:
@@ -36,12 +38,18 @@ class SnapshotRZPotential(Potential):
 
         INPUT:
 
-           s - a simulation snapshot loaded with pynbody
+           s - a simulation snapshot loaded with pynbody or a tuple (pos,mass) of the positions (Nx3 array) and masses (N array or number) of the particles (potential and forces are computed with G=1 in the units of these arrays)
 
            num_threads= (4) number of threads to use for calculation
 
            nazimuths= (4) number of azimuths to average over
 
+           gravity= ('direct' for pynbody snapshots, 'tree' otherwise) how to compute the gravity of the particles: 'direct' for direct summation with pynbody or 'tree' for galpy's built-in Barnes-Hut tree code
+
+           theta= (0.5) opening angle for the tree code
+
+           softening= (0.) Plummer softening length for the tree code
+
            ro=, vo= distance and velocity scales for translation into internal units (default from configuration file)
 
         OUTPUT:
@@ -54,16 +62,12 @@ class SnapshotRZPotential(Potential):
 
            2014-11-24 - Edited for merging into main galpy - Bovy (IAS)
 
+           2026-10-19 - Added tree code and array input - agent
+
         """
-        if not _PYNBODY_LOADED: #pragma: no cover
-            raise ImportError("The SnapShotRZPotential class is designed to work with pynbody snapshots, which cannot be loaded (probably because it is not installed) -- obtain from pynbody.github.io")
         Potential.__init__(self,amp=1.0,ro=ro,vo=vo)
-        self._s = s
+        _setup_snapshot_gravity(self,s,num_threads,gravity,theta,softening)
         self._point_hash = {}
-        if num_threads is None:
-            self._num_threads= pynbody.config['number_of_threads']
-        else:
-            self._num_threads = num_threads
         # Set up azimuthal averaging
         self._naz= nazimuths
         self._cosaz= numpy.cos(numpy.arange(self._naz,dtype='float')\
@@ -109,7 +113,7 @@ class SnapshotRZPotential(Potential):
                                       z[i]*self._zones]).T
 
             points_new = points.reshape(points.size//3,3)
-            pot, acc = gravity.calc.direct(self._s,points_new,num_threads=self._num_threads)
+            pot, acc = self._calc_gravity(points_new)
 
             pot = pot.reshape(len(R),self._naz)
             acc = acc.reshape(len(R),self._naz,3)
@@ -132,6 +136,49 @@ class SnapshotRZPotential(Potential):
 
         return pot, rz_acc
 
+    def _calc_gravity(self,points):
+        """Compute the potential and acceleration at points (Nx3)"""
+        if self._gravity == 'direct':
+            return gravity.calc.direct(self._s,points,
+                                       num_threads=self._num_threads)
+        if self._tree is None:
+            self._tree= treecode.build_tree(*_snapshot_pos_mass(self))
+        return treecode.tree_gravity(None,None,points,theta=self._theta,
+                                     softening=self._softening,
+                                     numcores=self._num_threads,
+                                     tree=self._tree)
+
+def _setup_snapshot_gravity(pot,s,num_threads,grav,theta,softening):
+    """Parse the snapshot and the options for computing its gravity"""
+    pot._pynbody= not isinstance(s,(tuple,list))
+    if pot._pynbody and not _PYNBODY_LOADED: #pragma: no cover
+        raise ImportError("SnapshotRZPotential and InterpSnapshotRZPotential require pynbody to work with pynbody snapshots, which cannot be loaded (probably because it is not installed) -- obtain from pynbody.github.io, or give the snapshot as (pos,mass) arrays")
+    if grav is None:
+        grav= 'direct' if pot._pynbody else 'tree'
+    if not grav in ['direct','tree']:
+        raise ValueError("gravity= must be either 'direct' or 'tree'")
+    if grav == 'direct' and not pot._pynbody:
+        raise ValueError("gravity='direct' requires a pynbody snapshot; use gravity='tree' for snapshots given as arrays")
+    pot._s= s
+    if not pot._pynbody:
+        pot._pos= numpy.array(s[0],dtype='float')
+        pot._mass= numpy.asarray(s[1],dtype='float')*numpy.ones(len(pot._pos))
+    pot._gravity= grav
+    pot._theta= theta
+    pot._softening= softening
+    pot._tree= None
+    if num_threads is None and _PYNBODY_LOADED:
+        pot._num_threads= pynbody.config['number_of_threads']
+    else:
+        pot._num_threads= num_threads
+    return None
+
+def _snapshot_pos_mass(pot):
+    """Positions and masses of the particles as plain arrays"""
+    if pot._pynbody:
+        return (numpy.array(pot._s['pos'],dtype='float'),
+                numpy.array(pot._s['mass'],dtype='float'))
+    return (pot._pos,pot._mass)
 
 class InterpSnapshotRZPotential(interpRZPotential) : 
     """
@@ -144,7 +191,8 @@ class InterpSnapshotRZPotential(interpRZPotential) :
                  interpepifreq = False, interpverticalfreq = False, 
                  interpPot = True,
                  enable_c = True, logR = True, zsym = True, 
-                 numcores=None,nazimuths=4,use_pkdgrav = False) : 
+                 numcores=None,nazimuths=4,use_pkdgrav = False,
+                 gravity=None,theta=0.5,softening=0.) : 
         """
         NAME:
 
@@ -156,7 +204,7 @@ class InterpSnapshotRZPotential(interpRZPotential) :
 
         INPUT:
 
-           s - a simulation snapshot loaded with pynbody
+           s - a simulation snapshot loaded with pynbody or a tuple (pos,mass) of the positions (Nx3 array) and masses (N array or number) of the particles (potential and forces are computed with G=1 in the units of these arrays)
 
            rgrid - R grid to be given to linspace as in rs= linspace(*rgrid)
 
@@ -176,6 +224,12 @@ class InterpSnapshotRZPotential(interpRZPotential) :
 
            use_pkdgrav= (False) use PKDGRAV to calculate the snapshot's potential and forces (CURRENTLY NOT IMPLEMENTED)
 
+           gravity= ('direct' for pynbody snapshots, 'tree' otherwise) how to compute the gravity of the particles: 'direct' for direct summation with pynbody or 'tree' for galpy's built-in Barnes-Hut tree code
+
+           theta= (0.5) opening angle for the tree code
+
+           softening= (0.) Plummer softening length for the tree code
+
            ro=, vo= distance and velocity scales for translation into internal units (default from configuration file)
 
         OUTPUT:
@@ -188,18 +242,19 @@ class InterpSnapshotRZPotential(interpRZPotential) :
 
            2014-11-24 - Edited for merging into main galpy - Bovy (IAS)
 
+           2026-10-19 - Added tree code and array input - agent
+
         """
-        if not _PYNBODY_LOADED: #pragma: no cover
-            raise ImportError("The InterpSnapRZShotPotential class is designed to work with pynbody snapshots, which cannot be loaded (probably because it is not installed) -- obtain from pynbody.github.io")
-        
         # inititalize using the base class
         Potential.__init__(self,amp=1.0,ro=ro,vo=vo)
 
+        # make the potential accessible at points beyond the grid; this
+        # also parses the snapshot and is used to compute its gravity
+        self._origPot = SnapshotRZPotential(s,numcores,gravity=gravity,
+                                            theta=theta,softening=softening)
+
         # other properties
-        if numcores is None:
-            self._numcores= pynbody.config['number_of_threads']
-        else:
-            self._numcores = numcores
+        self._numcores= self._origPot._num_threads
         self._s = s 
 
         # Set up azimuthal averaging
@@ -228,9 +283,6 @@ class InterpSnapshotRZPotential(interpRZPotential) :
         self._interpepifreq = interpepifreq
         self._interpverticalfreq = interpverticalfreq
 
-        # make the potential accessible at points beyond the grid
-        self._origPot = SnapshotRZPotential(s, numcores)
-
         # setup the grid
         self._zsym = zsym
         self._logR = logR
@@ -380,7 +432,7 @@ class InterpSnapshotRZPotential(interpRZPotential) :
         else : 
             
             if self._interpPot: 
-                pot, acc = gravity.calc.direct(self._s,points_new,num_threads=self._numcores)
+                pot, acc = self._origPot._calc_gravity(points_new)
 
                 pot = pot.reshape(len(R)*len(z),self._naz)
                 acc = acc.reshape(len(R)*len(z),self._naz,3)
@@ -411,7 +463,7 @@ class InterpSnapshotRZPotential(interpRZPotential) :
 
             # first get the accelerations
             if self._interpverticalfreq : 
-                zgrad_pot, zgrad_acc = gravity.calc.direct(self._s,zgrad_points,num_threads=self._numcores)
+                zgrad_pot, zgrad_acc = self._origPot._calc_gravity(zgrad_points)
                 # each point from the points used above for pot and acc is straddled by 
                 # two points to get the gradient across it. Compute the gradient by 
                 # using a finite difference 
@@ -429,7 +481,7 @@ class InterpSnapshotRZPotential(interpRZPotential) :
 
             # do the same for the radial component
             if self._interpepifreq:
-                rgrad_pot, rgrad_acc = gravity.calc.direct(self._s,rgrad_points,num_threads=self._numcores)
+                rgrad_pot, rgrad_acc = self._origPot._calc_gravity(rgrad_points)
                 rgrad = numpy.zeros(len(points_new))
 
                 for i,racc in enumerate(rgrad_acc.reshape((len(rgrad_acc)//2,2,3))) :
@@ -450,7 +502,16 @@ class InterpSnapshotRZPotential(interpRZPotential) :
                 
                 # reshape the arrays
                 self._RzderivGrid = -Rzgrad.reshape((len(Rzgrad)//self._naz,self._naz)).mean(axis=1).reshape((len(R),len(z)))
-       
+
+    # The splines are set up differently from interpRZPotential (and
+    # re-scaled by normalize), so store them when pickling or serializing
+    def __getstate__(self):
+        return self.__dict__
+
+    def __setstate__(self,state):
+        self.__dict__.update(state)
+        return None
+
     @scalarVectorDecorator
     @zsymDecorator(False)
     def _R2deriv(self,R,Z,phi=0.,t=0.): 
@@ -488,16 +549,18 @@ class InterpSnapshotRZPotential(interpRZPotential) :
         self._normPhi0 = Phi0
 
         # rescale the simulation 
-        if not isinstance(self._s['pos'].units,NoUnit):
-            self._posunit = self._s['pos'].units
-            self._s['pos'].convert_units('%s kpc'%R0)
-        else:
-            self._posunit = None
-        if not isinstance(self._s['vel'].units,NoUnit):
-            self._velunit = self._s['vel'].units
-            self._s['vel'].convert_units('%s km s**-1'%Vc0)
+        self._posunit = None
+        self._velunit = None
+        if not self._origPot._pynbody:
+            self._origPot._pos/= R0
         else:
-            self._velunit = None
+            if not isinstance(self._s['pos'].units,NoUnit):
+                self._posunit = self._s['pos'].units
+                self._s['pos'].convert_units('%s kpc'%R0)
+            if not isinstance(self._s['vel'].units,NoUnit):
+                self._velunit = self._s['vel'].units
+                self._s['vel'].convert_units('%s km s**-1'%Vc0)
+        self._origPot._tree = None
                            
         # rescale the grid
         self._rgrid /= R0
@@ -559,10 +622,13 @@ class InterpSnapshotRZPotential(interpRZPotential) :
         Phi0 = self._normPhi0
         
         # rescale the simulation
+        if not self._origPot._pynbody:
+            self._origPot._pos*= R0
         if not self._posunit is None:
             self._s['pos'].convert_units(self._posunit)
         if not self._velunit is None:
             self._s['vel'].convert_units(self._velunit)
+        self._origPot._tree = None
         
         # rescale the grid
         self._rgrid *= R0
@@ -0,0 +1,172 @@
+###############################################################################
+#   TimeDependentSCFPotential.py: SCF potential with expansion coefficients
+#                                 that are interpolated in time
+###############################################################################
+import numpy
+from scipy import interpolate
+from .Potential import _APY_LOADED
+from .SCFPotential import SCFPotential
+from ..util import bovy_conversion
+if _APY_LOADED:
+    from astropy import units
+class TimeDependentSCFPotential(SCFPotential):
+    """Class that implements a time-dependent `Hernquist & Ostriker (1992) <http://adsabs.harvard.edu/abs/1992ApJ...386..375H>`_ Self-Consistent-Field-type potential, for which the expansion coefficients are given at a set of times :math:`t_i` (for example, computed from the snapshots of a simulation) and are interpolated in time. At time :math:`t` the potential is that of :ref:`SCFPotential <scf_potential>` with coefficients
+
+    .. math::
+
+        A_{cos, nlm}(t) = \\mathrm{interp}\\left(\\{t_i\\},\\{A_{cos, nlm}(t_i)\\}\\right)(t)\\,,\\qquad A_{sin, nlm}(t) = \\mathrm{interp}\\left(\\{t_i\\},\\{A_{sin, nlm}(t_i)\\}\\right)(t)
+
+    where the interpolation is either linear or a natural cubic spline. Outside of the range of :math:`t_i`, the coefficients are held fixed at their first or last value.
+    """
+    def __init__(self,amp=1.,Acos=numpy.array([[[[1]]]]),Asin=None,
+                 times=numpy.array([0.]),a=1.,interp='linear',
+                 normalize=False,ro=None,vo=None):
+        """
+        NAME:
+
+            __init__
+
+        PURPOSE:
+
+            initialize a time-dependent SCF Potential
+
+        INPUT:
+
+           amp - amplitude to be applied to the potential (default: 1); can be a Quantity with units of mass or Gxmass
+
+           Acos - The real part of the expansion coefficent at each time (ntimesxNxLxL array, or optionally ntimesxNxLx1 if Asin=None)
+
+           Asin - The imaginary part of the expansion coefficient at each time (ntimesxNxLxL array or None)
+
+           times - times at which the coefficients are given (ntimes array, strictly increasing; can be Quantity)
+
+           a - scale length (can be Quantity)
+
+           interp= ('linear') interpolation in time: 'linear' or 'cubic' (natural cubic spline)
+
+           normalize - if True, normalize such that vc(1.,0.)=1. at t=0., or, if given as a number, such that the force is this fraction of the force necessary to make vc(1.,0.)=1.
+
+           ro=, vo= distance and velocity scales for translation into internal units (default from configuration file)
+
+        OUTPUT:
+
+           TimeDependentSCFPotential object
+
+        HISTORY:
+
+           2026-10-19 - Written - agent
+
+        """
+        Acos= numpy.asarray(Acos,dtype=float)
+        if not Asin is None: Asin= numpy.asarray(Asin,dtype=float)
+        if len(Acos.shape) != 4:
+            raise RuntimeError("Acos must be a 4 dimensional numpy array")
+        if not Asin is None and Asin.shape != Acos.shape:
+            raise RuntimeError("The shape of Asin does not match the shape of Acos.")
+        if not interp.lower() in ['linear','cubic']:
+            raise ValueError("interp= must be either 'linear' or 'cubic'")
+        # Initialize as the SCF potential at the first time, this also
+        # checks the shape of the coefficients
+        SCFPotential.__init__(self,amp=amp,Acos=Acos[0],
+                              Asin=None if Asin is None else Asin[0],
+                              a=a,normalize=False,ro=ro,vo=vo)
+        if _APY_LOADED and isinstance(times,units.Quantity):
+            times= times.to(units.Gyr).value\
+                /bovy_conversion.time_in_Gyr(self._vo,self._ro)
+        times= numpy.atleast_1d(numpy.array(times,dtype=float))
+        if len(times) != Acos.shape[0]:
+            raise RuntimeError("The length of times does not match the first dimension of Acos")
+        if numpy.any(numpy.diff(times) <= 0.):
+            raise ValueError("times must be strictly increasing")
+        self._times= times
+        self._interp_order= 3 if interp.lower() == 'cubic' else 1
+        # Non-axisymmetric if the coefficients at any time are
+        self.isNonAxi= not (Asin is None or Acos.shape[2] == 1 \
+                                or (numpy.all(Acos[:,:,:,1:] == 0) \
+                                        and numpy.all(Asin == 0)))
+        NN= self._Nroot(Acos.shape[2],Acos.shape[3])
+        self._Acos_times= Acos*NN[numpy.newaxis,numpy.newaxis,:,:]
+        if Asin is not None:
+            self._Asin_times= Asin*NN[numpy.newaxis,numpy.newaxis,:,:]
+        else:
+            self._Asin_times= numpy.zeros_like(Acos)
+        if self._interp_order == 3 and len(times) > 1:
+            # Second derivatives of the natural cubic spline at the knots
+            self._Acos_times_d2= interpolate.CubicSpline(\
+                times,self._Acos_times,axis=0,bc_type='natural')(times,2)
+            self._Asin_times_d2= interpolate.CubicSpline(\
+                times,self._Asin_times,axis=0,bc_type='natural')(times,2)
+        else:
+            self._Acos_times_d2= numpy.zeros_like(self._Acos_times)
+            self._Asin_times_d2= numpy.zeros_like(self._Asin_times)
+        self._coeffs_t= None
+        self._set_coeffs(0.)
+        if normalize or \
+                (isinstance(normalize,(int,float)) \
+                     and not isinstance(normalize,bool)):
+            self.normalize(normalize)
+        return None
+
+    def _set_coeffs(self,t):
+        """Set the current expansion coefficients to those at time t"""
+        if t == self._coeffs_t: return None
+        self._coeffs_t= t
+        self._force_hash= None
+        self._Acos= _interp_coeffs(self._times,self._Acos_times,
+                                   self._Acos_times_d2,self._interp_order,t)
+        self._Asin= _interp_coeffs(self._times,self._Asin_times,
+                                   self._Asin_times_d2,self._interp_order,t)
+        return None
+
+    def _call_at_t(self,func,R,z,phi,t):
+        """Evaluate func(R,z,phi) of the parent SCFPotential with the coefficients at t, looping over t if it is an array"""
+        if numpy.ndim(t) == 0:
+            self._set_coeffs(float(t))
+            return func(self,R,z,phi=phi)
+        R,z,phi,t= numpy.broadcast_arrays(R,z,phi,t)
+        out= numpy.empty(t.shape)
+        for ii in numpy.ndindex(t.shape):
+            self._set_coeffs(float(t[ii]))
+            out[ii]= func(self,R[ii],z[ii],phi=phi[ii])
+        return out
+
+    def _evaluate(self,R,z,phi=0.,t=0.):
+        if not self.isNonAxi and phi is None:
+            phi= 0.
+        return self._call_at_t(SCFPotential._evaluate,R,z,phi,t)
+
+    def _dens(self,R,z,phi=0.,t=0.):
+        if not self.isNonAxi and phi is None:
+            phi= 0.
+        return self._call_at_t(SCFPotential._dens,R,z,phi,t)
+
+    def _Rforce(self,R,z,phi=0.,t=0.):
+        if not self.isNonAxi and phi is None:
+            phi= 0.
+        return self._call_at_t(SCFPotential._Rforce,R,z,phi,t)
+
+    def _zforce(self,R,z,phi=0.,t=0.):
+        if not self.isNonAxi and phi is None:
+            phi= 0.
+        return self._call_at_t(SCFPotential._zforce,R,z,phi,t)
+
+    def _phiforce(self,R,z,phi=0.,t=0.):
+        if not self.isNonAxi and phi is None:
+            phi= 0.
+        return self._call_at_t(SCFPotential._phiforce,R,z,phi,t)
+
+def _interp_coeffs(times,coeffs,d2coeffs,interp_order,t):
+    # Interpolate the coefficients to time t, same as in the C implementation
+    if len(times) == 1 or t <= times[0]:
+        return coeffs[0]
+    elif t >= times[-1]:
+        return coeffs[-1]
+    hi= numpy.searchsorted(times,t,side='right')
+    lo= hi-1
+    h= times[hi]-times[lo]
+    B= (t-times[lo])/h
+    A= 1.-B
+    out= A*coeffs[lo]+B*coeffs[hi]
+    if interp_order == 3:
+        out+= ((A**3.-A)*d2coeffs[lo]+(B**3.-B)*d2coeffs[hi])*h**2./6.
+    return out
@@ -36,7 +36,8 @@ class TwoPowerTriaxialPotential(EllipsoidalPotential):
     """
     def __init__(self,amp=1.,a=5.,alpha=1.5,beta=3.5,b=1.,c=1.,
                  zvec=None,pa=None,glorder=50,
-                 normalize=False,ro=None,vo=None):
+                 normalize=False,ro=None,vo=None,
+                 tabulate=False,tabulate_rrange=None,tabulate_tol=1e-8):
         """
         NAME:
 
@@ -66,6 +67,12 @@ class TwoPowerTriaxialPotential(EllipsoidalPotential):
 
            glorder= (50) if set, compute the relevant force and potential integrals with Gaussian quadrature of this order
 
+           tabulate= (False) if True, pre-compute the force integrals on an adaptive grid and interpolate the forces (see EllipsoidalPotential)
+
+           tabulate_rrange= (None) range in spherical radius covered by the table (can be Quantity); default: [10^-3,10^2] a
+
+           tabulate_tol= (1e-8) relative precision of the interpolated forces
+
            normalize - if True, normalize such that vc(1.,0.)=1., or, if given as a number, such that the force is this fraction of the force necessary to make vc(1.,0.)=1.
 
            ro=, vo= distance and velocity scales for translation into internal units (default from configuration file)
@@ -83,7 +90,10 @@ class TwoPowerTriaxialPotential(EllipsoidalPotential):
         """
         EllipsoidalPotential.__init__(self,amp=amp,b=b,c=c,
                                       zvec=zvec,pa=pa,glorder=glorder,
-                                      ro=ro,vo=vo,amp_units='mass')
+                                      ro=ro,vo=vo,amp_units='mass',
+                                      tabulate=tabulate,
+                                      tabulate_rrange=tabulate_rrange,
+                                      tabulate_tol=tabulate_tol)
         if _APY_LOADED and isinstance(a,units.Quantity):
             a= a.to(units.kpc).value/self._ro
         self.a= a
@@ -101,6 +111,7 @@ class TwoPowerTriaxialPotential(EllipsoidalPotential):
                 /special.gamma(self.betaminusalpha)
         # Adjust amp
         self._amp/= (4.*numpy.pi*self.a**3)
+        self._setup_force_table()
         if normalize or \
                 (isinstance(normalize,(int,float)) \
                      and not isinstance(normalize,bool)): #pragma: no cover
@@ -150,7 +161,8 @@ class TriaxialHernquistPotential(EllipsoidalPotential):
 
     """
     def __init__(self,amp=1.,a=2.,normalize=False,b=1.,c=1.,zvec=None,pa=None,
-                 glorder=50,ro=None,vo=None):
+                 glorder=50,ro=None,vo=None,
+                 tabulate=False,tabulate_rrange=None,tabulate_tol=1e-8):
         """
         NAME:
 
@@ -176,6 +188,12 @@ class TriaxialHernquistPotential(EllipsoidalPotential):
 
            glorder= (50) if set, compute the relevant force and potential integrals with Gaussian quadrature of this order
 
+           tabulate= (False) if True, pre-compute the force integrals on an adaptive grid and interpolate the forces (see EllipsoidalPotential)
+
+           tabulate_rrange= (None) range in spherical radius covered by the table (can be Quantity); default: [10^-3,10^2] a
+
+           tabulate_tol= (1e-8) relative precision of the interpolated forces
+
            normalize - if True, normalize such that vc(1.,0.)=1., or, if given as a number, such that the force is this fraction of the force necessary to make vc(1.,0.)=1.
 
            ro=, vo= distance and velocity scales for translation into internal units (default from configuration file)
@@ -193,7 +211,10 @@ class TriaxialHernquistPotential(EllipsoidalPotential):
         """
         EllipsoidalPotential.__init__(self,amp=amp,b=b,c=c,
                                       zvec=zvec,pa=pa,glorder=glorder,
-                                      ro=ro,vo=vo,amp_units='mass')
+                                      ro=ro,vo=vo,amp_units='mass',
+                                      tabulate=tabulate,
+                                      tabulate_rrange=tabulate_rrange,
+                                      tabulate_tol=tabulate_tol)
         if _APY_LOADED and isinstance(a,units.Quantity):
             a= a.to(units.kpc).value/self._ro
         self.a= a
@@ -201,6 +222,7 @@ class TriaxialHernquistPotential(EllipsoidalPotential):
         # Adjust amp
         self.a4= self.a**4
         self._amp/= (4.*numpy.pi*self.a**3)
+        self._setup_force_table()
         if normalize or \
                 (isinstance(normalize,(int,float)) \
                      and not isinstance(normalize,bool)):
@@ -239,7 +261,8 @@ class TriaxialJaffePotential(EllipsoidalPotential):
 
     """
     def __init__(self,amp=1.,a=2.,b=1.,c=1.,zvec=None,pa=None,normalize=False,
-                 glorder=50,ro=None,vo=None):
+                 glorder=50,ro=None,vo=None,
+                 tabulate=False,tabulate_rrange=None,tabulate_tol=1e-8):
         """
         NAME:
 
@@ -265,6 +288,12 @@ class TriaxialJaffePotential(EllipsoidalPotential):
 
            glorder= (50) if set, compute the relevant force and potential integrals with Gaussian quadrature of this order
 
+           tabulate= (False) if True, pre-compute the force integrals on an adaptive grid and interpolate the forces (see EllipsoidalPotential)
+
+           tabulate_rrange= (None) range in spherical radius covered by the table (can be Quantity); default: [10^-3,10^2] a
+
+           tabulate_tol= (1e-8) relative precision of the interpolated forces
+
            normalize - if True, normalize such that vc(1.,0.)=1., or, if given as a number, such that the force is this fraction of the force necessary to make vc(1.,0.)=1.
 
            ro=, vo= distance and velocity scales for translation into internal units (default from configuration file)
@@ -282,7 +311,10 @@ class TriaxialJaffePotential(EllipsoidalPotential):
         """
         EllipsoidalPotential.__init__(self,amp=amp,b=b,c=c,
                                       zvec=zvec,pa=pa,glorder=glorder,
-                                      ro=ro,vo=vo,amp_units='mass')
+                                      ro=ro,vo=vo,amp_units='mass',
+                                      tabulate=tabulate,
+                                      tabulate_rrange=tabulate_rrange,
+                                      tabulate_tol=tabulate_tol)
         if _APY_LOADED and isinstance(a,units.Quantity):
             a= a.to(units.kpc).value/self._ro
         self.a= a
@@ -290,6 +322,7 @@ class TriaxialJaffePotential(EllipsoidalPotential):
         # Adjust amp
         self.a2= self.a**2
         self._amp/= (4.*numpy.pi*self.a2*self.a)
+        self._setup_force_table()
         if normalize or \
                 (isinstance(normalize,(int,float)) \
                      and not isinstance(normalize,bool)): #pragma: no cover
@@ -331,7 +364,8 @@ class TriaxialNFWPotential(EllipsoidalPotential):
                  normalize=False,
                  conc=None,mvir=None,
                  glorder=50,vo=None,ro=None,
-                 H=70.,Om=0.3,overdens=200.,wrtcrit=False):
+                 H=70.,Om=0.3,overdens=200.,wrtcrit=False,
+                 tabulate=False,tabulate_rrange=None,tabulate_tol=1e-8):
         """
         NAME:
 
@@ -357,6 +391,12 @@ class TriaxialNFWPotential(EllipsoidalPotential):
 
            glorder= (50) if set, compute the relevant force and potential integrals with Gaussian quadrature of this order
 
+           tabulate= (False) if True, pre-compute the force integrals on an adaptive grid and interpolate the forces (see EllipsoidalPotential)
+
+           tabulate_rrange= (None) range in spherical radius covered by the table (can be Quantity); default: [10^-3,10^2] a
+
+           tabulate_tol= (1e-8) relative precision of the interpolated forces
+
            normalize - if True, normalize such that vc(1.,0.)=1., or, if given as a number, such that the force is this fraction of the force necessary to make vc(1.,0.)=1.
 
 
@@ -391,7 +431,10 @@ class TriaxialNFWPotential(EllipsoidalPotential):
         """
         EllipsoidalPotential.__init__(self,amp=amp,b=b,c=c,
                                       zvec=zvec,pa=pa,glorder=glorder,
-                                      ro=ro,vo=vo,amp_units='mass')
+                                      ro=ro,vo=vo,amp_units='mass',
+                                      tabulate=tabulate,
+                                      tabulate_rrange=tabulate_rrange,
+                                      tabulate_tol=tabulate_tol)
         if _APY_LOADED and isinstance(a,units.Quantity):
             a= a.to(units.kpc).value/self._ro
         if conc is None:
@@ -409,6 +452,7 @@ class TriaxialNFWPotential(EllipsoidalPotential):
         # Adjust amp
         self.a3= self.a**3
         self._amp/= (4.*numpy.pi*self.a3)
+        self._setup_force_table()
         if normalize or \
                 (isinstance(normalize,(int,float)) \
                      and not isinstance(normalize,bool)):
@@ -48,6 +48,9 @@ from . import PerfectEllipsoidPotential
 from . import IsothermalDiskPotential
 from . import NumericalPotentialDerivativesMixin
 from . import HomogeneousSpherePotential
+from . import CylindricalSplinePotential
+from . import TimeDependentSCFPotential
+from . import MovingObjectPopulationPotential
 #
 # Functions
 #
@@ -98,15 +101,20 @@ nemo_accname= Potential.nemo_accname
 nemo_accpars= Potential.nemo_accpars
 turn_physical_off= Potential.turn_physical_off
 turn_physical_on= Potential.turn_physical_on
+turn_circular_cache_on= Potential.turn_circular_cache_on
+turn_circular_cache_off= Potential.turn_circular_cache_off
 _dim= Potential._dim
 _isNonAxi= Potential._isNonAxi
 scf_compute_coeffs_spherical = SCFPotential.scf_compute_coeffs_spherical
 scf_compute_coeffs_axi = SCFPotential.scf_compute_coeffs_axi
 scf_compute_coeffs = SCFPotential.scf_compute_coeffs
+scf_compute_coeffs_nbody = SCFPotential.scf_compute_coeffs_nbody
 rtide= Potential.rtide
 ttensor= Potential.ttensor
 flatten= Potential.flatten
 to_amuse= Potential.to_amuse
+to_bytes= Potential.to_bytes
+from_bytes= Potential.from_bytes
 #
 # Classes
 #
@@ -164,6 +172,9 @@ PerfectEllipsoidPotential= PerfectEllipsoidPotential.PerfectEllipsoidPotential
 IsothermalDiskPotential= IsothermalDiskPotential.IsothermalDiskPotential
 NumericalPotentialDerivativesMixin= NumericalPotentialDerivativesMixin.NumericalPotentialDerivativesMixin
 HomogeneousSpherePotential= HomogeneousSpherePotential.HomogeneousSpherePotential
+CylindricalSplinePotential= CylindricalSplinePotential.CylindricalSplinePotential
+TimeDependentSCFPotential= TimeDependentSCFPotential.TimeDependentSCFPotential
+MovingObjectPopulationPotential= MovingObjectPopulationPotential.MovingObjectPopulationPotential
 #Wrappers
 DehnenSmoothWrapperPotential= DehnenSmoothWrapperPotential.DehnenSmoothWrapperPotential
 SolidBodyRotationWrapperPotential= SolidBodyRotationWrapperPotential.SolidBodyRotationWrapperPotential
@@ -6,10 +6,14 @@ import numpy
 from numpy.ctypeslib import ndpointer
 from scipy import interpolate
 from ..util import multi
+from ..util.cache import cached
 from .Potential import Potential
 from ..util.bovy_conversion import physical_conversion
 from ..util import _load_extension_libs
 _DEBUG= False
+_INTERP_ATTRIBUTES= ['_potInterp','_rforceInterp','_zforceInterp','_densInterp',
+                     '_vcircInterp','_dvcircdrInterp','_epifreqInterp',
+                     '_verticalfreqInterp']
 
 _lib, ext_loaded= _load_extension_libs.load_libgalpy()
 
@@ -82,7 +86,7 @@ class interpRZPotential(Potential):
                  interpepifreq=False,interpverticalfreq=False,
                  ro=None,vo=None,
                  use_c=False,enable_c=False,zsym=True,
-                 numcores=None):
+                 numcores=None,cache=None):
         """
         NAME:
 
@@ -104,13 +108,15 @@ class interpRZPotential(Potential):
 
            interpPot, interpRforce, interpzforce, interpDens,interpvcirc, interpepifreq, interpverticalfreq, interpdvcircdr= if True, interpolate these functions
 
-           use_c= use C to speed up the calculation of the grid
+           use_c= use C to speed up the calculation of the grid (the potential, forces, and vcirc are then all computed in a single parallel pass through the grid)
 
            enable_c= enable use of C for interpolations
 
            zsym= if True (default), the potential is assumed to be symmetric around z=0 (so you can use, e.g.,  zgrid=(0.,1.,101)).
 
-           numcores= if set to an integer, use this many cores (only used for vcirc, dvcircdR, epifreq, and verticalfreq; NOT NECESSARILY FASTER, TIME TO MAKE SURE)
+           numcores= if set to an integer, use this many OpenMP threads when computing the grid in C (default: all available); also used to parallelize the calculation of the dvcircdR, epifreq, and verticalfreq tables for potentials that do not support array input
+
+           cache= (None) if True, save the computed tables and spline coefficients to the persistent cache (see galpy.util.cache) and load them from there when the same interpolation is set up again; can also be set to the directory to use for the cache
 
            ro=, vo= distance and velocity scales for translation into internal units (default from configuration file)
 
@@ -124,6 +130,8 @@ class interpRZPotential(Potential):
 
            2013-01-24 - Started with new implementation - Bovy (IAS)
 
+           2026-10-19 - Compute all grids in a single pass and added on-disk caching - agent
+
         """
         if isinstance(RZPot,interpRZPotential):
             from ..potential import PotentialError
@@ -167,142 +175,104 @@ class interpRZPotential(Potential):
         self._enable_c= enable_c*ext_loaded
         self.hasC= self._enable_c
         self._zsym= zsym
-        if interpPot:
-            if use_c*ext_loaded:
-                self._potGrid, err= calc_potential_c(self._origPot,self._rgrid,self._zgrid)
-            else:
-                from ..potential import evaluatePotentials
-                potGrid= numpy.zeros((len(self._rgrid),len(self._zgrid)))
-                for ii in range(len(self._rgrid)):
-                    for jj in range(len(self._zgrid)):
-                        potGrid[ii,jj]= evaluatePotentials(self._origPot,self._rgrid[ii],self._zgrid[jj])
-                self._potGrid= potGrid
-            if self._logR:
-                self._potInterp= interpolate.RectBivariateSpline(self._logrgrid,
-                                                                 self._zgrid,
-                                                                 self._potGrid,
-                                                                 kx=3,ky=3,s=0.)
-            else:
-                self._potInterp= interpolate.RectBivariateSpline(self._rgrid,
-                                                                 self._zgrid,
-                                                                 self._potGrid,
-                                                                 kx=3,ky=3,s=0.)
-            if enable_c*ext_loaded:
-                self._potGrid_splinecoeffs= calc_2dsplinecoeffs_c(self._potGrid)
-        if interpRforce:
-            if use_c*ext_loaded:
-                self._rforceGrid, err= calc_potential_c(self._origPot,self._rgrid,self._zgrid,rforce=True)
-            else:
-                from ..potential import evaluateRforces
-                rforceGrid= numpy.zeros((len(self._rgrid),len(self._zgrid)))
-                for ii in range(len(self._rgrid)):
-                    for jj in range(len(self._zgrid)):
-                        rforceGrid[ii,jj]= evaluateRforces(self._origPot,self._rgrid[ii],self._zgrid[jj])
-                self._rforceGrid= rforceGrid
-            if self._logR:
-                self._rforceInterp= interpolate.RectBivariateSpline(self._logrgrid,
-                                                                    self._zgrid,
-                                                                    self._rforceGrid,
-                                                                    kx=3,ky=3,s=0.)
-            else:
-                self._rforceInterp= interpolate.RectBivariateSpline(self._rgrid,
-                                                                    self._zgrid,
-                                                                    self._rforceGrid,
-                                                                    kx=3,ky=3,s=0.)
-            if enable_c*ext_loaded:
-                self._rforceGrid_splinecoeffs= calc_2dsplinecoeffs_c(self._rforceGrid)
-        if interpzforce:
-            if use_c*ext_loaded:
-                self._zforceGrid, err= calc_potential_c(self._origPot,self._rgrid,self._zgrid,zforce=True)
-            else:
-                from ..potential import evaluatezforces
-                zforceGrid= numpy.zeros((len(self._rgrid),len(self._zgrid)))
-                for ii in range(len(self._rgrid)):
-                    for jj in range(len(self._zgrid)):
-                        zforceGrid[ii,jj]= evaluatezforces(self._origPot,self._rgrid[ii],self._zgrid[jj])
-                self._zforceGrid= zforceGrid
-            if self._logR:
-                self._zforceInterp= interpolate.RectBivariateSpline(self._logrgrid,
-                                                                    self._zgrid,
-                                                                    self._zforceGrid,
-                                                                    kx=3,ky=3,s=0.)
-            else:
-                self._zforceInterp= interpolate.RectBivariateSpline(self._rgrid,
-                                                                    self._zgrid,
-                                                                    self._zforceGrid,
-                                                                    kx=3,ky=3,s=0.)
-            if enable_c*ext_loaded:
-                self._zforceGrid_splinecoeffs= calc_2dsplinecoeffs_c(self._zforceGrid)
-        if interpDens:
-            from ..potential import evaluateDensities
-            densGrid= numpy.zeros((len(self._rgrid),len(self._zgrid)))
-            for ii in range(len(self._rgrid)):
-                for jj in range(len(self._zgrid)):
-                    densGrid[ii,jj]= evaluateDensities(self._origPot,self._rgrid[ii],self._zgrid[jj])
-            self._densGrid= densGrid
-            if self._logR:
-                self._densInterp= interpolate.RectBivariateSpline(self._logrgrid,
-                                                                  self._zgrid,
-                                                                  numpy.log(self._densGrid+10.**-10.),
-                                                                  kx=3,ky=3,s=0.)
-            else:
-                self._densInterp= interpolate.RectBivariateSpline(self._rgrid,
-                                                                  self._zgrid,
-                                                                  numpy.log(self._densGrid+10.**-10.),
-                                                                  kx=3,ky=3,s=0.)
-        if interpvcirc:
-            from ..potential import vcirc
-            if not numcores is None:
-                self._vcircGrid= multi.parallel_map((lambda x: vcirc(self._origPot,self._rgrid[x])),
-                                                    list(range(len(self._rgrid))),numcores=numcores)
-            else:
-                self._vcircGrid= numpy.array([vcirc(self._origPot,r) for r in self._rgrid])
-            if self._logR:
-                self._vcircInterp= interpolate.InterpolatedUnivariateSpline(self._logrgrid,self._vcircGrid,k=3)
-            else:
-                self._vcircInterp= interpolate.InterpolatedUnivariateSpline(self._rgrid,self._vcircGrid,k=3)
-        if interpdvcircdr:
-            from ..potential import dvcircdR
-            if not numcores is None:
-                self._dvcircdrGrid= multi.parallel_map((lambda x: dvcircdR(self._origPot,self._rgrid[x])),
-                                                       list(range(len(self._rgrid))),numcores=numcores)
-            else:
-                self._dvcircdrGrid= numpy.array([dvcircdR(self._origPot,r) for r in self._rgrid])
-            if self._logR:
-                self._dvcircdrInterp= interpolate.InterpolatedUnivariateSpline(self._logrgrid,self._dvcircdrGrid,k=3)
-            else:
-                self._dvcircdrInterp= interpolate.InterpolatedUnivariateSpline(self._rgrid,self._dvcircdrGrid,k=3)
-        if interpepifreq:
-            from ..potential import epifreq
-            if not numcores is None:
-                self._epifreqGrid= numpy.array(multi.parallel_map((lambda x: epifreq(self._origPot,self._rgrid[x])),
-                                                      list(range(len(self._rgrid))),numcores=numcores))
-            else:
-                self._epifreqGrid= numpy.array([epifreq(self._origPot,r) for r in self._rgrid])
+        # Compute the tables or load them from the cache
+        tables= cached(lambda: self._calc_tables(use_c*ext_loaded,numcores),
+                       cache,'interpRZPotential',self._origPot,
+                       self._rgrid,self._zgrid,self._logR,self._zsym,
+                       self._interpPot,self._interpRforce,self._interpzforce,
+                       self._interpDens,self._interpvcirc,
+                       self._interpdvcircdr,self._interpepifreq,
+                       self._interpverticalfreq,bool(self._enable_c))
+        for name in tables:
+            setattr(self,'_'+name,tables[name])
+        self._setup_interpolations()
+        return None
+
+    def _calc_tables(self,use_c,numcores):
+        """Compute all of the requested tables on the grid (and their C spline coefficients); use_c= compute the potential, forces, and vcirc in a single parallel pass in C"""
+        from ..potential import evaluatePotentials, evaluateRforces, \
+            evaluatezforces, evaluateDensities, vcirc, dvcircdR, epifreq, \
+            verticalfreq
+        out= {}
+        if use_c and (self._interpPot or self._interpRforce
+                      or self._interpzforce or self._interpvcirc):
+            out.update(calc_grids_c(self._origPot,self._rgrid,self._zgrid,
+                                    potential=self._interpPot,
+                                    rforce=self._interpRforce,
+                                    zforce=self._interpzforce,
+                                    vcirc=self._interpvcirc,
+                                    numcores=numcores)[0])
+        for name,func,interp in \
+                [('potGrid',evaluatePotentials,self._interpPot),
+                 ('rforceGrid',evaluateRforces,self._interpRforce),
+                 ('zforceGrid',evaluatezforces,self._interpzforce),
+                 ('densGrid',evaluateDensities,self._interpDens)]:
+            if interp and not name in out:
+                out[name]= _grid_eval(lambda R,z: func(self._origPot,R,z),
+                                      self._rgrid,self._zgrid)
+        for name,func,interp in \
+                [('vcircGrid',vcirc,self._interpvcirc),
+                 ('dvcircdrGrid',dvcircdR,self._interpdvcircdr),
+                 ('epifreqGrid',epifreq,self._interpepifreq),
+                 ('verticalfreqGrid',verticalfreq,self._interpverticalfreq)]:
+            if interp and not name in out:
+                out[name]= _table_eval(lambda R: func(self._origPot,R),
+                                       self._rgrid,numcores)
+        if self._enable_c:
+            for name in ['potGrid','rforceGrid','zforceGrid']:
+                if name in out:
+                    out[name+'_splinecoeffs']= calc_2dsplinecoeffs_c(out[name])
+        return out
+
+    def _setup_interpolations(self):
+        """Set up the spline interpolations of all tables"""
+        if self._logR:
+            rs= self._logrgrid
+        else:
+            rs= self._rgrid
+        if self._interpPot:
+            self._potInterp= interpolate.RectBivariateSpline(rs,self._zgrid,
+                                                             self._potGrid,
+                                                             kx=3,ky=3,s=0.)
+        if self._interpRforce:
+            self._rforceInterp= interpolate.RectBivariateSpline(rs,
+                                                                self._zgrid,
+                                                                self._rforceGrid,
+                                                                kx=3,ky=3,s=0.)
+        if self._interpzforce:
+            self._zforceInterp= interpolate.RectBivariateSpline(rs,
+                                                                self._zgrid,
+                                                                self._zforceGrid,
+                                                                kx=3,ky=3,s=0.)
+        if self._interpDens:
+            self._densInterp= interpolate.RectBivariateSpline(rs,self._zgrid,
+                                                              numpy.log(self._densGrid+10.**-10.),
+                                                              kx=3,ky=3,s=0.)
+        if self._interpvcirc:
+            self._vcircInterp= interpolate.InterpolatedUnivariateSpline(rs,self._vcircGrid,k=3)
+        if self._interpdvcircdr:
+            self._dvcircdrInterp= interpolate.InterpolatedUnivariateSpline(rs,self._dvcircdrGrid,k=3)
+        if self._interpepifreq:
             indx= True^numpy.isnan(self._epifreqGrid)
             if numpy.sum(indx) < 4:
-                if self._logR:
-                    self._epifreqInterp= interpolate.InterpolatedUnivariateSpline(self._logrgrid[indx],self._epifreqGrid[indx],k=1)
-                else:
-                    self._epifreqInterp= interpolate.InterpolatedUnivariateSpline(self._rgrid[indx],self._epifreqGrid[indx],k=1)
+                self._epifreqInterp= interpolate.InterpolatedUnivariateSpline(rs[indx],self._epifreqGrid[indx],k=1)
             else:
-                if self._logR:
-                    self._epifreqInterp= interpolate.InterpolatedUnivariateSpline(self._logrgrid[indx],self._epifreqGrid[indx],k=3)
-                else:
-                    self._epifreqInterp= interpolate.InterpolatedUnivariateSpline(self._rgrid[indx],self._epifreqGrid[indx],k=3)
-        if interpverticalfreq:
-            from ..potential import verticalfreq
-            if not numcores is None:
-                self._verticalfreqGrid= multi.parallel_map((lambda x: verticalfreq(self._origPot,self._rgrid[x])),
-                                                       list(range(len(self._rgrid))),numcores=numcores)
-            else:
-                self._verticalfreqGrid= numpy.array([verticalfreq(self._origPot,r) for r in self._rgrid])
-            if self._logR:
-                self._verticalfreqInterp= interpolate.InterpolatedUnivariateSpline(self._logrgrid,self._verticalfreqGrid,k=3)
-            else:
-                self._verticalfreqInterp= interpolate.InterpolatedUnivariateSpline(self._rgrid,self._verticalfreqGrid,k=3)
+                self._epifreqInterp= interpolate.InterpolatedUnivariateSpline(rs[indx],self._epifreqGrid[indx],k=3)
+        if self._interpverticalfreq:
+            self._verticalfreqInterp= interpolate.InterpolatedUnivariateSpline(rs,self._verticalfreqGrid,k=3)
+        return None
+
+    # When pickling or serializing, only store the tables and re-compute
+    # the spline interpolations when loading
+    def __getstate__(self):
+        return dict((k,v) for k,v in self.__dict__.items()
+                    if not k in _INTERP_ATTRIBUTES)
+
+    def __setstate__(self,state):
+        self.__dict__.update(state)
+        self._setup_interpolations()
         return None
-                                                 
+
     @scalarVectorDecorator
     @zsymDecorator(False)
     def _evaluate(self,R,z,phi=0.,t=0.):
@@ -474,6 +444,113 @@ class interpRZPotential(Potential):
         else:
             return verticalfreq(self._origPot,R)
     
+def _grid_eval(func,R,z):
+    """Evaluate func(R,z) on the grid R x z, looping over the grid for potentials that do not accept array input"""
+    mR, mz= numpy.meshgrid(R,z,indexing='ij')
+    try:
+        out= numpy.asarray(func(mR.flatten(),mz.flatten()),dtype=float)
+        return out.reshape(mR.shape)
+    except (TypeError,ValueError):
+        out= numpy.empty(mR.shape)
+        for ii in range(len(R)):
+            for jj in range(len(z)):
+                out[ii,jj]= func(R[ii],z[jj])
+        return out
+
+def _table_eval(func,R,numcores):
+    """Evaluate func(R) on the grid R, looping (in parallel if numcores is set) over the grid for potentials that do not accept array input"""
+    try:
+        return numpy.asarray(func(R),dtype=float)*numpy.ones_like(R)
+    except (TypeError,ValueError):
+        if not numcores is None:
+            return numpy.array(multi.parallel_map((lambda x: func(R[x])),
+                                                  list(range(len(R))),
+                                                  numcores=numcores))
+        else:
+            return numpy.array([func(r) for r in R])
+
+def calc_grids_c(pot,R,z,potential=True,rforce=False,zforce=False,
+                 vcirc=False,numcores=None):
+    """
+    NAME:
+       calc_grids_c
+    PURPOSE:
+       Use C to calculate the potential, forces, and circular velocity on a grid in a single (OpenMP parallel) pass through the grid
+    INPUT:
+       pot - Potential or list of such instances
+       R - grid in R
+       z - grid in z
+       potential=, rforce=, zforce=, vcirc= if True, calculate the potential, radial force, vertical force, and/or circular velocity (at z=0)
+       numcores= (None) number of OpenMP threads to use (default: all available)
+    OUTPUT:
+       (dictionary with the requested tables as potGrid, rforceGrid, zforceGrid, vcircGrid,error)
+    HISTORY:
+       2026-10-19 - Written - agent
+    """
+    from ..orbit.integrateFullOrbit import _parse_pot #here bc otherwise there is an infinite loop
+    #Parse the potential
+    npot, pot_type, pot_args= _parse_pot(pot)
+
+    #Set up result arrays (only allocated for the requested tables)
+    potout= numpy.zeros((len(R),len(z)) if potential else 1)
+    rforceout= numpy.zeros((len(R),len(z)) if rforce else 1)
+    zforceout= numpy.zeros((len(R),len(z)) if zforce else 1)
+    vcircout= numpy.zeros(len(R) if vcirc else 1)
+    err= ctypes.c_int(0)
+
+    #Set up the C code
+    ndarrayFlags= ('C_CONTIGUOUS','WRITEABLE')
+    interppotential_calc_gridsFunc= _lib.calc_grids
+    interppotential_calc_gridsFunc.argtypes= [ctypes.c_int,
+                                              ndpointer(dtype=numpy.float64,flags=ndarrayFlags),
+                                              ctypes.c_int,
+                                              ndpointer(dtype=numpy.float64,flags=ndarrayFlags),
+                                              ctypes.c_int,
+                                              ndpointer(dtype=numpy.int32,flags=ndarrayFlags),
+                                              ndpointer(dtype=numpy.float64,flags=ndarrayFlags),
+                                              ctypes.c_int,
+                                              ctypes.c_int,
+                                              ctypes.c_int,
+                                              ctypes.c_int,
+                                              ctypes.c_int,
+                                              ndpointer(dtype=numpy.float64,flags=ndarrayFlags),
+                                              ndpointer(dtype=numpy.float64,flags=ndarrayFlags),
+                                              ndpointer(dtype=numpy.float64,flags=ndarrayFlags),
+                                              ndpointer(dtype=numpy.float64,flags=ndarrayFlags),
+                                              ctypes.POINTER(ctypes.c_int)]
+
+    #Array requirements
+    R= numpy.require(R,dtype=numpy.float64,requirements=['C','W'])
+    z= numpy.require(z,dtype=numpy.float64,requirements=['C','W'])
+
+    #Run the C code
+    interppotential_calc_gridsFunc(len(R),
+                                   R,
+                                   len(z),
+                                   z,
+                                   ctypes.c_int(npot),
+                                   pot_type,
+                                   pot_args,
+                                   ctypes.c_int(0 if numcores is None
+                                                else numcores),
+                                   ctypes.c_int(potential),
+                                   ctypes.c_int(rforce),
+                                   ctypes.c_int(zforce),
+                                   ctypes.c_int(vcirc),
+                                   potout,
+                                   rforceout,
+                                   zforceout,
+                                   vcircout,
+                                   ctypes.byref(err))
+
+    out= {}
+    for name,grid,calc in [('potGrid',potout,potential),
+                           ('rforceGrid',rforceout,rforce),
+                           ('zforceGrid',zforceout,zforce),
+                           ('vcircGrid',vcircout,vcirc)]:
+        if calc: out[name]= grid
+    return (out,err.value)
+
 def calc_potential_c(pot,R,z,rforce=False,zforce=False):
     """
     NAME:
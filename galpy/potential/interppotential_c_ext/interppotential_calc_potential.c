@@ -201,3 +201,52 @@ EXPORT void eval_zforce(int nR,
   free_potentialArgs(npot,potentialArgs);
   free(potentialArgs);
 }
+EXPORT void calc_grids(int nR,
+		       double *R,
+		       int nz,
+		       double *z,
+		       int npot,
+		       int * pot_type,
+		       double * pot_args,
+		       int nthreads,
+		       int dopot,
+		       int dorforce,
+		       int dozforce,
+		       int dovcirc,
+		       double *potout,
+		       double *rforceout,
+		       double *zforceout,
+		       double *vcircout,
+		       int * err){
+  // Calculate all requested tables in a single pass through the R grid
+  int ii, jj;
+  //Set up the potentials
+  struct potentialArg * potentialArgs= (struct potentialArg *) malloc ( npot * sizeof (struct potentialArg) );
+  parse_leapFuncArgs_Full(npot,potentialArgs,&pot_type,&pot_args);
+#ifdef _OPENMP
+  if ( nthreads <= 0 ) nthreads= omp_get_max_threads();
+#endif
+  //Run through the grid and calculate
+  UNUSED int chunk= CHUNKSIZE;
+#pragma omp parallel for num_threads(nthreads) schedule(dynamic,chunk) \
+  private(ii,jj) \
+  shared(npot,potentialArgs,R,z,nR,nz)
+  for (ii=0; ii < nR; ii++){
+    for (jj=0; jj < nz; jj++){
+      if ( dopot )
+	*(potout+ii*nz+jj)= evaluatePotentials(*(R+ii),*(z+jj),
+					       npot,potentialArgs);
+      if ( dorforce )
+	*(rforceout+ii*nz+jj)= calcRforce(*(R+ii),*(z+jj),0.,0.,
+					  npot,potentialArgs);
+      if ( dozforce )
+	*(zforceout+ii*nz+jj)= calczforce(*(R+ii),*(z+jj),0.,0.,
+					  npot,potentialArgs);
+    }
+    if ( dovcirc )
+      *(vcircout+ii)= sqrt ( - *(R+ii) * calcRforce(*(R+ii),0.,0.,0.,
+						    npot,potentialArgs) );
+  }
+  free_potentialArgs(npot,potentialArgs);
+  free(potentialArgs);
+}
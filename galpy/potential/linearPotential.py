@@ -6,6 +6,7 @@ import pickle
 import numpy
 from ..util import bovy_plot as plot
 from ..util import config
+from ..util import serialize
 from .Potential import PotentialError, flatten
 from ..util.bovy_conversion import physical_conversion,\
     potential_physical_input, physical_compatible
@@ -189,6 +190,31 @@ class linearPotential(object):
             self._vo= vo
         return None
 
+    def to_bytes(self):
+        """
+        NAME:
+
+           to_bytes
+
+        PURPOSE:
+
+           serialize the potential to a compact byte string, e.g., to send it to other processes (load with galpy.potential.from_bytes; only works with the same Python and galpy versions)
+
+        INPUT:
+
+           (none)
+
+        OUTPUT:
+
+           bytes
+
+        HISTORY:
+
+           2026-10-19 - Written - agent
+
+        """
+        return serialize.dumps(self)
+
     @potential_physical_input
     @physical_conversion('energy',pop=True)
     def __call__(self,x,t=0.):
@@ -7,6 +7,7 @@ import numpy
 from scipy import integrate
 from ..util import bovy_plot as plot
 from ..util import config
+from ..util import serialize
 from ..util.bovy_conversion import physical_conversion,\
     potential_physical_input, freq_in_Gyr, physical_compatible
 from .Potential import Potential, PotentialError, lindbladR, flatten
@@ -193,6 +194,31 @@ class planarPotential(object):
             self._vo= vo
         return None
 
+    def to_bytes(self):
+        """
+        NAME:
+
+           to_bytes
+
+        PURPOSE:
+
+           serialize the potential to a compact byte string, e.g., to send it to other processes (load with galpy.potential.from_bytes; only works with the same Python and galpy versions)
+
+        INPUT:
+
+           (none)
+
+        OUTPUT:
+
+           bytes
+
+        HISTORY:
+
+           2026-10-19 - Written - agent
+
+        """
+        return serialize.dumps(self)
+
     @potential_physical_input
     @physical_conversion('energy',pop=True)
     def __call__(self,R,phi=0.,t=0.,dR=0,dphi=0):
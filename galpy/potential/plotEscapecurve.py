@@ -185,6 +185,9 @@ def vesc(Pot,R,t=0.):
     """
     from ..potential import evaluateplanarPotentials
     from ..potential import PotentialError
+    from .Potential import _use_circular_cache, _circular_cached
+    if _use_circular_cache(Pot,t):
+        return numpy.sqrt(_circular_cached(Pot,'vesc2',R))
     try:
         return numpy.sqrt(2.*(evaluateplanarPotentials(Pot,_INF,t=t,use_physical=False)-evaluateplanarPotentials(Pot,R,t=t,use_physical=False)))
     except PotentialError:
@@ -201,6 +201,9 @@ def vcirc(Pot,R,phi=None,t=0.):
     """
     from ..potential import evaluateplanarRforces
     from ..potential import PotentialError
+    from .Potential import _use_circular_cache, _circular_cached
+    if _use_circular_cache(Pot,t,phi=phi):
+        return numpy.sqrt(_circular_cached(Pot,'vc2',R))
     try:
         return numpy.sqrt(-R*evaluateplanarRforces(Pot,R,phi=phi,t=t,
                                                 use_physical=False))
@@ -246,7 +249,10 @@ def dvcircdR(Pot,R,phi=None,t=0.):
     """
     from ..potential import evaluateplanarRforces, evaluateplanarR2derivs
     from ..potential import PotentialError
+    from .Potential import _use_circular_cache, _circular_cached
     tvc= vcirc(Pot,R,phi=phi,t=t,use_physical=False)
+    if _use_circular_cache(Pot,t,phi=phi):
+        return 0.5*_circular_cached(Pot,'dvc2dR',R)/tvc
     try:
         return 0.5*(-evaluateplanarRforces(Pot,R,phi=phi,t=t,use_physical=False)+R*evaluateplanarR2derivs(Pot,R,phi=phi,t=t,use_physical=False))/tvc
     except PotentialError:
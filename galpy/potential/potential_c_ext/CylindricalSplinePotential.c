@@ -0,0 +1,130 @@
+#include <math.h>
+#include <galpy_potentials.h>
+#include <cubic_bspline_2d_interpol.h>
+//CylindricalSplinePotential
+//Arguments: amp, nR, nz, npad, Rmin, Rmax, zmin, zmax, mmax, mass,
+//           (mmax+1) x (nR+2npad) x (nz+2npad) cosine and sine spline
+//           coefficients on the grid extended by npad points on each side
+//Helper function that sums the harmonics for the potential (deriv=0), or its
+//R (deriv=1), z (deriv=2), or phi (deriv=3) derivative inside of the grid;
+//returns 0 if the point is outside of the grid
+int CylindricalSplinePotentialSum(double R,double z,double phi,
+				  double * args,int deriv,double * out){
+  int ii;
+  //Get args
+  int nR= (int) *args++;
+  int nz= (int) *args++;
+  int npad= (int) *args++;
+  double Rmin= *args++;
+  double Rmax= *args++;
+  double zmin= *args++;
+  double zmax= *args++;
+  int mmax= (int) *args++;
+  args++; // mass
+  double * cosCoeffs= args;
+  double x, y, val= 0., dR, dz;
+  if ( R > Rmax || z < zmin || z > zmax )
+    return 0;
+  dR= (Rmax-Rmin)/(nR-1);
+  dz= (zmax-zmin)/(nz-1);
+  x= (R-Rmin)/dR+npad;
+  y= (z-zmin)/dz+npad;
+  nR+= 2*npad;
+  nz+= 2*npad;
+  double * sinCoeffs= args+(mmax+1)*nR*nz;
+  *out= 0.;
+  for (ii=0; ii < mmax+1; ii++){
+    switch ( deriv ) {
+    case 0:
+      val= cubic_bspline_2d_interpol(cosCoeffs+ii*nR*nz,nR,nz,x,y)*cos(ii*phi);
+      if ( ii > 0 )
+	val+= cubic_bspline_2d_interpol(sinCoeffs+ii*nR*nz,nR,nz,x,y)
+	  *sin(ii*phi);
+      break;
+    case 1:
+      val= cubic_bspline_2d_interpol_dx(cosCoeffs+ii*nR*nz,nR,nz,x,y)
+	*cos(ii*phi);
+      if ( ii > 0 )
+	val+= cubic_bspline_2d_interpol_dx(sinCoeffs+ii*nR*nz,nR,nz,x,y)
+	  *sin(ii*phi);
+      val/= dR;
+      break;
+    case 2:
+      val= cubic_bspline_2d_interpol_dy(cosCoeffs+ii*nR*nz,nR,nz,x,y)
+	*cos(ii*phi);
+      if ( ii > 0 )
+	val+= cubic_bspline_2d_interpol_dy(sinCoeffs+ii*nR*nz,nR,nz,x,y)
+	  *sin(ii*phi);
+      val/= dz;
+      break;
+    case 3:
+      if ( ii == 0 ) continue;
+      val= ii*(cubic_bspline_2d_interpol(sinCoeffs+ii*nR*nz,nR,nz,x,y)
+	       *cos(ii*phi)
+	       -cubic_bspline_2d_interpol(cosCoeffs+ii*nR*nz,nR,nz,x,y)
+	       *sin(ii*phi));
+      break;
+    }
+    *out+= val;
+  }
+  return 1;
+}
+double CylindricalSplinePotentialEval(double R,double z, double phi,
+				      double t,
+				      struct potentialArg * potentialArgs){
+  double * args= potentialArgs->args;
+  //Get args
+  double amp= *args++;
+  double mass= *(args+8);
+  double out;
+  if ( CylindricalSplinePotentialSum(R,z,phi,args,0,&out) )
+    return amp * out;
+  else
+    return - amp * mass / sqrt ( R * R + z * z );
+}
+double CylindricalSplinePotentialRforce(double R,double z, double phi,
+					double t,
+					struct potentialArg * potentialArgs){
+  double * args= potentialArgs->args;
+  //Get args
+  double amp= *args++;
+  double mass= *(args+8);
+  double out;
+  if ( CylindricalSplinePotentialSum(R,z,phi,args,1,&out) )
+    return - amp * out;
+  else
+    return - amp * mass * R / pow ( R * R + z * z , 1.5 );
+}
+double CylindricalSplinePotentialzforce(double R,double z, double phi,
+					double t,
+					struct potentialArg * potentialArgs){
+  double * args= potentialArgs->args;
+  //Get args
+  double amp= *args++;
+  double mass= *(args+8);
+  double out;
+  if ( CylindricalSplinePotentialSum(R,z,phi,args,2,&out) )
+    return - amp * out;
+  else
+    return - amp * mass * z / pow ( R * R + z * z , 1.5 );
+}
+double CylindricalSplinePotentialphiforce(double R,double z, double phi,
+					  double t,
+					  struct potentialArg * potentialArgs){
+  double * args= potentialArgs->args;
+  //Get args
+  double amp= *args++;
+  double out;
+  if ( CylindricalSplinePotentialSum(R,z,phi,args,3,&out) )
+    return - amp * out;
+  else
+    return 0.;
+}
+double CylindricalSplinePotentialPlanarRforce(double R,double phi,double t,
+					      struct potentialArg * potentialArgs){
+  return CylindricalSplinePotentialRforce(R,0.,phi,t,potentialArgs);
+}
+double CylindricalSplinePotentialPlanarphiforce(double R,double phi,double t,
+						struct potentialArg * potentialArgs){
+  return CylindricalSplinePotentialphiforce(R,0.,phi,t,potentialArgs);
+}
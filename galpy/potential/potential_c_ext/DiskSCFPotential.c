@@ -17,13 +17,19 @@
 //
 //         0= exponential: amp x exp(-R/h)
 //         1= exponential w/ hole: amp x exp(-Rhole/R-R/h)
+//         2= tabulated: amp x cubic spline of Sigma, dSigma/dR, d2Sigma/dR2
+//            (spline1d 0-2); zero beyond the tabulated range
 //
 //      Vertical profile is passed by type:
 //
 //         0= exponential: exp(-|z|/h)/[2h]
 //         1= sech2: sech^2(z/[2h])/[4h]
+//         2= tabulated: cubic spline of h, H, dH/dz (spline1d 0-2 or 3-5,
+//            depending on whether Sigma is tabulated); H is linearly
+//            extrapolated beyond the tabulated range
 //
 ///////////////////////////////////////////////////////////////////////////////
+#include <stdlib.h>
 #include <math.h>
 #include <galpy_potentials.h>
 #ifndef M_LN2
@@ -31,19 +37,51 @@
 #endif
 //DiskSCFPotential
 //Only the part coming from a single approximation pair
-// Arguments: nsigma_args,sigma_type,sigma_amp,sigma_h[,sigma_rhole],
+// Arguments: nsigma_args,sigma_type,sigma_amp[,sigma_h,sigma_rhole],
 //            hz_type,hz_h
-double Sigma(double R,double * Sigma_args){
+// followed in pot_args (but not in args) by the tabulated profiles for
+// type 2, which are turned into splines by initDiskSCFSplines
+double DiskSCFSigmaSpline(double R,int deriv,
+			  struct potentialArg * potentialArgs){
+  gsl_spline * spline= *(potentialArgs->spline1d+deriv);
+  if ( R > spline->interp->xmax )
+    return 0.;
+  else if ( R < spline->interp->xmin )
+    R= spline->interp->xmin;
+  return gsl_spline_eval(spline,R,*(potentialArgs->acc1d+deriv));
+}
+double DiskSCFhzSpline(double z,int deriv,
+		       struct potentialArg * potentialArgs){
+  int offset= ( (int) *(potentialArgs->args+1) == 2 ) ? 3 : 0;
+  gsl_spline * spline= *(potentialArgs->spline1d+offset+deriv);
+  double zedge;
+  if ( z > spline->interp->xmax || z < spline->interp->xmin ) {
+    // h = 0 and H linear outside of the tabulated range
+    if ( deriv == 0 ) return 0.;
+    zedge= ( z > spline->interp->xmax ) ? spline->interp->xmax		      : spline->interp->xmin;
+    if ( deriv == 2 )
+      return gsl_spline_eval(spline,zedge,
+			     *(potentialArgs->acc1d+offset+deriv));
+    return gsl_spline_eval(spline,zedge,*(potentialArgs->acc1d+offset+1))
+      + ( z - zedge ) * DiskSCFhzSpline(zedge,2,potentialArgs);
+  }
+  return gsl_spline_eval(spline,z,*(potentialArgs->acc1d+offset+deriv));
+}
+double Sigma(double R,double * Sigma_args,
+	     struct potentialArg * potentialArgs){
   int Sigma_type= (int) *Sigma_args;
   switch ( Sigma_type ) {
   case 0: // Pure exponential
     return *(Sigma_args+1) * exp(-R / *(Sigma_args+2) );
   case 1: // Exponential with central hole
     return *(Sigma_args+1) * exp(- *(Sigma_args+3) / R - R / *(Sigma_args+2) );
+  case 2: // Tabulated
+    return *(Sigma_args+1) * DiskSCFSigmaSpline(R,0,potentialArgs);
   }
   return -1; // LCOV_EXCL_LINE
 }
-double dSigmadR(double R,double * Sigma_args){
+double dSigmadR(double R,double * Sigma_args,
+	     struct potentialArg * potentialArgs){
   int Sigma_type= (int) *Sigma_args;
   switch ( Sigma_type ) {
   case 0: // Pure exponential
@@ -51,10 +89,13 @@ double dSigmadR(double R,double * Sigma_args){
   case 1: // Exponential with central hole
     return *(Sigma_args+1) * ( *(Sigma_args+3) / R / R - 1. / *(Sigma_args+2))\
       * exp(- *(Sigma_args+3) / R - R / *(Sigma_args+2) );
+  case 2: // Tabulated
+    return *(Sigma_args+1) * DiskSCFSigmaSpline(R,1,potentialArgs);
   }
   return -1; // LCOV_EXCL_LINE
 }
-double d2SigmadR2(double R,double * Sigma_args){
+double d2SigmadR2(double R,double * Sigma_args,
+	     struct potentialArg * potentialArgs){
   int Sigma_type= (int) *Sigma_args;
   switch ( Sigma_type ) {
   case 0: // Pure exponential
@@ -65,10 +106,13 @@ double d2SigmadR2(double R,double * Sigma_args){
 				    - 1. / *(Sigma_args+2) , 2 ) \
 			       -2. * *(Sigma_args+3) / R / R / R )\
       * exp(- *(Sigma_args+3) / R - R / *(Sigma_args+2) );
+  case 2: // Tabulated
+    return *(Sigma_args+1) * DiskSCFSigmaSpline(R,2,potentialArgs);
   }
   return -1; // LCOV_EXCL_LINE
 }
-double hz(double z,double * hz_args){
+double hz(double z,double * hz_args,
+	  struct potentialArg * potentialArgs){
   int hz_type= (int) *hz_args;
   double fz;
   switch ( hz_type ) {
@@ -78,10 +122,13 @@ double hz(double z,double * hz_args){
   case 1: // sech2
     return 0.25 * pow ( cosh ( 0.5 * z / *(hz_args+1) ) , -2 ) \
       / *(hz_args+1);
+  case 2: // Tabulated
+    return DiskSCFhzSpline(z,0,potentialArgs);
   }
   return -1; // LCOV_EXCL_LINE
 }
-double Hz(double z,double * hz_args){
+double Hz(double z,double * hz_args,
+	  struct potentialArg * potentialArgs){
   int hz_type= (int) *hz_args;
   double fz= fabs(z);
   switch ( hz_type ) {
@@ -91,10 +138,13 @@ double Hz(double z,double * hz_args){
   case 1: // sech2
     return *(hz_args+1) * ( log ( 1. + exp ( - fz / *(hz_args+1) ) )	\
 			    + 0.5 * fz / *(hz_args+1)  - M_LN2 );
+  case 2: // Tabulated
+    return DiskSCFhzSpline(z,1,potentialArgs);
   }
   return -1; // LCOV_EXCL_LINE
 }
-double dHzdz(double z,double * hz_args){
+double dHzdz(double z,double * hz_args,
+	  struct potentialArg * potentialArgs){
   int hz_type= (int) *hz_args;
   double fz;
   switch ( hz_type ) {
@@ -103,6 +153,8 @@ double dHzdz(double z,double * hz_args){
     return 0.5 * copysign ( 1. - exp ( - fz / *(hz_args+1) ) , z);
   case 1: // sech2
     return 0.5 * tanh ( 0.5 * z / *(hz_args+1) );
+  case 2: // Tabulated
+    return DiskSCFhzSpline(z,2,potentialArgs);
   }
   return -1; // LCOV_EXCL_LINE
 }
@@ -116,7 +168,7 @@ double DiskSCFPotentialEval(double R,double Z, double phi,
   double * hz_args= args+1+nsigma_args;
   //Calculate Rforce
   double r= sqrt( R * R + Z * Z );
-  return Sigma(r,Sigma_args) * Hz(Z,hz_args);
+  return Sigma(r,Sigma_args,potentialArgs) * Hz(Z,hz_args,potentialArgs);
 }
 double DiskSCFPotentialRforce(double R,double Z, double phi,
 			      double t,
@@ -128,7 +180,8 @@ double DiskSCFPotentialRforce(double R,double Z, double phi,
   double * hz_args= args+1+nsigma_args;
   //Calculate Rforce
   double r= sqrt( R * R + Z * Z );
-  return -dSigmadR(r,Sigma_args) * Hz(Z,hz_args) * R / r;
+  return -dSigmadR(r,Sigma_args,potentialArgs) * Hz(Z,hz_args,potentialArgs)
+    * R / r;
 }
 double DiskSCFPotentialPlanarRforce(double R,double phi,
 				    double t,
@@ -140,7 +193,8 @@ double DiskSCFPotentialPlanarRforce(double R,double phi,
   double * Sigma_args= args+1;
   double * hz_args= args+1+nsigma_args;
   //Calculate Rforce
-  return -dSigmadR(R,Sigma_args) * Hz(0.,hz_args);
+  return -dSigmadR(R,Sigma_args,potentialArgs)
+    * Hz(0.,hz_args,potentialArgs);
 }
 double DiskSCFPotentialzforce(double R,double Z, double phi,
 			      double t,
@@ -152,8 +206,9 @@ double DiskSCFPotentialzforce(double R,double Z, double phi,
   double * hz_args= args+1+nsigma_args;
   //Calculate Rforce
   double r= sqrt( R * R + Z * Z );
-  return -dSigmadR(r,Sigma_args) * Hz(Z,hz_args) * Z / r \
-    -Sigma(r,Sigma_args) * dHzdz(Z,hz_args);
+  return -dSigmadR(r,Sigma_args,potentialArgs) * Hz(Z,hz_args,potentialArgs)
+    * Z / r - Sigma(r,Sigma_args,potentialArgs)
+    * dHzdz(Z,hz_args,potentialArgs);
 }
 double DiskSCFPotentialDens(double R,double Z, double phi,
 			    double t,
@@ -165,8 +220,41 @@ double DiskSCFPotentialDens(double R,double Z, double phi,
   double * hz_args= args+1+nsigma_args;
   //Calculate Rforce
   double r= sqrt( R * R + Z * Z );
-  return M_1_PI / 4. * (Sigma(r,Sigma_args) * hz(Z,hz_args) 
-			+ d2SigmadR2(r,Sigma_args) * Hz(Z,hz_args)
-			+ 2. / r * dSigmadR(r,Sigma_args)	\
-			    * ( Hz(Z,hz_args) + Z * dHzdz(Z,hz_args) ) );
+  return M_1_PI / 4. * (Sigma(r,Sigma_args,potentialArgs)
+			* hz(Z,hz_args,potentialArgs)
+			+ d2SigmadR2(r,Sigma_args,potentialArgs)
+			* Hz(Z,hz_args,potentialArgs)
+			+ 2. / r * dSigmadR(r,Sigma_args,potentialArgs)	\
+			* ( Hz(Z,hz_args,potentialArgs)
+			    + Z * dHzdz(Z,hz_args,potentialArgs) ) );
   }
+void initDiskSCFSplines(struct potentialArg * potentialArgs,
+			double ** pot_args){
+  // Set up the splines for tabulated Sigma and/or hz profiles, stored
+  // as [npts,x,f,df,d2f] after the arguments of the potential
+  int ii, jj, nPts, nspline= 0;
+  int nsigma_args= (int) *potentialArgs->args;
+  int tabulated_Sigma= (int) *(potentialArgs->args+1) == 2;
+  int tabulated_hz= (int) *(potentialArgs->args+1+nsigma_args) == 2;
+  double * x;
+  potentialArgs->nspline1d= 3 * ( tabulated_Sigma + tabulated_hz );
+  if ( potentialArgs->nspline1d == 0 )
+    return;
+  potentialArgs->spline1d= (gsl_spline **) \
+    malloc ( potentialArgs->nspline1d*sizeof ( gsl_spline *) );
+  potentialArgs->acc1d= (gsl_interp_accel **) \
+    malloc ( potentialArgs->nspline1d * sizeof ( gsl_interp_accel * ) );
+  for (ii=0; ii < tabulated_Sigma + tabulated_hz; ii++) {
+    nPts= (int) *(*pot_args)++;
+    x= *pot_args;
+    for (jj=0; jj < 3; jj++) {
+      *(potentialArgs->acc1d+nspline)= gsl_interp_accel_alloc();
+      *(potentialArgs->spline1d+nspline)= \
+	gsl_spline_alloc(gsl_interp_cspline,nPts);
+      gsl_spline_init(*(potentialArgs->spline1d+nspline),x,
+		      x+(jj+1)*nPts,nPts);
+      nspline++;
+    }
+    *pot_args+= 4*nPts;
+  }
+}
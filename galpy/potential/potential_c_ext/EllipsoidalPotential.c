@@ -22,6 +22,75 @@ static inline void rotate_force(double *Fx, double *Fy, double *Fz,
   *Fy= Fyp;
   *Fz= Fzp;
 }
+//Number of arguments: amp, 6 cached values, npsi, psi args [npsi], b2, c2,
+//aligned, rot [9], glorder, glx [glorder], glw [glorder], tabulated, and, if
+//tabulated, lnrmin, lnrmax, nr, nu, nv, table [nr,nu,nv,3]
+int EllipsoidalPotentialnargs(double * args){
+  int npsi= (int) *(args+7);
+  int glorder= (int) *(args+20+npsi);
+  double * tabargs= args + 21 + npsi + 2 * glorder;
+  if ( (bool) *tabargs )
+    return 27 + npsi + 2 * glorder
+      + 3 * (int) *(tabargs+3) * (int) *(tabargs+4) * (int) *(tabargs+5);
+  else
+    return 22 + npsi + 2 * glorder;
+}
+//6-point Lagrange interpolation weights at fractional grid index q on a grid
+//of n points
+static inline void lagrange6(double q,int n,int * i0,double * w){
+  double p, d01, d23, d45;
+  *i0= (int) floor ( q ) - 2;
+  if ( *i0 > n - 6 ) *i0= n - 6;
+  if ( *i0 < 0 ) *i0= 0;
+  p= q - *i0;
+  d01= p * ( p - 1. );
+  d23= ( p - 2. ) * ( p - 3. );
+  d45= ( p - 4. ) * ( p - 5. );
+  *w= - ( p - 1. ) * d23 * d45 / 120.;
+  *(w+1)= p * d23 * d45 / 24.;
+  *(w+2)= - d01 * ( p - 3. ) * d45 / 12.;
+  *(w+3)= d01 * ( p - 2. ) * d45 / 12.;
+  *(w+4)= - d01 * d23 * ( p - 5. ) / 24.;
+  *(w+5)= d01 * d23 * ( p - 4. ) / 120.;
+}
+//Interpolate the tabulated ln(-F_i/x_i) in (ln r, z^2/r^2, y^2/R^2); returns
+//false if r is outside of the range of the table
+static inline bool EllipsoidalPotentialTableForces(double x,double y,double z,
+						   double * Fx,double * Fy,
+						   double * Fz,double * tabargs){
+  int jj, kk, ll, ir, iu, iv;
+  double lnrmin= *tabargs;
+  double lnrmax= *(tabargs+1);
+  int nr= (int) *(tabargs+2);
+  int nu= (int) *(tabargs+3);
+  int nv= (int) *(tabargs+4);
+  double * table;
+  double R2= x * x + y * y;
+  double r2= R2 + z * z;
+  double lnr, wr[6], wu[6], wv[6], wru, w, g[3]= {0.,0.,0.};
+  if ( r2 == 0. ) return false;
+  lnr= 0.5 * log ( r2 );
+  if ( lnr < lnrmin || lnr > lnrmax ) return false;
+  lagrange6(( lnr - lnrmin ) / ( lnrmax - lnrmin ) * ( nr - 1 ),nr,&ir,wr);
+  lagrange6(z * z / r2 * ( nu - 1 ),nu,&iu,wu);
+  lagrange6(( R2 > 0. ) ? y * y / R2 * ( nv - 1 ) : 0.,nv,&iv,wv);
+  for (jj=0; jj < 6; jj++)
+    for (kk=0; kk < 6; kk++) {
+      wru= wr[jj] * wu[kk];
+      // The three components are stored next to each other
+      table= tabargs + 5 + 3 * ( ( ( ir + jj ) * nu + iu + kk ) * nv + iv );
+      for (ll=0; ll < 6; ll++) {
+	w= wru * wv[ll];
+	g[0]+= w * *table++;
+	g[1]+= w * *table++;
+	g[2]+= w * *table++;
+      }
+    }
+  *Fx= - x * exp ( g[0] );
+  *Fy= - y * exp ( g[1] );
+  *Fz= - z * exp ( g[2] );
+  return true;
+}
 double EllipsoidalPotentialEval(double R,double z, double phi,
 				double t,
 				struct potentialArg * potentialArgs){
@@ -72,22 +141,26 @@ void EllipsoidalPotentialxyzforces_xyz(double (*dens)(double m,
   int glorder= (int) *ellipargs++;
   double * glx= ellipargs;
   double * glw= ellipargs + glorder;
+  double * tabargs= ellipargs + 2 * glorder;
   //Setup caching
   *(args + 1)= x;
   *(args + 2)= y;
   *(args + 3)= z;
   if ( !aligned ) 
     rotate(&x,&y,&z,rot);
-  *Fx= 0.;
-  *Fy= 0.;
-  *Fz= 0.;
-  for (ii=0; ii < glorder; ii++) {
-    t= 1. / *(glx+ii) / *(glx+ii) - 1.;
-    td= *(glw+ii) * dens( sqrt ( x * x / ( 1. + t )	+ y * y / ( b2 + t ) \
-				 + z * z / ( c2 + t ) ),args+8);
-    *Fx+= td * x / ( 1. + t );
-    *Fy+= td * y / ( b2 + t );
-    *Fz+= td * z / ( c2 + t );
+  if ( !( (bool) *tabargs
+	  && EllipsoidalPotentialTableForces(x,y,z,Fx,Fy,Fz,tabargs+1) ) ) {
+    *Fx= 0.;
+    *Fy= 0.;
+    *Fz= 0.;
+    for (ii=0; ii < glorder; ii++) {
+      t= 1. / *(glx+ii) / *(glx+ii) - 1.;
+      td= *(glw+ii) * dens( sqrt ( x * x / ( 1. + t ) + y * y / ( b2 + t ) \
+				   + z * z / ( c2 + t ) ),args+8);
+      *Fx+= td * x / ( 1. + t );
+      *Fy+= td * y / ( b2 + t );
+      *Fz+= td * z / ( c2 + t );
+    }
   }
   if ( !aligned )
     rotate_force(Fx,Fy,Fz,rot);
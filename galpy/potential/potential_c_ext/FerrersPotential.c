@@ -0,0 +1,254 @@
+#include <math.h>
+#include <bovy_coords.h>
+#include <galpy_potentials.h>
+//FerrersPotential
+//Arguments: amp (= amp x pi x rho_c x a^3 b c), a2, b2 (= b^2 a^2),
+//           c2 (= c^2 a^2), n, omegab, pa, glorder, glx, glw,
+//           7 cached values (x,y,z,t,Fx,Fy,Fz)
+//The integrals over tau from lambda to infinity are computed with
+//Gauss-Legendre quadrature in s, with tau = (lambda+a2)/s^2-a2; when the
+//point is outside of the ellipsoid, s = 1-(1-v)^2 to remove the integrable
+//singularity of B^n at tau = lambda
+//Lower limit lambda of the integrals: positive root of
+//x^2/(a2+t)+y^2/(b2+t)+z^2/(c2+t) = 1 when outside, zero otherwise
+static inline double FerrersPotentialLowerlim(double x,double y,double z,
+					      double a2,double b2,double c2){
+  int ii;
+  double f, fp, dt;
+  double t= 0.;
+  if ( x * x / a2 + y * y / b2 + z * z / c2 <= 1. )
+    return 0.;
+  // Newton-Raphson from t=0 converges monotonically, because the function
+  // is decreasing and convex
+  for (ii=0; ii < 100; ii++) {
+    f= x * x / ( a2 + t ) + y * y / ( b2 + t ) + z * z / ( c2 + t ) - 1.;
+    fp= - x * x / ( a2 + t ) / ( a2 + t ) - y * y / ( b2 + t ) / ( b2 + t )
+      - z * z / ( c2 + t ) / ( c2 + t );
+    dt= - f / fp;
+    t+= dt;
+    if ( fabs ( dt ) <= 1e-15 * ( a2 + t ) ) break;
+  }
+  return t;
+}
+//Compute the quadrature nodes tau, the weights (including dtau/Delta), and
+//B at each node
+static inline void FerrersPotentialNode(double x,double y,double z,
+					double a2,double b2,double c2,
+					double lambda,double glx,double glw,
+					double * tau,double * w,double * B){
+  double s, ds;
+  if ( lambda > 0. ) {
+    s= 1. - ( 1. - glx ) * ( 1. - glx );
+    ds= 2. * ( 1. - glx );
+  }
+  else {
+    s= glx;
+    ds= 1.;
+  }
+  *tau= ( lambda + a2 ) / s / s - a2;
+  *w= glw * ds * 2. * ( lambda + a2 ) / s / s / s
+    / sqrt ( ( a2 + *tau ) * ( b2 + *tau ) * ( c2 + *tau ) );
+  *B= 1. - x * x / ( a2 + *tau ) - y * y / ( b2 + *tau )
+    - z * z / ( c2 + *tau );
+  if ( *B < 0. ) *B= 0.;
+}
+//Rotate from the inertial to the aligned frame
+static inline void FerrersPotentialAligned(double R,double phi,double t,
+					   double omegab,double pa,
+					   double * x,double * y){
+  cyl_to_rect(R,phi-pa-omegab*t,x,y);
+}
+double FerrersPotentialEval(double R,double z, double phi,
+			    double t,
+			    struct potentialArg * potentialArgs){
+  int ii;
+  double * args= potentialArgs->args;
+  //Get args
+  double amp= *args++;
+  double a2= *args++;
+  double b2= *args++;
+  double c2= *args++;
+  double n= *args++;
+  double omegab= *args++;
+  double pa= *args++;
+  int glorder= (int) *args++;
+  double * glx= args;
+  double * glw= args + glorder;
+  //Calculate potential
+  double x, y, lambda, tau, w, B;
+  double out= 0.;
+  FerrersPotentialAligned(R,phi,t,omegab,pa,&x,&y);
+  lambda= FerrersPotentialLowerlim(x,y,z,a2,b2,c2);
+  for (ii=0; ii < glorder; ii++) {
+    FerrersPotentialNode(x,y,z,a2,b2,c2,lambda,*(glx+ii),*(glw+ii),
+			 &tau,&w,&B);
+    out+= w * pow(B,n+1.);
+  }
+  return - amp * out / ( n + 1. );
+}
+//Forces in the inertial frame, (x,y,z) are the aligned coordinates
+void FerrersPotentialxyzforces(double x,double y,double z,double t,
+			       double * Fx,double * Fy,double * Fz,
+			       double * args){
+  int ii;
+  //Get args
+  double amp= *args;
+  double a2= *(args+1);
+  double b2= *(args+2);
+  double c2= *(args+3);
+  double n= *(args+4);
+  double omegab= *(args+5);
+  double pa= *(args+6);
+  int glorder= (int) *(args+7);
+  double * glx= args + 8;
+  double * glw= args + 8 + glorder;
+  double lambda, tau, w, B, Fxa, Fya, ang;
+  lambda= FerrersPotentialLowerlim(x,y,z,a2,b2,c2);
+  Fxa= 0.;
+  Fya= 0.;
+  *Fz= 0.;
+  for (ii=0; ii < glorder; ii++) {
+    FerrersPotentialNode(x,y,z,a2,b2,c2,lambda,*(glx+ii),*(glw+ii),
+			 &tau,&w,&B);
+    w*= pow(B,n);
+    Fxa+= w * x / ( a2 + tau );
+    Fya+= w * y / ( b2 + tau );
+    *Fz+= w * z / ( c2 + tau );
+  }
+  Fxa*= -2. * amp;
+  Fya*= -2. * amp;
+  *Fz*= -2. * amp;
+  // Rotate back to the inertial frame
+  ang= pa + omegab * t;
+  *Fx= cos ( ang ) * Fxa - sin ( ang ) * Fya;
+  *Fy= sin ( ang ) * Fxa + cos ( ang ) * Fya;
+}
+//Cached version of the forces
+static inline void FerrersPotentialForces(double R,double z,double phi,
+					  double t,double * Fx,double * Fy,
+					  double * Fz,double * args){
+  int glorder= (int) *(args+7);
+  double * cache= args + 8 + 2 * glorder;
+  double x, y;
+  if ( R == *cache && phi == *(cache+1) && z == *(cache+2) \
+       && t == *(cache+3) ) {
+    //LCOV_EXCL_START
+    *Fx= *(cache+4);
+    *Fy= *(cache+5);
+    *Fz= *(cache+6);
+    //LCOV_EXCL_STOP
+  }
+  else {
+    FerrersPotentialAligned(R,phi,t,*(args+5),*(args+6),&x,&y);
+    FerrersPotentialxyzforces(x,y,z,t,Fx,Fy,Fz,args);
+    *cache= R;
+    *(cache+1)= phi;
+    *(cache+2)= z;
+    *(cache+3)= t;
+    *(cache+4)= *Fx;
+    *(cache+5)= *Fy;
+    *(cache+6)= *Fz;
+  }
+}
+double FerrersPotentialRforce(double R,double z, double phi,
+			      double t,
+			      struct potentialArg * potentialArgs){
+  double Fx, Fy, Fz;
+  FerrersPotentialForces(R,z,phi,t,&Fx,&Fy,&Fz,potentialArgs->args);
+  return cos ( phi ) * Fx + sin ( phi ) * Fy;
+}
+double FerrersPotentialphiforce(double R,double z, double phi,
+				double t,
+				struct potentialArg * potentialArgs){
+  double Fx, Fy, Fz;
+  FerrersPotentialForces(R,z,phi,t,&Fx,&Fy,&Fz,potentialArgs->args);
+  return R * ( - sin ( phi ) * Fx + cos ( phi ) * Fy );
+}
+double FerrersPotentialzforce(double R,double z, double phi,
+			      double t,
+			      struct potentialArg * potentialArgs){
+  double Fx, Fy, Fz;
+  FerrersPotentialForces(R,z,phi,t,&Fx,&Fy,&Fz,potentialArgs->args);
+  return Fz;
+}
+double FerrersPotentialPlanarRforce(double R,double phi,double t,
+				    struct potentialArg * potentialArgs){
+  return FerrersPotentialRforce(R,0.,phi,t,potentialArgs);
+}
+double FerrersPotentialPlanarphiforce(double R,double phi,double t,
+				      struct potentialArg * potentialArgs){
+  return FerrersPotentialphiforce(R,0.,phi,t,potentialArgs);
+}
+//In-plane second derivatives d^2Phi/dx^2, d^2Phi/dxdy, d^2Phi/dy^2 in the
+//inertial frame
+static inline void FerrersPotentialPlanar2ndderivs(double R,double phi,
+						   double t,double * phixx,
+						   double * phixy,
+						   double * phiyy,
+						   double * args){
+  int ii;
+  //Get args
+  double amp= *args;
+  double a2= *(args+1);
+  double b2= *(args+2);
+  double c2= *(args+3);
+  double n= *(args+4);
+  double omegab= *(args+5);
+  double pa= *(args+6);
+  int glorder= (int) *(args+7);
+  double * glx= args + 8;
+  double * glw= args + 8 + glorder;
+  double x, y, lambda, tau, w, B, Bn1, Bn, c, s;
+  double phixxa= 0., phixya= 0., phiyya= 0.;
+  FerrersPotentialAligned(R,phi,t,omegab,pa,&x,&y);
+  lambda= FerrersPotentialLowerlim(x,y,0.,a2,b2,c2);
+  for (ii=0; ii < glorder; ii++) {
+    FerrersPotentialNode(x,y,0.,a2,b2,c2,lambda,*(glx+ii),*(glw+ii),
+			 &tau,&w,&B);
+    Bn1= n * pow(B,n-1.);
+    Bn= pow(B,n);
+    phixxa+= w * ( 4. * Bn1 * x * x / ( a2 + tau ) / ( a2 + tau )
+		   - 2. * Bn / ( a2 + tau ) );
+    phixya+= w * 4. * Bn1 * x * y / ( a2 + tau ) / ( b2 + tau );
+    phiyya+= w * ( 4. * Bn1 * y * y / ( b2 + tau ) / ( b2 + tau )
+		   - 2. * Bn / ( b2 + tau ) );
+  }
+  phixxa*= -amp;
+  phixya*= -amp;
+  phiyya*= -amp;
+  // Rotate back to the inertial frame
+  c= cos ( pa + omegab * t );
+  s= sin ( pa + omegab * t );
+  *phixx= c * c * phixxa + 2. * c * s * phixya + s * s * phiyya;
+  *phixy= ( c * c - s * s ) * phixya + c * s * ( phiyya - phixxa );
+  *phiyy= s * s * phixxa - 2. * c * s * phixya + c * c * phiyya;
+}
+double FerrersPotentialPlanarR2deriv(double R,double phi,double t,
+				     struct potentialArg * potentialArgs){
+  double phixx, phixy, phiyy;
+  FerrersPotentialPlanar2ndderivs(R,phi,t,&phixx,&phixy,&phiyy,
+				  potentialArgs->args);
+  return cos ( phi ) * cos ( phi ) * phixx + sin ( phi ) * sin ( phi ) * phiyy
+    + 2. * cos ( phi ) * sin ( phi ) * phixy;
+}
+double FerrersPotentialPlanarphi2deriv(double R,double phi,double t,
+				       struct potentialArg * potentialArgs){
+  double phixx, phixy, phiyy, Fx, Fy, Fz;
+  FerrersPotentialPlanar2ndderivs(R,phi,t,&phixx,&phixy,&phiyy,
+				  potentialArgs->args);
+  FerrersPotentialForces(R,0.,phi,t,&Fx,&Fy,&Fz,potentialArgs->args);
+  return R * R * ( sin ( phi ) * sin ( phi ) * phixx
+		   + cos ( phi ) * cos ( phi ) * phiyy
+		   - 2. * cos ( phi ) * sin ( phi ) * phixy )
+    + R * ( cos ( phi ) * Fx + sin ( phi ) * Fy );
+}
+double FerrersPotentialPlanarRphideriv(double R,double phi,double t,
+				       struct potentialArg * potentialArgs){
+  double phixx, phixy, phiyy, Fx, Fy, Fz;
+  FerrersPotentialPlanar2ndderivs(R,phi,t,&phixx,&phixy,&phiyy,
+				  potentialArgs->args);
+  FerrersPotentialForces(R,0.,phi,t,&Fx,&Fy,&Fz,potentialArgs->args);
+  return R * cos ( phi ) * sin ( phi ) * ( phiyy - phixx )
+    + R * cos ( 2. * phi ) * phixy
+    + sin ( phi ) * Fx - cos ( phi ) * Fy;
+}
@@ -0,0 +1,210 @@
+#include <math.h>
+#include <galpy_potentials.h>
+//MovingObjectPopulationPotential
+//Arguments: amp, profile (0: Plummer, 1: Hernquist), cutoff (<0: none),
+//           nobj, nt, nbins, t0, tbin, ncells (total over bins),
+//           times [nt], masses [nobj], rs [nobj], positions [nobj,nt,3],
+//           velocities [nobj,nt,3],
+//           grids [nbins,7] (xmin,ymin,zmin,cellsize,nx,ny,nz),
+//           start of each bin's cell offsets [nbins+1],
+//           cell offsets [ncells+nbins], objects sorted by cell [nbins,nobj],
+//           7 cached values (R,z,phi,t,Fx,Fy,Fz)
+//Add the potential (deriv=0) or the forces (deriv=1) of object ii
+static inline void MovingObjectPopulationPotentialAdd(double x,double y,
+						      double z,int ii,int k,
+						      double * hw,
+						      double cutoff,int profile,
+						      int nt,double * masses,
+						      double * rs,double * pos,
+						      double * vel,int deriv,
+						      double * out){
+  int jj;
+  double dx[3], r, fac;
+  double * p= pos + 3 * ( ii * nt + k );
+  double * v= vel + 3 * ( ii * nt + k );
+  // Cubic Hermite interpolation of the object's position
+  for (jj=0; jj < 3; jj++)
+    dx[jj]= *hw * *(p+jj) + *(hw+1) * *(v+jj)
+      + *(hw+2) * *(p+jj+3) + *(hw+3) * *(v+jj+3);
+  dx[0]-= x;
+  dx[1]-= y;
+  dx[2]-= z;
+  r= sqrt ( dx[0] * dx[0] + dx[1] * dx[1] + dx[2] * dx[2] );
+  if ( cutoff >= 0. && r > cutoff ) return;
+  if ( deriv == 0 ) {
+    if ( profile == 0 )
+      *out-= *(masses+ii) / sqrt ( r * r + *(rs+ii) * *(rs+ii) );
+    else
+      *out-= *(masses+ii) / ( r + *(rs+ii) );
+  }
+  else {
+    if ( profile == 0 )
+      fac= *(masses+ii) * pow(r * r + *(rs+ii) * *(rs+ii),-1.5);
+    else if ( r == 0. ) // no force at the center of the object
+      return;
+    else
+      fac= *(masses+ii) / r / ( r + *(rs+ii) ) / ( r + *(rs+ii) );
+    for (jj=0; jj < 3; jj++)
+      *(out+jj)+= fac * dx[jj];
+  }
+}
+//Sum the potential (deriv=0) or the forces (deriv=1) of all objects
+void MovingObjectPopulationPotentialSum(double x,double y,double z,double t,
+					double * args,int deriv,double * out){
+  int ii, jj, ix, iy, iz, jx, jy, jz, lo, hi, mid, k, bin, cell, nx, ny, nz;
+  //Get args
+  double amp= *args++;
+  int profile= (int) *args++;
+  double cutoff= *args++;
+  int nobj= (int) *args++;
+  int nt= (int) *args++;
+  int nbins= (int) *args++;
+  double t0= *args++;
+  double tbin= *args++;
+  int ncells= (int) *args++;
+  double * times= args;
+  double * masses= times + nt;
+  double * rs= masses + nobj;
+  double * pos= rs + nobj;
+  double * vel= pos + 3 * nobj * nt;
+  double * grids= vel + 3 * nobj * nt;
+  double * binstart= grids + 7 * nbins;
+  double * offsets= binstart + nbins + 1;
+  double * entries= offsets + ncells + nbins;
+  double * grid, * boffsets, * bentries;
+  double hw[4], h, s;
+  *out= 0.;
+  if ( deriv ) {
+    *(out+1)= 0.;
+    *(out+2)= 0.;
+  }
+  // Find the time interval and the Hermite weights
+  if ( t <= *times ) {
+    k= 0;
+    s= 0.;
+  }
+  else if ( t >= *(times+nt-1) ) {
+    k= nt-2;
+    s= 1.;
+  }
+  else {
+    lo= 0;
+    hi= nt-1;
+    while ( hi - lo > 1 ) {
+      mid= ( lo + hi ) / 2;
+      if ( *(times+mid) > t ) hi= mid;
+      else lo= mid;
+    }
+    k= lo;
+    s= ( t - *(times+k) ) / ( *(times+k+1) - *(times+k) );
+  }
+  h= *(times+k+1) - *(times+k);
+  hw[0]= 2. * s * s * s - 3. * s * s + 1.;
+  hw[1]= ( s * s * s - 2. * s * s + s ) * h;
+  hw[2]= -2. * s * s * s + 3. * s * s;
+  hw[3]= ( s * s * s - s * s ) * h;
+  if ( nbins == 0 ) {
+    for (ii=0; ii < nobj; ii++)
+      MovingObjectPopulationPotentialAdd(x,y,z,ii,k,hw,cutoff,profile,nt,
+					 masses,rs,pos,vel,deriv,out);
+  }
+  else {
+    // Use the spatial index to loop over the 27 cells around (x,y,z)
+    bin= (int) floor ( ( t - t0 ) / tbin );
+    if ( bin < 0 ) bin= 0;
+    if ( bin > nbins-1 ) bin= nbins-1;
+    grid= grids + 7 * bin;
+    boffsets= offsets + (int) *(binstart+bin);
+    bentries= entries + bin * nobj;
+    nx= (int) *(grid+4);
+    ny= (int) *(grid+5);
+    nz= (int) *(grid+6);
+    ix= (int) floor ( ( x - *grid ) / *(grid+3) );
+    iy= (int) floor ( ( y - *(grid+1) ) / *(grid+3) );
+    iz= (int) floor ( ( z - *(grid+2) ) / *(grid+3) );
+    for (jx= ( ix > 0 ) ? ix-1 : 0; jx <= ix+1 && jx < nx; jx++)
+      for (jy= ( iy > 0 ) ? iy-1 : 0; jy <= iy+1 && jy < ny; jy++)
+	for (jz= ( iz > 0 ) ? iz-1 : 0; jz <= iz+1 && jz < nz; jz++) {
+	  cell= ( jx * ny + jy ) * nz + jz;
+	  for (jj= (int) *(boffsets+cell); jj < (int) *(boffsets+cell+1);
+	       jj++)
+	    MovingObjectPopulationPotentialAdd(x,y,z,(int) *(bentries+jj),k,
+					       hw,cutoff,profile,nt,masses,rs,
+					       pos,vel,deriv,out);
+	}
+  }
+  *out*= amp;
+  if ( deriv ) {
+    *(out+1)*= amp;
+    *(out+2)*= amp;
+  }
+}
+//Cached version of the forces
+static inline void MovingObjectPopulationPotentialForces(double R,double z,
+							 double phi,double t,
+							 double * F,
+							 double * args){
+  int nobj= (int) *(args+3);
+  int nt= (int) *(args+4);
+  int nbins= (int) *(args+5);
+  int ncells= (int) *(args+8);
+  double * cache= args + 9 + nt + 2 * nobj + 6 * nobj * nt + 7 * nbins
+    + nbins + 1 + ncells + nbins + nbins * nobj;
+  if ( R == *cache && z == *(cache+1) && phi == *(cache+2) \
+       && t == *(cache+3) ) {
+    //LCOV_EXCL_START
+    *F= *(cache+4);
+    *(F+1)= *(cache+5);
+    *(F+2)= *(cache+6);
+    //LCOV_EXCL_STOP
+  }
+  else {
+    MovingObjectPopulationPotentialSum(R*cos(phi),R*sin(phi),z,t,args,1,F);
+    *cache= R;
+    *(cache+1)= z;
+    *(cache+2)= phi;
+    *(cache+3)= t;
+    *(cache+4)= *F;
+    *(cache+5)= *(F+1);
+    *(cache+6)= *(F+2);
+  }
+}
+double MovingObjectPopulationPotentialEval(double R,double z,double phi,
+					   double t,
+					   struct potentialArg * potentialArgs){
+  double out;
+  MovingObjectPopulationPotentialSum(R*cos(phi),R*sin(phi),z,t,
+				     potentialArgs->args,0,&out);
+  return out;
+}
+double MovingObjectPopulationPotentialRforce(double R,double z,double phi,
+					     double t,
+					     struct potentialArg * potentialArgs){
+  double F[3];
+  MovingObjectPopulationPotentialForces(R,z,phi,t,F,potentialArgs->args);
+  return cos ( phi ) * F[0] + sin ( phi ) * F[1];
+}
+double MovingObjectPopulationPotentialzforce(double R,double z,double phi,
+					     double t,
+					     struct potentialArg * potentialArgs){
+  double F[3];
+  MovingObjectPopulationPotentialForces(R,z,phi,t,F,potentialArgs->args);
+  return F[2];
+}
+double MovingObjectPopulationPotentialphiforce(double R,double z,double phi,
+					       double t,
+					       struct potentialArg * potentialArgs){
+  double F[3];
+  MovingObjectPopulationPotentialForces(R,z,phi,t,F,potentialArgs->args);
+  return R * ( - sin ( phi ) * F[0] + cos ( phi ) * F[1] );
+}
+double MovingObjectPopulationPotentialPlanarRforce(double R,double phi,
+						   double t,
+						   struct potentialArg * potentialArgs){
+  return MovingObjectPopulationPotentialRforce(R,0.,phi,t,potentialArgs);
+}
+double MovingObjectPopulationPotentialPlanarphiforce(double R,double phi,
+						     double t,
+						     struct potentialArg * potentialArgs){
+  return MovingObjectPopulationPotentialphiforce(R,0.,phi,t,potentialArgs);
+}
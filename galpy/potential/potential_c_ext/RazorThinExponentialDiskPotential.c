@@ -0,0 +1,134 @@
+#include <math.h>
+#include <gsl/gsl_sf_bessel.h>
+#include <galpy_potentials.h>
+#ifndef M_PI
+#define M_PI 3.14159265358979323846
+#endif
+//RazorThinExponentialDiskPotential
+//Arguments: amp, alpha, kzmax, nzeros, glorder, glx, glw,
+//           (nzeros+1) zeros of J0 and (nzeros+1) zeros of J1 (starting at 0)
+//Hankel transform int_0^infty dk f(k) exp(-k|z|)/(alpha^2+k^2)^1.5 with
+//f(k) = J0(kR) (kind=0), k J1(kR) (kind=1), or k J0(kR) (kind=2), computed
+//with Gauss-Legendre quadrature between the zeros of the Bessel function;
+//intervals are split in pieces no longer than max(alpha,k) and the result is
+//the average of the last two partial sums, unless exp(-k|z|) becomes
+//negligible first
+static double RazorThinExponentialDiskPotentialHankel(double R,double z,
+						      int kind,double * args){
+  int ii, jj;
+  //Get args
+  double alpha= *args;
+  double kzmax= *(args+1);
+  int nzeros= (int) *(args+2);
+  int glorder= (int) *(args+3);
+  double * glx= args + 4;
+  double * glw= args + 4 + glorder;
+  double * zeros= args + 4 + 2 * glorder + ( kind == 1 ) * ( nzeros + 1 );
+  double absz= fabs ( z );
+  double out= 0., prev= 0.;
+  double lo, hi, up, k, fk;
+  int cut= 0;
+  for (ii=0; ii < nzeros; ii++) {
+    lo= ( ii == 0 ) ? 0. : *(zeros+ii) / R;
+    hi= ( R > 0. ) ? *(zeros+ii+1) / R : INFINITY;
+    prev= out;
+    while ( lo < hi ) {
+      if ( lo * absz > kzmax ) {
+	cut= 1;
+	break;
+      }
+      up= fmin(lo + fmax(alpha,lo),hi);
+      for (jj=0; jj < glorder; jj++) {
+	k= 0.5 * ( *(glx+jj) + 1. ) * ( up - lo ) + lo;
+	switch ( kind ) {
+	case 0:
+	  fk= gsl_sf_bessel_J0(k*R);
+	  break;
+	case 1:
+	  fk= k * gsl_sf_bessel_J1(k*R);
+	  break;
+	default:
+	  fk= k * gsl_sf_bessel_J0(k*R);
+	  break;
+	}
+	out+= 0.5 * *(glw+jj) * ( up - lo ) * fk * exp ( - k * absz )
+	  * pow(alpha * alpha + k * k,-1.5);
+      }
+      lo= up;
+    }
+    if ( cut ) break;
+  }
+  if ( cut )
+    return out;
+  else
+    return 0.5 * ( prev + out );
+}
+double RazorThinExponentialDiskPotentialEval(double R,double z, double phi,
+					     double t,
+					     struct potentialArg * potentialArgs){
+  double * args= potentialArgs->args;
+  //Get args
+  double amp= *args;
+  double alpha= *(args+1);
+  double y;
+  if ( fabs ( z ) < 1e-6 ) {
+    y= 0.5 * alpha * R;
+    return - amp * M_PI * R
+      * ( gsl_sf_bessel_I0_scaled(y) * gsl_sf_bessel_K1_scaled(y)
+	  - gsl_sf_bessel_I1_scaled(y) * gsl_sf_bessel_K0_scaled(y) );
+  }
+  return - amp * 2. * M_PI * alpha
+    * RazorThinExponentialDiskPotentialHankel(R,z,0,args+1);
+}
+double RazorThinExponentialDiskPotentialRforce(double R,double z, double phi,
+					       double t,
+					       struct potentialArg * potentialArgs){
+  double * args= potentialArgs->args;
+  //Get args
+  double amp= *args;
+  double alpha= *(args+1);
+  double y;
+  if ( fabs ( z ) < 1e-6 ) {
+    y= 0.5 * alpha * R;
+    return - amp * 2. * M_PI * y
+      * ( gsl_sf_bessel_I0_scaled(y) * gsl_sf_bessel_K0_scaled(y)
+	  - gsl_sf_bessel_I1_scaled(y) * gsl_sf_bessel_K1_scaled(y) );
+  }
+  return - amp * 2. * M_PI * alpha
+    * RazorThinExponentialDiskPotentialHankel(R,z,1,args+1);
+}
+double RazorThinExponentialDiskPotentialPlanarRforce(double R,double phi,
+						     double t,
+						     struct potentialArg * potentialArgs){
+  return RazorThinExponentialDiskPotentialRforce(R,0.,phi,t,potentialArgs);
+}
+double RazorThinExponentialDiskPotentialzforce(double R,double z,double phi,
+					       double t,
+					       struct potentialArg * potentialArgs){
+  double * args= potentialArgs->args;
+  //Get args
+  double amp= *args;
+  double alpha= *(args+1);
+  if ( fabs ( z ) < 1e-6 )
+    return 0.;
+  return - amp * 2. * M_PI * alpha * ( ( z > 0. ) ? 1. : -1. )
+    * RazorThinExponentialDiskPotentialHankel(R,z,2,args+1);
+}
+double RazorThinExponentialDiskPotentialPlanarR2deriv(double R,double phi,
+						      double t,
+						      struct potentialArg * potentialArgs){
+  double * args= potentialArgs->args;
+  //Get args
+  double amp= *args;
+  double alpha= *(args+1);
+  double y= 0.5 * alpha * R;
+  double I0= gsl_sf_bessel_I0_scaled(y);
+  double I1= gsl_sf_bessel_I1_scaled(y);
+  double I2= gsl_sf_bessel_In_scaled(2,y);
+  double K0= gsl_sf_bessel_K0_scaled(y);
+  double K1= gsl_sf_bessel_K1_scaled(y);
+  double K2= gsl_sf_bessel_Kn_scaled(2,y);
+  return amp * ( M_PI * alpha * ( I0 * K0 - I1 * K1 )
+		 + 0.25 * M_PI * alpha * alpha * R
+		 * ( I1 * ( 3. * K0 + K2 ) - K1 * ( 3. * I0 + I2 ) ) );
+}
@@ -908,3 +908,166 @@ double SCFPotentialDens(double R,double Z, double phi,
 
 }
 
+
+//TimeDependentSCFPotential
+//Arguments: a, isNonAxi, N, L, M, ntimes, interp_order, cached_t, times,
+//           Acos and [Asin] at each time (stored per time), [their second
+//           derivatives with respect to t for cubic interpolation], and a
+//           block of SCFPotential arguments (a, isNonAxi, N, L, M, Acos,
+//           [Asin], 7 caching) that holds the interpolated coefficients
+//Interpolate the coefficients to time t and return the SCFPotential args
+double * TimeDependentSCFPotentialUpdate(double t, double * args)
+{
+    int ii;
+    double A, B, h;
+    int isNonAxi = (int) *(args+1);
+    int N = (int) *(args+2);
+    int L = (int) *(args+3);
+    int M = (int) *(args+4);
+    int ntimes = (int) *(args+5);
+    int interp_order = (int) *(args+6);
+    double * cached_t = args+7;
+    double * times = args+8;
+    int ncoeffs = (1 + isNonAxi) * N * L * M;
+    double * coeffs = times + ntimes;
+    double * d2coeffs = coeffs + ntimes * ncoeffs;
+    double * scf_args = ( interp_order == 3 ) ? d2coeffs + ntimes * ncoeffs \
+      : d2coeffs;
+    double * scf_coeffs = scf_args + 5;
+    if ( t == *cached_t )
+        return scf_args;
+    *cached_t = t;
+    *(scf_coeffs + ncoeffs) = 0.; // invalidate SCFPotential's cache
+    //Outside of the range of times, use the first or last coefficients
+    if ( ntimes == 1 || t <= *times ) {
+        for (ii = 0; ii < ncoeffs; ii++)
+            *(scf_coeffs + ii) = *(coeffs + ii);
+        return scf_args;
+    }
+    if ( t >= *(times + ntimes - 1) ) {
+        for (ii = 0; ii < ncoeffs; ii++)
+            *(scf_coeffs + ii) = *(coeffs + (ntimes - 1) * ncoeffs + ii);
+        return scf_args;
+    }
+    //Find the interval through bisection
+    int lo = 0, hi = ntimes - 1, mid;
+    while ( hi - lo > 1 ) {
+        mid = ( lo + hi ) / 2;
+        if ( *(times + mid) > t )
+            hi = mid;
+        else
+            lo = mid;
+    }
+    h = *(times + hi) - *(times + lo);
+    B = ( t - *(times + lo) ) / h;
+    A = 1. - B;
+    for (ii = 0; ii < ncoeffs; ii++)
+        *(scf_coeffs + ii) = A * *(coeffs + lo * ncoeffs + ii)
+            + B * *(coeffs + hi * ncoeffs + ii);
+    if ( interp_order == 3 )
+        for (ii = 0; ii < ncoeffs; ii++)
+            *(scf_coeffs + ii) += ( ( A * A * A - A ) * *(d2coeffs + lo * ncoeffs + ii)
+                                    + ( B * B * B - B ) * *(d2coeffs + hi * ncoeffs + ii) ) \
+                * h * h / 6.;
+    return scf_args;
+}
+double TimeDependentSCFPotentialEval(double R,double Z, double phi,
+                                     double t,
+                                     struct potentialArg * potentialArgs)
+{
+    double * args= potentialArgs->args;
+    double out;
+    potentialArgs->args= TimeDependentSCFPotentialUpdate(t,args);
+    out= SCFPotentialEval(R,Z,phi,t,potentialArgs);
+    potentialArgs->args= args;
+    return out;
+}
+double TimeDependentSCFPotentialRforce(double R,double Z, double phi,
+                                       double t,
+                                       struct potentialArg * potentialArgs)
+{
+    double * args= potentialArgs->args;
+    double out;
+    potentialArgs->args= TimeDependentSCFPotentialUpdate(t,args);
+    out= SCFPotentialRforce(R,Z,phi,t,potentialArgs);
+    potentialArgs->args= args;
+    return out;
+}
+double TimeDependentSCFPotentialzforce(double R,double Z, double phi,
+                                       double t,
+                                       struct potentialArg * potentialArgs)
+{
+    double * args= potentialArgs->args;
+    double out;
+    potentialArgs->args= TimeDependentSCFPotentialUpdate(t,args);
+    out= SCFPotentialzforce(R,Z,phi,t,potentialArgs);
+    potentialArgs->args= args;
+    return out;
+}
+double TimeDependentSCFPotentialphiforce(double R,double Z, double phi,
+                                         double t,
+                                         struct potentialArg * potentialArgs)
+{
+    double * args= potentialArgs->args;
+    double out;
+    potentialArgs->args= TimeDependentSCFPotentialUpdate(t,args);
+    out= SCFPotentialphiforce(R,Z,phi,t,potentialArgs);
+    potentialArgs->args= args;
+    return out;
+}
+double TimeDependentSCFPotentialPlanarRforce(double R,double phi,
+                                             double t,
+                                             struct potentialArg * potentialArgs)
+{
+    return TimeDependentSCFPotentialRforce(R,0.,phi,t,potentialArgs);
+}
+double TimeDependentSCFPotentialPlanarphiforce(double R,double phi,
+                                               double t,
+                                               struct potentialArg * potentialArgs)
+{
+    return TimeDependentSCFPotentialphiforce(R,0.,phi,t,potentialArgs);
+}
+double TimeDependentSCFPotentialPlanarR2deriv(double R, double phi,
+                                              double t,
+                                              struct potentialArg * potentialArgs)
+{
+    double * args= potentialArgs->args;
+    double out;
+    potentialArgs->args= TimeDependentSCFPotentialUpdate(t,args);
+    out= SCFPotentialPlanarR2deriv(R,phi,t,potentialArgs);
+    potentialArgs->args= args;
+    return out;
+}
+double TimeDependentSCFPotentialPlanarphi2deriv(double R, double phi,
+                                                double t,
+                                                struct potentialArg * potentialArgs)
+{
+    double * args= potentialArgs->args;
+    double out;
+    potentialArgs->args= TimeDependentSCFPotentialUpdate(t,args);
+    out= SCFPotentialPlanarphi2deriv(R,phi,t,potentialArgs);
+    potentialArgs->args= args;
+    return out;
+}
+double TimeDependentSCFPotentialPlanarRphideriv(double R, double phi,
+                                                double t,
+                                                struct potentialArg * potentialArgs)
+{
+    double * args= potentialArgs->args;
+    double out;
+    potentialArgs->args= TimeDependentSCFPotentialUpdate(t,args);
+    out= SCFPotentialPlanarRphideriv(R,phi,t,potentialArgs);
+    potentialArgs->args= args;
+    return out;
+}
+double TimeDependentSCFPotentialDens(double R,double Z, double phi,
+                                     double t,
+                                     struct potentialArg * potentialArgs)
+{
+    double * args= potentialArgs->args;
+    double out;
+    potentialArgs->args= TimeDependentSCFPotentialUpdate(t,args);
+    out= SCFPotentialDens(R,Z,phi,t,potentialArgs);
+    potentialArgs->args= args;
+    return out;
+}
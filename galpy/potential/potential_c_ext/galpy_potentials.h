@@ -393,6 +393,7 @@ double BurkertPotentialPlanarR2deriv(double,double,double,
 double BurkertPotentialDens(double,double,double,double,
 			    struct potentialArg *);
 //EllipsoidalPotential
+int EllipsoidalPotentialnargs(double *);
 double EllipsoidalPotentialEval(double,double,double,double,
 				     struct potentialArg *);
 double EllipsoidalPotentialRforce(double,double,double,double,
@@ -441,6 +442,27 @@ double SCFPotentialPlanarRphideriv(double,double,double,
 				        struct potentialArg *);
 double SCFPotentialDens(double,double,double,double,
 			struct potentialArg *);
+//TimeDependentSCFPotential
+double TimeDependentSCFPotentialEval(double,double,double,double,
+				     struct potentialArg *);
+double TimeDependentSCFPotentialRforce(double,double,double,double,
+				       struct potentialArg *);
+double TimeDependentSCFPotentialzforce(double,double,double,double,
+				       struct potentialArg *);
+double TimeDependentSCFPotentialphiforce(double,double,double,double,
+					 struct potentialArg *);
+double TimeDependentSCFPotentialPlanarRforce(double,double,double,
+					     struct potentialArg *);
+double TimeDependentSCFPotentialPlanarphiforce(double,double,double,
+					       struct potentialArg *);
+double TimeDependentSCFPotentialPlanarR2deriv(double,double,double,
+					      struct potentialArg *);
+double TimeDependentSCFPotentialPlanarphi2deriv(double,double,double,
+						struct potentialArg *);
+double TimeDependentSCFPotentialPlanarRphideriv(double,double,double,
+						struct potentialArg *);
+double TimeDependentSCFPotentialDens(double,double,double,double,
+				     struct potentialArg *);
 //SoftenedNeedleBarPotential
 double SoftenedNeedleBarPotentialEval(double,double,double,double,
 				      struct potentialArg *);
@@ -465,6 +487,7 @@ double DiskSCFPotentialPlanarRforce(double,double,double,
 					      struct potentialArg *);
 double DiskSCFPotentialDens(double,double,double,double,
 			    struct potentialArg *);
+void initDiskSCFSplines(struct potentialArg *,double **);
 
 // SpiralArmsPotential
 double SpiralArmsPotentialEval(double, double, double, double,
@@ -548,6 +571,66 @@ double HomogeneousSpherePotentialPlanarR2deriv(double ,double, double,
 double HomogeneousSpherePotentialDens(double ,double , double, double,
 				      struct potentialArg *);
 
+//CylindricalSplinePotential
+double CylindricalSplinePotentialEval(double ,double , double, double,
+				      struct potentialArg *);
+double CylindricalSplinePotentialRforce(double ,double , double, double,
+					struct potentialArg *);
+double CylindricalSplinePotentialPlanarRforce(double ,double, double,
+					      struct potentialArg *);
+double CylindricalSplinePotentialzforce(double,double,double,double,
+					struct potentialArg *);
+double CylindricalSplinePotentialphiforce(double,double,double,double,
+					  struct potentialArg *);
+double CylindricalSplinePotentialPlanarphiforce(double,double,double,
+						struct potentialArg *);
+
+//FerrersPotential
+double FerrersPotentialEval(double,double,double,double,
+			    struct potentialArg *);
+double FerrersPotentialRforce(double,double,double,double,
+			      struct potentialArg *);
+double FerrersPotentialphiforce(double,double,double,double,
+				struct potentialArg *);
+double FerrersPotentialzforce(double,double,double,double,
+			      struct potentialArg *);
+double FerrersPotentialPlanarRforce(double,double,double,
+				    struct potentialArg *);
+double FerrersPotentialPlanarphiforce(double,double,double,
+				      struct potentialArg *);
+double FerrersPotentialPlanarR2deriv(double,double,double,
+				     struct potentialArg *);
+double FerrersPotentialPlanarphi2deriv(double,double,double,
+				       struct potentialArg *);
+double FerrersPotentialPlanarRphideriv(double,double,double,
+				       struct potentialArg *);
+
+//RazorThinExponentialDiskPotential
+double RazorThinExponentialDiskPotentialEval(double,double,double,double,
+					     struct potentialArg *);
+double RazorThinExponentialDiskPotentialRforce(double,double,double,double,
+					       struct potentialArg *);
+double RazorThinExponentialDiskPotentialPlanarRforce(double,double,double,
+						     struct potentialArg *);
+double RazorThinExponentialDiskPotentialzforce(double,double,double,double,
+					       struct potentialArg *);
+double RazorThinExponentialDiskPotentialPlanarR2deriv(double,double,double,
+						      struct potentialArg *);
+
+//MovingObjectPopulationPotential
+double MovingObjectPopulationPotentialEval(double,double,double,double,
+					   struct potentialArg *);
+double MovingObjectPopulationPotentialRforce(double,double,double,double,
+					     struct potentialArg *);
+double MovingObjectPopulationPotentialzforce(double,double,double,double,
+					     struct potentialArg *);
+double MovingObjectPopulationPotentialphiforce(double,double,double,double,
+					       struct potentialArg *);
+double MovingObjectPopulationPotentialPlanarRforce(double,double,double,
+						   struct potentialArg *);
+double MovingObjectPopulationPotentialPlanarphiforce(double,double,double,
+						     struct potentialArg *);
+
 //////////////////////////////// WRAPPERS /////////////////////////////////////
 //DehnenSmoothWrapperPotential
 double DehnenSmoothWrapperPotentialEval(double,double,double,double,
@@ -0,0 +1,288 @@
+###############################################################################
+#   cache.py: persistent, content-addressed cache for the results of
+#             expensive setup computations
+#
+#   Results are pickled to files in a cache directory whose names are a hash
+#   of all of the inputs to the computation; functions in the inputs are
+#   hashed by their code, default arguments, closure variables, and the
+#   current values of the (non-module) global variables that they use. The
+#   cache is not used when any of these cannot be pickled. Objects that are
+#   only reached through attributes of modules (e.g., mod.x) or through
+#   mutable state outside of the function are not part of the key, so
+#   changing those does not invalidate cached results. Objects are hashed
+#   by their attributes, leaving out transient caches of evaluations that
+#   do not change the object's parameters (e.g., _force_hash, _cached_*,
+#   _circ_cache), such that evaluating an object does not change its key.
+#   The cache directory is set in the [cache] section of the configuration
+#   file, which also sets its maximum size in MB; when this size is
+#   exceeded, the least-recently used results are removed.
+###############################################################################
+import os
+import io
+import re
+import types
+import pickle
+import hashlib
+import warnings
+from . import galpyWarning, save_pickles
+from .config import __config__
+from .. import __version__ as galpy_version
+_CACHEFILE_RE= re.compile(r'^[0-9a-f]{40}\.pkl$')
+# Attributes that cache evaluations and are therefore not part of the key
+_TRANSIENT_ATTRS= frozenset(['_circ_cache','_torus_cache','_maxVT_ip'])
+def cached(func,cache,*key):
+    """
+    NAME:
+       cached
+    PURPOSE:
+       return the result of func(), loading it from the cache if it was computed before for the same key and saving it to the cache otherwise
+    INPUT:
+       func - function without arguments that performs the computation
+       cache - if False or None, do not use the cache and simply return func(); if True, use the cache directory from the configuration file; if a string, use this as the cache directory
+       +key - all inputs that determine the result of func() (e.g., a name for the computation, potentials, functions, arrays, parameters); functions are identified by their code, default arguments, closure variables, and the current values of the global variables that they use
+    OUTPUT:
+       func()
+    HISTORY:
+       2026-10-19 - Written - agent
+    """
+    filename= _cache_filename(cache,key)
+    if filename is None:
+        return func()
+    found, out= _load(filename)
+    if not found:
+        out= func()
+        _save(filename,out)
+    return out
+
+def cached_setup(obj,setup,cache,*key):
+    """
+    NAME:
+       cached_setup
+    PURPOSE:
+       run the expensive part of an object's initialization, setup(), unless it was run before for an object in the same state, in which case the attributes that it set or changed (including in place) are loaded from the cache
+    INPUT:
+       obj - object being initialized; its current attributes are part of the key
+       setup - function without arguments that sets attributes of obj
+       cache - if False or None, do not use the cache and simply run setup(); if True, use the cache directory from the configuration file; if a string, use this as the cache directory
+       +key - any inputs to setup() that are not attributes of obj
+    OUTPUT:
+       (none)
+    HISTORY:
+       2026-10-19 - Written - agent
+    """
+    filename= _cache_filename(cache,(obj.__class__.__name__,
+                                     _key_state(obj.__dict__))+key)
+    if filename is None:
+        setup()
+        return None
+    found, state= _load(filename)
+    if found:
+        obj.__dict__.update(state)
+        return None
+    # Hashes of the current attributes by value, such that attributes that
+    # setup() changes in place are also saved
+    before= dict((k,cache_key(v)) for k,v in obj.__dict__.items())
+    setup()
+    _save(filename,dict((k,v) for k,v in obj.__dict__.items()
+                        if _attribute_changed(v,before.get(k))))
+    return None
+
+def cache_key(*key):
+    """
+    NAME:
+       cache_key
+    PURPOSE:
+       compute the hash used to identify a computation in the cache
+    INPUT:
+       +key - all inputs that determine the result of a computation
+    OUTPUT:
+       hexadecimal SHA1 hash (raises pickle.PicklingError, TypeError, or AttributeError when the inputs cannot be hashed)
+    HISTORY:
+       2026-10-19 - Written - agent
+    """
+    buf= io.BytesIO()
+    _KeyPickler(buf,protocol=2).dump((galpy_version,key))
+    return hashlib.sha1(buf.getvalue()).hexdigest()
+
+def cachedir(cache=True):
+    """
+    NAME:
+       cachedir
+    PURPOSE:
+       return the cache directory
+    INPUT:
+       cache= (True) if True, the directory from the configuration file; if a string, this directory
+    OUTPUT:
+       path of the cache directory
+    HISTORY:
+       2026-10-19 - Written - agent
+    """
+    if cache is True:
+        return os.path.expanduser(__config__.get('cache','dir'))
+    return os.path.expanduser(cache)
+
+def clear(cache=True):
+    """
+    NAME:
+       clear
+    PURPOSE:
+       remove all results from the cache
+    INPUT:
+       cache= (True) if True, the directory from the configuration file; if a string, this directory
+    OUTPUT:
+       (none)
+    HISTORY:
+       2026-10-19 - Written - agent
+    """
+    for filename,size,mtime in _cachefiles(cachedir(cache)):
+        os.remove(filename)
+    return None
+
+def _is_transient(name):
+    """Whether the attribute name is a transient cache of evaluations"""
+    return name in _TRANSIENT_ATTRS or name.startswith('_cached') \
+        or name.endswith('_hash')
+
+def _key_state(state):
+    """The attributes in state that are part of the key"""
+    return dict((k,v) for k,v in state.items() if not _is_transient(k))
+
+def _attribute_changed(val,hbefore):
+    """Whether an attribute with value val is new or changed from the one with hash hbefore"""
+    if hbefore is None:
+        return True
+    try:
+        return cache_key(val) != hbefore
+    except (pickle.PicklingError,TypeError,AttributeError,ValueError,
+            RuntimeError):
+        return True
+
+class _KeyPickler(pickle.Pickler):
+    """Pickler that replaces functions and methods by their code, default arguments, closure variables, and global variables, and objects with transient caches by their other attributes, such that they can be hashed"""
+    def __init__(self,*args,**kwargs):
+        # Functions whose key is being computed, to deal with recursion
+        self._active= kwargs.pop('active',set())
+        # Objects whose attributes are being pickled, to deal with cycles
+        self._objects= kwargs.pop('objects',set())
+        pickle.Pickler.__init__(self,*args,**kwargs)
+    def persistent_id(self,obj):
+        if isinstance(obj,types.FunctionType):
+            return ('function',_function_key(obj,self._active))
+        elif isinstance(obj,types.MethodType):
+            return ('method',obj.__self__,obj.__func__)
+        elif not isinstance(obj,type) \
+                and isinstance(getattr(obj,'__dict__',None),dict) \
+                and any(_is_transient(k) for k in obj.__dict__):
+            if id(obj) in self._objects: # reference cycle
+                return ('cycle',obj.__class__)
+            self._objects.add(id(obj))
+            # Pickle the attributes now, while obj is marked as active
+            buf= io.BytesIO()
+            _KeyPickler(buf,protocol=2,active=self._active,
+                        objects=self._objects)\
+                .dump((obj.__class__,_key_state(obj.__dict__)))
+            self._objects.remove(id(obj))
+            return ('object',hashlib.sha1(buf.getvalue()).hexdigest())
+        return None
+
+def _function_key(func,active):
+    """Hash of a function's code, default arguments, closure variables, and the values of the global variables that it uses"""
+    if id(func) in active: # recursive function
+        return ('recursive',func.__code__.co_name)
+    active.add(id(func))
+    try:
+        buf= io.BytesIO()
+        _KeyPickler(buf,protocol=2,active=active)\
+            .dump((_code_key(func.__code__),func.__defaults__,
+                   None if func.__closure__ is None
+                   else tuple(c.cell_contents for c in func.__closure__),
+                   _globals_key(func)))
+    finally:
+        active.remove(id(func))
+    return hashlib.sha1(buf.getvalue()).hexdigest()
+
+def _globals_key(func):
+    """Values of the global variables used by func (modules by name)"""
+    out= []
+    for name in sorted(_code_names(func.__code__)):
+        if not name in func.__globals__: continue # builtin or attribute
+        val= func.__globals__[name]
+        if isinstance(val,types.ModuleType):
+            out.append((name,'module',val.__name__))
+        else:
+            out.append((name,val))
+    return tuple(out)
+
+def _code_names(code):
+    """All global and attribute names used by a code object and the code objects nested in it"""
+    out= set(code.co_names)
+    for c in code.co_consts:
+        if isinstance(c,types.CodeType):
+            out|= _code_names(c)
+    return out
+
+def _code_key(code):
+    """Key for a code object that does not depend on where it is defined"""
+    return (code.co_code,code.co_argcount,code.co_names,code.co_varnames,
+            code.co_freevars,
+            tuple(_code_key(c) if isinstance(c,types.CodeType) else c
+                  for c in code.co_consts))
+
+def _cache_filename(cache,key):
+    """Name of the cache file for key, or None if not caching"""
+    if cache is None or cache is False:
+        return None
+    try:
+        hkey= cache_key(*key)
+    except (pickle.PicklingError,TypeError,AttributeError,ValueError,
+            RuntimeError) as e:
+        warnings.warn("Inputs cannot be hashed ({}), not using the cache"\
+                          .format(e),galpyWarning)
+        return None
+    thiscachedir= cachedir(cache)
+    if not os.path.exists(thiscachedir):
+        os.makedirs(thiscachedir)
+    return os.path.join(thiscachedir,hkey+'.pkl')
+
+def _load(filename):
+    """Load a result from the cache, marking it as recently used"""
+    if not os.path.exists(filename):
+        return (False,None)
+    try:
+        with open(filename,'rb') as savefile:
+            out= pickle.load(savefile)
+    except Exception: # Corrupted or incompatible file, recompute
+        return (False,None)
+    os.utime(filename,None)
+    return (True,out)
+
+def _save(filename,out):
+    """Save a result to the cache and evict the least-recently used results if the cache becomes too large"""
+    try:
+        save_pickles(filename,out)
+    except (pickle.PicklingError,TypeError,AttributeError) as e:
+        warnings.warn("Result cannot be pickled ({}), not saving it to the cache"\
+                          .format(e),galpyWarning)
+        return None
+    maxsize= __config__.getfloat('cache','maxsize')*1024.**2.
+    cachefiles= sorted(_cachefiles(os.path.dirname(filename)),
+                       key=lambda x: x[2])
+    totalsize= sum([c[1] for c in cachefiles])
+    for thisfilename,size,mtime in cachefiles:
+        if totalsize <= maxsize: break
+        if thisfilename == filename: continue
+        os.remove(thisfilename)
+        totalsize-= size
+    return None
+
+def _cachefiles(thiscachedir):
+    """List the (filename,size,modification time) of all results in the cache directory"""
+    if not os.path.exists(thiscachedir):
+        return []
+    out= []
+    for name in os.listdir(thiscachedir):
+        if not _CACHEFILE_RE.match(name): continue
+        filename= os.path.join(thiscachedir,name)
+        stat= os.stat(filename)
+        out.append((filename,stat.st_size,stat.st_mtime))
+    return out
@@ -14,7 +14,10 @@ default_configuration= {'normalization': {'ro':'8.',
                         'astropy': {'astropy-units':'False',
                                     'astropy-coords':'True'},
                         'plot': {'seaborn-bovy-defaults':'False'},
-                        'warnings': {'verbose':'False'}}
+                        'warnings': {'verbose':'False'},
+                        'cache': {'dir':os.path.join('~','.galpy','cache'),
+                                  'maxsize':'1024',
+                                  'orbit-actionangles':'5'}}
 default_filename= os.path.join(os.path.expanduser('~'),'.galpyrc')
 def check_config(configuration):
     # Check that the configuration is a valid galpy configuration
@@ -0,0 +1,304 @@
+###############################################################################
+#   serialize.py: compact, schema-based serialization of galpy objects (e.g.,
+#                 potentials) for sending them to other processes
+#
+#   The serialized form consists of a JSON document that describes the
+#   structure of the object (galpy classes and their attributes, lists,
+#   dicts, parameters, ...) followed by the raw data buffers of all numpy
+#   arrays. Functions and classes that can be imported by name are stored by
+#   name, other functions (lambdas, functions defined inside functions or in
+#   __main__) by their compiled code, default arguments, and closure
+#   variables, with the globals of the module that they were defined in.
+#   Besides galpy objects and their parameters (numbers, strings, lists,
+#   tuples, dicts, numpy arrays, and functions), only numpy and scipy
+#   objects (e.g., the splines held by some potentials) are supported, by
+#   their constructor and state; serializing any other object raises a
+#   TypeError. Because compiled code is specific to the Python version, the
+#   serialized form can only be loaded with the same Python and galpy
+#   versions that created it. Loading runs the stored code, so, like pickle,
+#   loads must never be used on data from an untrusted source.
+###############################################################################
+import sys
+import json
+import types
+import struct
+import marshal
+import importlib
+import numpy
+from .. import __version__ as galpy_version
+_MAGIC= b'GALPYSER'
+_FORMAT_VERSION= 1
+_PYTHON_VERSION= '%i.%i' % sys.version_info[:2]
+# Packages whose objects are stored by their constructor and state
+_REDUCE_PACKAGES= ['numpy','scipy']
+def dumps(obj):
+    """
+    NAME:
+       dumps
+    PURPOSE:
+       serialize an object (e.g., a Potential instance or a list of potentials) to bytes
+    INPUT:
+       obj - object to serialize
+    OUTPUT:
+       bytes (raises TypeError for objects that are not supported, see the module description)
+    HISTORY:
+       2026-10-19 - Written - agent
+    """
+    encoder= _Encoder()
+    tree= encoder.encode(obj)
+    header= json.dumps({'format':_FORMAT_VERSION,'galpy':galpy_version,
+                        'python':_PYTHON_VERSION,'tree':tree,
+                        'buffers':[len(b) for b in encoder.buffers]},
+                       separators=(',',':')).encode('utf-8')
+    return b''.join([_MAGIC,struct.pack('<Q',len(header)),header]
+                    +encoder.buffers)
+
+def loads(data):
+    """
+    NAME:
+       loads
+    PURPOSE:
+       load an object serialized with dumps
+    INPUT:
+       data - bytes returned by dumps
+    OUTPUT:
+       object
+    HISTORY:
+       2026-10-19 - Written - agent
+    NOTE:
+       loading runs the compiled code contained in data, so never use loads on data from an untrusted source (like pickle.loads)
+    """
+    data= memoryview(data)
+    if bytes(data[:len(_MAGIC)]) != _MAGIC:
+        raise ValueError("Input is not a serialized galpy object")
+    start= len(_MAGIC)+8
+    hlen= struct.unpack('<Q',data[len(_MAGIC):start])[0]
+    header= json.loads(bytes(data[start:start+hlen]).decode('utf-8'))
+    if header['format'] != _FORMAT_VERSION \
+            or header['galpy'] != galpy_version \
+            or header['python'] != _PYTHON_VERSION:
+        raise ValueError("Serialized object was created with galpy {} and Python {}, cannot be loaded with galpy {} and Python {}".format(header['galpy'],header['python'],galpy_version,_PYTHON_VERSION))
+    buffers= []
+    offset= start+hlen
+    for blen in header['buffers']:
+        buffers.append(data[offset:offset+blen])
+        offset+= blen
+    return _Decoder(buffers).decode(header['tree'])
+
+def _import(module,name):
+    """Import an object by module and (qualified) name"""
+    out= importlib.import_module(module)
+    for attr in name.split('.'):
+        out= getattr(out,attr)
+    return out
+
+def _importable(obj):
+    """Return (module,name) if obj can be imported by its name, None otherwise"""
+    module= getattr(obj,'__module__',None)
+    name= getattr(obj,'__qualname__',getattr(obj,'__name__',None))
+    # Objects in __main__ cannot be imported by another process
+    if module is None or module == '__main__' or name is None \
+            or '<' in name: return None
+    try:
+        if _import(module,name) is obj: return (module,name)
+    except (ImportError,AttributeError):
+        pass
+    return None
+
+def _make_cell(value):
+    """Create a closure cell that contains value"""
+    return (lambda: value).__closure__[0]
+
+class _Encoder(object):
+    """Convert an object to a JSON-compatible tree and a list of raw buffers"""
+    def __init__(self):
+        self.buffers= []
+        self._memo= {}
+        self._keepalive= []
+        return None
+
+    def _buffer(self,data):
+        self.buffers.append(bytes(data))
+        return len(self.buffers)-1
+
+    def encode(self,obj):
+        if obj is None or isinstance(obj,(bool,str)):
+            return obj
+        elif isinstance(obj,(int,float)) and type(obj) in (int,float):
+            return obj
+        elif isinstance(obj,list):
+            return [self.encode(o) for o in obj]
+        elif isinstance(obj,tuple) and type(obj) is tuple:
+            return {'t':'tuple','v':[self.encode(o) for o in obj]}
+        elif isinstance(obj,dict) and type(obj) is dict:
+            return {'t':'dict','v':[[self.encode(k),self.encode(v)]
+                                    for k,v in obj.items()]}
+        elif isinstance(obj,complex):
+            return {'t':'complex','v':[obj.real,obj.imag]}
+        elif isinstance(obj,bytes):
+            return {'t':'bytes','b':self._buffer(obj)}
+        elif isinstance(obj,numpy.ndarray) and type(obj) is numpy.ndarray \
+                and not obj.dtype.hasobject and obj.dtype.fields is None:
+            return {'t':'array','dtype':obj.dtype.str,'shape':obj.shape,
+                    'b':self._buffer(numpy.ascontiguousarray(obj).data)}
+        elif isinstance(obj,numpy.generic) and not obj.dtype.hasobject \
+                and obj.dtype.fields is None:
+            return {'t':'scalar','dtype':obj.dtype.str,
+                    'b':self._buffer(obj.tobytes())}
+        elif id(obj) in self._memo:
+            return {'t':'memo','i':self._memo[id(obj)]}
+        elif isinstance(obj,types.FunctionType):
+            return self._encode_function(obj)
+        elif isinstance(obj,types.MethodType):
+            return {'t':'method','self':self.encode(obj.__self__),
+                    'name':obj.__func__.__name__}
+        elif _is_galpy_object(obj):
+            return self._encode_object(obj)
+        elif _is_galpy_object(obj,importable=False):
+            return self._encode_reduce(obj)
+        imp= _importable(obj) if callable(obj) else None
+        if not imp is None:
+            return {'t':'ref','module':imp[0],'name':imp[1]}
+        elif obj.__class__.__module__.split('.')[0] in _REDUCE_PACKAGES:
+            return self._encode_reduce(obj)
+        raise TypeError("Cannot serialize object of type {}.{}; only galpy objects, their parameters (numbers, strings, lists, tuples, dicts, numpy arrays, and functions), and numpy and scipy objects are supported".format(obj.__class__.__module__,obj.__class__.__name__))
+
+    def _remember(self,obj):
+        # Keep obj alive such that its id is not re-used while encoding
+        self._memo[id(obj)]= len(self._memo)
+        self._keepalive.append(obj)
+        return self._memo[id(obj)]
+
+    def _encode_function(self,func):
+        imp= _importable(func)
+        if not imp is None:
+            return {'t':'ref','module':imp[0],'name':imp[1]}
+        out= {'t':'function','i':self._remember(func),'name':func.__name__,
+              'module':func.__module__,
+              'code':self._buffer(marshal.dumps(func.__code__))}
+        out['defaults']= self.encode(func.__defaults__)
+        out['kwdefaults']= self.encode(func.__kwdefaults__)
+        out['closure']= None if func.__closure__ is None \
+            else [self.encode(c.cell_contents) for c in func.__closure__]
+        return out
+
+    def _encode_object(self,obj):
+        cls= obj.__class__
+        out= {'t':'object','i':self._remember(obj),'module':cls.__module__,
+              'name':cls.__qualname__}
+        if _has_custom_state(cls):
+            out['state']= self.encode(obj.__getstate__())
+            out['setstate']= True
+        else:
+            out['state']= self.encode(obj.__dict__)
+        return out
+
+    def _encode_reduce(self,obj):
+        # For objects of galpy classes that are created on the fly (e.g., 
+        # wrappers) and numpy and scipy objects
+        reduced= obj.__reduce_ex__(2)
+        if isinstance(reduced,str) \
+                or any(not r is None for r in reduced[3:]):
+            raise TypeError("Cannot serialize object of type {}.{}, because it cannot be reconstructed from its constructor and state".format(obj.__class__.__module__,obj.__class__.__name__))
+        out= {'t':'reduce','func':self.encode(reduced[0]),
+              'args':self.encode(reduced[1])}
+        out['i']= self._remember(obj)
+        out['state']= self.encode(reduced[2] if len(reduced) > 2 else None)
+        return out
+
+class _Decoder(object):
+    """Convert a tree and list of raw buffers back into an object"""
+    def __init__(self,buffers):
+        self._buffers= buffers
+        self._memo= {}
+        return None
+
+    def decode(self,tree):
+        if tree is None or isinstance(tree,(bool,str,int,float)):
+            return tree
+        elif isinstance(tree,list):
+            return [self.decode(t) for t in tree]
+        kind= tree['t']
+        if kind == 'tuple':
+            return tuple(self.decode(t) for t in tree['v'])
+        elif kind == 'dict':
+            return dict((self.decode(k),self.decode(v)) for k,v in tree['v'])
+        elif kind == 'complex':
+            return complex(*tree['v'])
+        elif kind == 'bytes':
+            return bytes(self._buffers[tree['b']])
+        elif kind == 'array':
+            # Copy such that the array owns its (writeable) data
+            return numpy.frombuffer(self._buffers[tree['b']],
+                                    dtype=tree['dtype'])\
+                                    .reshape(tree['shape']).copy()
+        elif kind == 'scalar':
+            return numpy.frombuffer(self._buffers[tree['b']],
+                                    dtype=tree['dtype'])[0]
+        elif kind == 'memo':
+            return self._memo[tree['i']]
+        elif kind == 'ref':
+            return _import(tree['module'],tree['name'])
+        elif kind == 'function':
+            return self._decode_function(tree)
+        elif kind == 'method':
+            return getattr(self.decode(tree['self']),tree['name'])
+        elif kind == 'object':
+            return self._decode_object(tree)
+        elif kind == 'reduce':
+            return self._decode_reduce(tree)
+        raise ValueError("Unknown type {} in serialized object".format(kind))
+
+    def _decode_function(self,tree):
+        code= marshal.loads(self._buffers[tree['code']])
+        # Create the function with empty closure cells first, such that
+        # recursive references to it can be resolved
+        cells= None if tree['closure'] is None \
+            else tuple(_make_cell(None) for c in tree['closure'])
+        func= types.FunctionType(code,
+                                 importlib.import_module(tree['module'])\
+                                     .__dict__,
+                                 tree['name'],None,cells)
+        self._memo[tree['i']]= func
+        func.__defaults__= self.decode(tree['defaults'])
+        func.__kwdefaults__= self.decode(tree['kwdefaults'])
+        if not cells is None:
+            for cell,c in zip(cells,tree['closure']):
+                cell.cell_contents= self.decode(c)
+        return func
+
+    def _decode_object(self,tree):
+        cls= _import(tree['module'],tree['name'])
+        obj= cls.__new__(cls)
+        self._memo[tree['i']]= obj
+        state= self.decode(tree['state'])
+        if tree.get('setstate',False):
+            obj.__setstate__(state)
+        else:
+            obj.__dict__.update(state)
+        return obj
+
+    def _decode_reduce(self,tree):
+        obj= self.decode(tree['func'])(*self.decode(tree['args']))
+        self._memo[tree['i']]= obj
+        state= self.decode(tree['state'])
+        if state is None:
+            pass
+        elif hasattr(obj,'__setstate__') and _has_custom_state(type(obj)):
+            obj.__setstate__(state)
+        else:
+            obj.__dict__.update(state)
+        return obj
+
+def _is_galpy_object(obj,importable=True):
+    """Whether obj is an instance of a galpy class that can be imported (importable=True) or that is created on the fly (importable=False)"""
+    return hasattr(obj,'__dict__') \
+        and not isinstance(obj,(type,types.ModuleType)) \
+        and obj.__class__.__module__.split('.')[0] == 'galpy' \
+        and (_importable(obj.__class__) is None) is (not importable)
+
+def _has_custom_state(cls):
+    """Whether cls defines its own __getstate__ and __setstate__"""
+    return getattr(cls,'__getstate__',None) \
+        is not getattr(object,'__getstate__',None) \
+        and hasattr(cls,'__setstate__')
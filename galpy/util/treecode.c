@@ -0,0 +1,121 @@
+/*
+  C code for walking a Barnes-Hut octree (built in galpy/util/treecode.py) to
+  compute the gravitational potential and acceleration (G=1) at a set of
+  points; nodes carry monopole and traceless quadrupole moments
+*/
+#ifdef _WIN32
+#include <Python.h>
+#endif
+#include <stdlib.h>
+#include <math.h>
+#ifdef _OPENMP
+#include <omp.h>
+#endif
+#define CHUNKSIZE 16
+// At most 7 siblings on the stack per level of the tree, plus the root
+#define TREECODE_STACKSIZE 256
+//Macros to export functions in DLL on different OS
+#if defined(_WIN32)
+#define EXPORT __declspec(dllexport)
+#elif defined(__GNUC__)
+#define EXPORT __attribute__((visibility("default")))
+#else
+// Just do nothing?
+#define EXPORT
+#endif
+static void treecode_gravity_point(double x,double y,double z,
+				   double * pos,double * mass,
+				   double * com,double * nmass,double * quad,
+				   double * crit2,long long * first_child,
+				   long long * nchild,long long * start,
+				   long long * end,double eps2,
+				   double * pot,double * acc){
+  int nstack= 1;
+  long long stack[TREECODE_STACKSIZE];
+  long long node, ii;
+  double dx, dy, dz, d2, dm2, id2, id5, fac, Qx, Qy, Qz, xQx;
+  double * Q;
+  *pot= 0.;
+  *acc= 0.;
+  *(acc+1)= 0.;
+  *(acc+2)= 0.;
+  *stack= 0;
+  while ( nstack > 0 ) {
+    node= *(stack + --nstack);
+    dx= x - *(com+3*node);
+    dy= y - *(com+3*node+1);
+    dz= z - *(com+3*node+2);
+    d2= dx * dx + dy * dy + dz * dz;
+    if ( d2 > *(crit2+node) ) {
+      // Monopole (softened)
+      dm2= d2 + eps2;
+      fac= *(nmass+node) / sqrt ( dm2 );
+      *pot-= fac;
+      fac/= dm2;
+      *acc-= fac * dx;
+      *(acc+1)-= fac * dy;
+      *(acc+2)-= fac * dz;
+      // Quadrupole
+      Q= quad + 6 * node;
+      Qx= *Q * dx + *(Q+1) * dy + *(Q+2) * dz;
+      Qy= *(Q+1) * dx + *(Q+3) * dy + *(Q+4) * dz;
+      Qz= *(Q+2) * dx + *(Q+4) * dy + *(Q+5) * dz;
+      xQx= dx * Qx + dy * Qy + dz * Qz;
+      id2= 1. / d2;
+      id5= id2 * id2 * sqrt ( id2 );
+      *pot-= 0.5 * xQx * id5;
+      *acc+= ( Qx - 2.5 * xQx * dx * id2 ) * id5;
+      *(acc+1)+= ( Qy - 2.5 * xQx * dy * id2 ) * id5;
+      *(acc+2)+= ( Qz - 2.5 * xQx * dz * id2 ) * id5;
+    }
+    else if ( *(first_child+node) < 0 ) {
+      // Leaf: direct summation
+      for (ii= *(start+node); ii < *(end+node); ii++) {
+	dx= x - *(pos+3*ii);
+	dy= y - *(pos+3*ii+1);
+	dz= z - *(pos+3*ii+2);
+	dm2= dx * dx + dy * dy + dz * dz + eps2;
+	if ( dm2 == 0. ) continue;
+	fac= *(mass+ii) / sqrt ( dm2 );
+	*pot-= fac;
+	fac/= dm2;
+	*acc-= fac * dx;
+	*(acc+1)-= fac * dy;
+	*(acc+2)-= fac * dz;
+      }
+    }
+    else
+      for (ii=0; ii < *(nchild+node); ii++)
+	*(stack + nstack++)= *(first_child+node) + ii;
+  }
+}
+EXPORT void treecode_gravity(int npart,
+			     double * pos,
+			     double * mass,
+			     int nnode,
+			     double * com,
+			     double * nmass,
+			     double * quad,
+			     double * crit2,
+			     long long * first_child,
+			     long long * nchild,
+			     long long * start,
+			     long long * end,
+			     double softening,
+			     int npts,
+			     double * points,
+			     int nthreads,
+			     double * pot,
+			     double * acc){
+  int ii;
+  double eps2= softening * softening;
+#ifdef _OPENMP
+  if ( nthreads <= 0 ) nthreads= omp_get_max_threads();
+#endif
+#pragma omp parallel for num_threads(nthreads) schedule(dynamic,CHUNKSIZE) \
+  private(ii)
+  for (ii=0; ii < npts; ii++)
+    treecode_gravity_point(*(points+3*ii),*(points+3*ii+1),*(points+3*ii+2),
+			   pos,mass,com,nmass,quad,crit2,first_child,nchild,
+			   start,end,eps2,pot+ii,acc+3*ii);
+}
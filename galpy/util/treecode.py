@@ -0,0 +1,375 @@
+###############################################################################
+#   treecode.py: Barnes-Hut tree code for the gravitational potential and
+#                acceleration of a set of particles
+#
+#   The octree is built in a vectorized way from the particles sorted along
+#   a Morton (Z-order) curve and nodes carry monopole and quadrupole moments;
+#   the tree is walked in C (in parallel with OpenMP) when the C extension
+#   is available, and with a vectorized numpy walk otherwise
+###############################################################################
+import ctypes
+import numpy
+from numpy.ctypeslib import ndpointer
+from . import _load_extension_libs
+_lib, _ext_loaded= _load_extension_libs.load_libgalpy()
+_MAXLEVEL= 21 # 21 bits per dimension in the 63-bit Morton keys
+def tree_gravity(pos,mass,points,theta=0.5,softening=0.,leafsize=8,
+                 numcores=None,use_c=None,tree=None):
+    """
+    NAME:
+
+       tree_gravity
+
+    PURPOSE:
+
+       compute the gravitational potential and acceleration (with G=1) of a set of particles at a set of points using a Barnes-Hut tree code with quadrupole moments
+
+    INPUT:
+
+       pos - positions of the particles (Nx3 array)
+
+       mass - masses of the particles (N array or number)
+
+       points - points at which to compute the potential and acceleration (Mx3 array)
+
+       theta= (0.5) opening angle: a node of size l at distance d from its center of mass is accepted when d > l/theta + delta, with delta the offset between the node's center of mass and its geometric center
+
+       softening= (0.) Plummer softening length
+
+       leafsize= (8) maximum number of particles in a leaf of the tree
+
+       numcores= (None) number of OpenMP threads to use in C (default: all available)
+
+       use_c= (None) if True, use the C implementation of the tree walk (default: if the C extension is loaded)
+
+       tree= (None) tree for these particles previously returned by build_tree, such that it does not need to be rebuilt (pos, mass, and leafsize are then ignored)
+
+    OUTPUT:
+
+       (potential [M], acceleration [M,3])
+
+    HISTORY:
+
+       2026-10-19 - Written - agent
+
+    """
+    points= numpy.atleast_2d(numpy.asarray(points,dtype='float'))
+    if use_c is None: use_c= _ext_loaded
+    if tree is None:
+        tree= build_tree(pos,mass,leafsize=leafsize)
+    # Squared distance beyond which a node's multipole expansion is used
+    crit2= (tree['size']/theta+tree['delta'])**2.
+    if use_c:
+        return _tree_gravity_c(tree,crit2,points,softening,numcores)
+    else:
+        return _tree_gravity_python(tree,crit2,points,softening)
+
+def build_tree(pos,mass,leafsize=8):
+    """
+    NAME:
+
+       build_tree
+
+    PURPOSE:
+
+       build the octree used by tree_gravity
+
+    INPUT:
+
+       pos - positions of the particles (Nx3 array)
+
+       mass - masses of the particles (N array or number)
+
+       leafsize= (8) maximum number of particles in a leaf of the tree
+
+    OUTPUT:
+
+       dictionary with the particles sorted along a Morton curve and the node arrays (nodes are numbered breadth-first, such that the children of a node are contiguous)
+
+    HISTORY:
+
+       2026-10-19 - Written - agent
+
+    """
+    pos= numpy.atleast_2d(numpy.asarray(pos,dtype='float'))
+    mass= numpy.asarray(mass,dtype='float')*numpy.ones(len(pos))
+    npart= len(pos)
+    xmin= numpy.amin(pos,axis=0)
+    size= numpy.amax(numpy.amax(pos,axis=0)-xmin)
+    if size == 0.: size= 1.
+    size*= 1.+10.**-10.
+    ncell= 2**_MAXLEVEL
+    ijk= numpy.clip(((pos-xmin)/size*ncell).astype('int64'),0,ncell-1)
+    keys= _spread_bits(ijk[:,0])\
+        |(_spread_bits(ijk[:,1]) << numpy.uint64(1))\
+        |(_spread_bits(ijk[:,2]) << numpy.uint64(2))
+    order= numpy.argsort(keys,kind='stable')
+    keys= keys[order]
+    spos= pos[order]
+    smass= mass[order]
+    # Build the tree level by level; nodes to be split at the current level
+    # are given by their start and end in the sorted particle array
+    starts= [numpy.array([0])]
+    ends= [numpy.array([npart])]
+    levels= [numpy.array([0])]
+    first_child= []
+    nchild= []
+    level= 0
+    split= numpy.array([npart > leafsize])
+    while numpy.any(split):
+        pstart= starts[-1][split]
+        pend= ends[-1][split]
+        # All boundaries between cells at the next level
+        shift= numpy.uint64(3*(_MAXLEVEL-level-1))
+        cell= keys >> shift
+        bounds= numpy.flatnonzero(cell[1:] != cell[:-1])+1
+        segstart= numpy.concatenate(([0],bounds))
+        segend= numpy.concatenate((bounds,[npart]))
+        # Children are the cells that lie within the nodes that are split
+        parent= numpy.searchsorted(pstart,segstart,side='right')-1
+        inparent= (parent >= 0)\
+            *(segstart < pend[numpy.clip(parent,0,None)])
+        segstart= segstart[inparent]
+        segend= segend[inparent]
+        parent= parent[inparent]
+        tnchild= numpy.bincount(parent,minlength=len(pstart))
+        tfirst_child= numpy.zeros(len(starts[-1]),dtype='int64')-1
+        tnchild_all= numpy.zeros(len(starts[-1]),dtype='int64')
+        offset= numpy.sum([len(s) for s in starts])
+        tfirst_child[split]= offset+numpy.cumsum(tnchild)-tnchild
+        tnchild_all[split]= tnchild
+        first_child.append(tfirst_child)
+        nchild.append(tnchild_all)
+        level+= 1
+        starts.append(segstart)
+        ends.append(segend)
+        levels.append(numpy.zeros(len(segstart),dtype='int64')+level)
+        split= (segend-segstart > leafsize)*(level < _MAXLEVEL)
+    first_child.append(numpy.zeros(len(starts[-1]),dtype='int64')-1)
+    nchild.append(numpy.zeros(len(starts[-1]),dtype='int64'))
+    # Moments, from the leaves up
+    nmass= []
+    ncom= []
+    nsec= [] # second moments about the center of mass
+    for ii in range(len(starts)-1,-1,-1):
+        leaf= first_child[ii] < 0
+        tmass= numpy.zeros(len(starts[ii]))
+        tcom= numpy.zeros((len(starts[ii]),3))
+        tsec= numpy.zeros((len(starts[ii]),6))
+        if numpy.any(leaf):
+            tmass[leaf],tcom[leaf],tsec[leaf]=\
+                _leaf_moments(spos,smass,starts[ii][leaf],ends[ii][leaf])
+        if numpy.any(True^leaf):
+            tmass[True^leaf],tcom[True^leaf],tsec[True^leaf]=\
+                _node_moments(nmass[0],ncom[0],nsec[0],
+                              first_child[ii][True^leaf]\
+                                  -numpy.sum([len(s) for s in starts[:ii+1]]),
+                              nchild[ii][True^leaf])
+        nmass.insert(0,tmass)
+        ncom.insert(0,tcom)
+        nsec.insert(0,tsec)
+    starts= numpy.concatenate(starts)
+    levels= numpy.concatenate(levels)
+    tree= {}
+    tree['pos']= spos
+    tree['mass']= smass
+    tree['start']= starts
+    tree['end']= numpy.concatenate(ends)
+    tree['first_child']= numpy.concatenate(first_child)
+    tree['nchild']= numpy.concatenate(nchild)
+    tree['nmass']= numpy.concatenate(nmass)
+    tree['com']= numpy.concatenate(ncom)
+    sec= numpy.concatenate(nsec)
+    # Traceless quadrupole moment Q_ij = sum m (3 x_i x_j - r^2 delta_ij)
+    trace= sec[:,0]+sec[:,3]+sec[:,5]
+    tree['quad']= 3.*sec
+    tree['quad'][:,0]-= trace
+    tree['quad'][:,3]-= trace
+    tree['quad'][:,5]-= trace
+    # Geometric size and center of each node's cell
+    tree['size']= size/2.**levels
+    shift= (3*(_MAXLEVEL-levels)).astype('uint64')
+    cellkeys= keys[starts] >> shift
+    center= numpy.array([_compact_bits(cellkeys >> numpy.uint64(ii))
+                         for ii in range(3)]).T
+    center= xmin+(center+0.5)*tree['size'][:,None]
+    tree['delta']= numpy.sqrt(numpy.sum((tree['com']-center)**2.,axis=1))
+    return tree
+
+def _leaf_moments(pos,mass,start,end):
+    """Mass, center of mass, and second moments of the particles in leaves, which do not overlap"""
+    counts= end-start
+    indx= numpy.repeat(start-numpy.cumsum(counts)+counts,counts)\
+        +numpy.arange(numpy.sum(counts))
+    leaf= numpy.repeat(numpy.arange(len(start)),counts)
+    tmass= numpy.bincount(leaf,weights=mass[indx],minlength=len(start))
+    tcom= numpy.array([numpy.bincount(leaf,weights=mass[indx]*pos[indx,ii],
+                                      minlength=len(start))
+                       for ii in range(3)]).T
+    tcom[tmass > 0.]/= tmass[tmass > 0.,None]
+    dx= pos[indx]-tcom[leaf]
+    tsec= numpy.array([numpy.bincount(leaf,weights=mass[indx]*dx[:,ii]*dx[:,jj],
+                                      minlength=len(start))
+                       for ii,jj in _SEC_INDX]).T
+    return (tmass,tcom,tsec)
+
+def _node_moments(cmass,ccom,csec,first_child,nchild):
+    """Mass, center of mass, and second moments of internal nodes from those of their children (whose indices start at 0 for the first child)"""
+    child= numpy.repeat(numpy.arange(len(first_child)),nchild)
+    cindx= numpy.repeat(first_child-numpy.cumsum(nchild)+nchild,nchild)\
+        +numpy.arange(numpy.sum(nchild))
+    tmass= numpy.bincount(child,weights=cmass[cindx],
+                          minlength=len(first_child))
+    tcom= numpy.array([numpy.bincount(child,weights=cmass[cindx]\
+                                          *ccom[cindx,ii],
+                                      minlength=len(first_child))
+                       for ii in range(3)]).T
+    tcom[tmass > 0.]/= tmass[tmass > 0.,None]
+    # Parallel-axis theorem
+    dx= ccom[cindx]-tcom[child]
+    tsec= numpy.array([numpy.bincount(child,weights=csec[cindx,kk]
+                                      +cmass[cindx]*dx[:,ii]*dx[:,jj],
+                                      minlength=len(first_child))
+                       for kk,(ii,jj) in enumerate(_SEC_INDX)]).T
+    return (tmass,tcom,tsec)
+
+_SEC_INDX= [(0,0),(0,1),(0,2),(1,1),(1,2),(2,2)]
+
+def _spread_bits(x):
+    """Spread the lowest 21 bits of x such that there are two zero bits between each bit"""
+    x= x.astype('uint64') & numpy.uint64(0x1fffff)
+    x= (x | (x << numpy.uint64(32))) & numpy.uint64(0x1f00000000ffff)
+    x= (x | (x << numpy.uint64(16))) & numpy.uint64(0x1f0000ff0000ff)
+    x= (x | (x << numpy.uint64(8))) & numpy.uint64(0x100f00f00f00f00f)
+    x= (x | (x << numpy.uint64(4))) & numpy.uint64(0x10c30c30c30c30c3)
+    x= (x | (x << numpy.uint64(2))) & numpy.uint64(0x1249249249249249)
+    return x
+
+def _compact_bits(x):
+    """Inverse of _spread_bits"""
+    x= x & numpy.uint64(0x1249249249249249)
+    x= (x | (x >> numpy.uint64(2))) & numpy.uint64(0x10c30c30c30c30c3)
+    x= (x | (x >> numpy.uint64(4))) & numpy.uint64(0x100f00f00f00f00f)
+    x= (x | (x >> numpy.uint64(8))) & numpy.uint64(0x1f0000ff0000ff)
+    x= (x | (x >> numpy.uint64(16))) & numpy.uint64(0x1f00000000ffff)
+    x= (x | (x >> numpy.uint64(32))) & numpy.uint64(0x1fffff)
+    return x.astype('int64')
+
+def _tree_gravity_python(tree,crit2,points,softening,chunk=256):
+    """Vectorized walk of the tree for chunks of points"""
+    npts= len(points)
+    pot= numpy.zeros(npts)
+    acc= numpy.zeros((npts,3))
+    eps2= softening**2.
+    for cstart in range(0,npts,chunk):
+        tpoints= points[cstart:cstart+chunk]
+        ntp= len(tpoints)
+        tpot= numpy.zeros(ntp)
+        tacc= numpy.zeros((ntp,3))
+        # Frontier of (point, node) pairs that remain to be considered
+        pi= numpy.arange(ntp)
+        ni= numpy.zeros(ntp,dtype='int64')
+        while len(pi) > 0:
+            dx= tpoints[pi]-tree['com'][ni]
+            d2= numpy.sum(dx**2.,axis=1)
+            accept= d2 > crit2[ni]
+            if numpy.any(accept):
+                _add_multipole(tpot,tacc,pi[accept],dx[accept],d2[accept],
+                               tree['nmass'][ni[accept]],
+                               tree['quad'][ni[accept]],eps2)
+            leaf= (True^accept)*(tree['first_child'][ni] < 0)
+            if numpy.any(leaf):
+                counts= tree['end'][ni[leaf]]-tree['start'][ni[leaf]]
+                ppi= numpy.repeat(pi[leaf],counts)
+                ppart= numpy.repeat(tree['start'][ni[leaf]]
+                                    -numpy.cumsum(counts)+counts,counts)\
+                                    +numpy.arange(numpy.sum(counts))
+                pdx= tpoints[ppi]-tree['pos'][ppart]
+                pd2= numpy.sum(pdx**2.,axis=1)+eps2
+                good= pd2 > 0.
+                ppi, pdx, pd2= ppi[good], pdx[good], pd2[good]
+                pm= tree['mass'][ppart[good]]
+                tpot-= numpy.bincount(ppi,weights=pm/numpy.sqrt(pd2),
+                                      minlength=ntp)
+                for ii in range(3):
+                    tacc[:,ii]-= numpy.bincount(ppi,
+                                                weights=pm*pdx[:,ii]\
+                                                    /pd2**1.5,
+                                                minlength=ntp)
+            openn= (True^accept)*(tree['first_child'][ni] >= 0)
+            counts= tree['nchild'][ni[openn]]
+            newpi= numpy.repeat(pi[openn],counts)
+            ni= numpy.repeat(tree['first_child'][ni[openn]]
+                             -numpy.cumsum(counts)+counts,counts)\
+                             +numpy.arange(numpy.sum(counts))
+            pi= newpi
+        pot[cstart:cstart+chunk]= tpot
+        acc[cstart:cstart+chunk]= tacc
+    return (pot,acc)
+
+def _add_multipole(pot,acc,pi,dx,d2,mass,quad,eps2):
+    """Add the potential and acceleration of nodes with mass and traceless quadrupole moment quad (xx,xy,xz,yy,yz,zz) at separations dx (point - center of mass)"""
+    ntp= len(pot)
+    # Monopole (softened)
+    dm2= d2+eps2
+    pot-= numpy.bincount(pi,weights=mass/numpy.sqrt(dm2),minlength=ntp)
+    for ii in range(3):
+        acc[:,ii]-= numpy.bincount(pi,weights=mass*dx[:,ii]/dm2**1.5,
+                                   minlength=ntp)
+    # Quadrupole: Phi_q = - x.Q.x / 2 / d^5
+    Qx= numpy.array([quad[:,0]*dx[:,0]+quad[:,1]*dx[:,1]+quad[:,2]*dx[:,2],
+                     quad[:,1]*dx[:,0]+quad[:,3]*dx[:,1]+quad[:,4]*dx[:,2],
+                     quad[:,2]*dx[:,0]+quad[:,4]*dx[:,1]+quad[:,5]*dx[:,2]]).T
+    xQx= numpy.sum(dx*Qx,axis=1)
+    id2= 1./d2
+    id5= id2**2.5
+    pot-= numpy.bincount(pi,weights=0.5*xQx*id5,minlength=ntp)
+    for ii in range(3):
+        acc[:,ii]+= numpy.bincount(pi,weights=(Qx[:,ii]-2.5*xQx*dx[:,ii]*id2)
+                                   *id5,minlength=ntp)
+    return None
+
+def _tree_gravity_c(tree,crit2,points,softening,numcores):
+    """Walk the tree in C"""
+    npts= len(points)
+    pot= numpy.zeros(npts)
+    acc= numpy.zeros((npts,3))
+    if numcores is None: numcores= 0 # use the OpenMP default
+    ndarrayFlags= ('C_CONTIGUOUS','WRITEABLE')
+    treecode_walk= _lib.treecode_gravity
+    treecode_walk.argtypes=\
+        [ctypes.c_int,
+         ndpointer(dtype=numpy.float64,flags=ndarrayFlags),
+         ndpointer(dtype=numpy.float64,flags=ndarrayFlags),
+         ctypes.c_int,
+         ndpointer(dtype=numpy.float64,flags=ndarrayFlags),
+         ndpointer(dtype=numpy.float64,flags=ndarrayFlags),
+         ndpointer(dtype=numpy.float64,flags=ndarrayFlags),
+         ndpointer(dtype=numpy.float64,flags=ndarrayFlags),
+         ndpointer(dtype=numpy.int64,flags=ndarrayFlags),
+         ndpointer(dtype=numpy.int64,flags=ndarrayFlags),
+         ndpointer(dtype=numpy.int64,flags=ndarrayFlags),
+         ndpointer(dtype=numpy.int64,flags=ndarrayFlags),
+         ctypes.c_double,
+         ctypes.c_int,
+         ndpointer(dtype=numpy.float64,flags=ndarrayFlags),
+         ctypes.c_int,
+         ndpointer(dtype=numpy.float64,flags=ndarrayFlags),
+         ndpointer(dtype=numpy.float64,flags=ndarrayFlags)]
+    # Make sure all arrays are contiguous
+    f_cont= [numpy.require(x,requirements=['C','W'])
+             for x in [tree['pos'],tree['mass'],tree['com'],tree['nmass'],
+                       tree['quad'],crit2]]
+    i_cont= [numpy.require(tree[k].astype('int64'),requirements=['C','W'])
+             for k in ['first_child','nchild','start','end']]
+    points= numpy.require(points,requirements=['C','W'])
+    treecode_walk(ctypes.c_int(len(tree['mass'])),
+                  f_cont[0],f_cont[1],
+                  ctypes.c_int(len(tree['nmass'])),
+                  f_cont[2],f_cont[3],f_cont[4],f_cont[5],
+                  i_cont[0],i_cont[1],i_cont[2],i_cont[3],
+                  ctypes.c_double(softening),
+                  ctypes.c_int(npts),points,
+                  ctypes.c_int(numcores),
+                  pot,acc)
+    return (pot,acc)
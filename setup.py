@@ -126,7 +126,8 @@ if WIN32:
 
 #main C extension
 galpy_c_src= ['galpy/util/bovy_symplecticode.c', 'galpy/util/bovy_rk.c', 
-              'galpy/util/leung_dop853.c','galpy/util/bovy_coords.c']
+              'galpy/util/leung_dop853.c','galpy/util/bovy_coords.c',
+              'galpy/util/treecode.c']
 galpy_c_src.extend(glob.glob('galpy/potential/potential_c_ext/*.c'))
 galpy_c_src.extend(glob.glob('galpy/potential/interppotential_c_ext/*.c'))
 galpy_c_src.extend(glob.glob('galpy/util/interp_2d/*.c'))
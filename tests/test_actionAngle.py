@@ -613,6 +613,43 @@ def test_actionAngleSpherical_otherIsochrone_angles():
     assert daz < 10.**-6., 'actionAngleSpherical applied to isochrone potential fails for az at %g%%' % (daz*100.)
     return None
 
+# Test that the C implementation of actionAngleSpherical agrees with the
+# Python implementation for a set of orbits
+def test_actionAngleSpherical_c_against_python():
+    from galpy.potential import NFWPotential, HernquistPotential, \
+        IsochronePotential
+    R= numpy.array([1.1,0.6,1.5,0.9])
+    vR= numpy.array([0.3,-0.2,0.1,0.4])
+    vT= numpy.array([0.9,1.1,-0.7,0.5])
+    z= numpy.array([0.2,-0.3,0.5,0.1])
+    vz= numpy.array([-0.1,0.3,0.2,-0.4])
+    phi= numpy.array([0.5,2.,4.,5.5])
+    for pot in [NFWPotential(normalize=1.,a=3.),
+                [HernquistPotential(normalize=0.6,a=2.),
+                 IsochronePotential(normalize=0.4,b=0.8)]]:
+        _check_actionAngleSpherical_c_against_python(pot,R,vR,vT,z,vz,phi)
+    return None
+
+def _check_actionAngleSpherical_c_against_python(pot,R,vR,vT,z,vz,phi):
+    from galpy.actionAngle import actionAngleSpherical
+    aAS= actionAngleSpherical(pot=pot)
+    assert not aAS._c, 'actionAngleSpherical does not use Python by default'
+    jfac= aAS.actionsFreqsAngles(R,vR,vT,z,vz,phi,c=True)
+    jfap= aAS.actionsFreqsAngles(R,vR,vT,z,vz,phi,c=False)
+    for ii in range(9):
+        assert numpy.all(numpy.fabs(jfac[ii]-jfap[ii]) < 10.**-6.), 'actionAngleSpherical C and Python implementations disagree'
+    jc= aAS(R,vR,vT,z,vz,c=True)
+    for ii in range(3):
+        assert numpy.all(numpy.fabs(jc[ii]-jfap[ii]) < 10.**-6.), 'actionAngleSpherical C and Python implementations disagree'
+    jfc= aAS.actionsFreqs(R,vR,vT,z,vz,c=True)
+    for ii in range(6):
+        assert numpy.all(numpy.fabs(jfc[ii]-jfap[ii]) < 10.**-6.), 'actionAngleSpherical C and Python implementations disagree'
+    ec= aAS.EccZmaxRperiRap(R,vR,vT,z,vz,c=True)
+    ep= aAS.EccZmaxRperiRap(R,vR,vT,z,vz,c=False)
+    for ii in range(4):
+        assert numpy.all(numpy.fabs(ec[ii]-ep[ii]) < 10.**-8.), 'actionAngleSpherical C and Python implementations disagree'
+    return None
+
 #Basic sanity checking of the actionAngleAdiabatic actions
 def test_actionAngleAdiabatic_basic_actions():
     from galpy.actionAngle import actionAngleAdiabatic
@@ -780,6 +817,73 @@ def test_actionAngleAdiabatic_basic_EccZmaxRperiRap_gamma_c():
     assert numpy.fabs(tzmax) < 2.*10.**-2., 'Close-to-circular orbit in the MWPotential does not have small zmax'
     return None
 
+# Test that the vectorized Python implementation for multiple phase-space
+# points agrees with that for single phase-space points
+def test_actionAngleAdiabatic_vectorized_against_single():
+    from galpy.actionAngle import actionAngleAdiabatic
+    from galpy.potential import MWPotential2014
+    numpy.random.seed(1)
+    nobj= 10
+    R= 0.5+numpy.random.uniform(size=nobj)
+    vR= 0.2*numpy.random.normal(size=nobj)
+    vT= 1.+0.1*numpy.random.normal(size=nobj)
+    z= 0.1*numpy.random.normal(size=nobj)
+    vz= 0.1*numpy.random.normal(size=nobj)
+    # Include turning points, a radial orbit, and an orbit in the plane
+    vR[0]= 0.
+    vz[1]= 0.
+    vT[2]= 0.
+    z[3]= 0.
+    vz[3]= 0.
+    # Circular in the plane, but not in the effective potential for gamma != 0
+    R[4], vR[4], vT[4], z[4], vz[4]= 1., 0., 1., 0.2, 0.
+    for gamma in [0.,1.]:
+        aAA= actionAngleAdiabatic(pot=MWPotential2014,gamma=gamma,c=False)
+        jv= aAA(R,vR,vT,z,vz)
+        ev= aAA.EccZmaxRperiRap(R,vR,vT,z,vz)
+        for ii in range(nobj):
+            js= aAA(R[ii],vR[ii],vT[ii],z[ii],vz[ii])
+            es= aAA.EccZmaxRperiRap(R[ii],vR[ii],vT[ii],z[ii],vz[ii])
+            for jj in range(3):
+                assert numpy.fabs(jv[jj][ii]-js[jj]) < 10.**-5., 'Vectorized actionAngleAdiabatic actions do not agree with those for single phase-space points'
+            for jj in range(4):
+                assert numpy.fabs(ev[jj][ii]-es[jj]) < 10.**-5., 'Vectorized actionAngleAdiabatic EccZmaxRperiRap do not agree with those for single phase-space points'
+    return None
+
+# Test that the vectorized Python implementation works for potentials that
+# only accept scalar input
+def test_actionAngleAdiabatic_vectorized_scalarpot():
+    from galpy.actionAngle import actionAngleAdiabatic
+    from galpy.potential import Potential, PlummerPotential
+    class scalarPlummerPotential(Potential):
+        def __init__(self):
+            Potential.__init__(self,amp=1.)
+        def _evaluate(self,R,z,phi=0.,t=0.):
+            if R < 0.: raise ValueError('R must be positive')
+            return -1./numpy.sqrt(R**2.+z**2.+1.)
+        def _Rforce(self,R,z,phi=0.,t=0.):
+            if R < 0.: raise ValueError('R must be positive')
+            return -R/(R**2.+z**2.+1.)**1.5
+        def _zforce(self,R,z,phi=0.,t=0.):
+            if R < 0.: raise ValueError('R must be positive')
+            return -z/(R**2.+z**2.+1.)**1.5
+    R= numpy.array([1.,0.8,1.2])
+    vR= numpy.array([0.,0.1,-0.05])
+    vT= numpy.array([0.4,0.5,0.3])
+    z= numpy.array([0.1,-0.2,0.])
+    vz= numpy.array([0.05,0.,0.1])
+    aAs= actionAngleAdiabatic(pot=scalarPlummerPotential(),c=False)
+    aAp= actionAngleAdiabatic(pot=PlummerPotential(amp=1.,b=1.),c=False)
+    js= aAs(R,vR,vT,z,vz)
+    jp= aAp(R,vR,vT,z,vz)
+    es= aAs.EccZmaxRperiRap(R,vR,vT,z,vz)
+    ep= aAp.EccZmaxRperiRap(R,vR,vT,z,vz)
+    for jj in range(3):
+        assert numpy.all(numpy.fabs(js[jj]-jp[jj]) < 10.**-10.), 'Vectorized actionAngleAdiabatic does not work for a potential that only accepts scalar input'
+    for jj in range(4):
+        assert numpy.all(numpy.fabs(es[jj]-ep[jj]) < 10.**-10.), 'Vectorized actionAngleAdiabatic does not work for a potential that only accepts scalar input'
+    return None
+
 #Test the actions of an actionAngleAdiabatic
 def test_actionAngleAdiabatic_conserved_actions():
     from galpy.potential import MWPotential
@@ -986,6 +1090,73 @@ def test_actionAngleAdiabaticGrid_conserved_actions_c():
                                         -1.4,-8.,-1.7,ntimes=101)
     return None
 
+#Test that the grid built with one batched call agrees with direct evaluation, that points off the grid are evaluated directly, and save/load
+def test_actionAngleAdiabaticGrid_batched():
+    import shutil, tempfile
+    from galpy.potential import MWPotential
+    from galpy.actionAngle import actionAngleAdiabaticGrid, \
+        actionAngleAdiabatic
+    aA= actionAngleAdiabatic(pot=MWPotential,gamma=1.,c=False)
+    aAA= actionAngleAdiabaticGrid(pot=MWPotential,gamma=1.,c=False,
+                                  Rmax=2.,zmax=0.3,nR=8,nEz=8,nEr=11,nLz=11)
+    aAA2= actionAngleAdiabaticGrid(pot=MWPotential,gamma=1.,c=False,
+                                   Rmax=2.,zmax=0.3,nR=8,nEz=8,nEr=11,nLz=11,
+                                   numcores=2)
+    assert numpy.all(numpy.fabs(aAA._jr-aAA2._jr) < 10.**-10.), 'actionAngleAdiabaticGrid JR grid depends on numcores'
+    assert numpy.all(numpy.fabs(aAA._jz-aAA2._jz) < 10.**-10.), 'actionAngleAdiabaticGrid Jz grid depends on numcores'
+    numpy.random.seed(1)
+    nobj= 20
+    R= 0.8+1.6*numpy.random.uniform(size=nobj) # about half off the grid
+    vR= 0.05*numpy.random.normal(size=nobj)
+    vT= 1.+0.03*numpy.random.normal(size=nobj)
+    z= 0.03*numpy.random.normal(size=nobj)
+    vz= 0.03*numpy.random.normal(size=nobj)
+    js= aA(R,vR,vT,z,vz)
+    jsa= aAA(R,vR,vT,z,vz)
+    indx= R > 2.
+    assert numpy.all(numpy.fabs(js[0][indx]-jsa[0][indx]) < 10.**-8.), 'actionAngleAdiabaticGrid evaluation outside of the grid fails'
+    assert numpy.all(numpy.fabs(js[2][indx]-jsa[2][indx]) < 10.**-8.), 'actionAngleAdiabaticGrid evaluation outside of the grid fails'
+    assert numpy.all(numpy.fabs(jsa[0][True^indx]-js[0][True^indx]) < 10.**-4.), 'actionAngleAdiabaticGrid evaluation on the grid fails'
+    assert numpy.all(numpy.fabs(jsa[2][True^indx]-js[2][True^indx]) < 10.**-4.), 'actionAngleAdiabaticGrid evaluation on the grid fails'
+    # Saving and loading gives the same
+    savedir= tempfile.mkdtemp()
+    try:
+        savefilename= os.path.join(savedir,'aAA.sav')
+        aAA.save(savefilename)
+        aAAl= actionAngleAdiabaticGrid.load(savefilename)
+        jsl= aAAl(R,vR,vT,z,vz)
+        assert numpy.all(numpy.fabs(jsl[0]-jsa[0]) < 10.**-10.), 'actionAngleAdiabaticGrid loaded from a file does not give the same radial actions'
+        assert numpy.all(numpy.fabs(jsl[2]-jsa[2]) < 10.**-10.), 'actionAngleAdiabaticGrid loaded from a file does not give the same vertical actions'
+    finally:
+        shutil.rmtree(savedir)
+    return None
+
+#Test that the grids computed in C (the default) agree with those computed in Python
+def test_actionAngleAdiabaticGrid_python_against_c():
+    from galpy.potential import MWPotential
+    from galpy.actionAngle import actionAngleAdiabaticGrid
+    aAAc= actionAngleAdiabaticGrid(pot=MWPotential,gamma=1.,c=True,
+                                   Rmax=2.,zmax=0.3,nR=8,nEz=8,nEr=11,nLz=11)
+    aAAp= actionAngleAdiabaticGrid(pot=MWPotential,gamma=1.,c=False,
+                                   Rmax=2.,zmax=0.3,nR=8,nEz=8,nEr=11,nLz=11)
+    # The grids extend to very eccentric orbits (up to apocenter 99, 
+    # beyond the C root-finding bracket), for which C and Python only 
+    # agree at the 10^-3 level
+    assert numpy.all(numpy.fabs(aAAc._jr-aAAp._jr) < 10.**-2.*numpy.fabs(aAAp._jr)+10.**-5.), 'actionAngleAdiabaticGrid JR grid computed in C does not agree with that computed in Python'
+    assert numpy.all(numpy.fabs(aAAc._jz-aAAp._jz) < 10.**-3.*numpy.fabs(aAAp._jz)+10.**-5.), 'actionAngleAdiabaticGrid Jz grid computed in C does not agree with that computed in Python'
+    numpy.random.seed(2)
+    nobj= 20
+    R= 0.8+1.6*numpy.random.uniform(size=nobj) # about half off the grid
+    vR= 0.05*numpy.random.normal(size=nobj)
+    vT= 1.+0.03*numpy.random.normal(size=nobj)
+    z= 0.03*numpy.random.normal(size=nobj)
+    vz= 0.03*numpy.random.normal(size=nobj)
+    jsc= aAAc(R,vR,vT,z,vz)
+    jsp= aAAp(R,vR,vT,z,vz)
+    for ii in [0,2]:
+        assert numpy.all(numpy.fabs(jsc[ii]-jsp[ii]) < 10.**-5.), 'actionAngleAdiabaticGrid actions using C do not agree with those using Python'
+    return None
+
 #Test the actionAngleAdiabatic against an isochrone potential: actions
 def test_actionAngleAdiabaticGrid_Isochrone_actions():
     from galpy.potential import IsochronePotential
@@ -1447,6 +1618,52 @@ def test_estimateDeltaStaeckel_no_median():
 	assert (numpy.fabs(nomed-indiv) < 1e-10).all(), 'no_median option returns different values to individual Delta estimation'
 	return None
 
+# Test that interpDeltaStaeckel agrees with estimateDeltaStaeckel and that
+# it can be used as a per-point delta in actionAngleStaeckel
+def test_interpDeltaStaeckel():
+    from galpy.potential import MWPotential2014
+    from galpy.actionAngle import estimateDeltaStaeckel, interpDeltaStaeckel, \
+        actionAngleStaeckel
+    numpy.random.seed(2)
+    nobj= 101
+    R= 0.1+2.*numpy.random.uniform(size=nobj)
+    vR= 0.1*numpy.random.normal(size=nobj)
+    vT= 1.+0.1*numpy.random.normal(size=nobj)
+    z= 0.3*numpy.random.normal(size=nobj)
+    vz= 0.1*numpy.random.normal(size=nobj)
+    ip= interpDeltaStaeckel(pot=MWPotential2014)
+    deltas= estimateDeltaStaeckel(MWPotential2014,R,z,no_median=True)
+    assert numpy.all(numpy.fabs(ip(R,z)/deltas-1.) < 10.**-5.), 'interpDeltaStaeckel does not agree with estimateDeltaStaeckel'
+    assert numpy.fabs(ip(R[0],z[0])/deltas[0]-1.) < 10.**-5., 'interpDeltaStaeckel does not agree with estimateDeltaStaeckel for scalar input'
+    # Use as a per-point delta
+    aAS= actionAngleStaeckel(pot=MWPotential2014,delta=ip,c=False)
+    jr,lz,jz= aAS(R[:3],vR[:3],vT[:3],z[:3],vz[:3])
+    jri,lzi,jzi= aAS(R[:3],vR[:3],vT[:3],z[:3],vz[:3],delta=ip(R[:3],z[:3]))
+    assert numpy.all(numpy.fabs(jr-jri) < 10.**-10.), 'Radial action computed with interpDeltaStaeckel does not agree with that computed with the interpolated individual delta'
+    assert numpy.all(numpy.fabs(jz-jzi) < 10.**-10.), 'Vertical action computed with interpDeltaStaeckel does not agree with that computed with the interpolated individual delta'
+    ecc,zmax,rperi,rap= aAS.EccZmaxRperiRap(R[:3],vR[:3],vT[:3],z[:3],vz[:3])
+    ecci,zmaxi,rperii,rapi= aAS.EccZmaxRperiRap(R[:3],vR[:3],vT[:3],
+                                                z[:3],vz[:3],
+                                                delta=ip(R[:3],z[:3]))
+    assert numpy.all(numpy.fabs(ecc-ecci) < 10.**-10.), 'Eccentricity computed with interpDeltaStaeckel does not agree with that computed with the interpolated individual delta'
+    assert numpy.all(numpy.fabs(zmax-zmaxi) < 10.**-10.), 'zmax computed with interpDeltaStaeckel does not agree with that computed with the interpolated individual delta'
+    # Scalar input
+    R,vR,vT,z,vz= 1.,0.1,1.1,0.1,0.05
+    jr,lz,jz= aAS(R,vR,vT,z,vz)
+    jri,lzi,jzi= aAS(R,vR,vT,z,vz,delta=ip(R,z))
+    assert numpy.fabs(jr-jri) < 10.**-10., 'Radial action computed with interpDeltaStaeckel does not agree with that computed with the interpolated individual delta for scalar input'
+    assert numpy.fabs(jz-jzi) < 10.**-10., 'Vertical action computed with interpDeltaStaeckel does not agree with that computed with the interpolated individual delta for scalar input'
+    umin,umax,vmin= aAS._uminumaxvmin(R,vR,vT,z,vz)
+    umini,umaxi,vmini= aAS._uminumaxvmin(R,vR,vT,z,vz,
+                                         delta=ip(R,z))
+    assert numpy.fabs(umax-umaxi) < 10.**-10., 'umax computed with interpDeltaStaeckel does not agree with that computed with the interpolated individual delta for scalar input'
+    assert numpy.fabs(vmin-vmini) < 10.**-10., 'vmin computed with interpDeltaStaeckel does not agree with that computed with the interpolated individual delta for scalar input'
+    ecc,zmax,rperi,rap= aAS.EccZmaxRperiRap(R,vR,vT,z,vz)
+    ecci,zmaxi,rperii,rapi= aAS.EccZmaxRperiRap(R,vR,vT,z,vz,
+                                                delta=ip(R,z))
+    assert numpy.fabs(ecc-ecci) < 10.**-10., 'Eccentricity computed with interpDeltaStaeckel does not agree with that computed with the interpolated individual delta for scalar input'
+    return None
+
 def test_actionAngleStaeckel_indivdelta_actions_c():
     from galpy.potential import MWPotential2014
     from galpy.orbit import Orbit
@@ -2042,6 +2259,66 @@ def test_actionAngleStaeckelGrid_setuperrs():
     else: raise AssertionError('actionAngleStaeckelGrid w/o delta does not give IOError')
     return None
 
+# Test the parallel, cached construction of an actionAngleStaeckelGrid with
+# a refined energy grid and saving/loading it
+def test_actionAngleStaeckelGrid_refinecirc_cache_saveload():
+    import os
+    import shutil
+    import tempfile
+    from galpy.potential import MWPotential2014
+    from galpy.actionAngle import actionAngleStaeckelGrid, \
+        actionAngleStaeckel
+    cachedir= tempfile.mkdtemp()
+    try:
+        aASG= actionAngleStaeckelGrid(pot=MWPotential2014,delta=0.4,c=False,
+                                      nE=11,npsi=11,nLz=12,refinecirc=True,
+                                      numcores=2,cache=cachedir)
+        # The grid is cached one Lz at a time (+ the full setup)
+        assert len(os.listdir(cachedir)) == 13, 'actionAngleStaeckelGrid does not cache its grid one Lz at a time'
+        # Near-circular orbits are well resolved even with a small grid
+        aAS= actionAngleStaeckel(pot=MWPotential2014,delta=0.4,c=False)
+        numpy.random.seed(1)
+        nobj= 10
+        R= 0.8+0.4*numpy.random.uniform(size=nobj)
+        vR= 0.05*numpy.random.normal(size=nobj)
+        vT= 1.+0.03*numpy.random.normal(size=nobj)
+        z= 0.03*numpy.random.normal(size=nobj)
+        vz= 0.03*numpy.random.normal(size=nobj)
+        js= aAS(R,vR,vT,z,vz,fixed_quad=True)
+        jsg= aASG(R,vR,vT,z,vz)
+        assert numpy.all(numpy.fabs(jsg[0]/js[0]-1.) < 0.05), 'actionAngleStaeckelGrid with refinecirc=True does not give accurate radial actions for near-circular orbits'
+        assert numpy.all(numpy.fabs(jsg[2]/js[2]-1.) < 0.05), 'actionAngleStaeckelGrid with refinecirc=True does not give accurate vertical actions for near-circular orbits'
+        # Loading from the cache and from a saved file gives the same
+        aASGc= actionAngleStaeckelGrid(pot=MWPotential2014,delta=0.4,c=False,
+                                       nE=11,npsi=11,nLz=12,refinecirc=True,
+                                       cache=cachedir)
+        savefilename= os.path.join(cachedir,'aASG.sav')
+        aASG.save(savefilename)
+        aASGl= actionAngleStaeckelGrid.load(savefilename)
+        for aA in [aASGc,aASGl]:
+            jsl= aA(R,vR,vT,z,vz)
+            assert numpy.all(numpy.fabs(jsl[0]-jsg[0]) < 10.**-10.), 'actionAngleStaeckelGrid loaded from the cache or file does not give the same radial actions'
+            assert numpy.all(numpy.fabs(jsl[2]-jsg[2]) < 10.**-10.), 'actionAngleStaeckelGrid loaded from the cache or file does not give the same vertical actions'
+    finally:
+        shutil.rmtree(cachedir)
+    return None
+
+# Test that the grid computed in a single C call agrees with that computed
+# one Lz at a time in Python
+def test_actionAngleStaeckelGrid_python_against_c():
+    from galpy.potential import MWPotential2014
+    from galpy.actionAngle import actionAngleStaeckelGrid
+    aAAc= actionAngleStaeckelGrid(pot=MWPotential2014,delta=0.4,c=True,
+                                  nE=7,npsi=7,nLz=8)
+    aAAp= actionAngleStaeckelGrid(pot=MWPotential2014,delta=0.4,c=False,
+                                  nE=7,npsi=7,nLz=8,numcores=2)
+    assert aAAc._c and not aAAp._c, 'actionAngleStaeckelGrid does not use C when asked to'
+    assert numpy.all(numpy.fabs(aAAc._u0-aAAp._u0) < 10.**-6.), 'actionAngleStaeckelGrid u0 grid computed in C does not agree with that computed in Python'
+    for attr in ['_jr','_jz']:
+        assert numpy.all(numpy.fabs(getattr(aAAc,attr)-getattr(aAAp,attr)) < 10.**-8.), 'actionAngleStaeckelGrid %s grid computed in C does not agree with that computed in Python' % attr[1:]
+        assert numpy.all(numpy.fabs(getattr(aAAc,attr+'LzE')/getattr(aAAp,attr+'LzE')-1.) < 10.**-8.), 'actionAngleStaeckelGrid %s grid computed in C does not agree with that computed in Python' % attr[1:]
+    return None
+
 #Test the actionAngleStaeckel against an isochrone potential: actions
 def test_actionAngleStaeckelGrid_Isochrone_actions():
     from galpy.potential import IsochronePotential
@@ -2062,6 +2339,47 @@ def test_actionAngleStaeckelGrid_Isochrone_actions():
     assert djz < 10.**-1.2, 'actionAngleStaeckel applied to isochrone potential fails for Jz at %f%%' % (djz*100.)
     return None
 
+#Test the interpolated frequencies of actionAngleStaeckelGrid against the
+#direct actionAngleStaeckel calculation
+def test_actionAngleStaeckelGrid_interpfreqs():
+    from galpy.potential import MWPotential2014
+    from galpy.actionAngle import actionAngleStaeckelGrid, \
+        actionAngleStaeckel
+    aAS= actionAngleStaeckel(pot=MWPotential2014,delta=0.45,c=True)
+    aAA= actionAngleStaeckelGrid(pot=MWPotential2014,delta=0.45,c=True,
+                                 interpfreqs=True)
+    numpy.random.seed(1)
+    nobj= 101
+    R= numpy.random.uniform(0.6,1.4,nobj)
+    vR= numpy.random.normal(size=nobj)*0.1
+    vT= 1.+numpy.random.normal(size=nobj)*0.1
+    z= numpy.random.normal(size=nobj)*0.1
+    vz= numpy.random.normal(size=nobj)*0.1
+    phi= numpy.random.uniform(size=nobj)*2.*numpy.pi
+    afa= aAS.actionsFreqs(R,vR,vT,z,vz)
+    af= aAA.actionsFreqs(R,vR,vT,z,vz)
+    # The direct calculation uses separate third integrals for the radial
+    # and vertical motion, so the interpolated frequencies are only 
+    # accurate to a few percent for close-to-planar orbits (like Jz)
+    for ii,name,tol in zip([3,4,5],['Or','Op','Oz'],[-1.4,-1.4,-1.2]):
+        assert numpy.all(numpy.fabs((af[ii]-afa[ii])/afa[ii]) < 10.**tol), 'actionAngleStaeckelGrid interpolated frequency %s does not agree with direct calculation' % name
+        assert numpy.median(numpy.fabs((af[ii]-afa[ii])/afa[ii])) < 10.**-2., 'actionAngleStaeckelGrid interpolated frequency %s does not agree with direct calculation' % name
+    # Angles are not tabulated
+    with pytest.raises(NotImplementedError) as excinfo:
+        aAA.actionsFreqsAngles(R,vR,vT,z,vz,phi)
+    # Actions the same as __call__
+    js= aAA(R,vR,vT,z,vz)
+    assert numpy.all(numpy.fabs(js[0]-af[0]) < 10.**-10.), 'actionAngleStaeckelGrid actionsFreqs actions do not agree with __call__'
+    # Single point
+    af1= aAA.actionsFreqs(R[0],vR[0],vT[0],z[0],vz[0])
+    assert numpy.all(numpy.fabs(numpy.array(af1)-numpy.array(af)[:,0]) < 10.**-10.), 'actionAngleStaeckelGrid actionsFreqs for a single point does not agree with that for an array'
+    # Without interpfreqs, actionsFreqs is not implemented
+    aAA= actionAngleStaeckelGrid(pot=MWPotential2014,delta=0.45,c=True,
+                                 nE=5,npsi=5,nLz=5)
+    with pytest.raises(NotImplementedError) as excinfo:
+        aAA.actionsFreqs(R,vR,vT,z,vz)
+    return None
+
 #Basic sanity checking of the actionAngleStaeckelGrid eccentricity etc.
 def test_actionAngleStaeckelGrid_basic_EccZmaxRperiRap_c():
     from galpy.actionAngle import actionAngleStaeckelGrid
@@ -2418,6 +2736,36 @@ def test_actionAngleIsochroneApprox_firstFlip():
         'actionAngleIsochroneApprox calculated w/ _firstFlip and w/o do not agree at %g%%' % (100.*numpy.amax(numpy.fabs((acfs-acfsfirstFlip)/acfs)))
     return None
 
+# Test that multiple objects integrated together and processed in chunks
+# give the same results as single objects
+def test_actionAngleIsochroneApprox_multi_chunks():
+    from galpy.potential import LogarithmicHaloPotential
+    from galpy.actionAngle import actionAngleIsochroneApprox
+    lp= LogarithmicHaloPotential(normalize=1.,q=0.9)
+    numpy.random.seed(1)
+    nobj= 4
+    R= 1.+0.2*numpy.random.uniform(size=nobj)
+    vR= 0.2*numpy.random.normal(size=nobj)
+    vT= 1.+0.1*numpy.random.normal(size=nobj)
+    z= 0.2*numpy.random.normal(size=nobj)
+    vz= 0.2*numpy.random.normal(size=nobj)
+    phi= 2.*numpy.pi*numpy.random.uniform(size=nobj)
+    aAI= actionAngleIsochroneApprox(pot=lp,b=0.8,tintJ=50.,ntintJ=1001)
+    # Small maxmem, such that each object is processed separately
+    aAIc= actionAngleIsochroneApprox(pot=lp,b=0.8,tintJ=50.,ntintJ=1001,
+                                     maxmem=10.**-4.)
+    acfs= numpy.array(aAI.actionsFreqsAngles(R,vR,vT,z,vz,phi))
+    acfsc= numpy.array(aAIc.actionsFreqsAngles(R,vR,vT,z,vz,phi))
+    js= numpy.array(aAI(R,vR,vT,z,vz,phi))
+    jsc= numpy.array(aAIc(R,vR,vT,z,vz,phi))
+    assert numpy.amax(numpy.fabs(acfs-acfsc)) < 10.**-8., 'actionAngleIsochroneApprox actionsFreqsAngles processed in chunks does not agree with that for all objects together'
+    assert numpy.amax(numpy.fabs(js-jsc)) < 10.**-8., 'actionAngleIsochroneApprox actions processed in chunks does not agree with that for all objects together'
+    for ii in range(nobj):
+        acfsi= numpy.array(aAI.actionsFreqsAngles(R[ii],vR[ii],vT[ii],
+                                                  z[ii],vz[ii],phi[ii]))
+        assert numpy.amax(numpy.fabs(acfs[:,ii]-acfsi[:,0])) < 10.**-8., 'actionAngleIsochroneApprox actionsFreqsAngles for multiple objects does not agree with that for single objects'
+    return None
+
 #Test the actionAngleIsochroneApprox used in Bovy (2014)
 def test_actionAngleIsochroneApprox_bovy14():   
     from galpy.potential import LogarithmicHaloPotential
@@ -3178,6 +3526,21 @@ def test_actionAngleIsochroneInverse_orbit():
         'Integrated orbit does not agree with torus orbit in phi'
     return None
 
+# Test that the vectorized solution of the Kepler-like equation for eta 
+# agrees with a root finder applied to each angle separately
+def test_actionAngleIsochroneInverse_solve_eta():
+    from scipy import optimize
+    from galpy.actionAngle.actionAngleIsochroneInverse import _solve_eta
+    angler= numpy.hstack(([0.,10.**-10.,numpy.pi,2.*numpy.pi-10.**-10.],
+                          numpy.linspace(0.,2.*numpy.pi,101,endpoint=False)))
+    for ecc in [0.,0.1,0.5,0.9,0.99]:
+        eta= _solve_eta(angler,ecc)
+        eta_direct= numpy.array([optimize.brentq(\
+                    lambda x: x-ecc*numpy.sin(x)-ar,0.,2.*numpy.pi,xtol=1e-15)
+                                 for ar in angler])
+        assert numpy.all(numpy.fabs(eta-eta_direct) < 10.**-8.), 'Vectorized solution for eta in actionAngleIsochroneInverse does not agree with direct root finding'
+    return None
+
 # Test physical output for actionAngleIsochroneInverse
 def test_physical_actionAngleIsochroneInverse():
     from galpy.potential import IsochronePotential
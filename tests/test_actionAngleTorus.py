@@ -479,6 +479,35 @@ def test_actionAngleTorus_jacobian_linear():
     assert numpy.all(numpy.fabs((xv_fromjac-xv_direct)/xv_direct) < 0.01), 'Jacobian returned by actionAngleTorus method xvJacobianFreqs does not appear to be correct'
     return None
 
+# Test that the torus cache gives the same (x,v) and frequencies as fitting
+# the torus directly, also for nearby actions
+def test_actionAngleTorus_cache():
+    from galpy.potential import MWPotential2014
+    from galpy.actionAngle import actionAngleTorus
+    aAT= actionAngleTorus(pot=MWPotential2014)
+    aATc= actionAngleTorus(pot=MWPotential2014,maxcache=2,interptol=0.05)
+    jr,jphi,jz= 0.075,1.1,0.05
+    angler= numpy.linspace(0.,2.*numpy.pi,11)+0.1
+    anglephi= numpy.linspace(0.,2.*numpy.pi,11)+1.
+    anglez= numpy.linspace(0.,2.*numpy.pi,11)+2.
+    for dj in [0.,0.,0.001]: # 2nd time from cache, 3rd interpolated
+        xvf= aAT.xvFreqs(jr+dj,jphi,jz+dj,angler,anglephi,anglez)
+        xvfc= aATc.xvFreqs(jr+dj,jphi,jz+dj,angler,anglephi,anglez)
+        dxv= xvfc[0]-xvf[0]
+        dxv[:,5]= (dxv[:,5]+numpy.pi) % (2.*numpy.pi)-numpy.pi
+        assert numpy.all(numpy.fabs(dxv) < 10.**-3.), 'actionAngleTorus with a torus cache does not return the same (x,v) as without'
+        assert numpy.all(numpy.fabs(numpy.array(xvfc[1:4])-numpy.array(xvf[1:4])) < 10.**-4.), 'actionAngleTorus with a torus cache does not return the same frequencies as without'
+        assert len(aATc._torus_cache) == 1, 'actionAngleTorus torus cache does not contain a single torus'
+    # Freqs and hessianFreqs use the cache
+    assert numpy.all(numpy.fabs(numpy.array(aATc.Freqs(jr,jphi,jz)[:3])-numpy.array(aAT.Freqs(jr,jphi,jz)[:3])) < 10.**-6.), 'actionAngleTorus Freqs with a torus cache does not return the same frequencies as without'
+    assert numpy.all(numpy.fabs(aATc.hessianFreqs(jr,jphi,jz)[0]-aAT.hessianFreqs(jr,jphi,jz)[0]) < 10.**-6.), 'actionAngleTorus hessianFreqs with a torus cache does not return the same Hessian as without'
+    # Tori far away are added to the cache, dropping the oldest
+    aATc(0.1,1.2,0.02,angler,anglephi,anglez)
+    aATc(0.05,0.9,0.02,angler,anglephi,anglez)
+    assert len(aATc._torus_cache) == 2, 'actionAngleTorus torus cache does not respect maxcache'
+    assert not (jr,jphi,jz,aATc._tol) in aATc._torus_cache, 'actionAngleTorus torus cache does not drop the least recently used torus'
+    return None
+
 #Test error when potential is not implemented in C
 def test_actionAngleTorus_nocerr():
     from galpy.actionAngle import actionAngleTorus
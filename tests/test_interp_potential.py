@@ -463,12 +463,26 @@ def test_interpolation_potential_force_use_c():
                                        interpRforce=True,interpzforce=True,
                                        zsym=True,
                                        use_c=True)
-    assert numpy.all(numpy.fabs(rzpot._rforceGrid-rzpot_c._rforceGrid) < 10.**-14.), \
+    assert numpy.all(numpy.fabs(rzpot._rforceGrid-rzpot_c._rforceGrid) < 10.**-13.), \
         'Potential interpolation grid of Rforce  calculated with use_c does not agree with that calculated in python'
-    assert numpy.all(numpy.fabs(rzpot._zforceGrid-rzpot_c._zforceGrid) < 10.**-14.), \
+    assert numpy.all(numpy.fabs(rzpot._zforceGrid-rzpot_c._zforceGrid) < 10.**-13.), \
         'Potential interpolation grid of zforce  calculated with use_c does not agree with that calculated in python'
     return None
 
+def test_interpolation_potential_pot_vcirc_use_c():
+    #Test the potential and vcirc tables calculated in C against python
+    kwargs= {'rgrid':(0.01,2.,51),'zgrid':(0.,0.2,51),'logR':False,
+             'interpPot':True,'interpvcirc':True,'zsym':True}
+    rzpot_c= potential.interpRZPotential(RZPot=potential.MWPotential2014,
+                                         use_c=True,**kwargs)
+    rzpot= potential.interpRZPotential(RZPot=potential.MWPotential2014,
+                                       use_c=False,**kwargs)
+    assert numpy.all(numpy.fabs(rzpot._potGrid-rzpot_c._potGrid) < 10.**-10.), \
+        'Potential interpolation grid of the potential calculated with use_c does not agree with that calculated in python'
+    assert numpy.all(numpy.fabs(rzpot._vcircGrid-rzpot_c._vcircGrid) < 10.**-10.), \
+        'Potential interpolation grid of vcirc calculated with use_c does not agree with that calculated in python'
+    return None
+
 # Test evaluation outside the grid
 def test_interpolation_potential_force_outsidegrid():
     rzpot= potential.interpRZPotential(RZPot=potential.MWPotential,
@@ -949,3 +963,31 @@ def test_interpolation_potential_verticalfreq_notinterpolated():
         assert vfdiff < 10.**-10., 'RZPot interpolation w/ interpRZPotential fails when the potential was not interpolated at R = %g by %g' % (r,vfdiff)
     return None
 
+
+def test_interpolation_potential_cache():
+    # Test that the tables are saved to and loaded from the cache
+    import os
+    import tempfile
+    cachedir= tempfile.mkdtemp()
+    kwargs= {'rgrid':(0.01,2.,51),'zgrid':(0.,0.2,51),'logR':False,
+             'interpPot':True,'interpRforce':True,'interpvcirc':True,
+             'interpepifreq':True,'zsym':True,'cache':cachedir}
+    rzpot= potential.interpRZPotential(RZPot=potential.MWPotential,**kwargs)
+    assert len(os.listdir(cachedir)) == 1, 'interpRZPotential did not save its tables to the cache'
+    # Loading from the cache gives the same interpolation
+    rzpotc= potential.interpRZPotential(RZPot=potential.MWPotential,
+                                        **kwargs)
+    assert len(os.listdir(cachedir)) == 1, 'interpRZPotential with the same setup did not re-use the cache'
+    rs= numpy.linspace(0.05,1.95,11)
+    zs= numpy.linspace(-0.15,0.15,11)
+    assert numpy.all(numpy.fabs(rzpot(rs,zs)-rzpotc(rs,zs)) < 10.**-14.), 'interpRZPotential loaded from the cache does not agree with the original'
+    assert numpy.all(numpy.fabs(rzpot.Rforce(rs,zs)-rzpotc.Rforce(rs,zs)) < 10.**-14.), 'interpRZPotential loaded from the cache does not agree with the original'
+    assert numpy.all(numpy.fabs(rzpot.vcirc(rs)-rzpotc.vcirc(rs)) < 10.**-14.), 'interpRZPotential loaded from the cache does not agree with the original'
+    assert numpy.all(numpy.fabs(rzpot.epifreq(rs)-rzpotc.epifreq(rs)) < 10.**-14.), 'interpRZPotential loaded from the cache does not agree with the original'
+    # A different potential or grid gives a new cache file
+    potential.interpRZPotential(RZPot=potential.MWPotential2014,**kwargs)
+    assert len(os.listdir(cachedir)) == 2, 'interpRZPotential for a different potential re-used the cache'
+    kwargs['rgrid']= (0.01,2.,101)
+    potential.interpRZPotential(RZPot=potential.MWPotential,**kwargs)
+    assert len(os.listdir(cachedir)) == 3, 'interpRZPotential for a different grid re-used the cache'
+    return None
@@ -38,6 +38,8 @@ from test_potential import testplanarMWPotential, testMWPotential, \
     mockSCFAxiDensity1Potential, \
     mockSCFAxiDensity2Potential, \
     mockSCFDensityPotential, \
+    mockCylindricalSplinePotential, \
+    mockAxiCylindricalSplinePotential, \
     specialFlattenedPowerPotential, \
     specialMiyamotoNagaiPotential, \
     BurkertPotentialNoC, \
@@ -141,12 +143,15 @@ def test_energy_jacobi_conservation():
     pots.append('mockFlatCorotatingRotationSpiralArmsPotential')
     pots.append('mockFlatGaussianAmplitudeBarPotential')
     pots.append('nestedListPotential')
+    pots.append('mockCylindricalSplinePotential')
+    pots.append('mockAxiCylindricalSplinePotential')
     rmpots= ['Potential','MWPotential','MWPotential2014',
-             'MovingObjectPotential',
+             'MovingObjectPotential','MovingObjectPopulationPotential',
              'interpRZPotential', 'linearPotential', 'planarAxiPotential',
              'planarPotential', 'verticalPotential','PotentialError',
              'SnapshotRZPotential','InterpSnapshotRZPotential',
-             'EllipsoidalPotential','NumericalPotentialDerivativesMixin']
+             'EllipsoidalPotential','NumericalPotentialDerivativesMixin',
+             'CylindricalSplinePotential']
     rmpots.append('SphericalShellPotential')
     rmpots.append('RingPotential')
     if False: #_TRAVIS: #travis CI
@@ -503,12 +508,15 @@ def test_energy_conservation_linear():
     pots.append('altExpwholeDiskSCFPotential')
     pots.append('triaxialLogarithmicHaloPotential')   
     pots.append('nestedListPotential')
+    pots.append('mockCylindricalSplinePotential')
+    pots.append('mockAxiCylindricalSplinePotential')
     rmpots= ['Potential','MWPotential','MWPotential2014',
-             'MovingObjectPotential',
+             'MovingObjectPotential','MovingObjectPopulationPotential',
              'interpRZPotential', 'linearPotential', 'planarAxiPotential',
              'planarPotential', 'verticalPotential','PotentialError',
              'SnapshotRZPotential','InterpSnapshotRZPotential',
-             'EllipsoidalPotential','NumericalPotentialDerivativesMixin']
+             'EllipsoidalPotential','NumericalPotentialDerivativesMixin',
+             'CylindricalSplinePotential']
     rmpots.append('SphericalShellPotential')
     rmpots.append('RingPotential')
     rmpots.append('SoftenedNeedleBarPotential')
@@ -667,16 +675,18 @@ def test_liouville_planar():
     pots.append('mockFlatTrulyCorotatingRotationSpiralArmsPotential')
     pots.append('mockFlatTrulyGaussianAmplitudeBarPotential')
     pots.append('nestedListPotential')
+    pots.append('mockCylindricalSplinePotential')
+    pots.append('mockAxiCylindricalSplinePotential')
     rmpots= ['Potential','MWPotential','MWPotential2014',
-             'MovingObjectPotential',
+             'MovingObjectPotential','MovingObjectPopulationPotential',
              'interpRZPotential', 'linearPotential', 'planarAxiPotential',
              'planarPotential', 'verticalPotential','PotentialError',
              'SnapshotRZPotential','InterpSnapshotRZPotential',
-             'EllipsoidalPotential','NumericalPotentialDerivativesMixin']
+             'EllipsoidalPotential','NumericalPotentialDerivativesMixin',
+             'CylindricalSplinePotential']
     #rmpots.append('BurkertPotential')
     #Don't have C implementations of the relevant 2nd derivatives
     rmpots.append('DoubleExponentialDiskPotential')
-    rmpots.append('RazorThinExponentialDiskPotential')
     #rmpots.append('PowerSphericalPotentialwCutoff')
     #Doesn't have the R2deriv
     rmpots.append('TwoPowerSphericalPotential')
@@ -701,6 +711,8 @@ def test_liouville_planar():
     tol['HomogeneousSpherePotential']= -4.
     tol['mockFlatCosmphiDiskwBreakPotential']= -7. # more difficult
     tol['mockFlatTrulyCorotatingRotationSpiralArmsPotential']= -5. # more difficult
+    tol['mockCylindricalSplinePotential']= -4. # no C implementation of dxdv
+    tol['mockAxiCylindricalSplinePotential']= -4. # no C implementation of dxdv
     firstTest= True
     for p in pots:
         #Setup instance of potential
@@ -797,12 +809,15 @@ def test_eccentricity():
                and not 'toVertical' in p)]
     pots.append('testMWPotential')
     pots.append('testplanarMWPotential')
+    pots.append('mockCylindricalSplinePotential')
+    pots.append('mockAxiCylindricalSplinePotential')
     rmpots= ['Potential','MWPotential','MWPotential2014',
-             'MovingObjectPotential',
+             'MovingObjectPotential','MovingObjectPopulationPotential',
              'interpRZPotential', 'linearPotential', 'planarAxiPotential',
              'planarPotential', 'verticalPotential','PotentialError',
              'SnapshotRZPotential','InterpSnapshotRZPotential',
-             'EllipsoidalPotential','NumericalPotentialDerivativesMixin']
+             'EllipsoidalPotential','NumericalPotentialDerivativesMixin',
+             'CylindricalSplinePotential']
     rmpots.append('SphericalShellPotential')
     rmpots.append('RingPotential')
     if False: #_TRAVIS: #travis CI
@@ -922,12 +937,15 @@ def test_pericenter():
                and not 'toVertical' in p)]
     pots.append('testMWPotential')
     pots.append('testplanarMWPotential')
+    pots.append('mockCylindricalSplinePotential')
+    pots.append('mockAxiCylindricalSplinePotential')
     rmpots= ['Potential','MWPotential','MWPotential2014',
-             'MovingObjectPotential',
+             'MovingObjectPotential','MovingObjectPopulationPotential',
              'interpRZPotential', 'linearPotential', 'planarAxiPotential',
              'planarPotential', 'verticalPotential','PotentialError',
              'SnapshotRZPotential','InterpSnapshotRZPotential',
-             'EllipsoidalPotential','NumericalPotentialDerivativesMixin']
+             'EllipsoidalPotential','NumericalPotentialDerivativesMixin',
+             'CylindricalSplinePotential']
     rmpots.append('SphericalShellPotential')
     rmpots.append('RingPotential')
     if False: #_TRAVIS: #travis CI
@@ -1046,12 +1064,15 @@ def test_apocenter():
                and not 'toVertical' in p)]
     pots.append('testMWPotential')
     pots.append('testplanarMWPotential')
+    pots.append('mockCylindricalSplinePotential')
+    pots.append('mockAxiCylindricalSplinePotential')
     rmpots= ['Potential','MWPotential','MWPotential2014',
-             'MovingObjectPotential',
+             'MovingObjectPotential','MovingObjectPopulationPotential',
              'interpRZPotential', 'linearPotential', 'planarAxiPotential',
              'planarPotential', 'verticalPotential','PotentialError',
              'SnapshotRZPotential','InterpSnapshotRZPotential',
-             'EllipsoidalPotential','NumericalPotentialDerivativesMixin']
+             'EllipsoidalPotential','NumericalPotentialDerivativesMixin',
+             'CylindricalSplinePotential']
     rmpots.append('SphericalShellPotential')
     rmpots.append('RingPotential')
     if False: #_TRAVIS: #travis CI
@@ -1170,12 +1191,15 @@ def test_zmax():
                and not 'evaluate' in p and not 'Wrapper' in p
                and not 'toVertical' in p)]
     pots.append('testMWPotential')
+    pots.append('mockCylindricalSplinePotential')
+    pots.append('mockAxiCylindricalSplinePotential')
     rmpots= ['Potential','MWPotential','MWPotential2014',
-             'MovingObjectPotential',
+             'MovingObjectPotential','MovingObjectPopulationPotential',
              'interpRZPotential', 'linearPotential', 'planarAxiPotential',
              'planarPotential', 'verticalPotential','PotentialError',
              'SnapshotRZPotential','InterpSnapshotRZPotential',
-             'EllipsoidalPotential','NumericalPotentialDerivativesMixin']
+             'EllipsoidalPotential','NumericalPotentialDerivativesMixin',
+             'CylindricalSplinePotential']
     rmpots.append('SphericalShellPotential')
     rmpots.append('RingPotential')
     if False: #_TRAVIS: #travis CI
@@ -1281,12 +1305,15 @@ def test_analytic_ecc_rperi_rap():
                and not 'toVertical' in p)]
     pots.append('testMWPotential')
     pots.append('testplanarMWPotential')
+    pots.append('mockCylindricalSplinePotential')
+    pots.append('mockAxiCylindricalSplinePotential')
     rmpots= ['Potential','MWPotential','MWPotential2014',
-             'MovingObjectPotential',
+             'MovingObjectPotential','MovingObjectPopulationPotential',
              'interpRZPotential', 'linearPotential', 'planarAxiPotential',
              'planarPotential', 'verticalPotential','PotentialError',
              'SnapshotRZPotential','InterpSnapshotRZPotential',
-             'EllipsoidalPotential','NumericalPotentialDerivativesMixin']
+             'EllipsoidalPotential','NumericalPotentialDerivativesMixin',
+             'CylindricalSplinePotential']
     rmpots.append('SphericalShellPotential')
     rmpots.append('RingPotential')
     rmpots.append('HomogeneousSpherePotential') # fails currently, because delta esimation gives a NaN due to a 0/0; delta should just be zero, but don't want to special-case
@@ -1604,12 +1631,15 @@ def test_analytic_zmax():
                and not 'evaluate' in p and not 'Wrapper' in p
                and not 'toVertical' in p)]
     pots.append('testMWPotential')
+    pots.append('mockCylindricalSplinePotential')
+    pots.append('mockAxiCylindricalSplinePotential')
     rmpots= ['Potential','MWPotential','MWPotential2014',
-             'MovingObjectPotential',
+             'MovingObjectPotential','MovingObjectPopulationPotential',
              'interpRZPotential', 'linearPotential', 'planarAxiPotential',
              'planarPotential', 'verticalPotential','PotentialError',
              'SnapshotRZPotential','InterpSnapshotRZPotential',
-             'EllipsoidalPotential','NumericalPotentialDerivativesMixin']
+             'EllipsoidalPotential','NumericalPotentialDerivativesMixin',
+             'CylindricalSplinePotential']
     rmpots.append('SphericalShellPotential')
     rmpots.append('RingPotential')
     rmpots.append('HomogeneousSpherePotential') # fails currently, because delta esimation gives a NaN due to a 0/0; delta should just be zero, but don't want to special-case
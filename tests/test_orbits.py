@@ -1722,6 +1722,38 @@ def test_energy_jacobi_angmom():
     _check_energy_jacobi_angmom(os,list_os)
     return None
 
+# Test that the tidal radius and tensor along orbits agree with those computed
+# for the individual positions
+def test_rtide_ttensor():
+    from galpy.orbit import Orbit
+    from galpy.potential import MWPotential2014, rtide, ttensor
+    numpy.random.seed(1)
+    nrand= 10
+    Rs= 0.2*(2.*numpy.random.uniform(size=nrand)-1.)+1.
+    vRs= 0.2*(2.*numpy.random.uniform(size=nrand)-1.)
+    vTs= 0.2*(2.*numpy.random.uniform(size=nrand)-1.)+1.
+    zs= 0.2*(2.*numpy.random.uniform(size=nrand)-1.)
+    vzs= 0.2*(2.*numpy.random.uniform(size=nrand)-1.)
+    phis= 2.*numpy.pi*(2.*numpy.random.uniform(size=nrand)-1.)
+    os= Orbit(list(zip(Rs,vRs,vTs,zs,vzs,phis)))
+    times= numpy.linspace(0.,10.,101)
+    os.integrate(times,MWPotential2014)
+    rts= os.rtide(times,M=1e-5)
+    tijs= os.ttensor(times)
+    eigs= os.ttensor(times,eigenval=True)
+    assert rts.shape == (nrand,len(times)), 'Orbits rtide does not return the expected shape'
+    assert tijs.shape == (nrand,len(times),3,3), 'Orbits ttensor does not return the expected shape'
+    assert eigs.shape == (nrand,len(times),3), 'Orbits ttensor does not return the expected shape'
+    for ii in range(nrand):
+        for jj in [0,37,100]:
+            R,z,phi= os.R(times)[ii,jj], os.z(times)[ii,jj], os.phi(times)[ii,jj]
+            assert numpy.fabs(rts[ii,jj]-rtide(MWPotential2014,R,z,phi=phi,M=1e-5)) < 10.**-10., 'Orbits rtide does not agree with rtide'
+            assert numpy.all(numpy.fabs(tijs[ii,jj]-ttensor(MWPotential2014,R,z,phi=phi)) < 10.**-10.), 'Orbits ttensor does not agree with ttensor'
+    # Single time and single orbit
+    assert numpy.all(numpy.fabs(os.rtide(times[37],M=1e-5)-rts[:,37]) < 10.**-10.), 'Orbits rtide at a single time does not agree with rtide along the orbit'
+    assert numpy.all(numpy.fabs(os[3].ttensor(times)-tijs[3]) < 10.**-10.), 'Orbit ttensor does not agree with Orbits ttensor'
+    return None
+
 def _check_energy_jacobi_angmom(os,list_os):
     nrand= len(os)
     from galpy.potential import MWPotential2014, SpiralArmsPotential, \
@@ -2799,6 +2831,54 @@ def test_actionsFreqsAngles_isochroneapproxb():
     assert numpy.all(numpy.fabs(jr-jrn) > 1e-4), 'Action calculation in Orbits using isochroneapprox approximation not updated when going from specifying delta to not specifying it'
     return None
 
+# Test that actions etc. can be computed at times along the integrated orbit,
+# using each orbit's own Staeckel delta, and that results for previous setups
+# are re-used
+def test_actionsFreqsAngles_t():
+    from galpy.potential import MWPotential2014
+    from galpy.actionAngle import actionAngleStaeckel
+    from galpy.orbit import Orbit
+    os= Orbit([[1.,0.1,1.1,0.1,0.05,0.],[0.9,-0.1,1.,0.4,0.1,1.]])
+    ts= numpy.linspace(0.,10.,101)
+    os.integrate(ts,MWPotential2014)
+    tts= ts[::10]
+    jr= os.jr(pot=MWPotential2014,t=tts)
+    jz= os.jz(pot=MWPotential2014,t=tts)
+    Or= os.Or(pot=MWPotential2014,t=tts)
+    assert jr.shape == (2,len(tts)), 'Orbit actions computed at times t do not have the expected shape'
+    assert numpy.all(numpy.fabs(jr[:,0]-os.jr(pot=MWPotential2014)) < 1e-10), 'Orbit actions computed at the initial time do not agree with those for the initial conditions'
+    for ii in range(len(os)):
+        aAS= actionAngleStaeckel(pot=MWPotential2014,delta=os._aA._delta[ii])
+        ajr,_,ajz,aOr,_,_= aAS.actionsFreqs(os[ii].R(tts),os[ii].vR(tts),
+                                            os[ii].vT(tts),os[ii].z(tts),
+                                            os[ii].vz(tts))
+        assert numpy.all(numpy.fabs(jr[ii]-ajr) < 1e-10), 'Orbit actions computed at times t do not agree with those computed directly'
+        assert numpy.all(numpy.fabs(jz[ii]-ajz) < 1e-10), 'Orbit actions computed at times t do not agree with those computed directly'
+        assert numpy.all(numpy.fabs(Or[ii]-aOr) < 1e-10), 'Orbit frequencies computed at times t do not agree with those computed directly'
+    # The second orbit reaches |z| ~ 0.4, where the Staeckel approximation 
+    # (in particular the C implementation) only conserves JR to ~7%
+    assert numpy.all(numpy.std(jr,axis=1)/numpy.mean(jr,axis=1) < 1e-1), 'Orbit actions computed at times t are not conserved'
+    assert numpy.all(numpy.std(jz,axis=1)/numpy.mean(jz,axis=1) < 1e-2), 'Orbit actions computed at times t are not conserved'
+    # Single time
+    assert numpy.all(numpy.fabs(os.jr(pot=MWPotential2014,t=tts[3])-jr[:,3]) < 1e-10), 'Orbit actions computed at a single time do not agree with those computed at multiple times'
+    # Results are re-used when going back to a previous setup
+    os.jr(pot=MWPotential2014,delta=0.4,t=tts)
+    prev_results= os._prev_actionAngles[0]['_aA_results']
+    assert numpy.all(os.jr(pot=MWPotential2014,t=tts) == jr), 'Orbit actions for a previous actionAngle setup are not re-used'
+    assert os._aA_results is prev_results, 'Orbit actions for a previous actionAngle setup are not re-used'
+    # but not when the orbit is integrated again
+    os.integrate(ts,MWPotential2014)
+    assert list(os._aA_results.keys()) == [None], 'Orbit actions at times t are not removed when re-integrating the orbit'
+    # With type=None, a new setup uses the default type rather than
+    # re-using a previous setup of a different type
+    from galpy.potential import LogarithmicHaloPotential
+    lp= LogarithmicHaloPotential(normalize=1.,q=0.9)
+    os.e(pot=lp,type='adiabatic',analytic=True)
+    os.jr(pot=MWPotential2014)
+    os.jr(pot=lp,type=None)
+    assert os._aAType == 'staeckel', 'Orbit actions with type=None re-use a previous setup of a different type'
+    return None
+
 def test_actionsFreqsAngles_RuntimeError_1d():
     from galpy.orbit import Orbit
     os= Orbit([[1.,0.1],[0.2,0.3]])
@@ -34,12 +34,14 @@ def test_normalize_potential():
     pots.append('specialFlattenedPowerPotential')
     pots.append('specialMN3ExponentialDiskPotentialPD')
     pots.append('specialMN3ExponentialDiskPotentialSECH')
+    pots.append('mockCylindricalSplinePotential')
     rmpots= ['Potential','MWPotential','MWPotential2014',
-             'MovingObjectPotential',
+             'MovingObjectPotential','MovingObjectPopulationPotential',
              'interpRZPotential', 'linearPotential', 'planarAxiPotential',
              'planarPotential', 'verticalPotential','PotentialError',
              'SnapshotRZPotential','InterpSnapshotRZPotential',
-             'EllipsoidalPotential','NumericalPotentialDerivativesMixin']
+             'EllipsoidalPotential','NumericalPotentialDerivativesMixin',
+             'CylindricalSplinePotential']
     if False: #_TRAVIS: #travis CI
         rmpots.append('DoubleExponentialDiskPotential')
         rmpots.append('RazorThinExponentialDiskPotential')
@@ -163,12 +165,14 @@ def test_forceAsDeriv_potential():
     pots.append('CorotatingRotationSpiralArmsPotential')
     pots.append('GaussianAmplitudeDehnenBarPotential')
     pots.append('nestedListPotential')
+    pots.append('mockCylindricalSplinePotential')
     rmpots= ['Potential','MWPotential','MWPotential2014',
-             'MovingObjectPotential',
+             'MovingObjectPotential','MovingObjectPopulationPotential',
              'interpRZPotential', 'linearPotential', 'planarAxiPotential',
              'planarPotential', 'verticalPotential','PotentialError',
              'SnapshotRZPotential','InterpSnapshotRZPotential',
-             'EllipsoidalPotential','NumericalPotentialDerivativesMixin']
+             'EllipsoidalPotential','NumericalPotentialDerivativesMixin',
+             'CylindricalSplinePotential']
     if False: #_TRAVIS: #travis CI
         rmpots.append('DoubleExponentialDiskPotential')
         rmpots.append('RazorThinExponentialDiskPotential')
@@ -331,12 +335,14 @@ def test_2ndDeriv_potential():
     pots.append('CorotatingRotationSpiralArmsPotential')
     pots.append('GaussianAmplitudeDehnenBarPotential')
     pots.append('nestedListPotential')
+    pots.append('mockCylindricalSplinePotential')
     rmpots= ['Potential','MWPotential','MWPotential2014',
-             'MovingObjectPotential',
+             'MovingObjectPotential','MovingObjectPopulationPotential',
              'interpRZPotential', 'linearPotential', 'planarAxiPotential',
              'planarPotential', 'verticalPotential','PotentialError',
              'SnapshotRZPotential','InterpSnapshotRZPotential',
-             'EllipsoidalPotential','NumericalPotentialDerivativesMixin']
+             'EllipsoidalPotential','NumericalPotentialDerivativesMixin',
+             'CylindricalSplinePotential']
     if False: #_TRAVIS: #travis CI
         rmpots.append('DoubleExponentialDiskPotential')
         rmpots.append('RazorThinExponentialDiskPotential')
@@ -553,12 +559,14 @@ def test_poisson_potential():
     pots.append('CorotatingRotationSpiralArmsPotential')
     pots.append('GaussianAmplitudeDehnenBarPotential')
     pots.append('nestedListPotential')
+    pots.append('mockCylindricalSplinePotential')
     rmpots= ['Potential','MWPotential','MWPotential2014',
-             'MovingObjectPotential',
+             'MovingObjectPotential','MovingObjectPopulationPotential',
              'interpRZPotential', 'linearPotential', 'planarAxiPotential',
              'planarPotential', 'verticalPotential','PotentialError',
              'SnapshotRZPotential','InterpSnapshotRZPotential',
-             'EllipsoidalPotential','NumericalPotentialDerivativesMixin']
+             'EllipsoidalPotential','NumericalPotentialDerivativesMixin',
+             'CylindricalSplinePotential']
     if False: #_TRAVIS: #travis CI
         rmpots.append('DoubleExponentialDiskPotential')
         rmpots.append('RazorThinExponentialDiskPotential')
@@ -578,6 +586,7 @@ def test_poisson_potential():
     tol['specialSpiralArmsPotential']= -4
     tol['SolidBodyRotationSpiralArmsPotential']= -2.9 #these are more difficult
     tol['nestedListPotential']= -3 #these are more difficult
+    tol['mockCylindricalSplinePotential']= -3 #spline 2nd derivatives
     #tol['RazorThinExponentialDiskPotential']= -6.
     for p in pots:
         #if not 'NFW' in p: continue #For testing the test
@@ -657,12 +666,14 @@ def test_poisson_surfdens_potential():
     pots.append('GaussianAmplitudeDehnenBarPotential')
     pots.append('nestedListPotential')
     """
+    pots.append('mockCylindricalSplinePotential')
     rmpots= ['Potential','MWPotential','MWPotential2014',
-             'MovingObjectPotential',
+             'MovingObjectPotential','MovingObjectPopulationPotential',
              'interpRZPotential', 'linearPotential', 'planarAxiPotential',
              'planarPotential', 'verticalPotential','PotentialError',
              'SnapshotRZPotential','InterpSnapshotRZPotential',
-             'EllipsoidalPotential','NumericalPotentialDerivativesMixin']
+             'EllipsoidalPotential','NumericalPotentialDerivativesMixin',
+             'CylindricalSplinePotential']
     if False: #_TRAVIS: #travis CI
         rmpots.append('DoubleExponentialDiskPotential')
         rmpots.append('RazorThinExponentialDiskPotential')
@@ -782,12 +793,14 @@ def test_evaluateAndDerivs_potential():
     pots.append('CorotatingRotationSpiralArmsPotential')
     pots.append('GaussianAmplitudeDehnenBarPotential')
     pots.append('nestedListPotential')
+    pots.append('mockCylindricalSplinePotential')
     rmpots= ['Potential','MWPotential','MWPotential2014',
-             'MovingObjectPotential',
+             'MovingObjectPotential','MovingObjectPopulationPotential',
              'interpRZPotential', 'linearPotential', 'planarAxiPotential',
              'planarPotential', 'verticalPotential','PotentialError',
              'SnapshotRZPotential','InterpSnapshotRZPotential',
-             'EllipsoidalPotential','NumericalPotentialDerivativesMixin']
+             'EllipsoidalPotential','NumericalPotentialDerivativesMixin',
+             'CylindricalSplinePotential']
     if False: #_TRAVIS: #travis CI
         rmpots.append('DoubleExponentialDiskPotential')
         rmpots.append('RazorThinExponentialDiskPotential')
@@ -989,12 +1002,14 @@ def test_amp_mult_divide():
     pots.append('CorotatingRotationSpiralArmsPotential')
     pots.append('GaussianAmplitudeDehnenBarPotential')
     pots.append('nestedListPotential')
+    pots.append('mockCylindricalSplinePotential')
     rmpots= ['Potential','MWPotential','MWPotential2014',
-             'MovingObjectPotential',
+             'MovingObjectPotential','MovingObjectPopulationPotential',
              'interpRZPotential', 'linearPotential', 'planarAxiPotential',
              'planarPotential', 'verticalPotential','PotentialError',
              'SnapshotRZPotential','InterpSnapshotRZPotential',
-             'EllipsoidalPotential','NumericalPotentialDerivativesMixin']
+             'EllipsoidalPotential','NumericalPotentialDerivativesMixin',
+             'CylindricalSplinePotential']
     if False: #_TRAVIS: #travis CI
         rmpots.append('DoubleExponentialDiskPotential')
         rmpots.append('RazorThinExponentialDiskPotential')
@@ -1035,10 +1050,12 @@ def test_potential_array_input():
                and not 'FullTo' in p and not 'toPlanar' in p
                and not 'evaluate' in p and not 'Wrapper' in p
                and not 'toVertical' in p)]
+    pots.append('mockCylindricalSplinePotential')
     rmpots= ['Potential','MWPotential','MWPotential2014',
              'interpRZPotential', 'linearPotential', 'planarAxiPotential',
              'planarPotential', 'verticalPotential','PotentialError',
-             'EllipsoidalPotential','NumericalPotentialDerivativesMixin']
+             'EllipsoidalPotential','NumericalPotentialDerivativesMixin',
+             'CylindricalSplinePotential']
     rmpots.append('FerrersPotential')
     rmpots.append('PerfectEllipsoidPotential')
     rmpots.append('TriaxialHernquistPotential')
@@ -1050,6 +1067,7 @@ def test_potential_array_input():
     rmpots.append('HomogeneousSpherePotential')
     # These cannot be setup without arguments
     rmpots.append('MovingObjectPotential')
+    rmpots.append('MovingObjectPopulationPotential')
     rmpots.append('SnapshotRZPotential')
     rmpots.append('InterpSnapshotRZPotential')
     # 2D ones that cannot use this test
@@ -1133,10 +1151,12 @@ def test_toVertical_array():
                and not 'FullTo' in p and not 'toPlanar' in p
                and not 'evaluate' in p and not 'Wrapper' in p
                and not 'toVertical' in p)]
+    pots.append('mockCylindricalSplinePotential')
     rmpots= ['Potential','MWPotential','MWPotential2014',
              'interpRZPotential', 'linearPotential', 'planarAxiPotential',
              'planarPotential', 'verticalPotential','PotentialError',
-             'EllipsoidalPotential','NumericalPotentialDerivativesMixin']
+             'EllipsoidalPotential','NumericalPotentialDerivativesMixin',
+             'CylindricalSplinePotential']
     rmpots.append('FerrersPotential')
     rmpots.append('PerfectEllipsoidPotential')
     rmpots.append('TriaxialHernquistPotential')
@@ -1148,6 +1168,7 @@ def test_toVertical_array():
     rmpots.append('HomogeneousSpherePotential')
     # These cannot be setup without arguments
     rmpots.append('MovingObjectPotential')
+    rmpots.append('MovingObjectPopulationPotential')
     rmpots.append('SnapshotRZPotential')
     rmpots.append('InterpSnapshotRZPotential')
     for p in rmpots:
@@ -1377,12 +1398,14 @@ def test_toVertical_toPlanar():
                and not 'FullTo' in p and not 'toPlanar' in p
                and not 'evaluate' in p and not 'Wrapper' in p
                and not 'toVertical' in p)]
+    pots.append('mockCylindricalSplinePotential')
     rmpots= ['Potential','MWPotential','MWPotential2014',
-             'MovingObjectPotential',
+             'MovingObjectPotential','MovingObjectPopulationPotential',
              'interpRZPotential', 'linearPotential', 'planarAxiPotential',
              'planarPotential', 'verticalPotential','PotentialError',
              'SnapshotRZPotential','InterpSnapshotRZPotential',
-             'EllipsoidalPotential','NumericalPotentialDerivativesMixin']
+             'EllipsoidalPotential','NumericalPotentialDerivativesMixin',
+             'CylindricalSplinePotential']
     if False: #_TRAVIS: #travis CI
         rmpots.append('DoubleExponentialDiskPotential')
         rmpots.append('RazorThinExponentialDiskPotential')
@@ -1728,6 +1751,125 @@ def test_vterm():
     assert numpy.fabs(potential.vterm(lp,numpy.pi/3.,deg=False)-numpy.sqrt(3.)/2.*(lp.omegac(numpy.sqrt(3.)/2.)-1.)) < 10.**-10., 'vterm for LogarithmicHaloPotential at l=60 in rad is incorrect'
     return None
 
+# Test that the cached circular-orbit quantities agree with the exact ones
+def test_circular_cache():
+    from galpy.potential import MWPotential2014
+    Rs= numpy.array([0.01,0.1,0.5,0.65,1.,2.,10.,100.,2000.])
+    funcs= [potential.vcirc,potential.dvcircdR,potential.omegac,
+            potential.epifreq,potential.verticalfreq,potential.vesc]
+    exact= [func(MWPotential2014,Rs) for func in funcs]
+    exact_scalar= [func(MWPotential2014,1.5) for func in funcs]
+    potential.turn_circular_cache_on(MWPotential2014)
+    try:
+        for func,ex,exs in zip(funcs,exact,exact_scalar):
+            assert numpy.all(numpy.fabs(func(MWPotential2014,Rs)/ex-1.) < 10.**-6.), '{} using cached tables does not agree with the exact calculation for MWPotential2014'.format(func.__name__)
+            assert numpy.fabs(func(MWPotential2014,1.5)/exs-1.) < 10.**-6., '{} using cached tables does not agree with the exact calculation for MWPotential2014'.format(func.__name__)
+            # Also for the individual potentials
+            for pot in MWPotential2014:
+                assert numpy.all(numpy.fabs(getattr(pot,func.__name__)(Rs)/func(pot,Rs,t=0.1)-1.) < 10.**-6.), '{} using cached tables does not agree with the exact calculation'.format(func.__name__)
+    finally:
+        potential.turn_circular_cache_off(MWPotential2014)
+    # Mass, and tables are re-computed when the amplitude changes
+    hp= potential.HernquistPotential(normalize=1.)
+    hp.turn_circular_cache_on(Rmin=0.01,Rmax=100.,nR=501)
+    for R in Rs:
+        assert numpy.fabs(hp.mass(R)/hp.mass(R,forceint=True)-1.) < 10.**-6., 'mass using cached tables does not agree with the exact calculation'
+    vc= hp.vcirc(2.)
+    hp.normalize(0.5)
+    assert numpy.fabs(hp.vcirc(2.)-numpy.sqrt(0.5)*vc) < 10.**-8., 'Cached tables are not updated when the potential is normalized'
+    # ... also for a copy multiplied by a number
+    hp2= 2.*hp
+    assert numpy.fabs(hp2.vcirc(2.)-numpy.sqrt(2.)*hp.vcirc(2.)) < 10.**-8., 'Cached tables are not updated when the potential is multiplied by a number'
+    # ... and when the cache is turned on again after another parameter 
+    # changes
+    hp.a= 2.*hp.a
+    hp.turn_circular_cache_on(Rmin=0.01,Rmax=100.,nR=501)
+    assert numpy.fabs(hp.vcirc(2.)/hp.vcirc(2.,phi=0.)-1.) < 10.**-8., 'Cached tables are not updated when a parameter of the potential changes'
+    # Non-axisymmetric potentials cannot be cached
+    with pytest.raises(RuntimeError):
+        potential.DehnenBarPotential().turn_circular_cache_on()
+    return None
+
+# Test that scalar evaluations using the cached circular-orbit tables build
+# each table once, re-use it, and are accurate
+def test_circular_cache_scalar():
+    pots= [potential.MiyamotoNagaiPotential(normalize=1.,a=0.5,b=0.05),
+           potential.NFWPotential(normalize=1.,a=4.)]
+    Rs= [0.05,0.5,1.5,7.,50.]
+    for pot in pots:
+        exact= [pot.vcirc(R) for R in Rs]
+        pot.turn_circular_cache_on()
+        try:
+            assert pot._circ_cache['tables'] == {}, 'Circular-orbit tables are built before they are used'
+            pot.vcirc(1.5)
+            assert list(pot._circ_cache['tables'].keys()) == ['vc2'], 'Circular-orbit table is not built when first used'
+            table= pot._circ_cache['tables']['vc2']
+            for R,ex in zip(Rs,exact):
+                assert numpy.fabs(pot.vcirc(R)/ex-1.) < 10.**-6., 'Scalar vcirc using cached tables does not agree with the exact calculation'
+                assert pot._circ_cache['tables']['vc2'] is table, 'Circular-orbit table is not re-used'
+            # turn_physical_on/off reset the tables, which are then rebuilt
+            pot.turn_physical_off()
+            assert pot._circ_cache['tables'] == {}, 'Circular-orbit tables are not reset by turn_physical_off'
+            assert numpy.fabs(pot.vcirc(1.5)/exact[2]-1.) < 10.**-6., 'Scalar vcirc using cached tables does not agree with the exact calculation'
+            pot.turn_physical_on()
+            assert pot._circ_cache['tables'] == {}, 'Circular-orbit tables are not reset by turn_physical_on'
+        finally:
+            pot.turn_circular_cache_off()
+    return None
+
+# Test that rl, lindbladR, and vterm work for array input
+def test_rl_array():
+    # Kepler, analytic
+    kp= potential.KeplerPotential(normalize=1.)
+    lz= numpy.array([[0.5,1.],[2.,-2.]])
+    assert numpy.all(numpy.fabs(kp.rl(lz)-lz**2.) < 10.**-8.), 'KeplerPotential radius of a circular orbit is wrong for array input'
+    # MWPotential2014, compare to scalar input, also zero and very small lz
+    lz= numpy.array([0.,0.000001,0.1,0.5,1.,1.5,3.])
+    rls= potential.rl(potential.MWPotential2014,lz)
+    assert rls[0] == 0., 'Radius of circular orbit with Lz=0 is not zero'
+    for ii in range(1,len(lz)):
+        assert numpy.fabs(rls[ii]-potential.rl(potential.MWPotential2014,lz[ii])) < 10.**-10., 'Radius of circular orbit for array input does not agree with scalar input'
+        assert numpy.fabs(potential.vcirc(potential.MWPotential2014,rls[ii])*rls[ii]-lz[ii]) < 10.**-12., 'Radius of circular orbit for array input does not have the correct Lz'
+    # Potential that does not accept array input
+    tnp= potential.TriaxialNFWPotential(normalize=1.,c=0.8)
+    lz= numpy.array([0.5,1.])
+    rls= tnp.rl(lz)
+    for ii in range(len(lz)):
+        assert numpy.fabs(rls[ii]-tnp.rl(lz[ii])) < 10.**-10., 'Radius of circular orbit for array input does not agree with scalar input'
+    return None
+
+def test_lindbladR_array():
+    lp= potential.LogarithmicHaloPotential(normalize=1.)
+    OmegaP= numpy.array([0.25,0.5,1.])
+    assert numpy.all(numpy.fabs(lp.lindbladR(OmegaP,'corotation')-1./OmegaP) < 10.**-10.), 'Location of co-rotation resonance is wrong for LogarithmicHaloPotential for array input'
+    for m in [2,-2]:
+        lRs= potential.lindbladR(lp,OmegaP,m)
+        assert numpy.all(numpy.fabs(lp.omegac(lRs)-m/(m-numpy.sqrt(2.))*OmegaP) < 10.**-10.), 'Location of m={} resonance is wrong for LogarithmicHaloPotential for array input'.format(m)
+    # Non-existent ones are NaN
+    mp= potential.MiyamotoNagaiPotential(normalize=1.,a=0.3)
+    OmegaP= numpy.array([0.5,3.])
+    lRs= mp.lindbladR(OmegaP,-2)
+    for ii in range(len(OmegaP)):
+        assert numpy.fabs(lRs[ii]-mp.lindbladR(OmegaP[ii],-2)) < 10.**-8., 'Lindblad resonance for array input does not agree with scalar input'
+    assert numpy.all(numpy.isnan(mp.lindbladR(OmegaP,2))), 'Non-existent Lindblad resonance for array input is not NaN'
+    # brentq kwargs not supported by the vectorized root finder are ignored
+    lRs= lp.lindbladR(numpy.array([0.25,0.5,1.]),'corotation',
+                      xtol=1e-12,disp=True,full_output=False)
+    assert numpy.all(numpy.fabs(lRs-1./numpy.array([0.25,0.5,1.])) < 10.**-10.), 'lindbladR for array input does not accept general brentq kwargs'
+    return None
+
+def test_vterm_array():
+    lp= potential.LogarithmicHaloPotential(normalize=1.)
+    ls= numpy.array([30.,60.,-30.])
+    vterms= lp.vterm(ls)
+    for ii in range(len(ls)):
+        assert numpy.fabs(vterms[ii]-lp.vterm(ls[ii])) < 10.**-10., 'vterm for array input does not agree with scalar input'
+    tnp= potential.TriaxialNFWPotential(normalize=1.,c=0.8)
+    vterms= potential.vterm(tnp,ls)
+    for ii in range(len(ls)):
+        assert numpy.fabs(vterms[ii]-potential.vterm(tnp,ls[ii])) < 10.**-10., 'vterm for array input does not agree with scalar input'
+    return None
+
 def test_flattening():
     #Simple tests: LogarithmicHalo
     qs= [0.75,1.,1.25]
@@ -2711,6 +2853,65 @@ def test_TwoPowerTriaxialPotential_betalowerror():
         dummy= potential.TwoPowerTriaxialPotential(beta=1.)
     return None
 
+def test_EllipsoidalPotential_tabulate():
+    # Test that the tabulated forces of EllipsoidalPotentials agree with
+    # those computed by direct integration, also outside of the table
+    numpy.random.seed(1)
+    xyz= numpy.random.normal(size=(100,3))\
+        *numpy.exp(numpy.random.uniform(-8.,6.,size=(100,1)))
+    Rs= numpy.sqrt(xyz[:,0]**2.+xyz[:,1]**2.)
+    phis= numpy.arctan2(xyz[:,1],xyz[:,0])
+    zs= xyz[:,2]
+    for cls,kw in [(potential.TriaxialNFWPotential,{}),
+                   (potential.TriaxialHernquistPotential,
+                    {'zvec':[0.,0.3,1.],'pa':0.4}),
+                   (potential.TriaxialJaffePotential,{}),
+                   (potential.PerfectEllipsoidPotential,{'a':1.}),
+                   (potential.TwoPowerTriaxialPotential,{'a':1.})]:
+        tp= cls(b=0.8,c=0.6,tabulate=True,tabulate_tol=1e-8,**kw)
+        dp= cls(b=0.8,c=0.6,**kw)
+        for R,z,phi in zip(Rs,zs,phis):
+            scale= numpy.fabs(dp.Rforce(R,z,phi=phi))\
+                +numpy.fabs(dp.zforce(R,z,phi=phi))
+            assert numpy.fabs(tp.Rforce(R,z,phi=phi)-dp.Rforce(R,z,phi=phi)) < 10.**-7.*scale, "Tabulated Rforce of {} does not agree with direct integration".format(cls.__name__)
+            assert numpy.fabs(tp.zforce(R,z,phi=phi)-dp.zforce(R,z,phi=phi)) < 10.**-7.*scale, "Tabulated zforce of {} does not agree with direct integration".format(cls.__name__)
+            assert numpy.fabs(tp.phiforce(R,z,phi=phi)-dp.phiforce(R,z,phi=phi)) < 10.**-7.*scale*R, "Tabulated phiforce of {} does not agree with direct integration".format(cls.__name__)
+    return None
+
+def test_EllipsoidalPotential_tabulate_noglorder():
+    with pytest.raises(ValueError) as excinfo:
+        dummy= potential.TriaxialNFWPotential(b=0.8,c=0.6,glorder=None,
+                                              tabulate=True)
+    return None
+
+def test_EllipsoidalPotential_tabulate_orbitintegration_c():
+    # Test that orbit integration in C with tabulated forces agrees with that
+    # in python
+    from galpy.orbit import Orbit
+    tp= potential.TriaxialNFWPotential(normalize=1.,b=0.8,c=0.6,tabulate=True)
+    # Potential and forces in C should agree with python, also outside of
+    # the table
+    Rs= [10.**-5.,0.1,0.5,1.,3.,10.**4.]
+    zs= [10.**-5.,-0.2,0.3,1.,-2.,10.**3.]
+    check_c_forces(tp,Rs,zs,10.**-8.)
+    check_c_forces(potential.TriaxialHernquistPotential(\
+            b=0.8,c=0.6,zvec=[0.,0.3,1.],pa=0.4,tabulate=True),Rs,zs,10.**-8.)
+    ts= numpy.linspace(0.,10.,1001)
+    o= Orbit([1.,0.1,1.1,0.1,0.1,0.])
+    oc= o()
+    o.integrate(ts,tp,method='dop853')
+    oc.integrate(ts,tp,method='dop853_c')
+    for attr in ['R','z','vR','vT','vz','phi']:
+        assert orbit_diff(o,oc,attr,ts) < 10.**-6., "Orbit integration in TriaxialNFWPotential with tabulated forces in C does not agree with that in python"
+    # Also planar
+    op= o.toPlanar()
+    opc= op()
+    op.integrate(ts,tp,method='dop853')
+    opc.integrate(ts,tp,method='dop853_c')
+    for attr in ['R','vR','vT','phi']:
+        assert orbit_diff(op,opc,attr,ts) < 10.**-6., "Planar orbit integration in TriaxialNFWPotential with tabulated forces in C does not agree with that in python"
+    return None
+
 # Test that DehnenSphericalPotential setup raises an error for bad values of alpha
 def test_DehnenSphericalPotential_alphalowhigherror():
     with pytest.raises(IOError) as excinfo:
@@ -2962,6 +3163,422 @@ def test_DiskSCFPotential_againstDoubleExp_dens():
     assert numpy.all(numpy.fabs((dp.dens(testR,testzs)-dscfp.dens(testR,testzs))/dscfp.dens(testRs,testz)) < 10.**-1.), "DiskSCFPotential for double-exponential disk does not agree with DoubleExponentialDiskPotential"
     return None
 
+def test_DiskSCFPotential_tabulatedProfiles():
+    # Test that user-supplied Sigma and hz functions are tabulated accurately
+    # for the C implementation and that orbit integration in C agrees with
+    # that in python
+    from scipy import interpolate
+    from galpy.orbit import Orbit
+    from galpy.potential import mwpot_helpers
+    Rd, Rm, zd= 1./3., 0.5, 1./27.
+    dscfp= potential.DiskSCFPotential(\
+        dens=lambda R,z: mwpot_helpers.expsech2_dens_with_hole(R,z,Rd,Rm,zd,
+                                                               13.5),
+        Sigma_amp=13.5,
+        Sigma=lambda R: numpy.exp(-Rm/R-R/Rd),
+        dSigmadR=lambda R: (Rm/R**2.-1./Rd)*numpy.exp(-Rm/R-R/Rd),
+        d2SigmadR2=lambda R: ((Rm/R**2.-1./Rd)**2.-2.*Rm/R**3.)\
+            *numpy.exp(-Rm/R-R/Rd),
+        hz=lambda z: 1./numpy.cosh(z/2./zd)**2./4./zd,
+        Hz=lambda z: zd*(numpy.logaddexp(z/2./zd,-z/2./zd)-numpy.log(2.)),
+        dHzdz=lambda z: numpy.tanh(z/2./zd)/2.,
+        a=1.,N=5,L=5)
+    assert dscfp.hasC, "DiskSCFPotential with user-supplied Sigma and hz functions should have a C implementation"
+    testRs= numpy.linspace(0.,3.,1001)
+    testzs= numpy.linspace(-1.,1.,1001)
+    for tab,funcs,xs in zip([dscfp._Sigma_tab[0],dscfp._hz_tab[0]],
+                            [[dscfp._Sigma[0],dscfp._dSigmadR[0],
+                              dscfp._d2SigmadR2[0]],
+                             [dscfp._hz[0],dscfp._Hz[0],dscfp._dHzdz[0]]],
+                            [testRs,testzs]):
+        xs= xs[(xs >= tab[0,0])*(xs <= tab[0,-1])]
+        for ii,func in enumerate(funcs):
+            spl= interpolate.CubicSpline(tab[0],tab[ii+1],bc_type='natural')
+            assert numpy.amax(numpy.fabs(spl(xs)-func(xs))) \
+                < 10.**-7.*numpy.amax(numpy.fabs(func(xs))), \
+                "Tabulated DiskSCFPotential profile does not agree with the input function"
+    # Potential and forces in C should agree with python, also outside of
+    # the range of the tabulated profiles
+    check_c_forces(dscfp,[0.1,0.5,1.,2.,5.,20.,1.,0.3],
+                   [0.,0.02,-0.1,0.5,-1.,2.,10.,-30.],10.**-7.)
+    ts= numpy.linspace(0.,10.,1001)
+    o= Orbit([1.,0.1,1.1,0.1,0.,0.])
+    oc= o()
+    o.integrate(ts,dscfp,method='dop853')
+    oc.integrate(ts,dscfp,method='dop853_c')
+    for attr in ['R','z','vR','vT','vz','phi']:
+        assert orbit_diff(o,oc,attr,ts) < 10.**-5., "Orbit integration in DiskSCFPotential with tabulated profiles in C does not agree with that in python"
+    return None
+
+def test_CylindricalSplinePotential_againstPlummer():
+    # Test that the CylindricalSplinePotential approx. of a Plummer sphere
+    # agrees with PlummerPotential
+    pp= potential.PlummerPotential(amp=1.,b=0.3)
+    cp= potential.CylindricalSplinePotential(\
+        dens=lambda R,z: pp.dens(R,z,use_physical=False),
+        Rgrid=(0.,3.,31),zgrid=(0.,3.,31))
+    assert numpy.fabs(cp._mass-1.) < 10.**-1.5, "Mass of CylindricalSplinePotential approx. of Plummer sphere is not close to one"
+    testRs= numpy.linspace(0.1,2.,11)
+    testzs= numpy.linspace(-1.,1.,11)
+    for R in testRs:
+        for z in testzs:
+            assert numpy.fabs((cp(R,z)-pp(R,z))/pp(R,z)) < 10.**-1.5, "CylindricalSplinePotential for Plummer sphere does not agree with PlummerPotential"
+            assert numpy.fabs((cp.Rforce(R,z)-pp.Rforce(R,z))/pp.Rforce(R,z)) < 10.**-2., "CylindricalSplinePotential Rforce for Plummer sphere does not agree with PlummerPotential"
+            assert numpy.fabs(cp.zforce(R,z)-pp.zforce(R,z)) < 10.**-2.*numpy.fabs(pp.Rforce(R,z)), "CylindricalSplinePotential zforce for Plummer sphere does not agree with PlummerPotential"
+    # Outside of the grid, should be a point mass
+    assert numpy.fabs(cp(5.,1.)+cp._mass/numpy.sqrt(26.)) < 10.**-10., "CylindricalSplinePotential outside of the grid is not a point mass"
+    assert numpy.fabs(cp.Rforce(5.,1.)+cp._mass*5./26.**1.5) < 10.**-10., "CylindricalSplinePotential Rforce outside of the grid is not that of a point mass"
+    assert numpy.fabs(cp.zforce(5.,1.)+cp._mass/26.**1.5) < 10.**-10., "CylindricalSplinePotential zforce outside of the grid is not that of a point mass"
+    # Should be axisymmetric
+    assert not cp.isNonAxi, "CylindricalSplinePotential of an axisymmetric density is not axisymmetric"
+    assert numpy.fabs(cp.phiforce(1.,0.1,phi=0.5)) < 10.**-10., "CylindricalSplinePotential of an axisymmetric density has a non-zero phiforce"
+    # evaluate* functions pass phi=None for axisymmetric potentials
+    assert numpy.fabs(potential.evaluatePotentials(cp,1.,0.1)-cp(1.,0.1)) < 10.**-10., "CylindricalSplinePotential evaluated with phi=None does not agree with phi=0"
+    assert numpy.fabs(potential.evaluateRforces(cp,1.,0.1)-cp.Rforce(1.,0.1)) < 10.**-10., "CylindricalSplinePotential evaluated with phi=None does not agree with phi=0"
+    return None
+
+def test_CylindricalSplinePotential_callables():
+    # Test that densities given as callables without a __code__ attribute
+    # are correctly identified as axisymmetric or non-axisymmetric
+    import functools
+    def dens_nonaxi(R,z,phi,q=0.5):
+        return numpy.exp(-3.*R-10.*numpy.fabs(z))*(1.+q*numpy.cos(2.*phi))
+    class Dens(object):
+        def __call__(self,R,z):
+            return numpy.exp(-3.*R-10.*numpy.fabs(z))
+    cp= potential.CylindricalSplinePotential(\
+        dens=functools.partial(dens_nonaxi,q=0.3),
+        Rgrid=(0.,2.,11),zgrid=(0.,1.,11),mmax=2)
+    assert cp.isNonAxi, "CylindricalSplinePotential with a functools.partial non-axisymmetric density is axisymmetric"
+    cpa= potential.CylindricalSplinePotential(\
+        dens=Dens(),Rgrid=(0.,2.,11),zgrid=(0.,1.,11))
+    assert not cpa.isNonAxi, "CylindricalSplinePotential with an axisymmetric callable-object density is non-axisymmetric"
+    assert numpy.fabs(cp(1.,0.1,phi=0.3)-cp(1.,0.1,phi=1.2)) > 10.**-4., "CylindricalSplinePotential with a non-axisymmetric density does not depend on phi"
+    return None
+
+def test_CylindricalSplinePotential_nonaxi():
+    # Test that the CylindricalSplinePotential approx. of a triaxial
+    # Hernquist potential agrees with TriaxialHernquistPotential
+    tp= potential.TriaxialHernquistPotential(amp=1.,a=0.2,b=0.7,c=0.5,
+                                             pa=0.3)
+    vdens= numpy.vectorize(lambda R,z,phi: tp.dens(R,z,phi=phi,
+                                                    use_physical=False))
+    cp= potential.CylindricalSplinePotential(\
+        dens=lambda R,z,phi: vdens(R,z,phi),
+        Rgrid=(0.,2.,21),zgrid=(0.,2.,21),mmax=4,numcores=2)
+    assert cp.isNonAxi, "CylindricalSplinePotential of a non-axisymmetric density is axisymmetric"
+    for R,z,phi in [(0.5,0.1,0.8),(1.,0.5,1.2),(0.3,-0.2,2.),(1.,-0.3,-0.5)]:
+        assert numpy.fabs((cp.Rforce(R,z,phi=phi)-tp.Rforce(R,z,phi=phi))/tp.Rforce(R,z,phi=phi)) < 10.**-1.5, "CylindricalSplinePotential Rforce for triaxial Hernquist does not agree with TriaxialHernquistPotential"
+        assert numpy.fabs((cp.zforce(R,z,phi=phi)-tp.zforce(R,z,phi=phi))/tp.zforce(R,z,phi=phi)) < 10.**-1.5, "CylindricalSplinePotential zforce for triaxial Hernquist does not agree with TriaxialHernquistPotential"
+        assert numpy.fabs((cp.phiforce(R,z,phi=phi)-tp.phiforce(R,z,phi=phi))/tp.phiforce(R,z,phi=phi)) < 10.**-1.5, "CylindricalSplinePotential phiforce for triaxial Hernquist does not agree with TriaxialHernquistPotential"
+    # Derivatives should be consistent with the potential
+    R,z,phi,dx= 0.8,0.3,0.7,10.**-6.
+    assert numpy.fabs(cp.phiforce(R,z,phi=phi)+(cp(R,z,phi=phi+dx)-cp(R,z,phi=phi))/dx) < 10.**-4., "CylindricalSplinePotential phiforce is not the derivative of the potential"
+    assert numpy.fabs(cp.phi2deriv(R,z,phi=phi)+(cp.phiforce(R,z,phi=phi+dx)-cp.phiforce(R,z,phi=phi))/dx) < 10.**-4., "CylindricalSplinePotential phi2deriv is not the derivative of the phiforce"
+    assert numpy.fabs(cp.Rphideriv(R,z,phi=phi)+(cp.Rforce(R,z,phi=phi+dx)-cp.Rforce(R,z,phi=phi))/dx) < 10.**-4., "CylindricalSplinePotential Rphideriv is not the derivative of the Rforce"
+    return None
+
+def test_CylindricalSplinePotential_orbitintegration_c():
+    # Test that orbit integration in C agrees with that in python
+    from galpy.orbit import Orbit
+    cp= potential.CylindricalSplinePotential(\
+        dens=lambda R,z,phi: numpy.exp(-3.*R-10.*numpy.fabs(z))\
+            *(1.+0.3*numpy.cos(2.*phi)+0.1*numpy.sin(3.*phi)),
+        Rgrid=(0.,2.,21),zgrid=(0.,1.,21),mmax=3)
+    # Potential and forces in C should agree with python, also close to and
+    # outside of the edge of the grid
+    check_c_forces(cp,[0.1,0.5,1.2,1.9,1.99,2.,2.5,0.5,0.5],
+                   [0.,0.07,-0.3,0.5,0.1,0.1,0.2,0.99,-1.2],10.**-10.)
+    ts= numpy.linspace(0.,10.,1001)
+    o= Orbit([0.8,0.1,1.,0.05,0.,0.3])
+    oc= o()
+    o.integrate(ts,cp,method='dop853')
+    oc.integrate(ts,cp,method='dop853_c')
+    for attr in ['R','z','vR','vT','vz','phi']:
+        assert orbit_diff(o,oc,attr,ts) < 10.**-5., "Orbit integration in CylindricalSplinePotential in C does not agree with that in python"
+    # Also planar
+    op= o.toPlanar()
+    opc= op()
+    op.integrate(ts,cp,method='dop853')
+    opc.integrate(ts,cp,method='dop853_c')
+    for attr in ['R','vR','vT','phi']:
+        assert orbit_diff(op,opc,attr,ts) < 10.**-5., "Planar orbit integration in CylindricalSplinePotential in C does not agree with that in python"
+    return None
+
+def test_TimeDependentSCFPotential_orbitintegration_c():
+    # Test that orbit integration in C agrees with that in python
+    from galpy.orbit import Orbit
+    numpy.random.seed(2)
+    Acos= numpy.zeros((4,3,3,3)); Asin= numpy.zeros((4,3,3,3))
+    Acos[:,0,0,0]= 1.+0.2*numpy.arange(4)
+    Acos[:,1:,:,:]= 0.05*numpy.tril(numpy.random.normal(size=(4,2,3,3)))
+    Asin[:,1:,:,1:]= 0.05*numpy.tril(numpy.random.normal(size=(4,2,3,2)),-1)
+    ts= numpy.linspace(0.,10.,1001)
+    for interp in ['linear','cubic']:
+        tp= potential.TimeDependentSCFPotential(\
+            Acos=Acos,Asin=Asin,times=numpy.array([0.,2.,5.,8.]),
+            interp=interp)
+        assert tp.isNonAxi, 'TimeDependentSCFPotential in this test should be non-axisymmetric'
+        check_c_forces(tp,[0.1,0.5,1.,2.,10.],[0.,0.1,-0.3,1.,-5.],10.**-10.)
+        o= Orbit([0.8,0.1,1.,0.05,0.,0.3])
+        oc= o()
+        o.integrate(ts,tp,method='dop853')
+        oc.integrate(ts,tp,method='dop853_c')
+        for attr in ['R','z','vR','vT','vz','phi']:
+            assert orbit_diff(o,oc,attr,ts) < 10.**-5., "Orbit integration in TimeDependentSCFPotential in C does not agree with that in python"
+        # Also planar
+        op= o.toPlanar()
+        opc= op()
+        op.integrate(ts,tp,method='dop853')
+        opc.integrate(ts,tp,method='dop853_c')
+        for attr in ['R','vR','vT','phi']:
+            assert orbit_diff(op,opc,attr,ts) < 10.**-5., "Planar orbit integration in TimeDependentSCFPotential in C does not agree with that in python"
+    return None
+
+def test_FerrersPotential_orbitintegration_c():
+    # Test that orbit integration in C agrees with that in python
+    from galpy.orbit import Orbit
+    # Higher glorder than the default, such that the second derivatives used
+    # for the phase-space volume agree to 1e-5
+    fp= potential.FerrersPotential(amp=0.5,a=1.2,n=1.5,b=0.5,c=0.3,
+                                   omegab=0.4,pa=0.3,glorder=100)
+    check_c_forces(fp,[0.1,0.5,1.,1.19,2.],[0.,0.1,-0.2,0.05,0.5],10.**-8.)
+    ts= numpy.linspace(0.,2.,101)
+    o= Orbit([0.8,0.1,1.,0.05,0.,0.3])
+    oc= o()
+    o.integrate(ts,fp,method='dop853')
+    oc.integrate(ts,fp,method='dop853_c')
+    for attr in ['R','z','vR','vT','vz','phi']:
+        assert orbit_diff(o,oc,attr,ts) < 10.**-6., "Orbit integration in FerrersPotential in C does not agree with that in python"
+    # Also planar, including the phase-space volume
+    op= o.toPlanar()
+    opc= op()
+    op.integrate_dxdv([1.,0.,0.,0.],ts,fp,method='dop853',
+                      rectIn=True,rectOut=True)
+    opc.integrate_dxdv([1.,0.,0.,0.],ts,fp,method='dop853_c',
+                       rectIn=True,rectOut=True)
+    for attr in ['R','vR','vT','phi']:
+        assert orbit_diff(op,opc,attr,ts) < 10.**-6., "Planar orbit integration in FerrersPotential in C does not agree with that in python"
+    assert numpy.amax(numpy.fabs(op.getOrbit_dxdv()-opc.getOrbit_dxdv())) < 10.**-5., "Phase-space deviations integrated in FerrersPotential in C do not agree with those in python"
+    return None
+
+def test_RazorThinExponentialDiskPotential_offplane():
+    # Test the Hankel-transform forces off the plane against direct
+    # integration of the Bessel integrals
+    from scipy import integrate, special
+    rp= potential.RazorThinExponentialDiskPotential(hr=1./3.)
+    alpha= 3.
+    def exact(R,z,kind):
+        if kind == 0:
+            f= lambda k: special.j0(k*R)*numpy.exp(-k*numpy.fabs(z))\
+                *(alpha**2.+k**2.)**-1.5
+        elif kind == 1:
+            f= lambda k: k*special.j1(k*R)*numpy.exp(-k*numpy.fabs(z))\
+                *(alpha**2.+k**2.)**-1.5
+        else:
+            f= lambda k: k*special.j0(k*R)*numpy.exp(-k*numpy.fabs(z))\
+                *(alpha**2.+k**2.)**-1.5
+        return -2.*numpy.pi*alpha\
+            *integrate.quad(f,0.,numpy.inf,limit=20000,epsabs=1e-15,
+                            epsrel=1e-12)[0]
+    for R,z in [(1.,0.1),(0.5,-0.01),(0.1,0.05),(0.01,0.01),(5.,0.3),
+                (1.,2.)]:
+        assert numpy.fabs(rp(R,z)/exact(R,z,0)-1.) < 10.**-8., "RazorThinExponentialDiskPotential off the plane does not agree with direct integration"
+        assert numpy.fabs(rp.Rforce(R,z)/exact(R,z,1)-1.) < 10.**-8., "RazorThinExponentialDiskPotential off the plane does not agree with direct integration"
+        assert numpy.fabs(rp.zforce(R,z)/exact(R,z,2)/numpy.sign(z)-1.) < 10.**-8., "RazorThinExponentialDiskPotential off the plane does not agree with direct integration"
+    return None
+
+def test_RazorThinExponentialDiskPotential_glorder_deprecated():
+    # glorder= used to set the total order of the old quadrature, it is now
+    # ignored with a warning; hankelorder= sets the per-interval order
+    import warnings
+    from galpy.util import galpyWarning
+    with warnings.catch_warnings(record=True) as w:
+        warnings.simplefilter("always",galpyWarning)
+        rp= potential.RazorThinExponentialDiskPotential(hr=1./3.,glorder=100)
+        raisedWarning= False
+        for wa in w:
+            raisedWarning= ('glorder' in str(wa.message))
+            if raisedWarning: break
+        assert raisedWarning, "RazorThinExponentialDiskPotential with glorder= did not raise galpyWarning"
+    assert rp._hankelorder == 10, "RazorThinExponentialDiskPotential with the deprecated glorder= does not use the default hankelorder"
+    rph= potential.RazorThinExponentialDiskPotential(hr=1./3.,hankelorder=20)
+    assert len(rph._glx) == 20, "RazorThinExponentialDiskPotential hankelorder= does not set the order of the quadrature"
+    assert numpy.fabs(rph(1.,0.1)/rp(1.,0.1)-1.) < 10.**-8., "RazorThinExponentialDiskPotential with a higher hankelorder does not agree with the default"
+    return None
+
+def test_RazorThinExponentialDiskPotential_orbitintegration_c():
+    # Test that orbit integration in C agrees with that in python
+    from galpy.orbit import Orbit
+    rp= potential.RazorThinExponentialDiskPotential(normalize=1.,hr=0.4)
+    check_c_forces(rp,[0.1,0.5,1.,2.,5.],[0.,0.1,-0.2,0.5,1.],10.**-6.)
+    ts= numpy.linspace(0.,2.,101)
+    o= Orbit([1.,0.1,1.1,0.1,0.1,0.])
+    oc= o()
+    o.integrate(ts,rp,method='dop853')
+    oc.integrate(ts,rp,method='dop853_c')
+    for attr in ['R','z','vR','vT','vz','phi']:
+        assert orbit_diff(o,oc,attr,ts) < 10.**-6., "Orbit integration in RazorThinExponentialDiskPotential in C does not agree with that in python"
+    # Also planar, including the phase-space volume
+    op= o.toPlanar()
+    opc= op()
+    op.integrate_dxdv([1.,0.,0.,0.],ts,rp,method='dop853',
+                      rectIn=True,rectOut=True)
+    opc.integrate_dxdv([1.,0.,0.,0.],ts,rp,method='dop853_c',
+                       rectIn=True,rectOut=True)
+    for attr in ['R','vR','vT','phi']:
+        assert orbit_diff(op,opc,attr,ts) < 10.**-6., "Planar orbit integration in RazorThinExponentialDiskPotential in C does not agree with that in python"
+    assert numpy.amax(numpy.fabs(op.getOrbit_dxdv()-opc.getOrbit_dxdv())) < 10.**-5., "Phase-space deviations integrated in RazorThinExponentialDiskPotential in C do not agree with those in python"
+    return None
+
+def test_MovingObjectPopulationPotential_againstMovingObjectPotential():
+    # Test that the population potential agrees with the sum of
+    # MovingObjectPotentials at the times of the orbits
+    from galpy.orbit import Orbit
+    numpy.random.seed(1)
+    nobj= 5
+    vxvv= numpy.array([numpy.random.uniform(0.8,1.2,nobj),
+                       numpy.random.normal(0.,0.1,nobj),
+                       numpy.random.uniform(0.9,1.1,nobj),
+                       numpy.random.normal(0.,0.1,nobj),
+                       numpy.random.normal(0.,0.1,nobj),
+                       numpy.random.uniform(0.,2.*numpy.pi,nobj)]).T
+    ts= numpy.linspace(0.,-3.,301)
+    os= Orbit(vxvv)
+    os.integrate(ts,potential.MWPotential2014)
+    masses= numpy.random.uniform(0.01,0.02,nobj)
+    rs= numpy.random.uniform(0.05,0.1,nobj)
+    for profile in ['plummer','hernquist']:
+        mp= potential.MovingObjectPopulationPotential(os,masses,rs,
+                                                      profile=profile)
+        mops= []
+        for ii in range(nobj):
+            if profile == 'plummer':
+                op= potential.PlummerPotential(amp=masses[ii],b=rs[ii])
+            else:
+                op= potential.HernquistPotential(amp=2.*masses[ii],a=rs[ii])
+            mops.append(potential.MovingObjectPotential(os[ii],pot=op))
+        for t in ts[::50]:
+            for R,z,phi in zip([0.5,1.,1.5],[0.,0.1,-0.2],[0.,1.,4.]):
+                assert numpy.fabs(mp(R,z,phi=phi,t=t)-potential.evaluatePotentials(mops,R,z,phi=phi,t=t)) < 10.**-8., "MovingObjectPopulationPotential does not agree with the sum of MovingObjectPotentials"
+                assert numpy.fabs(mp.Rforce(R,z,phi=phi,t=t)-potential.evaluateRforces(mops,R,z,phi=phi,t=t)) < 10.**-8., "MovingObjectPopulationPotential does not agree with the sum of MovingObjectPotentials"
+                assert numpy.fabs(mp.zforce(R,z,phi=phi,t=t)-potential.evaluatezforces(mops,R,z,phi=phi,t=t)) < 10.**-8., "MovingObjectPopulationPotential does not agree with the sum of MovingObjectPotentials"
+                assert numpy.fabs(mp.phiforce(R,z,phi=phi,t=t)-potential.evaluatephiforces(mops,R,z,phi=phi,t=t)) < 10.**-8., "MovingObjectPopulationPotential does not agree with the sum of MovingObjectPotentials"
+    return None
+
+def test_MovingObjectPopulationPotential_atobject():
+    # Test that the forces are finite at the center of one of the objects
+    # and equal to those of the other objects
+    from galpy.orbit import Orbit
+    numpy.random.seed(3)
+    nobj= 4
+    vxvv= numpy.array([numpy.random.uniform(0.8,1.2,nobj),
+                       numpy.random.normal(0.,0.1,nobj),
+                       numpy.random.uniform(0.9,1.1,nobj),
+                       numpy.random.normal(0.,0.1,nobj),
+                       numpy.random.normal(0.,0.1,nobj),
+                       numpy.random.uniform(0.,2.*numpy.pi,nobj)]).T
+    ts= numpy.linspace(0.,-1.,11)
+    os= Orbit(vxvv)
+    os.integrate(ts,potential.MWPotential2014)
+    masses= numpy.random.uniform(0.01,0.02,nobj)
+    rs= numpy.random.uniform(0.05,0.1,nobj)
+    for profile in ['plummer','hernquist']:
+        mp= potential.MovingObjectPopulationPotential(os,masses,rs,
+                                                      profile=profile)
+        mpo= potential.MovingObjectPopulationPotential(os[1:],masses[1:],
+                                                       rs[1:],profile=profile)
+        x,y,z= mp._pos[0,3]
+        out= mp._xyzforces(x,y,z,mp._times[3])
+        outo= mpo._xyzforces(x,y,z,mp._times[3])
+        assert numpy.all(numpy.isfinite(out)), 'MovingObjectPopulationPotential is not finite at the center of an object'
+        for ii in range(1,4):
+            assert numpy.fabs(out[ii]-outo[ii]) < 10.**-10., 'MovingObjectPopulationPotential force at the center of an object does not equal that of the other objects'
+        R,phi= numpy.sqrt(x**2.+y**2.), numpy.arctan2(y,x)
+        assert numpy.isfinite(mp.Rforce(R,z,phi=phi,t=mp._times[3])), 'MovingObjectPopulationPotential is not finite at the center of an object'
+    return None
+
+def test_MovingObjectPopulationPotential_cutoff():
+    # Test that the time-binned spatial index used with a cutoff (in C) finds
+    # all objects within the cutoff, by querying the index in the same way
+    # as the C implementation
+    from galpy.orbit import Orbit
+    from galpy.potential.MovingObjectPopulationPotential import \
+        _hermite_interp
+    numpy.random.seed(2)
+    nobj= 100
+    vxvv= numpy.array([numpy.random.uniform(0.5,2.,nobj),
+                       numpy.random.normal(0.,0.2,nobj),
+                       numpy.random.uniform(0.8,1.2,nobj),
+                       numpy.random.normal(0.,0.3,nobj),
+                       numpy.random.normal(0.,0.2,nobj),
+                       numpy.random.uniform(0.,2.*numpy.pi,nobj)]).T
+    ts= numpy.linspace(0.,-5.,101)
+    os= Orbit(vxvv)
+    os.integrate(ts,potential.MWPotential2014)
+    cutoff= 0.3
+    mp= potential.MovingObjectPopulationPotential(\
+        os,numpy.random.uniform(1e-4,1e-3,nobj),0.01,cutoff=cutoff,tbin=0.7)
+    grids, offsets, entries= mp._index
+    npts= 1000
+    R= numpy.random.uniform(0.3,2.5,npts)
+    phi= numpy.random.uniform(0.,2.*numpy.pi,npts)
+    xyz= numpy.array([R*numpy.cos(phi),R*numpy.sin(phi),
+                      numpy.random.normal(0.,0.3,npts)]).T
+    tt= numpy.random.uniform(-5.5,0.5,npts)
+    nfound= 0
+    for pt,t in zip(xyz,tt):
+        opos= _hermite_interp(mp._times,mp._pos,mp._vel,t)
+        near= numpy.arange(nobj)[numpy.sqrt(numpy.sum((opos-pt)**2.,
+                                                      axis=1)) <= cutoff]
+        bin= min(max(int(numpy.floor((t-mp._times[0])/mp._tbin)),0),
+                 mp._nbins-1)
+        grid= grids[bin]
+        ns= grid[4:].astype('int')
+        ii= numpy.floor((pt-grid[:3])/grid[3]).astype('int')
+        found= []
+        for jx in range(max(ii[0]-1,0),min(ii[0]+2,ns[0])):
+            for jy in range(max(ii[1]-1,0),min(ii[1]+2,ns[1])):
+                for jz in range(max(ii[2]-1,0),min(ii[2]+2,ns[2])):
+                    cell= (jx*ns[1]+jy)*ns[2]+jz
+                    found.extend(entries[bin,offsets[bin][cell]:offsets[bin][cell+1]])
+        assert numpy.all(numpy.isin(near,found)), "The spatial index of MovingObjectPopulationPotential misses objects within the cutoff"
+        nfound+= len(near)
+    assert nfound > 0, "No objects within the cutoff were found, test is not useful"
+    # Index should be useful
+    assert numpy.amax(grids[:,4:].prod(axis=1)) > 1, "The spatial index of MovingObjectPopulationPotential does not split the objects into cells"
+    return None
+
+def test_MovingObjectPopulationPotential_orbitintegration_c():
+    # Test that orbit integration in C agrees with that in python
+    from galpy.orbit import Orbit
+    numpy.random.seed(3)
+    nobj= 20
+    vxvv= numpy.array([numpy.random.uniform(0.8,1.2,nobj),
+                       numpy.random.normal(0.,0.1,nobj),
+                       numpy.random.uniform(0.9,1.1,nobj),
+                       numpy.random.normal(0.,0.1,nobj),
+                       numpy.random.normal(0.,0.1,nobj),
+                       numpy.random.uniform(0.,2.*numpy.pi,nobj)]).T
+    ts= numpy.linspace(0.,2.,201)
+    os= Orbit(vxvv)
+    os.integrate(ts,potential.MWPotential2014)
+    for cutoff in [None,0.5]:
+        mp= potential.MovingObjectPopulationPotential(\
+            os,numpy.random.uniform(0.001,0.002,nobj),0.05,cutoff=cutoff)
+        # Potential and forces in C should agree with python, at the radii
+        # and heights of the objects and elsewhere
+        check_c_forces(mp,numpy.hstack((os.R(0.),[0.1,0.9,1.,3.])),
+                       numpy.hstack((os.z(0.),[0.,0.01,-0.1,1.])),10.**-10.)
+        pot= potential.MWPotential2014+mp
+        o= Orbit([1.,0.1,1.1,0.1,0.1,0.])
+        oc= o()
+        o.integrate(ts,pot,method='dop853')
+        oc.integrate(ts,pot,method='dop853_c')
+        for attr in ['R','z','vR','vT','vz','phi']:
+            assert orbit_diff(o,oc,attr,ts) < 10.**-6., "Orbit integration in MovingObjectPopulationPotential in C does not agree with that in python"
+    return None
+
 def test_WrapperPotential_dims():
     # Test that WrapperPotentials get assigned to Potential/planarPotential 
     # correctly, based on input pot=
@@ -3238,6 +3855,30 @@ def test_ttensor_nonaxi():
         dummy= potential.ttensor(lp,1.,0.,0.)
     return None
 
+# Test that the tidal tensor and radius can be computed for arrays of positions
+def test_ttensor_rtide_array():
+    pots= [potential.MWPotential2014,
+           potential.DoubleExponentialDiskPotential(normalize=1.)]
+    R= numpy.array([0.5,1.,1.3,2.])
+    z= numpy.array([0.,0.1,-0.2,0.5])
+    phi= numpy.array([0.,1.,2.,-1.])
+    for pot in pots:
+        tij= potential.ttensor(pot,R,z,phi=phi)
+        eig= potential.ttensor(pot,R,z,phi=phi,eigenval=True)
+        rt= potential.rtide(pot,R,z,phi=phi,M=1e-5)
+        assert tij.shape == (4,3,3), 'ttensor for array input does not return an array of tensors'
+        assert eig.shape == (4,3), 'ttensor for array input does not return an array of eigenvalues'
+        for ii in range(len(R)):
+            assert numpy.all(numpy.fabs(tij[ii]-potential.ttensor(pot,R[ii],z[ii],phi=phi[ii])) < 1e-10), 'ttensor for array input does not agree with scalar input'
+            assert numpy.all(numpy.fabs(numpy.sort(eig[ii])-numpy.sort(potential.ttensor(pot,R[ii],z[ii],phi=phi[ii],eigenval=True))) < 1e-10), 'ttensor eigenvalues for array input do not agree with scalar input'
+            assert numpy.fabs(rt[ii]-potential.rtide(pot,R[ii],z[ii],phi=phi[ii],M=1e-5)) < 1e-10, 'rtide for array input does not agree with scalar input'
+    # Also test the methods and broadcasting of scalars
+    kp= potential.KeplerPotential(normalize=1.)
+    tij= kp.ttensor(R,0.)
+    assert numpy.all(numpy.fabs(tij[1]-numpy.diag([2,-1,-1])) < 1e-10), 'Calculation of tidal tensor for array input in point-mass potential fails'
+    assert numpy.all(numpy.fabs(kp.rtide(1.,0.,M=numpy.array([1.,2.]))/numpy.array([1.,2.])**(1./3.)-kp.rtide(1.,0.,M=1.)) < 1e-10), 'rtide for array of masses does not work as expected'
+    return None
+
 def test_NumericalPotentialDerivativesMixin():
     # Test that the NumericalPotentialDerivativesMixin works as expected
     def get_mixin_first_instance(cls,*args,**kwargs):
@@ -3449,6 +4090,144 @@ def test_isodisk_amplitude_issue400():
     assert numpy.fabs(dens_at_0-0.1) < 1e-7, 'Density at z=0 for IsothermalDiskPotential is not correct'
     return None
 
+# Test that potentials, wrappers, and lists of them survive serialization
+def test_to_from_bytes():
+    # Lists of 3D potentials, including functions defined as lambdas
+    dp= potential.DiskSCFPotential(dens=lambda R,z: 13.5*numpy.exp(-3.*R)\
+                                       *numpy.exp(-27.*numpy.fabs(z)),
+                                   Sigma={'type':'exp','h':1./3.,'amp':1.},
+                                   hz={'type':'exp','h':1./27.},
+                                   a=1.,N=5,L=5)
+    pot= [dp,potential.NFWPotential(a=4.5,normalize=0.35,ro=8.,vo=220.),
+          potential.DehnenSmoothWrapperPotential(\
+            pot=potential.DehnenBarPotential(),tform=-1.)]
+    bpot= potential.to_bytes(pot)
+    assert isinstance(bpot,bytes), 'to_bytes does not return bytes'
+    npot= potential.from_bytes(bpot)
+    assert isinstance(npot,list) and len(npot) == 3, 'from_bytes does not return the serialized list of potentials'
+    for p,np in zip(pot,npot):
+        assert type(p).__name__ == type(np).__name__, 'from_bytes does not return the serialized type of potential'
+        assert p._ro == np._ro and p._roSet == np._roSet, 'from_bytes does not return a potential with the same ro'
+    for R,z,phi,t in [(0.5,0.1,0.3,0.),(1.3,-0.4,2.,-0.5)]:
+        assert numpy.fabs(potential.evaluatePotentials(pot,R,z,phi=phi,t=t)
+                          -potential.evaluatePotentials(npot,R,z,phi=phi,t=t)) < 10.**-14., 'Serialized potential does not agree with the original potential'
+        assert numpy.fabs(potential.evaluateRforces(pot,R,z,phi=phi,t=t)
+                          -potential.evaluateRforces(npot,R,z,phi=phi,t=t)) < 10.**-14., 'Serialized potential does not agree with the original potential'
+        assert numpy.fabs(dp.dens(R,z)-npot[0].dens(R,z)) < 10.**-14., 'Serialized DiskSCFPotential does not have the same density function as the original potential'
+    # Method and 2D/1D potentials
+    ppot= potential.toPlanarPotential(potential.MWPotential2014)
+    nppot= potential.from_bytes(ppot[1].to_bytes())
+    assert numpy.fabs(nppot.Rforce(1.1)-ppot[1].Rforce(1.1)) < 10.**-14., 'Serialized planarPotential does not agree with the original potential'
+    vpot= potential.MiyamotoNagaiPotential(normalize=1.).toVertical(1.1)
+    nvpot= potential.from_bytes(vpot.to_bytes())
+    assert numpy.fabs(nvpot(0.2)-vpot(0.2)) < 10.**-14., 'Serialized linearPotential does not agree with the original potential'
+    # interpRZPotential does not store its splines, but sets them up again
+    ip= potential.interpRZPotential(RZPot=potential.MWPotential2014,
+                                    rgrid=(0.01,2.01,101),zgrid=(0.,0.2,101),
+                                    logR=False,interpPot=True,interpvcirc=True,
+                                    zsym=True)
+    bip= ip.to_bytes()
+    nip= potential.from_bytes(bip)
+    assert len(bip) < 1.2*(ip._potGrid.nbytes+ip._vcircGrid.nbytes+ip._rgrid.nbytes+ip._zgrid.nbytes), 'Serialized interpRZPotential is much larger than its tables'
+    assert numpy.fabs(nip(1.1,0.1)-ip(1.1,0.1)) < 10.**-14., 'Serialized interpRZPotential does not agree with the original potential'
+    assert numpy.fabs(nip.vcirc(1.1)-ip.vcirc(1.1)) < 10.**-14., 'Serialized interpRZPotential does not agree with the original potential'
+    # Input that is not a serialized object raises an error
+    with pytest.raises(ValueError) as excinfo:
+        potential.from_bytes(b'not a potential')
+    # Objects that are not galpy, numpy, or scipy objects cannot be serialized
+    class NotAParameter(object):
+        pass
+    with pytest.raises(TypeError) as excinfo:
+        potential.NFWPotential(a=NotAParameter()).to_bytes()
+    return None
+
+# Test that serialized potentials can be loaded in a fresh interpreter
+def test_to_from_bytes_subprocess():
+    import os
+    import sys
+    import subprocess
+    import tempfile
+    pot= [potential.NFWPotential(a=4.5,normalize=0.35,ro=8.,vo=220.),
+          potential.DehnenSmoothWrapperPotential(\
+            pot=potential.DehnenBarPotential(),tform=-1.),
+          # Holds scipy splines and a lambda
+          potential.CylindricalSplinePotential(Rgrid=(0.,2.,21),
+                                               zgrid=(0.,1.,21),mmax=2)]
+    R,z,phi,t= 0.9,0.1,0.3,-0.5
+    fd, filename= tempfile.mkstemp()
+    try:
+        with os.fdopen(fd,'wb') as savefile:
+            savefile.write(potential.to_bytes(pot))
+        out= subprocess.check_output(\
+            [sys.executable,'-c',
+             "import warnings; warnings.simplefilter('ignore');"
+             "from galpy import potential;"
+             "pot= potential.from_bytes(open({!r},'rb').read());"
+             "print(repr(potential.evaluatePotentials(pot,{},{},phi={},t={},use_physical=False)));"
+             "print(repr(potential.evaluatephiforces(pot,{},{},phi={},t={},use_physical=False)))"\
+                 .format(filename,R,z,phi,t,R,z,phi,t)])
+    finally:
+        os.remove(filename)
+    npotval, nphiforce= [float(x) for x in out.decode('utf-8').split()]
+    assert numpy.fabs(npotval-potential.evaluatePotentials(pot,R,z,phi=phi,t=t,use_physical=False)) < 10.**-14., 'Potential serialized and loaded in a fresh interpreter does not agree with the original potential'
+    assert numpy.fabs(nphiforce-potential.evaluatephiforces(pot,R,z,phi=phi,t=t,use_physical=False)) < 10.**-14., 'Potential serialized and loaded in a fresh interpreter does not agree with the original potential'
+    return None
+
+# Test that SnapshotRZPotential and InterpSnapshotRZPotential work with
+# arrays of positions and masses and the tree code (does not require pynbody)
+def test_snapshotKeplerPotential_treecode_arrayinput():
+    # Snapshot with just one unit mass at the origin, given as arrays
+    sp= potential.SnapshotRZPotential((numpy.zeros((1,3)),1.))
+    kp= potential.KeplerPotential(amp=1.) #should be the same
+    rs= numpy.array([0.5,1.,1.,1.])
+    zs= numpy.array([0.,0.,0.5,-0.5])
+    assert numpy.all(numpy.fabs(sp(rs,zs)-kp(rs,zs)) < 10.**-8.), 'SnapshotRZPotential with single unit mass given as arrays does not correspond to KeplerPotential'
+    assert numpy.all(numpy.fabs(sp.Rforce(rs,zs)-kp.Rforce(rs,zs)) < 10.**-8.), 'SnapshotRZPotential with single unit mass given as arrays does not correspond to KeplerPotential'
+    assert numpy.all(numpy.fabs(sp.zforce(rs,zs)-kp.zforce(rs,zs)) < 10.**-8.), 'SnapshotRZPotential with single unit mass given as arrays does not correspond to KeplerPotential'
+    return None
+
+def test_snapshotKeplerPotential_treecode_vs_direct():
+    # Test that the tree code agrees with direct summation over the particles
+    numpy.random.seed(1)
+    pos= numpy.random.normal(size=(1000,3))
+    mass= numpy.ones(1000)/1000.
+    spt= potential.SnapshotRZPotential((pos,mass),gravity='tree')
+    # Direct summation, averaged over the same azimuths
+    phis= numpy.arange(4)/4.*2.*numpy.pi
+    for R,z in [(0.5,0.),(1.,0.5),(2.,-1.)]:
+        pot, Rforce= 0., 0.
+        for phi in phis:
+            dx= numpy.array([R*numpy.cos(phi),R*numpy.sin(phi),z])-pos
+            r= numpy.sqrt(numpy.sum(dx**2.,axis=1))
+            pot-= numpy.sum(mass/r)/len(phis)
+            Rforce-= numpy.sum(mass*(dx[:,0]*numpy.cos(phi)
+                                     +dx[:,1]*numpy.sin(phi))/r**3.)\
+                                     /len(phis)
+        assert numpy.fabs(spt(R,z)/pot-1.) < 10.**-3., 'SnapshotRZPotential with the tree code does not agree with direct summation'
+        assert numpy.fabs(spt.Rforce(R,z)/Rforce-1.) < 10.**-2., 'SnapshotRZPotential with the tree code does not agree with direct summation'
+    return None
+
+def test_interpsnapshotKeplerPotential_treecode_arrayinput():
+    # Snapshot with just one mass at the origin, given as arrays
+    sp= potential.InterpSnapshotRZPotential((numpy.zeros((1,3)),2.),
+                                            rgrid=(0.01,2.,101),
+                                            zgrid=(0.,0.2,101),
+                                            logR=False,
+                                            interpPot=True,
+                                            zsym=True)
+    kp= potential.KeplerPotential(amp=2.) #should be the same
+    rs= numpy.linspace(0.01,2.,21)[1:]
+    zs= numpy.linspace(-0.2,0.2,41)
+    for r in rs:
+        for z in zs:
+            assert numpy.fabs((sp(r,z)-kp(r,z))/kp(r,z)) < 10.**-10., 'RZPot interpolation w/ InterpSnapShotPotential of KeplerPotential given as arrays fails at (R,z) = (%g,%g)' % (r,z)
+    # Also test normalize/denormalize
+    sp.normalize(R0=1.)
+    assert numpy.fabs(sp.Rforce(1.,0.)+1.) < 10.**-7., 'InterpSnapshotRZPotential given as arrays does not normalize correctly'
+    sp.denormalize()
+    assert numpy.fabs(sp(1.,0.1)/kp(1.,0.1)-1.) < 10.**-7., 'InterpSnapshotRZPotential given as arrays does not denormalize correctly'
+    return None
+
 def test_plotting():
     import tempfile
     #Some tests of the plotting routines, to make sure they don't fail
@@ -3884,6 +4663,19 @@ class mockInterpRZPotential(interpRZPotential):
                                    logR=True,
                                    interpPot=True,interpRforce=True,
                                    interpzforce=True,interpDens=True)
+# A CylindricalSplinePotential of a smooth density on a coarse grid, 
+# bc the default is slow
+class mockCylindricalSplinePotential(potential.CylindricalSplinePotential):
+    def __init__(self):
+        potential.CylindricalSplinePotential.__init__(self,
+            dens=lambda R,z,phi: numpy.exp(-R**2.-4.*z**2.)\
+                *(1.+0.1*numpy.cos(2.*phi)),
+            Rgrid=(0.,5.,21),zgrid=(0.,3.,25),mmax=2)
+class mockAxiCylindricalSplinePotential(potential.CylindricalSplinePotential):
+    def __init__(self):
+        potential.CylindricalSplinePotential.__init__(self,
+            dens=lambda R,z: numpy.exp(-R**2.-4.*z**2.),
+            Rgrid=(0.,5.,21),zgrid=(0.,3.,25))
 class mockSnapshotRZPotential(potential.SnapshotRZPotential):
     def __init__(self):
         # Test w/ equivalent of KeplerPotential: one mass
@@ -3999,6 +4791,30 @@ def scf_density(R, z=0, phi=0.):
     eps = .1
     return axi_density2(R,z,phi)*(1 + eps*(numpy.cos(phi) + numpy.sin(phi)))
 
+# Maximum difference between an attribute of two integrated orbits, with
+# differences in phi wrapped to [-pi,pi]
+def orbit_diff(o,oc,attr,ts):
+    diff= getattr(o,attr)(ts)-getattr(oc,attr)(ts)
+    if attr == 'phi':
+        diff= (diff+numpy.pi) % (2.*numpy.pi)-numpy.pi
+    return numpy.amax(numpy.fabs(diff))
+
+# Check that the potential and forces at phi=0 evaluated in C agree with those
+# evaluated in python
+def check_c_forces(pot,Rs,zs,tol):
+    from galpy.potential.interpRZPotential import eval_potential_c, \
+        eval_force_c
+    Rs, zs= numpy.array(Rs,dtype='float'), numpy.array(zs,dtype='float')
+    for cfunc,pyfunc,name in \
+            zip([eval_potential_c,eval_force_c,
+                 lambda p,R,z: eval_force_c(p,R,z,zforce=True)],
+                [potential.evaluatePotentials,potential.evaluateRforces,
+                 potential.evaluatezforces],
+                ['Potential','Rforce','zforce']):
+        pyvals= numpy.array([pyfunc(pot,R,z,phi=0.) for R,z in zip(Rs,zs)])
+        assert numpy.amax(numpy.fabs(cfunc(pot,Rs,zs)[0]-pyvals)) < tol, "{} evaluated in C does not agree with that in python".format(name)
+    return None
+
 ##Mock SCF class                                                         
 class mockSCFZeeuwPotential(potential.SCFPotential):
     def __init__(self):
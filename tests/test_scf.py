@@ -233,6 +233,125 @@ def test_density1_Order():
     assert numpy.all(numpy.fabs(Asin - Asin) < EPS), \
     "Increasing the radial, costheta, and phi order fails for Asin from scf_compute_coeffs"
 
+## Tests that computing the coefficients in parallel over small blocks of
+## quadrature points gives the same result as the serial computation
+def test_scf_compute_coeffs_parallel_blocks():
+    scfmodule= sys.modules['galpy.potential.SCFPotential']
+    Acos, Asin = potential.scf_compute_coeffs(density1, 5,5)
+    old_block= scfmodule._SCF_BLOCK_NNODES
+    scfmodule._SCF_BLOCK_NNODES= 1000 # Forces many blocks
+    try:
+        Acos2, Asin2 = potential.scf_compute_coeffs(density1, 5,5,numcores=2)
+        Acosa, _ = potential.scf_compute_coeffs_axi(axi_density1, 10,10)
+        Acosa2, _ = potential.scf_compute_coeffs_axi(axi_density1, 10,10,
+                                                     numcores=2)
+        # Blocks smaller than a single costheta x phi plane
+        scfmodule._SCF_BLOCK_NNODES= 7
+        Acos3, Asin3 = potential.scf_compute_coeffs(density1, 5,5)
+    finally:
+        scfmodule._SCF_BLOCK_NNODES= old_block
+    assert numpy.all(numpy.fabs(Acos - Acos2) < EPS), \
+    "Computing Acos in parallel over blocks in scf_compute_coeffs does not agree with the serial computation"
+    assert numpy.all(numpy.fabs(Asin - Asin2) < EPS), \
+    "Computing Asin in parallel over blocks in scf_compute_coeffs does not agree with the serial computation"
+    assert numpy.all(numpy.fabs(Acos - Acos3) < EPS), \
+    "Computing Acos over blocks that split the angular node grid in scf_compute_coeffs does not agree with the computation over large blocks"
+    assert numpy.all(numpy.fabs(Asin - Asin3) < EPS), \
+    "Computing Asin over blocks that split the angular node grid in scf_compute_coeffs does not agree with the computation over large blocks"
+    assert numpy.all(numpy.fabs(Acosa - Acosa2) < EPS), \
+    "Computing Acos in parallel over blocks in scf_compute_coeffs_axi does not agree with the serial computation"
+
+## Tests that scf_compute_coeffs_nbody for a sample from a Hernquist profile
+## agrees with the expected coefficients within the particle noise
+def test_scf_compute_coeffs_nbody_hernquist():
+    numpy.random.seed(1)
+    n= 100000
+    # Sample from a Hernquist profile: M(<r) = r^2/(1+r)^2
+    u= numpy.sqrt(numpy.random.uniform(size=n))
+    r= u/(1.-u)
+    costheta= numpy.random.uniform(-1.,1.,size=n)
+    phi= numpy.random.uniform(0.,2.*numpy.pi,size=n)
+    sintheta= numpy.sqrt(1.-costheta**2.)
+    pos= numpy.array([r*sintheta*numpy.cos(phi),r*sintheta*numpy.sin(phi),
+                      r*costheta])
+    Acos, Asin, Acos_var, Asin_var= \
+        potential.scf_compute_coeffs_nbody(pos,1./n,5,5,return_variance=True)
+    Aspherical= potential.scf_compute_coeffs_spherical(\
+        lambda r: potential.HernquistPotential(amp=2.).dens(r,0.),5)[0]
+    Aexpected= numpy.zeros_like(Acos)
+    Aexpected[:,0,0]= Aspherical[:,0,0]
+    assert numpy.all(numpy.fabs(Acos-Aexpected) < 5.*numpy.sqrt(Acos_var)+EPS), \
+    "scf_compute_coeffs_nbody for a Hernquist sample does not agree with the Hernquist coefficients"
+    assert numpy.all(numpy.fabs(Asin) < 5.*numpy.sqrt(Asin_var)+EPS), \
+    "scf_compute_coeffs_nbody for a Hernquist sample does not give Asin consistent with zero"
+    # Chunked and parallel computation should give the same result
+    Acos2, Asin2= potential.scf_compute_coeffs_nbody(pos,1./n*numpy.ones(n),
+                                                     5,5,chunksize=3333,
+                                                     numcores=2)
+    assert numpy.all(numpy.fabs(Acos-Acos2) < 10.**-10.), \
+    "scf_compute_coeffs_nbody with a different chunksize and in parallel does not agree with the default"
+    assert numpy.all(numpy.fabs(Asin-Asin2) < 10.**-10.), \
+    "scf_compute_coeffs_nbody with a different chunksize and in parallel does not agree with the default"
+
+## Tests that densities that do not take array inputs are still supported
+def test_scf_compute_coeffs_scalar_density():
+    def scalar_density(R,z,phi):
+        return float(sphericalHernquistDensity(R,z,phi))
+    Acos, Asin = potential.scf_compute_coeffs_axi(sphericalHernquistDensity,
+                                                  10,10)
+    Acos2, Asin2 = potential.scf_compute_coeffs_axi(scalar_density, 10,10)
+    assert numpy.all(numpy.fabs(Acos - Acos2) < EPS), \
+    "scf_compute_coeffs_axi for a density that does not take array inputs does not agree with that for the same density that does"
+
+
+## Tests that TimeDependentSCFPotential agrees with SCFPotential at the snapshot times and interpolates the coefficients in between
+def test_timedependentscf_interpolation():
+    from galpy.potential import TimeDependentSCFPotential
+    numpy.random.seed(1)
+    Acos= numpy.zeros((3,4,3,3)); Asin= numpy.zeros((3,4,3,3))
+    Acos[:,0,0,0]= 1.
+    Acos[:,1:,:,:]= 0.1*numpy.tril(numpy.random.normal(size=(3,3,3,3)))
+    Asin[:,1:,:,1:]= 0.1*numpy.tril(numpy.random.normal(size=(3,3,3,2)),-1)
+    times= numpy.array([0.,1.,3.])
+    Rs,zs,phis= [0.5,1.2,2.],[0.1,-0.4,0.8],[0.3,2.,-1.]
+    for interp in ['linear','cubic']:
+        tp= TimeDependentSCFPotential(Acos=Acos,Asin=Asin,times=times,
+                                      interp=interp)
+        for ii,ti in enumerate(times):
+            sp= SCFPotential(Acos=Acos[ii],Asin=Asin[ii])
+            for R,z,phi in zip(Rs,zs,phis):
+                for func in [potential.evaluatePotentials,
+                             potential.evaluateRforces,
+                             potential.evaluatezforces,
+                             potential.evaluatephiforces,
+                             potential.evaluateDensities]:
+                    assert numpy.fabs(func(tp,R,z,phi=phi,t=ti)
+                                      -func(sp,R,z,phi=phi)) < 10.**-10., \
+                        "TimeDependentSCFPotential does not agree with SCFPotential at a snapshot time"
+        # Outside of the range of times, coefficients are held fixed
+        sp= SCFPotential(Acos=Acos[-1],Asin=Asin[-1])
+        assert numpy.fabs(potential.evaluatePotentials(tp,1.,0.2,phi=0.5,t=10.)
+                          -potential.evaluatePotentials(sp,1.,0.2,phi=0.5)) < 10.**-10., "TimeDependentSCFPotential does not hold the coefficients fixed after the last time"
+    # Linear interpolation between snapshots
+    tp= TimeDependentSCFPotential(Acos=Acos,Asin=Asin,times=times)
+    sp= SCFPotential(Acos=0.75*Acos[1]+0.25*Acos[2],
+                     Asin=0.75*Asin[1]+0.25*Asin[2])
+    for R,z,phi in zip(Rs,zs,phis):
+        assert numpy.fabs(tp(R,z,phi=phi,t=1.5)-sp(R,z,phi=phi)) < 10.**-10., "TimeDependentSCFPotential does not linearly interpolate the coefficients"
+    # Cubic interpolation of coefficients linear in time is linear
+    Acos[2]= 2.*Acos[1]-Acos[0]; Asin[2]= 2.*Asin[1]-Asin[0]
+    times= numpy.array([0.,1.,2.])
+    tpl= TimeDependentSCFPotential(Acos=Acos,Asin=Asin,times=times)
+    tpc= TimeDependentSCFPotential(Acos=Acos,Asin=Asin,times=times,
+                                   interp='cubic')
+    for R,z,phi in zip(Rs,zs,phis):
+        assert numpy.fabs(tpl(R,z,phi=phi,t=0.3)-tpc(R,z,phi=phi,t=0.3)) < 10.**-10., "TimeDependentSCFPotential cubic interpolation does not reproduce linearly-evolving coefficients"
+    # Array of times
+    ts= numpy.array([0.3,1.5,0.3])
+    assert numpy.all(numpy.fabs(tpc(1.,0.2,phi=0.5,t=ts)
+                                -numpy.array([tpc(1.,0.2,phi=0.5,t=t)
+                                              for t in ts])) < 10.**-10.), "TimeDependentSCFPotential evaluated for an array of times does not agree with evaluating it at each time"
+    return None
 
 ## Tests whether scf_compute_axi reduces to scf_compute_spherical for the Hernquist Potential   
 def test_scf_axiHernquistCoeffs_ReducesToSpherical():
@@ -64,3 +64,151 @@ def test_quadpack():
     int= dblquad(lambda y,x: 4.*x*y,0.,1.,lambda z: 0.,lambda z: 1.)
     assert numpy.fabs(int[0]-1.) < int[1], 'bovy_quadpack.dblquad did not work as expected'
     return None
+
+def test_treecode_direct():
+    # Test that the tree code agrees with direct summation
+    from galpy.util import treecode
+    numpy.random.seed(1)
+    N= 2000
+    pos= numpy.random.normal(size=(N,3))
+    mass= numpy.random.uniform(size=N)/N
+    pts= numpy.random.normal(size=(50,3))*2.
+    dx= pts[:,None,:]-pos[None,:,:]
+    dm2= numpy.sum(dx**2.,axis=2)+0.01**2.
+    dpot= -numpy.sum(mass/numpy.sqrt(dm2),axis=1)
+    dacc= -numpy.sum((mass/dm2**1.5)[:,:,None]*dx,axis=1)
+    # Opening all nodes should give direct summation
+    pot, acc= treecode.tree_gravity(pos,mass,pts,theta=10.**-6.,
+                                    softening=0.01,use_c=False)
+    assert numpy.amax(numpy.fabs(pot/dpot-1.)) < 10.**-10., 'treecode with theta -> 0 does not agree with direct summation for the potential'
+    assert numpy.amax(numpy.fabs(acc-dacc)) < 10.**-10.*numpy.amax(numpy.fabs(dacc)), 'treecode with theta -> 0 does not agree with direct summation for the acceleration'
+    # Approximate forces for the default opening angle
+    pot, acc= treecode.tree_gravity(pos,mass,pts,softening=0.01,use_c=False)
+    assert numpy.amax(numpy.fabs(pot/dpot-1.)) < 10.**-2., 'treecode does not agree with direct summation for the potential'
+    assert numpy.median(numpy.sqrt(numpy.sum((acc-dacc)**2.,axis=1))/numpy.sqrt(numpy.sum(dacc**2.,axis=1))) < 10.**-2., 'treecode does not agree with direct summation for the acceleration'
+    return None
+
+def test_cache():
+    # Test the persistent cache
+    import os
+    import tempfile
+    import warnings
+    from galpy.util import cache, galpyWarning
+    from galpy.util.config import __config__
+    cachedir= tempfile.mkdtemp()
+    ncalls= [0]
+    def func():
+        ncalls[0]+= 1
+        return numpy.arange(10)
+    # Results are computed once and then loaded from the cache
+    for ii in range(2):
+        out= cache.cached(func,cachedir,'test',lambda x: 2.*x,3.)
+        assert numpy.all(out == numpy.arange(10)), 'cached does not return the result of the computation'
+    assert ncalls[0] == 1, 'cached does not load the result from the cache'
+    # Functions are hashed by their code
+    cache.cached(func,cachedir,'test',lambda x: 3.*x,3.)
+    assert ncalls[0] == 2, 'cached does not distinguish between different functions'
+    cache.cached(func,cachedir,'test',lambda x: 2.*x,4.)
+    assert ncalls[0] == 3, 'cached does not distinguish between different inputs'
+    assert len(os.listdir(cachedir)) == 3, 'cache does not contain the expected number of results'
+    # Without cache, always compute
+    cache.cached(func,None,'test',lambda x: 2.*x,3.)
+    assert ncalls[0] == 4, 'cached with cache=None does not compute the result'
+    # Inputs that cannot be hashed result in a warning and no caching
+    with warnings.catch_warnings(record=True) as w:
+        warnings.simplefilter('always',galpyWarning)
+        cache.cached(func,cachedir,'test',(x for x in range(3)))
+        assert any(['not using the cache' in str(wa.message) for wa in w]), 'cached does not warn when the inputs cannot be hashed'
+    assert ncalls[0] == 5, 'cached does not compute the result when the inputs cannot be hashed'
+    # Least-recently-used eviction
+    oldmaxsize= __config__.get('cache','maxsize')
+    __config__.set('cache','maxsize',str(1.5*os.path.getsize(os.path.join(cachedir,os.listdir(cachedir)[0]))/1024.**2.))
+    cache.cached(func,cachedir,'test',lambda x: 2.*x,3.)
+    cache.cached(func,cachedir,'test',lambda x: 2.*x,5.)
+    __config__.set('cache','maxsize',oldmaxsize)
+    assert len(os.listdir(cachedir)) == 1, 'cache does not evict results when it becomes too large'
+    assert ncalls[0] == 6, 'cached does not load the result from the cache'
+    cache.clear(cachedir)
+    assert len(os.listdir(cachedir)) == 0, 'cache.clear does not clear the cache'
+    return None
+
+def test_cache_key_globals():
+    # Test that the cache key of a function depends on the values of the
+    # global variables that it uses
+    from galpy.util import cache
+    glob= {'numpy':numpy,'hz':0.1}
+    exec("def f(z): return numpy.exp(-z/hz)",glob)
+    key= cache.cache_key(glob['f'])
+    glob['hz']= 0.5
+    exec("def f(z): return numpy.exp(-z/hz)",glob)
+    assert cache.cache_key(glob['f']) != key, 'cache_key does not depend on the global variables used by a function'
+    glob['hz']= 0.1
+    assert cache.cache_key(glob['f']) == key, 'cache_key is not the same for the same global variables'
+    # Also for functions nested in the function
+    exec("def g(z): return (lambda x: x/hz)(z)",glob)
+    key= cache.cache_key(glob['g'])
+    glob['hz']= 0.5
+    assert cache.cache_key(glob['g']) != key, 'cache_key does not depend on the global variables used by a nested function'
+    # Recursive functions can be hashed
+    exec("def h(n): return 1 if n == 0 else n*h(n-1)",glob)
+    key= cache.cache_key(glob['h'])
+    assert cache.cache_key(glob['h']) == key, 'cache_key is not the same for the same recursive function'
+    return None
+
+def test_cache_key_transient():
+    # Test that the cache key of an object does not change when the object
+    # caches evaluations
+    from galpy.potential import TriaxialNFWPotential, MWPotential2014
+    from galpy.potential import turn_circular_cache_on
+    from galpy.util import cache
+    tp= TriaxialNFWPotential(normalize=1.,b=0.8,c=0.7)
+    key= cache.cache_key(tp)
+    tp.Rforce(1.,0.1,phi=0.2)
+    assert hasattr(tp,'_force_hash'), 'TriaxialNFWPotential does not cache its forces'
+    assert cache.cache_key(tp) == key, 'cache_key changes when an object caches evaluations'
+    assert cache.cache_key(TriaxialNFWPotential(normalize=1.,b=0.8,c=0.6)) != key, 'cache_key does not depend on the parameters of an object'
+    # Also for objects contained in lists
+    key= cache.cache_key(MWPotential2014)
+    turn_circular_cache_on(MWPotential2014)
+    try:
+        MWPotential2014[0].vcirc(1.)
+        assert cache.cache_key(MWPotential2014) == key, 'cache_key changes when an object caches evaluations'
+    finally:
+        for pot in MWPotential2014: pot.turn_circular_cache_off()
+    return None
+
+def test_cached_setup():
+    # Test caching an object's setup
+    import tempfile
+    from galpy.util import cache
+    cachedir= tempfile.mkdtemp()
+    ncalls= [0]
+    class Obj(object):
+        def __init__(self,a,n):
+            self._a= a
+            cache.cached_setup(self,lambda: self._setup(n),cachedir,n)
+        def _setup(self,n):
+            ncalls[0]+= 1
+            self._b= self._a*numpy.arange(n)
+    o1= Obj(2.,5)
+    o2= Obj(2.,5)
+    assert ncalls[0] == 1, 'cached_setup does not load the setup from the cache'
+    assert numpy.all(o1._b == o2._b), 'cached_setup does not restore the attributes set up'
+    Obj(3.,5)
+    Obj(2.,6)
+    assert ncalls[0] == 3, 'cached_setup does not distinguish between different states or inputs'
+    # Attributes that setup() changes in place are also restored
+    class InPlaceObj(object):
+        def __init__(self,n):
+            self._c= numpy.zeros(n)
+            self._d= {}
+            cache.cached_setup(self,self._setup,cachedir)
+        def _setup(self):
+            ncalls[0]+= 1
+            self._c[:]= numpy.arange(len(self._c))
+            self._d['e']= 2.
+    o1= InPlaceObj(5)
+    o2= InPlaceObj(5)
+    assert ncalls[0] == 4, 'cached_setup does not load the setup from the cache'
+    assert numpy.all(o2._c == o1._c) and o2._d == o1._d, 'cached_setup does not restore the attributes changed in place'
+    return None